@@ -143,7 +143,8 @@ class configuration:
                     'src/TrackGenerator.cpp',
                     'src/Universe.cpp',
                     'src/Cmfd.cpp',
-                    'src/Mesh.cpp']
+                    'src/Mesh.cpp',
+                    'src/DiffusionSolver.cpp']
 
   sources['icpc'] = ['openmoc/openmoc_wrap.cpp',
                      'src/Cell.cpp',
@@ -164,7 +165,8 @@ class configuration:
                      'src/TrackGenerator.cpp',
                      'src/Universe.cpp',
                      'src/Cmfd.cpp',
-                     'src/Mesh.cpp']
+                     'src/Mesh.cpp',
+                     'src/DiffusionSolver.cpp']
 
   sources['bgxlc'] = ['openmoc/openmoc_wrap.cpp',
                       'src/Cell.cpp',
@@ -183,7 +185,8 @@ class configuration:
                       'src/TrackGenerator.cpp',
                       'src/Universe.cpp',
                       'src/Cmfd.cpp',
-                      'src/Mesh.cpp']
+                      'src/Mesh.cpp',
+                      'src/DiffusionSolver.cpp']
 
   sources['nvcc'] = ['openmoc/cuda/openmoc_cuda_wrap.cpp',
                      'src/accel/cuda/GPUQuery.cu',
@@ -48,6 +48,25 @@
   }
 }
 
+/* The Geometry's batch point location methods find the IDs for each point in
+ * parallel with OpenMP, so the GIL is released while they run */
+%define %release_gil_exception(METHOD)
+%exception METHOD {
+  PyThreadState* thread_state = PyEval_SaveThread();
+  try {
+    $function
+  } catch (const std::exception &e) {
+    PyEval_RestoreThread(thread_state);
+    SWIG_exception(SWIG_RuntimeError, e.what());
+  }
+  PyEval_RestoreThread(thread_state);
+}
+%enddef
+
+%release_gil_exception(Geometry::findFSRIds)
+%release_gil_exception(Geometry::findCellIds)
+%release_gil_exception(Geometry::findMaterialIds)
+
 /* C++ casting helper method for openmoc.process computePinPowers routine */
 %inline %{
   CellFill* castCellToCellFill(Cell* cell) {
@@ -243,10 +262,36 @@
  * getCellIds method for the data processing routines in openmoc.process */
 %apply (int* ARGOUT_ARRAY1, int DIM1) {(int* cell_ids, int num_cells)}
 
+/* The typemaps used to match the method signatures for the
+ * TrackGenerator's Track and segment arrays for the plotting routines in
+ * openmoc.plotter */
+%include "../../track_arrays.i"
+
+/* The typemaps used to match the method signatures for the Geometry's batch
+ * point location methods. These allow users to find the FSR, Cell and
+ * Material IDs for NumPy arrays of x and y coordinates, such as for the
+ * plotting routines in openmoc.plotter */
+%apply (double* IN_ARRAY1, int DIM1) {(double* x_coords, int num_x), (double* y_coords, int num_y)}
+%apply (int* ARGOUT_ARRAY1, int DIM1) {(int* fsr_ids, int num_points)}
+%apply (int* ARGOUT_ARRAY1, int DIM1) {(int* cell_ids, int num_points)}
+%apply (int* ARGOUT_ARRAY1, int DIM1) {(int* material_ids, int num_points)}
+
+/* The typemaps used to match the method signatures for the Geometry's bulk
+ * constructors. These allow users to create many Surfaces and Cells from
+ * NumPy arrays of their attributes in a single call */
+%apply (double* IN_ARRAY1, int DIM1) {(double* x, int num_x), (double* y, int num_y), (double* radii, int num_radii)}
+%apply (double* IN_ARRAY1, int DIM1) {(double* A, int num_A), (double* B, int num_B), (double* C, int num_C)}
+%apply (int* IN_ARRAY1, int DIM1) {(int* boundaries, int num_boundaries)}
+%apply (int* IN_ARRAY1, int DIM1) {(int* universes, int num_universes), (int* universe_fills, int num_fills)}
+%apply (int* IN_ARRAY1, int DIM1) {(int* materials, int num_materials), (int* rings, int num_rings), (int* sectors, int num_sectors)}
+%apply (int* IN_ARRAY1, int DIM1) {(int* surface_offsets, int num_offsets), (int* cell_surfaces, int num_cell_surfaces)}
+%apply (int* ARGOUT_ARRAY1, int DIM1) {(int* surface_ids, int num_surfaces)}
+
 #endif
 
 
 %include <exception.i>
+%include <std_string.i>
 %include ../../../src/Cell.h
 %include ../../../src/Geometry.h
 %include ../../../src/LocalCoords.h
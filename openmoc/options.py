@@ -82,6 +82,15 @@ class Options:
     ## The default CMFD mesh level
     self._cmfd_mesh_level = -1
 
+    ## The default CMFD matrix-free flag
+    self._cmfd_matrix_free = False
+
+    ## The default CMFD adaptive linear solver tolerance flag
+    self._cmfd_adaptive = False
+
+    ## The default CMFD multilevel acceleration flag
+    self._cmfd_multilevel = False
+
     # Parse in arguments from the command line
     self.parseArguments()
 
@@ -94,7 +103,7 @@ class Options:
   def parseArguments(self):
     try:
       opts, args = getopt.getopt(sys.argv[1:],
-                                 'hfa:s:i:c:t:b:g:r:l:',
+                                 'hfmdea:s:i:c:t:b:g:r:l:',
                                  ['help',
                                   'num-azim=',
                                   'track-spacing=',
@@ -105,7 +114,10 @@ class Options:
                                   'num-gpu-threads=',
                                   'relax-factor=',
                                   'cmfd-acceleration',
-                                  'mesh-level='])
+                                  'mesh-level=',
+                                  'cmfd-matrix-free',
+                                  'cmfd-adaptive',
+                                  'cmfd-multilevel'])
 
     except getopt.GetoptError as err:
       py_printf('WARNING', str(err))
@@ -169,6 +181,18 @@ class Options:
         mesh_level += 'The mesh level\n'
         print(mesh_level)
 
+        matrix_free = '\t{: <35}'.format('-m, --cmfd-matrix-free=<False>')
+        matrix_free += 'The cmfd matrix-free flag\n'
+        print(matrix_free)
+
+        adaptive = '\t{: <35}'.format('-d, --cmfd-adaptive=<False>')
+        adaptive += 'The cmfd adaptive linear solver tolerance flag\n'
+        print(adaptive)
+
+        multilevel = '\t{: <35}'.format('-e, --cmfd-multilevel=<False>')
+        multilevel += 'The cmfd multilevel acceleration flag\n'
+        print(multilevel)
+
         sys.exit()
 
       elif opt in ('-a', '--num-azim'):
@@ -201,6 +225,15 @@ class Options:
       elif opt in ('-l', '--mesh-level'):
         self._cmfd_mesh_level = int(arg)
 
+      elif opt in ('-m', '--cmfd-matrix-free'):
+        self._cmfd_matrix_free = True
+
+      elif opt in ('-d', '--cmfd-adaptive'):
+        self._cmfd_adaptive = True
+
+      elif opt in ('-e', '--cmfd-multilevel'):
+        self._cmfd_multilevel = True
+
 
   ##
   # @brief Returns the number of azimuthal angles.
@@ -270,3 +303,24 @@ class Options:
   # @return the number of CMFD multigrid mesh levels
   def getCmfdMeshLevel(self):
     return self._cmfd_mesh_level
+
+
+  ##
+  # @brief Returns whether or not to apply the CMFD matrices matrix-free.
+  # @return use matrix-free CMFD (true) or not (false)
+  def getCmfdMatrixFree(self):
+    return self._cmfd_matrix_free
+
+
+  ##
+  # @brief Returns whether or not to adapt the CMFD linear solver tolerance.
+  # @return use adaptive CMFD linear solver tolerances (true) or not (false)
+  def getCmfdAdaptive(self):
+    return self._cmfd_adaptive
+
+
+  ##
+  # @brief Returns whether or not to accelerate CMFD with coarser CMFD levels.
+  # @return use multilevel CMFD acceleration (true) or not (false)
+  def getCmfdMultilevel(self):
+    return self._cmfd_multilevel
@@ -45,6 +45,7 @@ plt.ioff()
 
 import matplotlib.colors as colors
 import matplotlib.cm as cmx
+from matplotlib.collections import LineCollection
 import numpy as np
 import numpy.random
 import os, sys
@@ -102,18 +103,16 @@ def plot_tracks(track_generator):
   # Retrieve data from TrackGenerator
   num_azim = track_generator.getNumAzim()
   spacing = track_generator.getTrackSpacing()
-  num_tracks = track_generator.getNumTracks()
-  coords = track_generator.retrieveTrackCoords(num_tracks*4)
+  points = track_generator.getTrackPoints()
 
-  # Convert data to NumPy arrays
-  coords = np.array(coords)
-  x = coords[0::2]
-  y = coords[1::2]
+  # Reshape the read-only array into the start and end points of each Track
+  lines = points.reshape((-1, 2, 2))
+  x = points[:,0::2]
+  y = points[:,1::2]
 
   # Make figure of line segments for each Track
   fig = plt.figure()
-  for i in range(num_tracks):
-    plt.plot([x[i*2], x[i*2+1]], [y[i*2], y[i*2+1]], 'b-')
+  plt.gca().add_collection(LineCollection(lines, colors='b'))
 
   plt.xlim([x.min(), x.max()])
   plt.ylim([y.min(), y.max()])
@@ -165,34 +164,22 @@ def plot_segments(track_generator):
   # Retrieve data from TrackGenerator
   num_azim = track_generator.getNumAzim()
   spacing = track_generator.getTrackSpacing()
-  num_segments = track_generator.getNumSegments()
-  num_fsrs = track_generator.getGeometry().getNumFSRs()
-  coords = track_generator.retrieveSegmentCoords(num_segments*5)
-
-  # Convert data to NumPy arrays
-  coords = np.array(coords)
-  x = numpy.zeros(num_segments*2)
-  y = numpy.zeros(num_segments*2)
-  fsrs = numpy.zeros(num_segments)
-
-  for i in range(num_segments):
-    fsrs[i] = coords[i*5]
-    x[i*2] = coords[i*5+1]
-    y[i*2] = coords[i*5+2]
-    x[i*2+1] = coords[i*5+3]
-    y[i*2+1] = coords[i*5+4]
+  points = track_generator.getSegmentPoints()
+  fsrs = track_generator.getSegmentFSRIds()
 
-  # Make figure of line segments for each track
-  fig = plt.figure()
+  # Reshape the read-only array into the start and end points of each segment
+  lines = points.reshape((-1, 2, 2))
+  x = points[:,0::2]
+  y = points[:,1::2]
 
-  for i in range(num_segments):
+  # Create a color map corresponding to FSR IDs
+  cNorm  = colors.Normalize(vmin=0, vmax=max(color_map))
+  scalarMap = cmx.ScalarMappable(norm=cNorm)
+  segment_colors = scalarMap.to_rgba(color_map[fsrs % num_colors])
 
-    # Create a color map corresponding to FSR IDs
-    jet = cm = plt.get_cmap('jet')
-    cNorm  = colors.Normalize(vmin=0, vmax=max(color_map))
-    scalarMap = cmx.ScalarMappable(norm=cNorm)
-    color = scalarMap.to_rgba(color_map[fsrs[i] % num_colors])
-    plt.plot([x[i*2], x[i*2+1]], [y[i*2], y[i*2+1]], c=color)
+  # Make figure of line segments for each track
+  fig = plt.figure()
+  plt.gca().add_collection(LineCollection(lines, colors=segment_colors))
 
   plt.xlim([x.min(), x.max()])
   plt.ylim([y.min(), y.max()])
@@ -261,19 +248,11 @@ def plot_materials(geometry, gridsize=250):
   xcoords = np.linspace(xmin, xmax, gridsize)
   ycoords = np.linspace(ymin, ymax, gridsize)
 
-  # Find the <aterial IDs for each grid point
-  for i in range(gridsize):
-    for j in range(gridsize):
-
-      x = xcoords[i]
-      y = ycoords[j]
-
-      point = LocalCoords(x, y)
-      point.setUniverse(0)
-      geometry.findCellContainingCoords(point)
-      fsr_id = geometry.findFSRId(point)
-      material_id = geometry.findCellContainingFSR(fsr_id).getMaterial()
-      surface[j][i] = color_map[material_id % num_colors]
+  # Find the Material IDs for each grid point
+  x, y = np.meshgrid(xcoords, ycoords)
+  material_ids = geometry.findMaterialIds(x.flatten(), y.flatten(), x.size)
+  material_ids = material_ids.reshape((gridsize, gridsize))
+  surface[:,:] = color_map[material_ids % num_colors]
 
   # Flip the surface vertically to align NumPy row/column indices with the
   # orientation expected by the user
@@ -340,18 +319,10 @@ def plot_cells(geometry, gridsize=250):
   ycoords = np.linspace(ymin, ymax, gridsize)
 
   # Find the Cell IDs for each grid point
-  for i in range(gridsize):
-    for j in range(gridsize):
-
-      x = xcoords[i]
-      y = ycoords[j]
-
-      point = LocalCoords(x, y)
-      point.setUniverse(0)
-      geometry.findCellContainingCoords(point)
-      fsr_id = geometry.findFSRId(point)
-      cell_id = geometry.findCellContainingFSR(fsr_id).getId()
-      surface[j][i] = color_map[cell_id % num_colors]
+  x, y = np.meshgrid(xcoords, ycoords)
+  cell_ids = geometry.findCellIds(x.flatten(), y.flatten(), x.size)
+  cell_ids = cell_ids.reshape((gridsize, gridsize))
+  surface[:,:] = color_map[cell_ids % num_colors]
 
   # Flip the surface vertically to align NumPy row/column indices with the
   # orientation expected by the user
@@ -419,17 +390,10 @@ def plot_flat_source_regions(geometry, gridsize=250):
   ycoords = np.linspace(ymin, ymax, gridsize)
 
   # Find the flat source region IDs for each grid point
-  for i in range(gridsize):
-    for j in range(gridsize):
-
-      x = xcoords[i]
-      y = ycoords[j]
-
-      point = LocalCoords(x, y)
-      point.setUniverse(0)
-      geometry.findCellContainingCoords(point)
-      fsr_id = geometry.findFSRId(point)
-      surface[j][i] = color_map[fsr_id % num_colors]
+  x, y = np.meshgrid(xcoords, ycoords)
+  fsr_ids = geometry.findFSRIds(x.flatten(), y.flatten(), x.size)
+  fsr_ids = fsr_ids.reshape((gridsize, gridsize))
+  surface[:,:] = color_map[fsr_ids % num_colors]
 
   # Flip the surface vertically to align NumPy row/column indices with the
   # orientation expected by the user
@@ -544,21 +508,18 @@ def plot_fluxes(geometry, solver, energy_groups=[0], gridsize=250):
   xcoords = np.linspace(xmin, xmax, gridsize)
   ycoords = np.linspace(ymin, ymax, gridsize)
 
-  for i in range(gridsize):
-    for j in range(gridsize):
-
-      # Find the flat source region IDs for each grid point
-      x = xcoords[i]
-      y = ycoords[j]
-
-      point = LocalCoords(x, y)
-      point.setUniverse(0)
-      geometry.findCellContainingCoords(point)
-      fsr_id = geometry.findFSRId(point)
+  # Find the flat source region IDs for each grid point
+  x, y = np.meshgrid(xcoords, ycoords)
+  fsr_ids = geometry.findFSRIds(x.flatten(), y.flatten(), x.size)
+  fsr_ids = fsr_ids.reshape((gridsize, gridsize))
+  unique_ids = np.unique(fsr_ids[fsr_ids >= 0])
 
-      # Get the scalar flux for each energy group in this FSR
-      for index, group in enumerate(energy_groups):
-        fluxes[index,j,i] = solver.getFSRScalarFlux(fsr_id, group)
+  # Get the scalar flux for each energy group in each FSR on the grid
+  for index, group in enumerate(energy_groups):
+    fsr_fluxes = np.zeros(geometry.getNumFSRs())
+    for fsr_id in unique_ids:
+      fsr_fluxes[fsr_id] = solver.getFSRScalarFlux(int(fsr_id), group)
+    fluxes[index,:,:] = np.where(fsr_ids >= 0, fsr_fluxes[fsr_ids], 0.)
 
   # Loop over all energy group and create a plot
   for index, group in enumerate(energy_groups):
@@ -644,3 +644,50 @@ def restore_simulation_state(filename='simulation-state.h5',
               '*.h5, *.hdf5, and *.pkl files are supported', filename)
 
     return {}
+
+
+##
+# @brief Returns the time spent in each phase timed by the OpenMOC Timers.
+# @details Each phase is identified by its path, the names of the enclosing
+#          phases and its own name joined by '/', such as
+#          'Source convergence/Transport sweep'. The phases may be returned
+#          as a dictionary or as a NumPy structured array with 'phase',
+#          'depth', 'time' and 'count' fields, sorted by path so that each
+#          phase is followed by the phases nested within it. This routine
+#          may be called from a Python script as follows:
+#
+# @code
+#          solver.convergeSource(max_iters)
+#          phases = get_timer_phases()
+#          sweep_time = phases['Source convergence/Transport sweep']['time']
+# @endcode
+#
+# @param as_array whether to return a NumPy structured array (False by
+#        default)
+# @return a dictionary of the 'time' (seconds) and 'count' of each phase
+#         keyed by path, or a NumPy structured array of the phases
+def get_timer_phases(as_array=False):
+
+  timer = openmoc.Timer.Get()
+  phases = {}
+
+  for i in range(timer.getNumPhases()):
+    name = timer.getPhaseName(i)
+    phases[name] = {'time': timer.getPhaseTime(name),
+                    'count': timer.getPhaseCount(name)}
+
+  if not as_array:
+    return phases
+
+  names = sorted(phases)
+  max_length = max([len(name) for name in names] + [1])
+  dtype = [('phase', 'U%d' % max_length), ('depth', np.int32),
+           ('time', np.float64), ('count', np.int64)]
+
+  array = np.zeros(len(names), dtype=dtype)
+
+  for i, name in enumerate(names):
+    array[i] = (name, name.count('/'), phases[name]['time'],
+                phases[name]['count'])
+
+  return array
@@ -0,0 +1,97 @@
+/**
+ * @file track_arrays.i
+ * @brief SWIG typemaps for the TrackGenerator's Track and segment arrays.
+ * @details The TrackGenerator's getTrackPoints, getTrackAzimIndices,
+ *          getSegmentLengths, getSegmentFSRIds, getSegmentMaterialIds and
+ *          getSegmentPoints methods fill a new C++ array for each call. These
+ *          typemaps wrap the array as a read-only NumPy array without
+ *          copying it and hand ownership of the array to NumPy through a
+ *          PyCapsule base object, which deletes the array when the NumPy
+ *          array is garbage collected. The NumPy arrays therefore remain
+ *          valid after the Tracks are regenerated or the TrackGenerator is
+ *          deleted. This file must be included after numpy.i.
+ * @date October 19, 2026
+ */
+
+%{
+
+  /* Deletes the C++ array owned by a NumPy array's PyCapsule base object */
+  template <typename DATA_TYPE>
+  void free_track_array(PyObject* capsule) {
+    delete [] (DATA_TYPE*)PyCapsule_GetPointer(capsule, NULL);
+  }
+
+  /* Wraps a new C++ array as a read-only NumPy array which owns it */
+  template <typename DATA_TYPE>
+  PyObject* track_array_to_numpy(int num_dims, npy_intp* dims,
+                                 int typecode, DATA_TYPE* data) {
+
+    PyObject* array = PyArray_SimpleNewFromData(num_dims, dims, typecode,
+                                                (void*)data);
+    if (!array) {
+      delete [] data;
+      return NULL;
+    }
+
+    PyObject* capsule = PyCapsule_New((void*)data, NULL,
+                                      free_track_array<DATA_TYPE>);
+    if (!capsule) {
+      Py_DECREF(array);
+      delete [] data;
+      return NULL;
+    }
+
+    /* PyArray_SetBaseObject steals the reference to the capsule */
+    if (PyArray_SetBaseObject((PyArrayObject*)array, capsule) < 0) {
+      Py_DECREF(array);
+      return NULL;
+    }
+
+    PyArray_CLEARFLAGS((PyArrayObject*)array, NPY_ARRAY_WRITEABLE);
+    return array;
+  }
+
+%}
+
+%define %track_array_typemaps(DATA_TYPE, DATA_TYPECODE)
+
+%typemap(in,numinputs=0) (DATA_TYPE** TRACK_ARRAY1, int* DIM1)
+  (DATA_TYPE* data_temp = NULL, int dim_temp) {
+  $1 = &data_temp;
+  $2 = &dim_temp;
+}
+
+%typemap(argout) (DATA_TYPE** TRACK_ARRAY1, int* DIM1) {
+  npy_intp dims[1] = { *$2 };
+  PyObject* array = track_array_to_numpy<DATA_TYPE>(1, dims, DATA_TYPECODE,
+                                                    *$1);
+  if (!array) SWIG_fail;
+  $result = SWIG_Python_AppendOutput($result, array);
+}
+
+%typemap(in,numinputs=0) (DATA_TYPE** TRACK_ARRAY2, int* DIM1, int* DIM2)
+  (DATA_TYPE* data_temp = NULL, int dim1_temp, int dim2_temp) {
+  $1 = &data_temp;
+  $2 = &dim1_temp;
+  $3 = &dim2_temp;
+}
+
+%typemap(argout) (DATA_TYPE** TRACK_ARRAY2, int* DIM1, int* DIM2) {
+  npy_intp dims[2] = { *$2, *$3 };
+  PyObject* array = track_array_to_numpy<DATA_TYPE>(2, dims, DATA_TYPECODE,
+                                                    *$1);
+  if (!array) SWIG_fail;
+  $result = SWIG_Python_AppendOutput($result, array);
+}
+
+%enddef
+
+%track_array_typemaps(double, NPY_DOUBLE)
+%track_array_typemaps(int, NPY_INT)
+
+%apply (double** TRACK_ARRAY2, int* DIM1, int* DIM2) {(double** track_points, int* num_tracks, int* num_coords)}
+%apply (int** TRACK_ARRAY1, int* DIM1) {(int** azim_indices, int* num_tracks)}
+%apply (double** TRACK_ARRAY1, int* DIM1) {(double** segment_lengths, int* num_segments)}
+%apply (int** TRACK_ARRAY1, int* DIM1) {(int** segment_FSR_ids, int* num_segments)}
+%apply (int** TRACK_ARRAY1, int* DIM1) {(int** segment_material_ids, int* num_segments)}
+%apply (double** TRACK_ARRAY2, int* DIM1, int* DIM2) {(double** segment_points, int* num_segments, int* num_coords)}
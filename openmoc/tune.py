@@ -0,0 +1,292 @@
+##
+# @file tune.py
+# @package openmoc.tune
+# @brief The tune module provides an auto-tuner for the Solver subclass and
+#        runtime parameters of an OpenMOC simulation.
+# @details This module times a few transport sweeps of the actual problem
+#          with each candidate Solver subclass, number of OpenMP threads,
+#          exponential evaluation method and OpenMP schedule, and selects
+#          the fastest configuration. Each decision is cached in a JSON file
+#          keyed by a fingerprint of the machine and the size of the problem
+#          so that later runs of the same problem skip the timed sweeps.
+# @date October 19, 2026
+
+
+import sys
+
+## @var openmoc
+#  @brief The openmoc module in use in the Python script using the
+#         openmoc.tune module.
+openmoc = ''
+
+# Determine which OpenMOC module is being used
+if 'openmoc.gnu.double' in sys.modules:
+  openmoc = sys.modules['openmoc.gnu.double']
+elif 'openmoc.gnu.single' in sys.modules:
+  openmoc = sys.modules['openmoc.gnu.single']
+elif 'openmoc.intel.double' in sys.modules:
+  openmoc = sys.modules['openmoc.intel.double']
+elif 'openmoc.intel.single' in sys.modules:
+  openmoc = sys.modules['openmoc.intel.single']
+elif 'openmoc.bgq.double' in sys.modules:
+  openmoc = sys.modules['openmoc.bgq.double']
+elif 'openmoc.bgq.single' in sys.modules:
+  openmoc = sys.modules['openmoc.bgq.single']
+else:
+  import openmoc
+
+import hashlib
+import json
+import multiprocessing
+import os
+import platform
+
+# For Python 2.X.X
+if (sys.version_info[0] == 2):
+  from log import *
+# For Python 3.X.X
+else:
+  from openmoc.log import *
+
+
+## The Solver subclasses to consider, in order of preference for ties
+SOLVER_TYPES = ['ThreadPrivateSolver', 'VectorizedPrivateSolver',
+                'VectorizedSolver', 'CPUSolver']
+
+## The methods to evaluate the exponential in the transport equation
+EXPONENTIALS = ['interpolation', 'intrinsic']
+
+## The OpenMP schedules for the loop over Tracks in each transport sweep
+SCHEDULES = ['guided', 'static', 'dynamic']
+
+## The names of the logging levels in the order of the C++ logLevel enum
+LOG_LEVELS = ['DEBUG', 'INFO', 'NORMAL', 'SEPARATOR', 'HEADER', 'TITLE',
+              'WARNING', 'CRITICAL', 'RESULT', 'UNITTEST', 'ERROR']
+
+
+##
+# @brief Returns a fingerprint of the machine and OpenMOC build.
+# @details The fingerprint is a hash of the processor model, the number of
+#          processors, the operating system and architecture, and the name
+#          of the OpenMOC extension module, which identifies the compiler
+#          and floating point precision of the build.
+# @return a string with the hexadecimal machine fingerprint
+def get_machine_fingerprint():
+
+  processor = platform.processor()
+
+  # Use the processor model name from the Linux kernel if it is available
+  if os.path.exists('/proc/cpuinfo'):
+    with open('/proc/cpuinfo') as cpuinfo:
+      for line in cpuinfo:
+        if line.startswith('model name'):
+          processor = line.split(':', 1)[1].strip()
+          break
+
+  machine = [processor, str(multiprocessing.cpu_count()), platform.system(),
+             platform.machine(), openmoc.__name__]
+
+  return hashlib.md5('|'.join(machine).encode('utf-8')).hexdigest()
+
+
+##
+# @brief Returns a key describing a problem.
+# @details The key contains the hash of the Geometry and its Materials from
+#          Geometry::hash() so that problems of the same size with different
+#          Geometries or cross sections are tuned separately.
+# @param geometry a pointer to the Geometry
+# @param track_generator a pointer to the TrackGenerator with Tracks
+# @param cmfd an optional pointer to the Cmfd object
+# @return a string with the Geometry hash and the number of FSRs, groups,
+#         Tracks and segments
+def get_problem_key(geometry, track_generator, cmfd=None):
+
+  key = '%016x-%d-fsrs-%d-groups-%d-azim-%d-tracks-%d-segments' % \
+      (geometry.hash(), geometry.getNumFSRs(), geometry.getNumEnergyGroups(),
+       track_generator.getNumAzim(), track_generator.getNumTracks(),
+       track_generator.getNumSegments())
+
+  if cmfd is not None and cmfd.getMesh().getAcceleration():
+    key += '-cmfd'
+
+  return key
+
+
+##
+# @brief Creates a Solver for a configuration from the auto-tuner.
+# @param config a dictionary with the 'solver', 'num threads', 'exponential'
+#        and 'schedule' of the configuration
+# @param geometry a pointer to the Geometry
+# @param track_generator a pointer to the TrackGenerator with Tracks
+# @param cmfd an optional pointer to the Cmfd object
+# @return a pointer to the configured Solver
+def create_solver(config, geometry, track_generator, cmfd=None):
+
+  solver_type = getattr(openmoc, config['solver'])
+
+  if cmfd is None:
+    solver = solver_type(geometry, track_generator)
+  else:
+    solver = solver_type(geometry, track_generator, cmfd)
+
+  solver.setNumThreads(config['num threads'])
+  solver.setSchedule(config['schedule'])
+
+  if config['exponential'] == 'intrinsic':
+    solver.useExponentialIntrinsic()
+  else:
+    solver.useExponentialInterpolation()
+
+  return solver
+
+
+##
+# @brief Measures the time per transport sweep of a configuration.
+# @details The time of a single source iteration is subtracted from the time
+#          of num_sweeps+1 iterations to exclude the initialization of the
+#          Solver's data structures from the measurement.
+# @param config a dictionary with the configuration to time
+# @param geometry a pointer to the Geometry
+# @param track_generator a pointer to the TrackGenerator with Tracks
+# @param cmfd an optional pointer to the Cmfd object
+# @param num_sweeps the number of timed transport sweeps
+# @return the time per transport sweep in seconds
+def time_solver(config, geometry, track_generator, cmfd=None, num_sweeps=3):
+
+  solver = create_solver(config, geometry, track_generator, cmfd)
+
+  # Prevent the source from converging during the timed sweeps
+  solver.setSourceConvergenceThreshold(1E-30)
+
+  solver.convergeSource(1)
+  setup_time = solver.getTotalTime()
+  solver.convergeSource(num_sweeps+1)
+  total_time = solver.getTotalTime()
+
+  del solver
+
+  return max(total_time - setup_time, 0.) / num_sweeps
+
+
+##
+# @brief Finds the fastest Solver configuration for a problem.
+# @details The auto-tuner searches one parameter at a time, starting from
+#          the ThreadPrivateSolver with all available threads, the
+#          exponential interpolation table and guided scheduling. It first
+#          selects the Solver subclass, then the number of threads, the
+#          exponential evaluation method and the OpenMP schedule, keeping
+#          the fastest value of each parameter before moving to the next.
+#          Solver subclasses which are not in the OpenMOC build in use are
+#          skipped. The ThreadPrivateSolver sweeps a static partition of the
+#          Tracks, so the schedule is only tuned for the other subclasses.
+#          This routine may be called from a Python script as follows:
+#
+# @code
+#          config = tune.tune_solver(geometry, track_generator)
+#          solver = tune.create_solver(config, geometry, track_generator)
+#          solver.convergeSource(max_iters)
+# @endcode
+#
+# @param geometry a pointer to the Geometry
+# @param track_generator a pointer to the TrackGenerator with Tracks
+# @param cmfd an optional pointer to the Cmfd object
+# @param num_sweeps the number of timed transport sweeps per configuration
+# @param solver_types the names of the Solver subclasses to consider
+# @param thread_counts the numbers of threads to consider (default is the
+#        powers of two up to and including the number of processors)
+# @param cache_file the JSON file with the cached configurations, or None to
+#        always run the timed sweeps without caching the result
+# @return a dictionary with the 'solver', 'num threads', 'exponential',
+#         'schedule' and 'time per sweep' of the fastest configuration
+def tune_solver(geometry, track_generator, cmfd=None, num_sweeps=3,
+                solver_types=SOLVER_TYPES, thread_counts=None,
+                cache_file='tuning/solver-configs.json'):
+
+  fingerprint = get_machine_fingerprint()
+  problem_key = get_problem_key(geometry, track_generator, cmfd)
+
+  # Load the cached configurations
+  cache = {}
+  if cache_file is not None and os.path.exists(cache_file):
+    with open(cache_file, 'r') as f:
+      cache = json.load(f)
+
+  if problem_key in cache.get(fingerprint, {}):
+    config = cache[fingerprint][problem_key]
+    py_printf('NORMAL', 'Using the cached %s with %d threads for problem %s',
+              config['solver'], config['num threads'], problem_key)
+    return config
+
+  if thread_counts is None:
+    num_procs = multiprocessing.cpu_count()
+    thread_counts = [2**i for i in range(num_procs.bit_length())]
+    if num_procs not in thread_counts:
+      thread_counts.append(num_procs)
+
+  solver_types = [name for name in solver_types if hasattr(openmoc, name)]
+
+  if len(solver_types) == 0:
+    py_printf('ERROR', 'Unable to tune the Solver since none of the '
+              'Solver subclasses are in the OpenMOC build')
+
+  py_printf('NORMAL', 'Tuning the Solver for problem %s...', problem_key)
+
+  # Silence the source iteration messages during the timed sweeps and
+  # restore the log level even if a timed sweep raises an exception
+  log_level = LOG_LEVELS[openmoc.get_log_level()]
+  set_log_level('ERROR')
+
+  try:
+    config = {'solver': solver_types[0], 'num threads': max(thread_counts),
+              'exponential': 'interpolation', 'schedule': 'guided'}
+    timings = {}
+
+    # Searches the values of one parameter and keeps the fastest
+    def search(parameter, values):
+      best_time = None
+      best_value = config[parameter]
+
+      for value in values:
+        config[parameter] = value
+        key = json.dumps(config, sort_keys=True)
+
+        if key not in timings:
+          timings[key] = time_solver(config, geometry, track_generator,
+                                     cmfd, num_sweeps)
+
+        if best_time is None or timings[key] < best_time:
+          best_time = timings[key]
+          best_value = value
+
+      config[parameter] = best_value
+      return best_time
+
+    search('solver', solver_types)
+    search('num threads', thread_counts)
+    sweep_time = search('exponential', EXPONENTIALS)
+
+    if config['solver'] != 'ThreadPrivateSolver':
+      sweep_time = search('schedule', SCHEDULES)
+
+    config['time per sweep'] = sweep_time
+
+  finally:
+    set_log_level(log_level)
+
+  py_printf('NORMAL', 'Selected the %s with %d threads, exponential %s and '
+            '%s schedule (%1.4E sec per sweep)', config['solver'],
+            config['num threads'], config['exponential'], config['schedule'],
+            sweep_time)
+
+  # Cache the configuration for later runs of this problem
+  if cache_file is not None:
+    directory = os.path.dirname(cache_file)
+    if directory != '' and not os.path.exists(directory):
+      os.makedirs(directory)
+
+    cache.setdefault(fingerprint, {})[problem_key] = config
+
+    with open(cache_file, 'w') as f:
+      json.dump(cache, f, indent=2, sort_keys=True)
+
+  return config
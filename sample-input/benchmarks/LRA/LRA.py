@@ -2,12 +2,20 @@ from openmoc import *
 import openmoc.log as log
 import openmoc.plotter as plotter
 import openmoc.materialize as materialize
+from openmoc.options import Options
 
 
 ###############################################################################
 #######################   Main Simulation Parameters   ########################
 ###############################################################################
 
+options = Options()
+
+num_threads = options.getNumThreads()
+matrix_free = options.getCmfdMatrixFree()
+adaptive = options.getCmfdAdaptive()
+multilevel = options.getCmfdMultilevel()
+
 log.set_log_level('INFO')
 
 ###############################################################################
@@ -193,16 +201,44 @@ geometry.addLattice(core)
 geometry.initializeFlatSourceRegions()
 
 ###############################################################################
-########################   Creating the Cmfd module   #########################
+#######################   Creating the Diffusion Solver   #####################
 ###############################################################################
 
-log.py_printf('NORMAL', 'Creating cmfd...')
+log.py_printf('NORMAL', 'Creating diffusion solver...')
+
+solver = DiffusionSolver(geometry)
+solver.getCmfd().setMatrixFree(matrix_free)
+solver.setAdaptive(adaptive)
+
+# The DiffusionSolver uses multilevel acceleration by default
+if multilevel:
+  solver.setMultilevel(multilevel)
+
+solver.computeKeff()
+
+log.py_printf('NORMAL', 'k_eff = %f', solver.getKeff())
+
+
+###############################################################################
+###########################   Parameter Study   ###############################
+###############################################################################
+
+log.py_printf('NORMAL', 'Perturbing the region 1 thermal absorption...')
+
+# The region 1 thermal absorption cross-section, including the buckling
+region = materials['region_1'].clone()
+sigma_a = region.getSigmaAByGroup(1)
+
+for perturbation in [-0.02, -0.01, 0.01, 0.02]:
+  case = solver.addCase()
+  region.setSigmaAByGroup(sigma_a * (1. + perturbation), 1)
+  solver.updateCaseMaterial(case, region)
 
-cmfd = Cmfd(geometry)
-cmfd.setOmega(1.5)
-cmfd.computeKeff()
+solver.setNumThreads(num_threads)
+solver.computeCases()
 
-log.py_printf('NORMAL', 'k_eff = %f', cmfd.getKeff())
+for case in range(solver.getNumCases()):
+  log.py_printf('NORMAL', 'case %d: k_eff = %f', case, solver.getCaseKeff(case))
 
 ###############################################################################
 ############################   Generating Plots   #############################
@@ -19,6 +19,9 @@ max_iters = options.getMaxIterations()
 relax_factor = options.getCmfdRelaxationFactor()
 acceleration = options.getCmfdAcceleration()
 mesh_level = options.getCmfdMeshLevel()
+matrix_free = options.getCmfdMatrixFree()
+adaptive = options.getCmfdAdaptive()
+multilevel = options.getCmfdMultilevel()
 
 log.set_log_level('NORMAL')
 
@@ -346,6 +349,9 @@ log.py_printf('NORMAL', 'Creating cmfd module...')
 cmfd = Cmfd(geometry)
 cmfd.setOmega(1.50)
 cmfd.createGroupStructure([0,3,7])
+cmfd.setMatrixFree(matrix_free)
+cmfd.setAdaptive(adaptive)
+cmfd.setMultilevel(multilevel)
 
 ###############################################################################
 ########################   Creating the TrackGenerator   ######################
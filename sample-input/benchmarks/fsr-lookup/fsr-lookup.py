@@ -0,0 +1,155 @@
+import time
+import numpy
+from openmoc import *
+import openmoc.log as log
+import openmoc.materialize as materialize
+from openmoc.options import Options
+
+
+###############################################################################
+#######################   Main Simulation Parameters   ########################
+###############################################################################
+
+options = Options()
+
+track_spacing = options.getTrackSpacing()
+num_azim = options.getNumAzimAngles()
+
+num_points = 1000000
+num_repeats = 5
+
+log.set_log_level('NORMAL')
+
+log.py_printf('TITLE', 'FSR lookup microbenchmark')
+
+
+###############################################################################
+###########################   Creating Materials   ############################
+###############################################################################
+
+log.py_printf('NORMAL', 'Importing materials data from HDF5...')
+
+materials = materialize.materialize('../../c5g7-materials.h5')
+
+uo2_id = materials['UO2'].getId()
+water_id = materials['Water'].getId()
+
+
+###############################################################################
+###########################   Creating Surfaces   #############################
+###############################################################################
+
+log.py_printf('NORMAL', 'Creating surfaces...')
+
+planes = []
+planes.append(XPlane(x=-32.13))
+planes.append(XPlane(x=32.13))
+planes.append(YPlane(y=-32.13))
+planes.append(YPlane(y=32.13))
+circle = Circle(x=0.0, y=0.0, radius=0.54)
+for plane in planes: plane.setBoundaryType(REFLECTIVE)
+
+
+###############################################################################
+#############################   Creating Cells   ##############################
+###############################################################################
+
+log.py_printf('NORMAL', 'Creating cells...')
+
+cells = []
+cells.append(CellBasic(universe=1, material=uo2_id, rings=3, sectors=8))
+cells.append(CellBasic(universe=1, material=water_id, sectors=8))
+cells.append(CellFill(universe=2, universe_fill=3))
+cells.append(CellFill(universe=0, universe_fill=4))
+
+cells[0].addSurface(halfspace=-1, surface=circle)
+cells[1].addSurface(halfspace=+1, surface=circle)
+
+cells[3].addSurface(halfspace=+1, surface=planes[0])
+cells[3].addSurface(halfspace=-1, surface=planes[1])
+cells[3].addSurface(halfspace=+1, surface=planes[2])
+cells[3].addSurface(halfspace=-1, surface=planes[3])
+
+
+###############################################################################
+###########################   Creating Lattices   #############################
+###############################################################################
+
+log.py_printf('NORMAL', 'Creating 3 x 3 core of 17 x 17 assemblies...')
+
+# 17x17 assembly
+assembly = Lattice(id=3, width_x=1.26, width_y=1.26)
+assembly.setLatticeCells([[1] * 17] * 17)
+
+# 3x3 core
+core = Lattice(id=4, width_x=21.42, width_y=21.42)
+core.setLatticeCells([[2] * 3] * 3)
+
+
+###############################################################################
+##########################   Creating the Geometry   ##########################
+###############################################################################
+
+log.py_printf('NORMAL', 'Creating geometry...')
+
+geometry = Geometry()
+for material in materials.values(): geometry.addMaterial(material)
+for cell in cells: geometry.addCell(cell)
+geometry.addLattice(assembly)
+geometry.addLattice(core)
+
+geometry.initializeFlatSourceRegions()
+
+
+###############################################################################
+##########################   Timing Point Lookups   ###########################
+###############################################################################
+
+log.py_printf('NORMAL', 'Timing lookups for %d random points...', num_points)
+
+numpy.random.seed(1)
+x = numpy.random.uniform(geometry.getXMin(), geometry.getXMax(), num_points)
+y = numpy.random.uniform(geometry.getYMin(), geometry.getYMax(), num_points)
+
+# The Cell lookup locates each point in the nested Universes, while the FSR
+# lookup additionally maps the located coordinates to an FSR ID
+cell_time = float('inf')
+fsr_time = float('inf')
+
+for i in range(num_repeats):
+  start = time.time()
+  geometry.findCellIds(x, y, num_points)
+  cell_time = min(cell_time, time.time() - start)
+
+  start = time.time()
+  geometry.findFSRIds(x, y, num_points)
+  fsr_time = min(fsr_time, time.time() - start)
+
+log.py_printf('RESULT', 'Cell lookup: %f ns / point',
+              cell_time / num_points * 1E9)
+log.py_printf('RESULT', 'FSR lookup: %f ns / point',
+              fsr_time / num_points * 1E9)
+log.py_printf('RESULT', 'FSR ID computation: %f ns / point',
+              (fsr_time - cell_time) / num_points * 1E9)
+
+
+###############################################################################
+#########################   Timing Track Segmentation   #######################
+###############################################################################
+
+log.py_printf('NORMAL', 'Timing track segmentation...')
+
+track_generator = TrackGenerator(geometry, num_azim, track_spacing)
+
+start = time.time()
+track_generator.generateTracks()
+segment_time = time.time() - start
+
+num_segments = track_generator.getNumSegments()
+
+log.py_printf('RESULT', 'Segmentation: %d segments in %f seconds',
+              num_segments, segment_time)
+log.py_printf('RESULT', 'Segmentation: %f ns / segment',
+              segment_time / num_segments * 1E9)
+
+log.py_printf('TITLE', 'Finished')
@@ -0,0 +1,398 @@
+##
+# @file run-benchmarks.py
+# @brief Runs the OpenMOC performance benchmark suite over the sample inputs.
+# @details This script runs each benchmark input in a separate Python process
+#          for each number of OpenMP threads and times the phases of the
+#          simulation separately: Track generation, Track file I/O, each
+#          phase of the source iterations (such as the transport sweep and
+#          CMFD) and post-processing. The fastest time of each phase over a
+#          number of repeats is exported to a JSON file, which may be
+#          compared against a stored baseline. The script exits with
+#          a nonzero status if any phase is slower than the baseline by more
+#          than the regression threshold. An example of how this might be
+#          used to benchmark a change to OpenMOC is as follows:
+#
+# @code
+#          python run-benchmarks.py --threads=1,4 --output=baseline.json
+#          ... rebuild OpenMOC with the change ...
+#          python run-benchmarks.py --threads=1,4 --baseline=baseline.json
+# @endcode
+#
+# @date October 19, 2026
+
+import getopt
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+## The directory with the sample inputs
+SAMPLE_INPUT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+## The benchmark inputs, relative to the sample input directory
+BENCHMARKS = {
+  'c5g7': 'benchmarks/c5g7/c5g7.py',
+  'c5g7-cmfd': 'benchmarks/c5g7/c5g7-cmfd.py',
+  'LRA': 'benchmarks/LRA/LRA.py',
+  'romano': 'benchmarks/romano/romano.py',
+  'homogeneous-one-group':
+    'benchmarks/homogeneous-one-group/homogeneous-one-group.py',
+  'homogeneous-two-group':
+    'benchmarks/homogeneous-two-group/homogeneous-two-groups.py',
+  'pin-cell': 'pin-cell/pin-cell.py',
+  'tiny-lattice': 'tiny-lattice/tiny-lattice.py',
+  'simple-lattice': 'simple-lattice/simple-lattice.py',
+  'nested-lattice': 'nested-lattice/nested-lattice.py',
+  'large-lattice': 'large-lattice/large-lattice.py',
+  'bundled-lattice': 'bundled-lattice/bundled-lattice.py'
+}
+
+## The phases timed by wrapping a method of an OpenMOC class
+TIMED_METHODS = [('TrackGenerator', 'generateTracks', 'track generation'),
+                 ('DiffusionSolver', 'computeKeff', 'diffusion eigenvalue'),
+                 ('DiffusionSolver', 'computeCases', 'diffusion cases')]
+
+## Phases faster than this (seconds) are too noisy to flag as regressions
+MIN_TIME = 1E-3
+
+
+##
+# @brief Wraps a method of an OpenMOC class to accumulate its runtime.
+# @param cls the OpenMOC class
+# @param method the name of the method
+# @param phase the name of the phase to accumulate the runtime into
+# @param timings the dictionary of the runtime of each phase
+# @return the original method, to restore it once the phase is timed
+def time_method(cls, method, phase, timings):
+
+  original = getattr(cls, method)
+
+  def timed(*args, **kwargs):
+    start = time.time()
+    result = original(*args, **kwargs)
+    timings[phase] = timings.get(phase, 0.) + time.time() - start
+    return result
+
+  setattr(cls, method, timed)
+  return original
+
+
+##
+# @brief Runs a benchmark input and exports the time of each phase.
+# @details This routine is run in a separate Python process for each
+#          benchmark so that each run starts from an empty Track file
+#          directory and does not share state with other runs.
+# @param script the path to the benchmark input
+# @param filename the JSON file to export the timings to
+# @param args the command line options for the benchmark input
+def run_worker(script, filename, args):
+
+  import openmoc
+  import openmoc.process as process
+
+  timings = {}
+  results = {}
+  originals = []
+
+  for cls, method, phase in TIMED_METHODS:
+    if hasattr(openmoc, cls):
+      original = time_method(getattr(openmoc, cls), method, phase, timings)
+      originals.append((getattr(openmoc, cls), method, original))
+
+  # Store the Track files and output of this run in an empty directory
+  output_dir = tempfile.mkdtemp()
+  openmoc.set_output_directory(os.path.join(output_dir, 'openmoc'))
+
+  os.chdir(os.path.dirname(script))
+  sys.argv = [script] + args
+
+  start = time.time()
+  with open(script) as f:
+    script_globals = {'__name__': '__main__', '__file__': script}
+    exec(compile(f.read(), script, 'exec'), script_globals)
+  timings['total'] = time.time() - start
+
+  # Restore the timed methods so that the Track file I/O below is not
+  # also counted as Track generation
+  for cls, method, original in originals:
+    setattr(cls, method, original)
+
+  geometry = script_globals.get('geometry')
+  track_generator = script_globals.get('track_generator')
+  solver = script_globals.get('solver')
+
+  # Time reading the Tracks back from the Track file
+  if track_generator is not None and track_generator.containsTracks():
+    start = time.time()
+    track_file_generator = \
+        openmoc.TrackGenerator(geometry, track_generator.getNumAzim(),
+                               track_generator.getTrackSpacing())
+    track_file_generator.generateTracks()
+    timings['track file I/O'] = time.time() - start
+
+  if isinstance(solver, openmoc.Solver) and solver.getNumIterations() > 0:
+    num_iters = solver.getNumIterations()
+    results['keff'] = float(solver.getKeff())
+    results['iterations'] = num_iters
+
+    timings['source iteration'] = solver.getTotalTime() / num_iters
+
+    start = time.time()
+    process.compute_pin_powers(solver, use_hdf5=False)
+    timings['post-processing'] = time.time() - start
+
+  elif isinstance(solver, openmoc.DiffusionSolver):
+    results['keff'] = float(solver.getKeff())
+
+  # Time in each phase of the source iterations and CMFD solver
+  for phase, timing in process.get_timer_phases().items():
+    timings[phase] = timing['time']
+
+  shutil.rmtree(output_dir, ignore_errors=True)
+
+  results['timings'] = timings
+
+  with open(filename, 'w') as f:
+    json.dump(results, f)
+
+
+##
+# @brief Runs a benchmark input in a separate Python process.
+# @param name the name of the benchmark
+# @param num_threads the number of OpenMP threads
+# @param args the additional command line options for the benchmark input
+# @return a dictionary with the timings of the run, or None if it failed
+def run_benchmark(name, num_threads, args):
+
+  script = os.path.join(SAMPLE_INPUT, BENCHMARKS[name])
+  handle, filename = tempfile.mkstemp(suffix='.json')
+  os.close(handle)
+
+  command = [sys.executable, os.path.abspath(__file__), '--worker',
+             script, filename, '-t', str(num_threads)] + args
+
+  with open(os.devnull, 'w') as devnull:
+    status = subprocess.call(command, stdout=devnull)
+
+  results = None
+  if status == 0:
+    with open(filename) as f:
+      results = json.load(f)
+
+  os.remove(filename)
+  return results
+
+
+##
+# @brief Returns a description of the machine and OpenMOC revision.
+# @return a dictionary describing the benchmark environment
+def get_environment():
+
+  environment = {'machine': platform.machine(),
+                 'processor': platform.processor(),
+                 'system': platform.platform(),
+                 'python': platform.python_version()}
+
+  try:
+    import multiprocessing
+    environment['num processors'] = multiprocessing.cpu_count()
+  except NotImplementedError:
+    pass
+
+  try:
+    environment['revision'] = subprocess.check_output(
+        ['git', 'rev-parse', 'HEAD'], cwd=SAMPLE_INPUT,
+        stderr=subprocess.STDOUT).decode('utf-8').strip()
+  except (OSError, subprocess.CalledProcessError):
+    pass
+
+  return environment
+
+
+##
+# @brief Compares benchmark timings against a baseline.
+# @param timings the benchmark timings
+# @param baseline the baseline benchmark timings
+# @param threshold the relative slowdown above which a phase is a regression
+# @return the number of regressions
+def compare(timings, baseline, threshold):
+
+  num_regressions = 0
+
+  print('{:<24}{:>8}{:<24}{:>12}{:>12}{:>9}'.format(
+      'Benchmark', 'Threads', '  Phase', 'Baseline', 'Current', 'Ratio'))
+
+  for name in sorted(timings):
+    for num_threads in sorted(timings[name], key=int):
+
+      if num_threads not in baseline.get(name, {}):
+        continue
+
+      current = timings[name][num_threads]
+      reference = baseline[name][num_threads]
+
+      for phase in sorted(current):
+        if phase not in reference or reference[phase] < MIN_TIME:
+          continue
+
+        ratio = current[phase] / reference[phase]
+        flag = ''
+
+        if ratio > 1. + threshold:
+          flag = '  REGRESSION'
+          num_regressions += 1
+
+        print('{:<24}{:>8}  {:<22}{:>12.4E}{:>12.4E}{:>9.3f}{}'.format(
+            name, num_threads, phase, reference[phase], current[phase],
+            ratio, flag))
+
+  return num_regressions
+
+
+##
+# @brief Prints the command line options for the benchmark runner.
+def print_help():
+  print('Usage: python run-benchmarks.py [options]\n')
+  print('\t{: <35}{}'.format('--benchmarks=<all>',
+                             'Comma-separated benchmarks to run'))
+  print('\t{: <35}{}'.format('--threads=<1>',
+                             'Comma-separated numbers of OpenMP threads'))
+  print('\t{: <35}{}'.format('--repeats=<3>',
+                             'The number of runs of each benchmark'))
+  print('\t{: <35}{}'.format('--max-iters=<1000>',
+                             'The max number of source iterations'))
+  print('\t{: <35}{}'.format('--output=<benchmarks.json>',
+                             'The JSON file for the timings'))
+  print('\t{: <35}{}'.format('--baseline=<None>',
+                             'A JSON file of timings to compare against'))
+  print('\t{: <35}{}'.format('--threshold=<0.1>',
+                             'The relative slowdown flagged as a regression'))
+  print('\nBenchmarks: ' + ', '.join(sorted(BENCHMARKS)))
+
+
+def main():
+
+  if len(sys.argv) > 3 and sys.argv[1] == '--worker':
+    run_worker(sys.argv[2], sys.argv[3], sys.argv[4:])
+    return 0
+
+  benchmarks = sorted(BENCHMARKS)
+  thread_counts = [1]
+  num_repeats = 3
+  max_iters = None
+  output = 'benchmarks.json'
+  baseline = None
+  threshold = 0.1
+
+  try:
+    opts, args = getopt.getopt(sys.argv[1:], 'h',
+                               ['help', 'benchmarks=', 'threads=', 'repeats=',
+                                'max-iters=', 'output=', 'baseline=',
+                                'threshold='])
+  except getopt.GetoptError as err:
+    print(str(err))
+    print_help()
+    return 2
+
+  for opt, arg in opts:
+    if opt in ('-h', '--help'):
+      print_help()
+      return 0
+    elif opt == '--benchmarks':
+      benchmarks = arg.split(',')
+    elif opt == '--threads':
+      thread_counts = [int(num_threads) for num_threads in arg.split(',')]
+    elif opt == '--repeats':
+      num_repeats = int(arg)
+    elif opt == '--max-iters':
+      max_iters = int(arg)
+    elif opt == '--output':
+      output = arg
+    elif opt == '--baseline':
+      baseline = arg
+    elif opt == '--threshold':
+      threshold = float(arg)
+
+  for name in benchmarks:
+    if name not in BENCHMARKS:
+      print('Unknown benchmark %s' % name)
+      print_help()
+      return 2
+
+  args = []
+  if max_iters is not None:
+    args += ['-i', str(max_iters)]
+
+  timings = {}
+  results = {}
+  failures = []
+
+  for name in benchmarks:
+    timings[name] = {}
+    results[name] = {}
+
+    for num_threads in thread_counts:
+      best = None
+
+      for repeat in range(num_repeats):
+        print('Running %s with %d threads (%d of %d)...' %
+              (name, num_threads, repeat+1, num_repeats))
+
+        run = run_benchmark(name, num_threads, args)
+
+        if run is None:
+          failures.append('%s with %d threads' % (name, num_threads))
+          best = None
+          break
+
+        # Keep the fastest time of each phase over the repeats
+        if best is None:
+          best = run
+        else:
+          for phase, phase_time in run['timings'].items():
+            best['timings'][phase] = min(best['timings'].get(phase,
+                                                             phase_time),
+                                         phase_time)
+
+      if best is not None:
+        timings[name][str(num_threads)] = best.pop('timings')
+        results[name][str(num_threads)] = best
+
+  report = {'environment': get_environment(),
+            'options': {'repeats': num_repeats, 'max iters': max_iters},
+            'timings': timings,
+            'results': results}
+
+  with open(output, 'w') as f:
+    json.dump(report, f, indent=2, sort_keys=True)
+
+  print('Exported the benchmark timings to %s' % output)
+
+  for failure in failures:
+    print('FAILED: %s' % failure)
+
+  status = 0
+  if len(failures) > 0:
+    status = 1
+
+  if baseline is not None:
+    with open(baseline) as f:
+      reference = json.load(f)
+
+    num_regressions = compare(timings, reference['timings'], threshold)
+
+    if num_regressions > 0:
+      print('%d phases are more than %d%% slower than the baseline' %
+            (num_regressions, int(threshold * 100)))
+      status = 1
+
+  return status
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -15,6 +15,7 @@ CPUSolver::CPUSolver(Geometry* geometry, TrackGenerator* track_generator,
                      Cmfd* cmfd) : Solver(geometry, track_generator, cmfd) {
 
   setNumThreads(1);
+  _schedule = omp_sched_guided;
 
   _FSR_locks = NULL;
   _mesh_surface_locks = NULL;
@@ -52,6 +53,22 @@ int CPUSolver::getNumThreads() {
 }
 
 
+/**
+ * @brief Returns the OpenMP schedule for the loop over Tracks in each
+ *        transport sweep.
+ * @return the name of the OpenMP schedule
+ */
+const char* CPUSolver::getSchedule() {
+
+  if (_schedule == omp_sched_static)
+    return "static";
+  else if (_schedule == omp_sched_dynamic)
+    return "dynamic";
+  else
+    return "guided";
+}
+
+
 /**
  * @brief Returns the scalar flux for some FSR and energy group.
  * @param fsr_id the ID for the FSR of interest
@@ -166,6 +183,30 @@ void CPUSolver::setNumThreads(int num_threads) {
 }
 
 
+/**
+ * @brief Sets the OpenMP schedule for the loop over Tracks in each
+ *        transport sweep.
+ * @details The schedule may be "static", "dynamic" or "guided" (default).
+ *          Guided scheduling balances Tracks with very different numbers
+ *          of segments, while static scheduling has the lowest overhead
+ *          for uniform lattices. The ThreadPrivateSolver sweeps a static
+ *          partition of the Tracks and does not use the schedule.
+ * @param schedule the name of the OpenMP schedule
+ */
+void CPUSolver::setSchedule(const char* schedule) {
+
+  if (strcmp("static", schedule) == 0)
+    _schedule = omp_sched_static;
+  else if (strcmp("dynamic", schedule) == 0)
+    _schedule = omp_sched_dynamic;
+  else if (strcmp("guided", schedule) == 0)
+    _schedule = omp_sched_guided;
+  else
+    log_printf(ERROR, "Unable to set the Solver's OpenMP schedule to %s "
+               "since it is not static, dynamic or guided", schedule);
+}
+
+
 /**
  * @brief Allocates memory for Track boundary angular flux and leakage
  *        and FSR scalar flux arrays.
@@ -772,6 +813,9 @@ void CPUSolver::transportSweep() {
   if (_cmfd->getMesh()->getCmfdOn())
     zeroSurfaceCurrents();
 
+  /* Set the OpenMP schedule for the loop over Tracks */
+  omp_set_schedule(_schedule, 0);
+
   /* Loop over azimuthal angle halfspaces */
   for (int i=0; i < 2; i++) {
 
@@ -782,7 +826,7 @@ void CPUSolver::transportSweep() {
 
     /* Loop over each thread within this azimuthal angle halfspace */
     #pragma omp parallel for private(curr_track, azim_index, num_segments, \
-      curr_segment, segments, track_flux, tid) schedule(guided)
+      curr_segment, segments, track_flux, tid) schedule(runtime)
     for (int track_id=min_track; track_id < max_track; track_id++) {
 
       tid = omp_get_thread_num();
@@ -51,6 +51,9 @@ protected:
   /** The number of shared memory OpenMP threads */
   int _num_threads;
 
+  /** The OpenMP schedule for the loop over Tracks in each transport sweep */
+  omp_sched_t _schedule;
+
   /** OpenMP mutual exclusion locks for atomic FSR scalar flux updates */
   omp_lock_t* _FSR_locks;
 
@@ -121,12 +124,14 @@ public:
   virtual ~CPUSolver();
 
   int getNumThreads();
+  const char* getSchedule();
   FP_PRECISION getFSRScalarFlux(int fsr_id, int energy_group);
   FP_PRECISION* getFSRScalarFluxes();
   FP_PRECISION getFSRSource(int fsr_id, int energy_group);
   double* getSurfaceCurrents();
 
   void setNumThreads(int num_threads);
+  void setSchedule(const char* schedule);
 
   void computeFSRFissionRates(double* fission_rates, int num_FSRs);
 
@@ -3,6 +3,8 @@
 
 int Cell::_n = 0;
 
+int CellBasic::_num_material_changes = 0;
+
 static int auto_id = 10000;
 
 
@@ -26,6 +28,7 @@ int cell_id() {
  * @brief Default constructor used in rings/sectors subdivision of Cells.
  */
 Cell::Cell() {
+  initializeBoundingBox();
 }
 
 
@@ -52,6 +55,8 @@ Cell::Cell(int universe, int id) {
   _uid = _n;
   _n++;
   _universe = universe;
+
+  initializeBoundingBox();
 }
 
 
@@ -118,6 +123,44 @@ std::map<Surface*, int> Cell::getSurfaces() const {
 }
 
 
+/**
+ * @brief Return the minimum x-coordinate of the Cell's bounding box.
+ * @details The bounding box is -INFINITY along any direction in which the
+ *          Cell's Surfaces do not bound it.
+ * @return the minimum x-coordinate of the bounding box
+ */
+double Cell::getMinX() const {
+  return _min_x;
+}
+
+
+/**
+ * @brief Return the maximum x-coordinate of the Cell's bounding box.
+ * @return the maximum x-coordinate of the bounding box
+ */
+double Cell::getMaxX() const {
+  return _max_x;
+}
+
+
+/**
+ * @brief Return the minimum y-coordinate of the Cell's bounding box.
+ * @return the minimum y-coordinate of the bounding box
+ */
+double Cell::getMinY() const {
+  return _min_y;
+}
+
+
+/**
+ * @brief Return the maximum y-coordinate of the Cell's bounding box.
+ * @return the maximum y-coordinate of the bounding box
+ */
+double Cell::getMaxY() const {
+  return _max_y;
+}
+
+
 /**
  * @brief Set the ID for the Universe within which this Cell resides.
  * @param universe the Universe's user-specified ID
@@ -138,7 +181,92 @@ void Cell::addSurface(int halfspace, Surface* surface) {
     log_printf(ERROR, "Unable to add surface %d to cell %d since the halfspace"
                " %d is not -1 or 1", surface->getId(), _id, halfspace);
 
-  _surfaces.insert(std::pair<Surface*, int>(surface, halfspace));
+  /* Do not add the same Surface twice */
+  if (!_surfaces.insert(std::pair<Surface*, int>(surface, halfspace)).second)
+    return;
+
+  /* Tighten the bounding box with axis-aligned Planes - the Point is in
+   * the Cell if halfspace * (A * x + B * y + C) >= 0 */
+  if (surface->getSurfaceType() != CIRCLE &&
+      surface->getSurfaceType() != QUADRATIC) {
+
+    Plane* plane = static_cast<Plane*>(surface);
+
+    /* Store the Plane's coefficients for Cell::minSurfaceDist(...) */
+    _plane_coeffs.push_back(plane->getA());
+    _plane_coeffs.push_back(plane->getB());
+    _plane_coeffs.push_back(plane->getC());
+    _planes.push_back(surface);
+
+    double A = plane->getA() * halfspace;
+    double B = plane->getB() * halfspace;
+    double C = plane->getC() * halfspace;
+
+    if (B == 0. && A > 0.)
+      _min_x = std::max(_min_x, -C / A);
+    else if (B == 0. && A < 0.)
+      _max_x = std::min(_max_x, -C / A);
+    else if (A == 0. && B > 0.)
+      _min_y = std::max(_min_y, -C / B);
+    else if (A == 0. && B < 0.)
+      _max_y = std::min(_max_y, -C / B);
+  }
+
+  else if (surface->getSurfaceType() == CIRCLE) {
+    Circle* circle = static_cast<Circle*>(surface);
+
+    /* Store the Circle's coefficients for Cell::minSurfaceDist(...) */
+    _circle_coeffs.push_back(circle->getX0());
+    _circle_coeffs.push_back(circle->getY0());
+    _circle_coeffs.push_back(circle->getRadius() * circle->getRadius());
+    _circles.push_back(surface);
+
+    /* Tighten the bounding box with the interior of a Circle */
+    if (halfspace == -1) {
+      _min_x = std::max(_min_x, circle->getX0() - circle->getRadius());
+      _max_x = std::min(_max_x, circle->getX0() + circle->getRadius());
+      _min_y = std::max(_min_y, circle->getY0() - circle->getRadius());
+      _max_y = std::min(_max_y, circle->getY0() + circle->getRadius());
+    }
+  }
+
+  else
+    _other_surfaces.push_back(surface);
+}
+
+
+/**
+ * @brief Adds a Cell in the same Universe across one of this Cell's Surfaces.
+ * @details This method is called by Geometry::initializeCellNeighbors() to
+ *          build the lists of neighboring Cells used when a Track crosses
+ *          a Surface during ray tracing.
+ * @param surface a pointer to a Surface bounding this Cell
+ * @param cell a pointer to the Cell across the Surface
+ */
+void Cell::addNeighborCell(Surface* surface, Cell* cell) {
+  _neighbors[surface].push_back(cell);
+}
+
+
+/**
+ * @brief Removes all neighboring Cells from this Cell.
+ */
+void Cell::clearNeighborCells() {
+  _neighbors.clear();
+}
+
+
+/**
+ * @brief Initializes the Cell's bounding box to all of the xy-plane.
+ * @details The bounding box is tightened each time a Surface is added to
+ *          the Cell and is used by the Universe to bin its Cells into a
+ *          uniform search grid.
+ */
+void Cell::initializeBoundingBox() {
+  _min_x = -std::numeric_limits<double>::infinity();
+  _max_x = std::numeric_limits<double>::infinity();
+  _min_y = -std::numeric_limits<double>::infinity();
+  _max_y = std::numeric_limits<double>::infinity();
 }
 
 
@@ -177,38 +305,131 @@ bool Cell::cellContainsCoords(LocalCoords* coords) {
 }
 
 
+/**
+ * @brief Finds the neighboring Cell across a Surface containing a LocalCoords.
+ * @details Only the Cells which were registered across the Surface with
+ *          Cell::addNeighborCell(...) are tested. Returns NULL if none of
+ *          them contains the LocalCoords.
+ * @param surface a pointer to the Surface crossed from this Cell
+ * @param coords a pointer to the LocalCoords across the Surface
+ * @return a pointer to the neighboring Cell or NULL if it was not found
+ */
+Cell* Cell::findNeighborCell(Surface* surface, LocalCoords* coords) {
+
+  std::map<Surface*, std::vector<Cell*> >::iterator iter;
+  iter = _neighbors.find(surface);
+
+  if (iter == _neighbors.end())
+    return NULL;
+
+  /* Loop over all Cells across the Surface */
+  std::vector<Cell*>::iterator iter2;
+  for (iter2 = iter->second.begin(); iter2 != iter->second.end(); ++iter2) {
+    if ((*iter2)->cellContainsCoords(coords))
+      return *iter2;
+  }
+
+  return NULL;
+}
+
+
 /**
  * @brief Computes the minimum distance to a Surface from a Point with a given
  *        trajectory at a certain angle.
  * @details If the trajectory will not intersect any of the Surfaces in the
- *          Cell returns INFINITY.
+ *          Cell returns INFINITY. The distances to the Planes and Circles
+ *          bounding the Cell are computed from the arrays of their
+ *          coefficients stored by Cell::addSurface(...) in a single pass
+ *          over each type of Surface, without virtual calls to
+ *          Surface::intersection(...). The distance along the trajectory
+ *          with direction \f$ (\cos\phi, \sin\phi) \f$ is the smallest
+ *          positive root \f$ t \f$ of each Surface's potential equation
+ *          evaluated at \f$ (x_0 + t\cos\phi, y_0 + t\sin\phi) \f$.
  * @param point the Point of interest
  * @param angle the angle of the trajectory (in radians from \f$[0,2\pi]\f$)
  * @param min_intersection a pointer to the intersection Point that is found
+ * @param min_surface an optional pointer to store the Surface intersected
  */
 double Cell::minSurfaceDist(Point* point, double angle,
-                            Point* min_intersection) {
+                            Point* min_intersection, Surface** min_surface) {
 
+  double x0 = point->getX();
+  double y0 = point->getY();
+  double cos_phi = cos(angle);
+  double sin_phi = sin(angle);
   double min_dist = INFINITY;
-  double d;
-  Point intersection;
+  Surface* surface = NULL;
+
+  int num_planes = _planes.size();
+  int num_circles = _circles.size();
+  const double* plane_coeffs = num_planes > 0 ? &_plane_coeffs[0] : NULL;
+  const double* circle_coeffs = num_circles > 0 ? &_circle_coeffs[0] : NULL;
+
+  /* Loop over all of the Cell's Planes: A(x0 + t cos) + B(y0 + t sin) + C
+   * is zero at t = -(A x0 + B y0 + C) / (A cos + B sin) */
+  for (int i=0; i < num_planes; i++) {
+    double A = plane_coeffs[3*i];
+    double B = plane_coeffs[3*i+1];
+    double C = plane_coeffs[3*i+2];
+    double denom = A * cos_phi + B * sin_phi;
+    double d = -(A * x0 + B * y0 + C) / denom;
+
+    /* Ignore Planes parallel to or behind the trajectory */
+    if (fabs(denom) > PARALLEL_PLANE_THRESH * (fabs(A) + fabs(B)) &&
+        d > 0. && d < min_dist) {
+      min_dist = d;
+      surface = _planes[i];
+    }
+  }
 
-  std::map<Surface*, int>::iterator iter;
+  /* Loop over all of the Cell's Circles: |(dx + t cos, dy + t sin)|^2 - r^2
+   * is zero at t = -b -/+ sqrt(b^2 - c) with b = dx cos + dy sin and
+   * c = dx^2 + dy^2 - r^2 */
+  for (int i=0; i < num_circles; i++) {
+    double dx = x0 - circle_coeffs[3*i];
+    double dy = y0 - circle_coeffs[3*i+1];
+    double b = dx * cos_phi + dy * sin_phi;
+    double discr = b * b - (dx * dx + dy * dy - circle_coeffs[3*i+2]);
+
+    if (discr < 0.)
+      continue;
+
+    /* Use the nearest intersection in front of the Point */
+    double sqrt_discr = sqrt(discr);
+    double d = -b - sqrt_discr;
+    if (d <= 0.)
+      d = -b + sqrt_discr;
+
+    if (d > 0. && d < min_dist) {
+      min_dist = d;
+      surface = _circles[i];
+    }
+  }
 
-  /* Loop over all of the Cell's Surfaces */
-  for (iter = _surfaces.begin(); iter != _surfaces.end(); ++iter) {
+  if (min_dist < INFINITY) {
+    min_intersection->setX(x0 + min_dist * cos_phi);
+    min_intersection->setY(y0 + min_dist * sin_phi);
+  }
 
-    /* Find the minimum distance from this surface to this Point */
-    d = iter->first->getMinDistance(point, angle, &intersection);
+  /* Loop over any other Surfaces using their intersection methods */
+  std::vector<Surface*>::iterator iter;
+  Point intersection;
+
+  for (iter = _other_surfaces.begin(); iter != _other_surfaces.end();
+       ++iter) {
+    double d = (*iter)->getMinDistance(point, angle, &intersection);
 
-    /* If the distance to Cell is less than current min distance, update */
     if (d < min_dist) {
       min_dist = d;
+      surface = *iter;
       min_intersection->setX(intersection.getX());
       min_intersection->setY(intersection.getY());
     }
   }
 
+  if (min_surface != NULL && surface != NULL)
+    *min_surface = surface;
+
   return min_dist;
 }
 
@@ -243,6 +464,19 @@ int CellBasic::getMaterial() const {
 }
 
 
+/**
+ * @brief Return the number of times the Material filling any CellBasic has
+ *        been changed with CellBasic::setMaterial(...).
+ * @details The Geometry compares this counter against its value when the
+ *          FSR Material maps were last updated to determine whether the
+ *          maps may need to be updated.
+ * @return the number of Material changes
+ */
+int CellBasic::getNumMaterialChanges() {
+  return _num_material_changes;
+}
+
+
 /**
  * @brief Return the number of rings in the Cell.
  * @return the number of rings
@@ -311,6 +545,12 @@ void CellBasic::setNumSectors(int num_sectors) {
  */
 void CellBasic::setMaterial(int material_id) {
   _material = material_id;
+  _num_material_changes++;
+
+  /* Update the Material for any rings and sectors subdivided from this Cell */
+  std::vector<CellBasic*>::iterator iter;
+  for (iter = _subcells.begin(); iter != _subcells.end(); ++iter)
+    (*iter)->setMaterial(material_id);
 }
 
 
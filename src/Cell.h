@@ -10,6 +10,7 @@
 #define CELL_H_
 
 #ifdef __cplusplus
+#include <algorithm>
 #include "Surface.h"
 #include "Point.h"
 #include "LocalCoords.h"
@@ -22,6 +23,11 @@ class LocalCoords;
 int cell_id();
 
 
+/** Threshold below which a trajectory is considered to be parallel to a
+ *  Plane when computing the distance to the Cell's Surfaces */
+#define PARALLEL_PLANE_THRESH 1E-11
+
+
 /**
  * @enum cellType
  * @brief The type of cell.
@@ -65,6 +71,41 @@ protected:
   /** Map of bounding Surface pointers to halfspaces (+/-1) */
   std::map<Surface*, int> _surfaces;
 
+  /** The minimum x-coordinate of the Cell's bounding box */
+  double _min_x;
+
+  /** The maximum x-coordinate of the Cell's bounding box */
+  double _max_x;
+
+  /** The minimum y-coordinate of the Cell's bounding box */
+  double _min_y;
+
+  /** The maximum y-coordinate of the Cell's bounding box */
+  double _max_y;
+
+  /** A std::map of bounding Surface pointers to the Cells in the same
+   *  Universe across the opposite halfspace of each Surface */
+  std::map<Surface*, std::vector<Cell*> > _neighbors;
+
+  /** The coefficients (A, B, C) of the potential equation of each Plane,
+   *  XPlane and YPlane bounding the Cell */
+  std::vector<double> _plane_coeffs;
+
+  /** The Planes bounding the Cell, in the order of their coefficients */
+  std::vector<Surface*> _planes;
+
+  /** The center coordinates and squared radius of each Circle bounding
+   *  the Cell */
+  std::vector<double> _circle_coeffs;
+
+  /** The Circles bounding the Cell, in the order of their coefficients */
+  std::vector<Surface*> _circles;
+
+  /** The Surfaces bounding the Cell which are neither Planes nor Circles */
+  std::vector<Surface*> _other_surfaces;
+
+  void initializeBoundingBox();
+
 public:
   Cell();
   Cell(int universe, int id=0);
@@ -75,6 +116,10 @@ public:
   int getUniverseId() const;
   int getNumSurfaces() const;
   std::map<Surface*, int> getSurfaces() const;
+  double getMinX() const;
+  double getMaxX() const;
+  double getMinY() const;
+  double getMaxY() const;
 
   /**
    * @brief Return the number of flat source regions in this Cell.
@@ -86,10 +131,14 @@ public:
 
   void setUniverse(int universe);
   void addSurface(int halfspace, Surface* surface);
+  void addNeighborCell(Surface* surface, Cell* cell);
+  void clearNeighborCells();
 
   bool cellContainsPoint(Point* point);
   bool cellContainsCoords(LocalCoords* coords);
-  double minSurfaceDist(Point* point, double angle, Point* min_intersection);
+  Cell* findNeighborCell(Surface* surface, LocalCoords* coords);
+  double minSurfaceDist(Point* point, double angle, Point* min_intersection,
+                        Surface** min_surface=NULL);
   /**
    * @brief Convert this CellFill's attributes to a string format.
    * @return a character array of this Cell's attributes
@@ -112,6 +161,10 @@ class CellBasic: public Cell {
 
 private:
 
+  /** A static counter for the number of times the Material filling any
+   *  CellBasic has been changed */
+  static int _num_material_changes;
+
   /** A pointer to the Material filling this Cell */
   int _material;
 
@@ -137,6 +190,7 @@ public:
   CellBasic(int universe, int material, int rings=0, int sectors=0, int id=0);
 
   int getMaterial() const;
+  static int getNumMaterialChanges();
   int getNumRings();
   int getNumSectors();
   int getNumFSRs();
@@ -1,5 +1,36 @@
 #include "Cmfd.h"
 
+/**
+ * @brief Compute the coarse Mesh cells and weights which interpolate a
+ *        fine Mesh cell along one direction for the multigrid solver.
+ * @details The fine Mesh cell is interpolated linearly between the centers
+ *          of the coarse Mesh cell containing it and the nearest neighboring
+ *          coarse Mesh cell, with weights of 3/4 and 1/4. Fine Mesh cells
+ *          next to the boundary of the grid take the value of the coarse
+ *          Mesh cell containing them.
+ * @param i the index of the fine Mesh cell
+ * @param num_coarse the number of coarse Mesh cells
+ * @param cells an array of 2 coarse Mesh cell indices to populate
+ * @param weights an array of 2 weights to populate
+ * @return the number of coarse Mesh cells interpolating the fine Mesh cell
+ */
+static int interpolation_weights(int i, int num_coarse, int* cells,
+                                 double* weights){
+
+  cells[0] = i / 2;
+  cells[1] = (i % 2 == 0) ? i / 2 - 1 : i / 2 + 1;
+  weights[0] = 0.75;
+  weights[1] = 0.25;
+
+  if (cells[1] < 0 || cells[1] >= num_coarse){
+    weights[0] = 1.0;
+    return 1;
+  }
+
+  return 2;
+}
+
+
 /**
  * @brief Constructor initializes boundaries and variables that describe
  *          the Cmfd object.
@@ -9,12 +40,19 @@
  *          are initialized.
  * @param geometry pointer to the Geometry
  * @param criteria convergence criteria on keff
+ * @param mesh an optional pointer to a Mesh of the Geometry to use instead
+ *        of the Geometry's Mesh
  */
-Cmfd::Cmfd(Geometry* geometry, double criteria) {
+Cmfd::Cmfd(Geometry* geometry, double criteria, Mesh* mesh) {
 
   /* Initialize Geometry and Mesh-related attribute */
   _geometry = geometry;
-  _mesh = geometry->getMesh();
+
+  if (mesh == NULL)
+    _mesh = geometry->getMesh();
+  else
+    _mesh = mesh;
+
   _num_FSRs = _mesh->getNumFSRs();
   _cx = _mesh->getCellsX();
   _cy = _mesh->getCellsY();
@@ -26,6 +64,11 @@ Cmfd::Cmfd(Geometry* geometry, double criteria) {
   _solve_method = _mesh->getSolveType();
   _flux_type = PRIMAL;
   _eigen_method = POWER;
+  _matrix_free = false;
+  _linear_method = SOR;
+  _adaptive = false;
+  _adaptive_shift = false;
+  _multilevel = false;
 
   /* Global variables used in solving CMFD problem */
   _l2_norm = 1.0;
@@ -45,6 +88,34 @@ Cmfd::Cmfd(Geometry* geometry, double criteria) {
   _group_indices = NULL;
   _group_indices_map = NULL;
 
+  /* Multigrid levels and Krylov vectors for the linear solvers */
+  _num_mg_levels = 0;
+  _mg_num_groups = 0;
+  _mg_cx = NULL;
+  _mg_cy = NULL;
+  _mg_matrices = NULL;
+  _mg_x = NULL;
+  _mg_b = NULL;
+  _mg_r = NULL;
+  _mg_dense = NULL;
+  _mg_pivots = NULL;
+  _krylov = NULL;
+  _partial_sums = NULL;
+
+  /* Coarse CMFD levels for multilevel acceleration */
+  _num_ml_levels = 0;
+  _ml_cx = NULL;
+  _ml_cy = NULL;
+  _ml_groups = NULL;
+  _ml_rows = NULL;
+  _ml_fine_row_ptr = NULL;
+  _ml_fine_rows = NULL;
+  _ml_A = NULL;
+  _ml_M = NULL;
+  _ml_flux = NULL;
+  _ml_source = NULL;
+  _ml_old_flux = NULL;
+
 
   /* If solving diffusion problem, create arrays for FSR parameters */
   if (_solve_method == DIFFUSION){
@@ -72,26 +143,14 @@ Cmfd::~Cmfd() {
 
   /* Delete matrix and vector objects */
 
-  if (_M != NULL){
-    for (int i = 0; i < _cx*_cy; i++)
-      delete [] _M[i];
-
-    delete [] _M;
-  }
-
-  if (_A != NULL){
-    for (int i = 0; i < _cx*_cy; i++)
-      delete [] _A[i];
-
-    delete [] _A;
-  }
+  if (_M != NULL)
+    deleteMatrix(_M);
 
-  if (_AM != NULL){
-    for (int i = 0; i < _cx*_cy; i++)
-      delete [] _AM[i];
+  if (_A != NULL)
+    deleteMatrix(_A);
 
-    delete [] _AM;
-  }
+  if (_AM != NULL)
+    deleteMatrix(_AM);
 
   if (_phi_temp != NULL)
     delete [] _phi_temp;
@@ -101,6 +160,39 @@ Cmfd::~Cmfd() {
 
   if (_new_source != NULL)
     delete [] _new_source;
+
+  clearMultigrid();
+
+  for (int level = 1; level < _num_ml_levels; level++){
+    delete [] _ml_rows[level];
+    delete [] _ml_fine_row_ptr[level];
+    delete [] _ml_fine_rows[level];
+    deleteMatrix(_ml_A[level]);
+    deleteMatrix(_ml_M[level]);
+    delete [] _ml_flux[level];
+    delete [] _ml_source[level];
+    delete [] _ml_old_flux[level];
+  }
+
+  if (_num_ml_levels > 0){
+    delete [] _ml_cx;
+    delete [] _ml_cy;
+    delete [] _ml_groups;
+    delete [] _ml_rows;
+    delete [] _ml_fine_row_ptr;
+    delete [] _ml_fine_rows;
+    delete [] _ml_A;
+    delete [] _ml_M;
+    delete [] _ml_flux;
+    delete [] _ml_source;
+    delete [] _ml_old_flux;
+  }
+
+  if (_krylov != NULL)
+    delete [] _krylov;
+
+  if (_partial_sums != NULL)
+    delete [] _partial_sums;
 }
 
 
@@ -465,11 +557,12 @@ double Cmfd::computeKeff(){
         createGroupStructure(NULL, _num_groups+1);
 
       _AM = NULL;
-      _M = new double*[_cx*_cy];
-      _A = new double*[_cx*_cy];
       _phi_temp = new double[_cx*_cy*_num_cmfd_groups];
       _old_source = new double[_cx*_cy*_num_cmfd_groups];
       _new_source = new double[_cx*_cy*_num_cmfd_groups];
+      _partial_sums = new double[2 * ((_cx*_cy*_num_cmfd_groups +
+                                       CMFD_REDUCTION_BLOCK - 1) /
+                                      CMFD_REDUCTION_BLOCK)];
 
       _mesh->setNumGroups(_num_cmfd_groups);
 
@@ -478,10 +571,10 @@ double Cmfd::computeKeff(){
       if (_solve_method == MOC)
         _mesh->initializeMaterialsMOC();
 
-      for (int i = 0; i < _cx*_cy; i++){
-        _M[i] = new double[_num_cmfd_groups*_num_cmfd_groups];
-        _A[i] = new double[_num_cmfd_groups*(_num_cmfd_groups+4)];
-      }
+      _M = createMatrix(true, _cx, _cy, _num_cmfd_groups,
+                        _matrix_free);
+      _A = createMatrix(false, _cx, _cy, _num_cmfd_groups,
+                        _matrix_free);
     }
     catch(std::exception &e){
       log_printf(ERROR, "Could not allocate memory for the CMFD mesh objects. "
@@ -489,10 +582,17 @@ double Cmfd::computeKeff(){
     }
   }
 
+  /* Create the coarse CMFD levels for multilevel acceleration */
+  if (_multilevel && _num_ml_levels == 0)
+    initializeMultilevel();
+
   /* If solving diffusion problem, initialize timer */
   if (_solve_method == DIFFUSION)
     _timer->startTimer();
 
+  _timer->startPhase("CMFD");
+  _timer_phase = _timer->getCurrentPhase();
+
   /* Initialize variables */
   double sum_new, sum_old, val, norm, scale_val;
   double flux_conv = 1e-8;
@@ -501,13 +601,22 @@ double Cmfd::computeKeff(){
   double* phi_new = _mesh->getFluxes(PRIMAL_UPDATE);
 
   /* Compute the cross sections and surface diffusion coefficients */
-  if (_solve_method == MOC)
+  if (_solve_method == MOC){
+    _timer->startPhase("Cross-section condensation");
     computeXS();
+    _timer->stopPhase();
+  }
 
+  _timer->startPhase("Diffusion coefficients");
   computeDs();
+  _timer->stopPhase();
 
   /* Construct matrices */
+  _timer->startPhase("Matrix construction");
   constructMatrices();
+  _timer->stopPhase();
+
+  _timer->startPhase("Eigenvalue iterations");
 
   if (_eigen_method == POWER){
 
@@ -519,13 +628,25 @@ double Cmfd::computeKeff(){
     vecCopy(phi_old, phi_new);
     vecScale(phi_new, scale_val);
     sum_old = _cx * _cy * _num_cmfd_groups;
+    norm = 1.0;
 
     /* Power iteration diffusion solver */
     for (int iter = 0; iter < 25000; iter++){
 
+      /* Tighten the linear solver tolerance with the source error */
+      if (_adaptive)
+        flux_conv = std::max(1e-8, CMFD_ADAPTIVE_RATIO * norm);
+
       /* Solve phi = A^-1 * old_source */
       linearSolve(_A, phi_new, _old_source, flux_conv);
 
+      /* Rebalance the flux on the coarser CMFD levels */
+      if (_multilevel && _num_ml_levels > 1){
+        _timer->startPhase("Multilevel rebalance");
+        rebalanceFlux(1, phi_new);
+        _timer->stopPhase();
+      }
+
       /* Compute the new source */
       matMultM(_M, phi_new, _new_source);
       sum_new = vecSum(_new_source);
@@ -533,17 +654,9 @@ double Cmfd::computeKeff(){
       /* Compute and set keff */
       _k_eff = sum_new / sum_old;
 
-      /* Scale the old source by keff */
-      vecScale(_old_source, _k_eff);
-
-      /* Compute the L2 norm of source error */
-      norm = 0.0;
-
-      for (int i = 0; i < _cx*_cy*_num_cmfd_groups; i++){
-        if (_new_source[i] != 0.0)
-          norm += pow((_new_source[i] - _old_source[i]) / _new_source[i], 2);
-      }
-
+      /* Compute the L2 norm of source error with the old source
+       * scaled by keff */
+      norm = vecRelativeDiff(_new_source, _old_source, _k_eff);
       norm = sqrt(norm / (_cx*_cy*_num_cmfd_groups));
 
       scale_val = (_cx * _cy * _num_cmfd_groups) / sum_new;
@@ -564,22 +677,12 @@ double Cmfd::computeKeff(){
     if (_AM == NULL){
       log_printf(INFO, "Allocating memory for AM");
 
-      try{
-        _AM = new double*[_cx*_cy];
-
-        for (int i = 0; i < _cx*_cy; i++){
-          _AM[i] = new double[_num_cmfd_groups*(_num_cmfd_groups+4)];
-        }
-      }
-      catch(std::exception &e){
-        log_printf(ERROR, "Could not allocate memory for the _AM matrix."
-                   " Backtrace:%s", e.what());
-      }
+      _AM = createMatrix(false, _cx, _cy, _num_cmfd_groups,
+                         _matrix_free);
       log_printf(INFO, "Done allocating memory for AM");
     }
 
-    int max_iter = 100;
-    double shift, offset;
+    double shift, k_old, norm_old;
     int iter = 0;
     norm = 1.0;
 
@@ -597,16 +700,33 @@ double Cmfd::computeKeff(){
     vecScale(phi_new, scale_val);
     sum_old = _cx * _cy * _num_cmfd_groups;
 
-    shift = 1.5;
+    /* The adaptive shift starts from a conservative shift well above the
+     * initial k_eff */
+    shift = CMFD_WIELANDT_SHIFT;
+    if (_adaptive_shift)
+      shift = std::max(shift, _k_eff + CMFD_WIELANDT_SHIFT - 1.0);
+    matSubtract(_AM, _A, 1.0/shift, _M);
+
+    while (norm > _conv_criteria){
 
-    while (norm > 1e-5){
+      /* Update the diagonal blocks of _AM for the new shift */
+      if (_AM->_shift != 1.0/shift)
+        shiftMatrix(_AM, _A, 1.0/shift, _M);
 
-      /* Reconstruct _AM */
-      matSubtract(_AM, _A, 1.0/shift, _M);
+      /* Tighten the linear solver tolerance with the source error */
+      if (_adaptive)
+        flux_conv = std::max(1e-8, CMFD_ADAPTIVE_RATIO * norm);
 
       /* Solve inverse system */
       linearSolve(_AM, phi_new, _old_source, flux_conv);
 
+      /* Rebalance the flux on the coarser CMFD levels */
+      if (_multilevel && _num_ml_levels > 1){
+        _timer->startPhase("Multilevel rebalance");
+        rebalanceFlux(1, phi_new);
+        _timer->stopPhase();
+      }
+
       /* Compute new flux */
       vecScale(phi_new, vecMax(phi_new));
       matMultM(_M, phi_new, _new_source);
@@ -615,84 +735,67 @@ double Cmfd::computeKeff(){
       vecScale(phi_new, (_cx*_cy*_num_cmfd_groups) / sum_new);
 
       /* Compute new eigenvalue */
+      k_old = _k_eff;
       _k_eff = rayleighQuotient(phi_new, _new_source, _phi_temp);
 
       /* Compute the L2 norm of source error */
-      norm = 0.0;
-      for (int i = 0; i < _cx*_cy*_num_cmfd_groups; i++){
-        if (_new_source[i] != 0.0)
-          norm += pow((_new_source[i] - _old_source[i]) / _new_source[i], 2);
-      }
-
+      norm_old = norm;
+      norm = vecRelativeDiff(_new_source, _old_source, 1.0);
       norm = pow(norm, 0.5);
       norm = norm / (_cx*_cy*_num_cmfd_groups);
       vecCopy(_new_source, _old_source);
 
       iter++;
 
-      log_printf(INFO, "iter: %i, k_eff: %f, norm: %f", iter, _k_eff, norm);
-    }
-
-    offset = 0.05;
-    log_printf(INFO, "offset set to: %f", offset);
-
-    while (norm > _conv_criteria){
-
-      /* Reconstruct _AM */
-      matSubtract(_AM, _A, 1.0/(_k_eff + offset), _M);
-
-      /* Solve inverse system */
-      linearSolve(_AM, phi_new, _old_source, flux_conv);
-
-      /* compute new flux */
-      vecScale(phi_new, vecMax(phi_new));
-      matMultM(_M, phi_new, _new_source);
-      sum_new = vecSum(_new_source);
-      vecScale(_new_source, (_cx*_cy*_num_cmfd_groups) / sum_new);
-      vecScale(phi_new, (_cx*_cy*_num_cmfd_groups) / sum_new);
-
-      /* compute new eigenvalue */
-      _k_eff = rayleighQuotient(phi_new, _new_source, _phi_temp);
+      log_printf(INFO, "iter: %i, k_eff: %f, norm: %f, shift: %f",
+                 iter, _k_eff, norm, shift);
 
-      /* compute the L2 norm of source error */
-      norm = 0.0;
-      for (int i = 0; i < _cx*_cy*_num_cmfd_groups; i++){
-        if (_new_source[i] != 0.0)
-          norm += pow((_new_source[i] - _old_source[i]) / _new_source[i], 2);
+      /* Adapt the shift to the convergence rate of the source, or keep a
+       * fixed shift until the source has converged and then a fixed
+       * offset above k_eff */
+      if (_adaptive_shift){
+        if (iter > 1)
+          shift = computeShift(shift, k_old, norm / norm_old);
       }
-
-      norm = pow(norm, 0.5);
-      norm = norm / (_cx*_cy*_num_cmfd_groups);
-      vecCopy(_new_source, _old_source);
-
-      iter++;
-
-      log_printf(INFO, "iter: %i, k_eff: %f, norm: %f", iter, _k_eff, norm);
+      else if (norm < CMFD_WIELANDT_SHIFT_CONV)
+        shift = _k_eff + CMFD_WIELANDT_MIN_OFFSET;
     }
   }
 
+  _timer->stopPhase();
+
   /* rescale the old and new flux */
+  _timer->startPhase("Flux update");
   rescaleFlux();
 
   /* update the MOC flux */
   if (_solve_method == MOC)
     updateMOCFlux();
 
+  _timer->stopPhase();
+  _timer->stopPhase();
+
   if (_flux_type == ADJOINT)
     vecCopy(phi_new, _mesh->getFluxes(ADJOINT));
 
-  /* If solving diffusion problem, print timing results */
+  /* If solving diffusion problem, stop the timer */
   if (_solve_method == DIFFUSION){
-    std::string msg_string;
-    log_printf(TITLE, "TIMING REPORT");
     _timer->stopTimer();
     _timer->recordSplit("Total time to solve diffusion eigenvalue problem");
+  }
+
+  /* Print timing results unless the solve is one of many run concurrently */
+  if (_solve_method == DIFFUSION && omp_get_level() == 0){
+    std::string msg_string;
+    log_printf(TITLE, "TIMING REPORT");
 
     double tot_time = _timer->getSplit("Total time to solve diffusion "
                                        "eigenvalue problem");
     msg_string = "Total time to solve diffusion eigenvalue problem";
     msg_string.resize(53, '.');
     log_printf(RESULT, "%s%1.4E sec", msg_string.c_str(), tot_time);
+
+    printTimerReport();
   }
 
   return _k_eff;
@@ -700,143 +803,143 @@ double Cmfd::computeKeff(){
 
 
 /**
- * @brief Solve the linear system Ax=b using Gauss Seidel with SOR.
+ * @brief Solve the linear system Ax=b.
+ * @details The system is solved with the method selected by
+ *          Cmfd::setLinearMethod(...): red-black Gauss-Seidel with SOR
+ *          (the default), geometric multigrid V-cycles, or BiCGSTAB
+ *          preconditioned with a multigrid V-cycle. The multigrid
+ *          V-cycles interpolate the coarse grid corrections bilinearly, so
+ *          the number of multigrid and BiCGSTAB iterations grows only
+ *          slowly with the number of Mesh cells.
  * @param mat pointer to A matrix
  * @param vec_x pointer to x vector
  * @param vec_b pointer to b vector
  * @param conv flux convergence criteria
  * @param max_iter the maximum number of iterations
  */
-void Cmfd::linearSolve(double** mat, double* vec_x, double* vec_b,
+void Cmfd::linearSolve(sparseMatrix* mat, double* vec_x, double* vec_b,
                        double conv, int max_iter){
 
-  double norm = 1e10;
-  int row, cell;
-  double val;
-  int iter = 0;
+  int iter;
 
-  while (norm > conv){
+  _timer->startPhase("Linear solves");
 
-    /* Pass new flux to old flux */
-    vecCopy(vec_x, _phi_temp);
+  if (_linear_method == SOR)
+    iter = solveSOR(mat, vec_x, vec_b, conv, max_iter);
 
-    /* Iteration over red cells */
-    #pragma omp parallel for private(row, val, cell)
-    for (int y = 0; y < _cy; y++){
-      for (int x = y % 2; x < _cx; x += 2){
+  else{
 
-        cell = y*_cx+x;
+    /* Compute the coarse grid matrices for this matrix */
+    initializeMultigrid();
 
-        for (int g = 0; g < _num_cmfd_groups; g++){
+    for (int level = 1; level < _num_mg_levels; level++)
+      restrictMatrix(mat, level);
 
-          row = (y*_cx+x)*_num_cmfd_groups + g;
-          val = 0.0;
-
-          /* Previous flux term */
-          val += (1.0 - _omega) * vec_x[row];
-
-          /* Source term */
-          val += _omega * vec_b[row] / mat[cell][g*(_num_cmfd_groups+4)+g+2];
-
-          /* Left surface */
-          if (x != 0)
-            val -= _omega * vec_x[row - _num_cmfd_groups] *
-                   mat[cell][g*(_num_cmfd_groups+4)] /
-                   mat[cell][g*(_num_cmfd_groups+4)+g+2];
-
-          /* Bottom surface */
-          if (y != _cy - 1)
-            val -= _omega * vec_x[row + _cx * _num_cmfd_groups] *
-                   mat[cell][g*(_num_cmfd_groups+4)+1] /
-                   mat[cell][g*(_num_cmfd_groups+4)+g+2];
-
-          /* Group-to-group */
-          for (int e = 0; e < _num_cmfd_groups; e++){
-            if (e != g)
-              val -= _omega * vec_x[(y*_cx+x)*_num_cmfd_groups+e] *
-                     mat[cell][g*(_num_cmfd_groups+4)+2+e] /
-                     mat[cell][g*(_num_cmfd_groups+4)+g+2];
-          }
+    factorCoarseMatrix(mat);
 
-          /* Right surface */
-          if (x != _cx - 1)
-            val -= _omega * vec_x[row + _num_cmfd_groups] *
-                   mat[cell][g*(_num_cmfd_groups+4)+_num_cmfd_groups+2] /
-                   mat[cell][g*(_num_cmfd_groups+4)+g+2];
+    if (_linear_method == MULTIGRID)
+      iter = solveMultigrid(mat, vec_x, vec_b, conv, max_iter);
+    else
+      iter = solveBiCGSTAB(mat, vec_x, vec_b, conv, max_iter);
+  }
 
-          /* Top surface */
-          if (y != 0)
-            val -= _omega * vec_x[row - _num_cmfd_groups*_cx] *
-                   mat[cell][g*(_num_cmfd_groups+4)+_num_cmfd_groups+3] /
-                   mat[cell][g*(_num_cmfd_groups+4)+g+2];
+  _timer->stopPhase();
 
-          vec_x[row] = val;
-        }
-      }
-    }
+  log_printf(DEBUG, "linear solver iterations: %i", iter);
+}
+
+
+/**
+ * @brief Perform one multi-color Gauss-Seidel sweep with over-relaxation
+ *        on a grid of Mesh cells.
+ * @details The Mesh cells are swept in a red-black checkerboard order so
+ *          that the cells of each color may be updated in parallel. The
+ *          coarse multigrid matrices also couple diagonal neighbors, so
+ *          they are swept in four colors, one for each parity of x and y.
+ *          The groups within each Mesh cell are updated in order.
+ * @param mat the matrix
+ * @param num_x the number of Mesh cells along x
+ * @param num_y the number of Mesh cells along y
+ * @param vec_x the x vector to update
+ * @param vec_b the b vector
+ * @param omega the over-relaxation factor
+ * @param num_colors the number of colors (2 or 4)
+ */
+void Cmfd::sweepGaussSeidel(sparseMatrix* mat, int num_x, int num_y,
+                            double* vec_x, double* vec_b, double omega,
+                            int num_colors){
+
+  int row, num_entries;
+  int* cols;
+  double* vals;
+  double val, diag;
 
-    /* Iteration over black cells */
-    #pragma omp parallel for private(row, val, cell)
-    for (int y = 0; y < _cy; y++){
-      for (int x = 1 - y % 2; x < _cx; x += 2){
+  /* Iteration over red (0) and black (1) cells, or over the four parities
+   * of x and y */
+  for (int color = 0; color < num_colors; color++){
 
-        cell = y*_cx+x;
+    int y_start = (num_colors == 4) ? color / 2 : 0;
+    int y_stride = (num_colors == 4) ? 2 : 1;
 
+    #pragma omp parallel for private(row, num_entries, cols, vals, val, diag)
+    for (int y = y_start; y < num_y; y += y_stride){
+
+      /* Buffers for the matrix rows computed in matrix-free mode */
+      int cols_buffer[_num_cmfd_groups+4];
+      double vals_buffer[_num_cmfd_groups+4];
+
+      int x_start = (num_colors == 4) ? color % 2 : (y + color) % 2;
+
+      for (int x = x_start; x < num_x; x += 2){
         for (int g = 0; g < _num_cmfd_groups; g++){
 
-          row = (y*_cx+x)*_num_cmfd_groups + g;
-          val = 0.0;
-
-          /* Previous flux term */
-          val += (1.0 - _omega) * vec_x[row];
-
-          /* Source term */
-          val += _omega * vec_b[row] / mat[cell][g*(_num_cmfd_groups+4)+g+2];
-
-          /* Left surface */
-          if (x != 0)
-            val -= _omega * vec_x[row - _num_cmfd_groups] *
-                   mat[cell][g*(_num_cmfd_groups+4)] /
-                   mat[cell][g*(_num_cmfd_groups+4)+g+2];
-
-          /* Bottom surface */
-          if (y != _cy - 1)
-            val -= _omega * vec_x[row + _cx * _num_cmfd_groups] *
-                   mat[cell][g*(_num_cmfd_groups+4)+1] /
-                   mat[cell][g*(_num_cmfd_groups+4)+g+2];
-
-          /* Group-to-group */
-          for (int e = 0; e < _num_cmfd_groups; e++){
-            if (e != g)
-              val -= _omega * vec_x[(y*_cx+x)*_num_cmfd_groups+e] *
-                     mat[cell][g*(_num_cmfd_groups+4)+2+e] /
-                     mat[cell][g*(_num_cmfd_groups+4)+g+2];
-          }
+          row = (y*num_x+x)*_num_cmfd_groups + g;
+          num_entries = getRow(mat, row, &cols, &vals, cols_buffer,
+                               vals_buffer);
 
-          /* Right surface */
-          if (x != _cx - 1)
-            val -= _omega * vec_x[row + _num_cmfd_groups] *
-                   mat[cell][g*(_num_cmfd_groups+4)+_num_cmfd_groups+2] /
-                   mat[cell][g*(_num_cmfd_groups+4)+g+2];
+          /* Source term less the off-diagonal terms */
+          val = vec_b[row];
+          diag = 0.0;
 
-          /* Top surface */
-          if (y != 0)
-            val -= _omega * vec_x[row - _num_cmfd_groups*_cx] *
-                   mat[cell][g*(_num_cmfd_groups+4)+_num_cmfd_groups+3] /
-                   mat[cell][g*(_num_cmfd_groups+4)+g+2];
+          for (int i = 0; i < num_entries; i++){
+            if (cols[i] == row)
+              diag = vals[i];
+            else
+              val -= vals[i] * vec_x[cols[i]];
+          }
 
-          vec_x[row] = val;
+          /* Over-relax with the previous flux */
+          vec_x[row] = (1.0 - omega) * vec_x[row] + omega * val / diag;
         }
       }
     }
+  }
+}
 
-    norm = 0.0;
 
-    for (int i = 0; i < _cx*_cy*_num_cmfd_groups; i++){
-      if (vec_x[i] != 0.0)
-        norm += pow((vec_x[i] - _phi_temp[i]) / vec_x[i], 2);
-    }
+/**
+ * @brief Solve the linear system Ax=b using Gauss Seidel with SOR.
+ * @param mat pointer to A matrix
+ * @param vec_x pointer to x vector
+ * @param vec_b pointer to b vector
+ * @param conv flux convergence criteria
+ * @param max_iter the maximum number of iterations
+ * @return the number of iterations
+ */
+int Cmfd::solveSOR(sparseMatrix* mat, double* vec_x, double* vec_b,
+                   double conv, int max_iter){
+
+  double norm = 1e10;
+  int iter = 0;
+
+  while (norm > conv){
+
+    /* Pass new flux to old flux */
+    vecCopy(vec_x, _phi_temp);
 
+    sweepGaussSeidel(mat, _cx, _cy, vec_x, vec_b, _omega);
+
+    norm = vecRelativeDiff(vec_x, _phi_temp, 1.0);
     norm = pow(norm, 0.5) / (_cx*_cy*_num_cmfd_groups);
 
     iter++;
@@ -847,290 +950,1584 @@ void Cmfd::linearSolve(double** mat, double* vec_x, double* vec_b,
       break;
   }
 
-  log_printf(DEBUG, "linear solver iterations: %i", iter);
+  return iter;
 }
 
 
 /**
- * @brief Rescale the initial and converged flux arrays.
+ * @brief Allocate the coarse grids and vectors for the multigrid solver.
+ * @details Each coarse grid has half as many Mesh cells along x and y as
+ *          the next finer grid, down to a grid of at most 4 Mesh cells
+ *          which is solved directly. The multigrid levels are rebuilt if
+ *          the CMFD Mesh or the number of CMFD groups has changed since
+ *          they were allocated.
  */
-void Cmfd::rescaleFlux(){
+void Cmfd::initializeMultigrid(){
 
-  double sum_new, sum_old, scale_val;
-  double* phi_old = _mesh->getFluxes(PRIMAL);
-  double* phi_new = _mesh->getFluxes(PRIMAL_UPDATE);
+  if (_num_mg_levels > 0 && _mg_cx[0] == _cx && _mg_cy[0] == _cy &&
+      _mg_num_groups == _num_cmfd_groups)
+    return;
 
-  /* Rescale the new and old flux to have an avg source of 1.0 */
-  matMultM(_M, phi_new, _new_source);
-  sum_new = vecSum(_new_source);
-  scale_val = _cx*_cy*_num_cmfd_groups / sum_new;
-  vecScale(phi_new, scale_val);
-  matMultM(_M, phi_old, _old_source);
-  sum_old = vecSum(_old_source);
-  scale_val = _cx*_cy*_num_cmfd_groups / sum_old;
-  vecScale(phi_old, scale_val);
-}
+  clearMultigrid();
 
+  int num_x = _cx;
+  int num_y = _cy;
+  _num_mg_levels = 1;
+  _mg_num_groups = _num_cmfd_groups;
 
-/**
- * @brief Scale vectgor by some scalar value.
- * @param vec vector to be scaled
- * @param scale_val value to scale vector
- */
-void Cmfd::vecScale(double* vec, double scale_val){
+  /* Count the multigrid levels */
+  while (num_x * num_y > 4){
+    num_x = (num_x + 1) / 2;
+    num_y = (num_y + 1) / 2;
+    _num_mg_levels++;
+  }
 
-  #pragma omp parallel for
-  for (int i = 0; i < _cx*_cy*_num_cmfd_groups; i++)
-    vec[i] *= scale_val;
-}
+  log_printf(INFO, "Creating %i multigrid levels", _num_mg_levels);
 
+  try{
+    _mg_cx = new int[_num_mg_levels];
+    _mg_cy = new int[_num_mg_levels];
+    _mg_matrices = new sparseMatrix*[_num_mg_levels];
+    _mg_x = new double*[_num_mg_levels];
+    _mg_b = new double*[_num_mg_levels];
+    _mg_r = new double*[_num_mg_levels];
 
-/**
- * @brief Set every element in vector to some value.
- * @param vec vector to be set
- * @param val value to set each element
- */
-void Cmfd::vecSet(double* vec, double val){
+    _mg_cx[0] = _cx;
+    _mg_cy[0] = _cy;
+    _mg_matrices[0] = NULL;
 
-  #pragma omp parallel for
-  for (int i = 0; i < _cx*_cy*_num_cmfd_groups; i++)
-    vec[i] = val;
-}
+    for (int level = 0; level < _num_mg_levels; level++){
 
+      if (level > 0){
+        _mg_cx[level] = (_mg_cx[level-1] + 1) / 2;
+        _mg_cy[level] = (_mg_cy[level-1] + 1) / 2;
+        _mg_matrices[level] = createCoarseMatrix(_mg_cx[level],
+                                                 _mg_cy[level]);
+      }
 
-/**
- * @brief Normalize vector to have avg source of 1.0.
- * @param mat source matrix
- * @param vec vector to be normalized
- */
-void Cmfd::vecNormal(double** mat, double* vec){\
-  double source, scale_val;
-  matMultM(mat, vec, _phi_temp);
-  source = vecSum(_phi_temp);
-  scale_val = (_cx*_cy*_num_cmfd_groups) / source;
-  vecScale(vec, scale_val);
+      int num_rows = _mg_cx[level] * _mg_cy[level] * _num_cmfd_groups;
+      _mg_x[level] = new double[num_rows];
+      _mg_b[level] = new double[num_rows];
+      _mg_r[level] = new double[num_rows];
+    }
+
+    int num_coarse = num_x * num_y * _num_cmfd_groups;
+    _mg_dense = new double[num_coarse * num_coarse];
+    _mg_pivots = new int[num_coarse];
+  }
+  catch(std::exception &e){
+    log_printf(ERROR, "Could not allocate memory for the CMFD multigrid "
+               "levels. Backtrace:%s", e.what());
+  }
 }
 
 
 /**
- * @brief Multiply matrix by vector (i.e., y = M *x).
- * @param mat source matrix
- * @param vec_x x vector
- * @param vec_y y vector
+ * @brief Deallocate the coarse grids and vectors for the multigrid solver.
  */
-void Cmfd::matMultM(double** mat, double* vec_x, double* vec_y){
+void Cmfd::clearMultigrid(){
 
-  vecSet(vec_y, 0.0);
+  if (_num_mg_levels == 0)
+    return;
 
-  for (int i = 0; i < _cx*_cy; i++){
-    for (int g = 0; g < _num_cmfd_groups; g++){
-      for (int e = 0; e < _num_cmfd_groups; e++){
-        vec_y[i*_num_cmfd_groups+g] += mat[i][g*_num_cmfd_groups+e] *
-                                   vec_x[i*_num_cmfd_groups+e];
-      }
-    }
+  for (int level = 0; level < _num_mg_levels; level++){
+    if (_mg_matrices[level] != NULL)
+      deleteMatrix(_mg_matrices[level]);
+
+    delete [] _mg_x[level];
+    delete [] _mg_b[level];
+    delete [] _mg_r[level];
   }
+
+  delete [] _mg_cx;
+  delete [] _mg_cy;
+  delete [] _mg_matrices;
+  delete [] _mg_x;
+  delete [] _mg_b;
+  delete [] _mg_r;
+  delete [] _mg_dense;
+  delete [] _mg_pivots;
+
+  _num_mg_levels = 0;
 }
 
 
 /**
- * @brief Sum all elements in a vector.
- * @param vec vector to be summed
- * @return sum of vector elements
+ * @brief Allocate a coarse multigrid matrix on a grid of Mesh cells.
+ * @details Each row couples a Mesh cell group to all groups in the same
+ *          Mesh cell and in each of the (up to) eight neighboring Mesh
+ *          cells, which is the non-zero structure of the Galerkin coarse
+ *          grid matrix with linear interpolation between Mesh cells.
+ * @param num_x the number of Mesh cells along x
+ * @param num_y the number of Mesh cells along y
+ * @return a pointer to the new matrix
  */
-double Cmfd::vecSum(double* vec){
+sparseMatrix* Cmfd::createCoarseMatrix(int num_x, int num_y){
 
-  double sum = 0.0;
+  int num_groups = _num_cmfd_groups;
+  int num_rows = num_x*num_y*num_groups;
+  sparseMatrix* mat = new sparseMatrix;
 
-  for (int i = 0; i < _cx*_cy*_num_cmfd_groups; i++)
-    sum += vec[i];
+  mat->_num_rows = num_rows;
+  mat->_shift = 0.0;
 
-    return sum;
-}
+  try{
+    mat->_row_ptr = new int[num_rows+1];
+    mat->_diag = new int[num_rows];
 
+    /* Count the non-zero entries in each row */
+    mat->_row_ptr[0] = 0;
 
-/**
- * @brief Copy a vector to another vector.
- * @param vec_from vector to be copied
- * @param vec_to vector to receive copied data
- */
-void Cmfd::vecCopy(double* vec_from, double* vec_to){
+    for (int row = 0; row < num_rows; row++){
 
-  #pragma omp parallel for
-  for (int i = 0; i < _cx*_cy*_num_cmfd_groups; i++)
-    vec_to[i] = vec_from[i];
-}
+      int cell = row / num_groups;
+      int x = cell % num_x;
+      int y = cell / num_x;
+      int nx = std::min(x+1, num_x-1) - std::max(x-1, 0) + 1;
+      int ny = std::min(y+1, num_y-1) - std::max(y-1, 0) + 1;
 
+      mat->_row_ptr[row+1] = mat->_row_ptr[row] + nx*ny*num_groups;
+    }
 
-/**
- * @brief Assign all elements in a matrix to zero.
- * @param mat matrix to be zeroed
- * @param width width of matrix row
- */
-void Cmfd::matZero(double** mat, int width){
+    mat->_num_nonzeros = mat->_row_ptr[num_rows];
+    mat->_cols = new int[mat->_num_nonzeros];
+    mat->_vals = new double[mat->_num_nonzeros];
+  }
+  catch(std::exception &e){
+    log_printf(ERROR, "Could not allocate memory for the CMFD multigrid "
+               "matrix. Backtrace:%s", e.what());
+  }
 
+  /* Set the sorted column indices of the entries in each row */
   #pragma omp parallel for
-  for (int i = 0; i < _cx*_cy; i++){
-    for (int g = 0; g < _num_cmfd_groups*width; g++)
-        mat[i][g] = 0.0;
-  }
-}
+  for (int row = 0; row < num_rows; row++){
 
+    int cell = row / num_groups;
+    int x = cell % num_x;
+    int y = cell / num_x;
+    int index = mat->_row_ptr[row];
 
-/** @brief Fill in the values in the A matrix, M matrix, and old
- *        scalar flux vector.
- */
-void Cmfd::constructMatrices(){
+    for (int j = std::max(y-1, 0); j <= std::min(y+1, num_y-1); j++){
+      for (int i = std::max(x-1, 0); i <= std::min(x+1, num_x-1); i++){
+        for (int g = 0; g < num_groups; g++){
 
-  log_printf(INFO,"Constructing matrices...");
+          mat->_cols[index] = (j*num_x + i)*num_groups + g;
 
-  double value, volume;
-  int cell, row;
-  Material* material;
+          if (mat->_cols[index] == row)
+            mat->_diag[row] = index;
 
-  double* heights = _mesh->getLengthsY();
-  double* widths = _mesh->getLengthsX();
+          index++;
+        }
+      }
+    }
+  }
 
-  /* Zero _A and _M matrices */
-  matZero(_M, _num_cmfd_groups);
-  matZero(_A, _num_cmfd_groups+4);
+  matZero(mat);
 
-  /* Loop over cells */
-  #pragma omp parallel for private(value, volume, cell, row, material)
-  for (int y = 0; y < _cy; y++){
-    for (int x = 0; x < _cx; x++){
+  return mat;
+}
 
-      cell = y*_cx + x;
-      material = _mesh->getMaterials()[cell];
-      volume = _mesh->getVolumes()[cell];
 
-      /* Loop over groups */
-      for (int e = 0; e < _num_cmfd_groups; e++){
+/**
+ * @brief Compute the Galerkin coarse grid matrix on a multigrid level.
+ * @details The coarse grid matrix is \f$ R A P \f$ where the prolongation
+ *          \f$ P \f$ interpolates each fine Mesh cell linearly from the
+ *          coarse Mesh cells nearest to it, as computed by
+ *          interpolation_weights(...), and the restriction \f$ R \f$ sums
+ *          the (up to) 2 x 2 finer Mesh cells in each coarse Mesh cell.
+ *          With this pairing the coarse grid matrix couples each coarse Mesh
+ *          cell only to its 8 neighbors.
+ * @param mat the matrix on the CMFD Mesh
+ * @param level the coarse multigrid level (> 0)
+ */
+void Cmfd::restrictMatrix(sparseMatrix* mat, int level){
 
-        row = cell*_num_cmfd_groups + e;
+  sparseMatrix* fine = (level == 1) ? mat : _mg_matrices[level-1];
+  sparseMatrix* coarse = _mg_matrices[level];
+  int fine_cx = _mg_cx[level-1];
+  int fine_cy = _mg_cy[level-1];
+  int coarse_cx = _mg_cx[level];
+  int coarse_cy = _mg_cy[level];
+  int num_groups = _num_cmfd_groups;
 
-        /* Absorption term */
-        value = material->getSigmaA()[e] * volume;
-        _A[cell][e*(_num_cmfd_groups+4)+e+2] += value;
+  matZero(coarse);
 
-        /* Out (1st) and in (2nd) scattering */
-        if (_flux_type == PRIMAL){
-          for (int g = 0; g < _num_cmfd_groups; g++){
-            if (e != g){
-              value = material->getSigmaS()[g*_num_cmfd_groups + e] * volume;
-              _A[cell][e*(_num_cmfd_groups+4)+e+2] += value;
-              value = - material->getSigmaS()[e*_num_cmfd_groups + g] * volume;
-              _A[cell][e*(_num_cmfd_groups+4)+g+2] += value;
-            }
-          }
+  /* Loop over coarse grid rows */
+  #pragma omp parallel for
+  for (int row = 0; row < coarse->_num_rows; row++){
+
+    int cell = row / num_groups;
+    int e = row % num_groups;
+    int x = cell % coarse_cx;
+    int y = cell / coarse_cx;
+    double* coarse_vals = &coarse->_vals[coarse->_row_ptr[row]];
+
+    /* The offset of the first group of each neighboring coarse Mesh cell
+     * in this row, indexed from the bottom left neighbor */
+    int offsets[9];
+    int index = 0;
+
+    for (int j = y-1; j <= y+1; j++){
+      for (int i = x-1; i <= x+1; i++){
+        if (i >= 0 && i < coarse_cx && j >= 0 && j < coarse_cy){
+          offsets[(j-y+1)*3 + (i-x+1)] = index;
+          index += num_groups;
         }
-        else{
-          for (int g = 0; g < _num_cmfd_groups; g++){
-            if (e != g){
-              value = material->getSigmaS()[e*_num_cmfd_groups + g] * volume;
-              _A[cell][e*(_num_cmfd_groups+4)+e+2] += value;
-              value = - material->getSigmaS()[g*_num_cmfd_groups + e] * volume;
-              _A[cell][e*(_num_cmfd_groups+4)+g+2] += value;
+      }
+    }
+
+    /* Buffers for the matrix rows computed in matrix-free mode */
+    int cols_buffer[num_groups+4];
+    double vals_buffer[num_groups+4];
+    int* cols;
+    double* vals;
+    int cells_x[2], cells_y[2];
+    double weights_x[2], weights_y[2];
+
+    /* Loop over the finer Mesh cells in this coarse Mesh cell */
+    for (int fj = 2*y; fj < std::min(2*y+2, fine_cy); fj++){
+      for (int fi = 2*x; fi < std::min(2*x+2, fine_cx); fi++){
+
+        int fine_row = (fj*fine_cx + fi)*num_groups + e;
+        int num_entries = getRow(fine, fine_row, &cols, &vals, cols_buffer,
+                                 vals_buffer);
+
+        /* Interpolate each column of the finer Mesh cell row */
+        for (int k = 0; k < num_entries; k++){
+
+          int fine_cell = cols[k] / num_groups;
+          int g = cols[k] % num_groups;
+          int nx = interpolation_weights(fine_cell % fine_cx, coarse_cx,
+                                         cells_x, weights_x);
+          int ny = interpolation_weights(fine_cell / fine_cx, coarse_cy,
+                                         cells_y, weights_y);
+
+          for (int b = 0; b < ny; b++){
+            for (int a = 0; a < nx; a++){
+              int neighbor = (cells_y[b]-y+1)*3 + (cells_x[a]-x+1);
+              coarse_vals[offsets[neighbor] + g] +=
+                   vals[k] * weights_x[a] * weights_y[b];
             }
           }
         }
+      }
+    }
+  }
+}
 
-        /* RIGHT SURFACE */
 
-        /* Set transport term on diagonal */
-        value = (material->getDifHat()[2*_num_cmfd_groups + e]
-                - material->getDifTilde()[2*_num_cmfd_groups + e])
-          * heights[cell / _cx];
+/**
+ * @brief Compute the LU factors of the matrix on the coarsest multigrid
+ *        level with partial pivoting.
+ * @param mat the matrix on the CMFD Mesh
+ */
+void Cmfd::factorCoarseMatrix(sparseMatrix* mat){
+
+  int level = _num_mg_levels - 1;
+  sparseMatrix* coarse = (level == 0) ? mat : _mg_matrices[level];
+  int n = _mg_cx[level] * _mg_cy[level] * _num_cmfd_groups;
+  int cols_buffer[_num_cmfd_groups+4];
+  double vals_buffer[_num_cmfd_groups+4];
+  int* cols;
+  double* vals;
+  double* lu = _mg_dense;
+
+  /* Copy the sparse matrix to the dense matrix */
+  for (int i = 0; i < n*n; i++)
+    lu[i] = 0.0;
+
+  for (int row = 0; row < n; row++){
+    int num_entries = getRow(coarse, row, &cols, &vals, cols_buffer,
+                             vals_buffer);
+
+    for (int k = 0; k < num_entries; k++)
+      lu[row*n + cols[k]] = vals[k];
+  }
 
-        _A[cell][e*(_num_cmfd_groups+4)+e+2] += value;
+  /* Gaussian elimination with partial pivoting */
+  for (int k = 0; k < n; k++){
 
-        /* Set transport term on off diagonal */
-        if (x != _cx - 1){
-          value = - (material->getDifHat()[2*_num_cmfd_groups + e]
-                  + material->getDifTilde()[2*_num_cmfd_groups + e])
-                  * heights[cell / _cx];
+    int pivot = k;
+    for (int i = k+1; i < n; i++){
+      if (fabs(lu[i*n + k]) > fabs(lu[pivot*n + k]))
+        pivot = i;
+    }
 
-          _A[cell][e*(_num_cmfd_groups+4)+_num_cmfd_groups+2] += value;
-        }
+    _mg_pivots[k] = pivot;
 
-        /* LEFT SURFACE */
+    if (pivot != k){
+      for (int j = 0; j < n; j++)
+        std::swap(lu[k*n + j], lu[pivot*n + j]);
+    }
 
-        /* Set transport term on diagonal */
-        value = (material->getDifHat()[0*_num_cmfd_groups + e]
-                + material->getDifTilde()[0*_num_cmfd_groups + e])
-                * heights[cell / _cx];
+    if (lu[k*n + k] == 0.0)
+      log_printf(ERROR, "Unable to factor the coarsest CMFD multigrid "
+                 "matrix since it is singular");
 
-        _A[cell][e*(_num_cmfd_groups+4)+e+2] += value;
+    for (int i = k+1; i < n; i++){
+      lu[i*n + k] /= lu[k*n + k];
 
-        /* Set transport term on off diagonal */
-        if (x != 0){
-          value = - (material->getDifHat()[0*_num_cmfd_groups + e]
-                  - material->getDifTilde()[0*_num_cmfd_groups + e])
-                  * heights[cell / _cx];
+      for (int j = k+1; j < n; j++)
+        lu[i*n + j] -= lu[i*n + k] * lu[k*n + j];
+    }
+  }
+}
 
-          _A[cell][e*(_num_cmfd_groups+4)] += value;
+
+/**
+ * @brief Apply a multigrid V-cycle to approximately solve Ax=b on a
+ *        multigrid level starting from a zero initial guess.
+ * @details A Gauss-Seidel sweep is applied before and after the coarse
+ *          grid correction. The residual is summed over the finer Mesh
+ *          cells in each coarse Mesh cell and the correction is interpolated
+ *          back with the weights from interpolation_weights(...). The
+ *          coarsest level is solved directly with the LU factors from
+ *          Cmfd::factorCoarseMatrix(...).
+ * @param mat the matrix on the CMFD Mesh
+ * @param level the multigrid level
+ * @param vec_x the x vector to compute
+ * @param vec_b the b vector
+ */
+void Cmfd::vCycle(sparseMatrix* mat, int level, double* vec_x,
+                  double* vec_b){
+
+  sparseMatrix* A = (level == 0) ? mat : _mg_matrices[level];
+  int num_x = _mg_cx[level];
+  int num_y = _mg_cy[level];
+  int num_rows = num_x * num_y * _num_cmfd_groups;
+
+  /* Solve the coarsest level directly */
+  if (level == _num_mg_levels - 1){
+
+    for (int i = 0; i < num_rows; i++)
+      vec_x[i] = vec_b[i];
+
+    /* Apply the row pivots in order before the forward substitution,
+     * since the factorization swaps whole rows of the LU factors */
+    for (int k = 0; k < num_rows; k++)
+      std::swap(vec_x[k], vec_x[_mg_pivots[k]]);
+
+    /* Forward substitution */
+    for (int k = 0; k < num_rows; k++){
+      for (int i = k+1; i < num_rows; i++)
+        vec_x[i] -= _mg_dense[i*num_rows + k] * vec_x[k];
+    }
+
+    /* Backward substitution */
+    for (int k = num_rows-1; k >= 0; k--){
+      for (int j = k+1; j < num_rows; j++)
+        vec_x[k] -= _mg_dense[k*num_rows + j] * vec_x[j];
+
+      vec_x[k] /= _mg_dense[k*num_rows + k];
+    }
+
+    return;
+  }
+
+  int coarse_cx = _mg_cx[level+1];
+  int coarse_cy = _mg_cy[level+1];
+  int num_colors = (level == 0) ? 2 : 4;
+  double* residual = _mg_r[level];
+  double* coarse_x = _mg_x[level+1];
+  double* coarse_b = _mg_b[level+1];
+
+  /* Pre-smoothing */
+  #pragma omp parallel for
+  for (int i = 0; i < num_rows; i++)
+    vec_x[i] = 0.0;
+
+  sweepGaussSeidel(A, num_x, num_y, vec_x, vec_b, 1.0, num_colors);
+
+  /* Compute the residual */
+  computeResidual(A, vec_x, vec_b, residual);
+
+  /* Restrict the residual to the coarse grid */
+  #pragma omp parallel for
+  for (int row = 0; row < coarse_cx * coarse_cy * _num_cmfd_groups; row++){
+
+    int cell = row / _num_cmfd_groups;
+    int e = row % _num_cmfd_groups;
+    int x = cell % coarse_cx;
+    int y = cell / coarse_cx;
+
+    coarse_b[row] = 0.0;
+
+    for (int j = 2*y; j < std::min(2*y+2, num_y); j++){
+      for (int i = 2*x; i < std::min(2*x+2, num_x); i++)
+        coarse_b[row] += residual[(j*num_x + i)*_num_cmfd_groups + e];
+    }
+  }
+
+  vCycle(mat, level+1, coarse_x, coarse_b);
+
+  /* Interpolate the coarse grid correction */
+  #pragma omp parallel for
+  for (int row = 0; row < num_rows; row++){
+
+    int cell = row / _num_cmfd_groups;
+    int e = row % _num_cmfd_groups;
+    int cells_x[2], cells_y[2];
+    double weights_x[2], weights_y[2];
+    int nx = interpolation_weights(cell % num_x, coarse_cx, cells_x,
+                                   weights_x);
+    int ny = interpolation_weights(cell / num_x, coarse_cy, cells_y,
+                                   weights_y);
+
+    for (int b = 0; b < ny; b++){
+      for (int a = 0; a < nx; a++)
+        vec_x[row] += weights_x[a] * weights_y[b] *
+             coarse_x[(cells_y[b]*coarse_cx + cells_x[a])*_num_cmfd_groups +
+                      e];
+    }
+  }
+
+  /* Post-smoothing */
+  sweepGaussSeidel(A, num_x, num_y, vec_x, vec_b, 1.0, num_colors);
+}
+
+
+/**
+ * @brief Solve the linear system Ax=b using multigrid V-cycles.
+ * @details Each iteration applies a V-cycle to the residual equation and
+ *          the iterations continue until the residual norm relative to
+ *          the norm of b is below the convergence criteria. The V-cycles
+ *          converge slowly for a Wielandt shifted matrix when the shift is
+ *          close to k_eff. If the residual norm decreases by less than
+ *          CMFD_MG_MAX_RATIO in an iteration after the second, the solve
+ *          continues with Cmfd::solveBiCGSTAB(...), which only uses the
+ *          V-cycle as a preconditioner.
+ * @param mat pointer to A matrix
+ * @param vec_x pointer to x vector
+ * @param vec_b pointer to b vector
+ * @param conv flux convergence criteria
+ * @param max_iter the maximum number of iterations
+ * @return the number of iterations
+ */
+int Cmfd::solveMultigrid(sparseMatrix* mat, double* vec_x, double* vec_b,
+                         double conv, int max_iter){
+
+  int num_rows = _cx*_cy*_num_cmfd_groups;
+  double* residual = _mg_b[0];
+  double* correction = _mg_x[0];
+  double norm_b = sqrt(vecDot(vec_b, vec_b));
+  double norm = 0.0, norm_old;
+  int iter = 0;
+
+  if (norm_b == 0.0){
+    vecSet(vec_x, 0.0);
+    return iter;
+  }
+
+  while (iter < max_iter){
+
+    /* Compute the residual */
+    norm_old = norm;
+    norm = sqrt(computeResidual(mat, vec_x, vec_b, residual)) / norm_b;
+
+    log_printf(DEBUG, "MG iter: %i, norm: %e", iter, norm);
+
+    /* Switch to BiCGSTAB if the V-cycles converge slowly */
+    if (iter > 1 && norm > CMFD_MG_MAX_RATIO * norm_old){
+      log_printf(DEBUG, "Switching to BiCGSTAB since the multigrid "
+                 "iterations converge slowly");
+      return iter + solveBiCGSTAB(mat, vec_x, vec_b, conv, max_iter - iter);
+    }
+
+    /* Always improve the solution at least once, as in SOR */
+    if (norm < conv && iter > 0)
+      break;
+
+    /* Apply the coarse grid corrections */
+    vCycle(mat, 0, correction, residual);
+
+    #pragma omp parallel for
+    for (int i = 0; i < num_rows; i++)
+      vec_x[i] += correction[i];
+
+    iter++;
+  }
+
+  return iter;
+}
+
+
+/**
+ * @brief Solve the linear system Ax=b using BiCGSTAB preconditioned with
+ *        a multigrid V-cycle.
+ * @details The preconditioner is applied on the right, and the iterations
+ *          continue until the residual norm relative to the norm of b is
+ *          below the convergence criteria.
+ * @param mat pointer to A matrix
+ * @param vec_x pointer to x vector
+ * @param vec_b pointer to b vector
+ * @param conv flux convergence criteria
+ * @param max_iter the maximum number of iterations
+ * @return the number of iterations
+ */
+int Cmfd::solveBiCGSTAB(sparseMatrix* mat, double* vec_x, double* vec_b,
+                        double conv, int max_iter){
+
+  int num_rows = _cx*_cy*_num_cmfd_groups;
+
+  if (_krylov == NULL){
+    try{
+      _krylov = new double[7*num_rows];
+    }
+    catch(std::exception &e){
+      log_printf(ERROR, "Could not allocate memory for the BiCGSTAB "
+                 "vectors. Backtrace:%s", e.what());
+    }
+  }
+
+  double* r = _krylov;
+  double* r_hat = _krylov + num_rows;
+  double* p = _krylov + 2*num_rows;
+  double* v = _krylov + 3*num_rows;
+  double* t = _krylov + 4*num_rows;
+  double* p_hat = _krylov + 5*num_rows;
+  double* s_hat = _krylov + 6*num_rows;
+
+  double rho = 1.0, alpha = 1.0, omega = 1.0;
+  double rho_new, beta;
+  double norm_b = sqrt(vecDot(vec_b, vec_b));
+  double norm;
+  int iter = 0;
+
+  /* Compute the initial residual */
+  computeResidual(mat, vec_x, vec_b, r);
+  vecCopy(r, r_hat);
+  vecSet(p, 0.0);
+  vecSet(v, 0.0);
+
+  if (norm_b == 0.0){
+    vecSet(vec_x, 0.0);
+    return iter;
+  }
+
+  while (iter < max_iter){
+
+    norm = sqrt(vecDot(r, r)) / norm_b;
+    rho_new = vecDot(r_hat, r);
+
+    log_printf(DEBUG, "BiCGSTAB iter: %i, norm: %e", iter, norm);
+
+    /* Always improve the solution at least once, as in SOR */
+    if (norm < conv && iter > 0)
+      break;
+
+    if (rho_new == 0.0){
+      log_printf(WARNING, "BiCGSTAB broke down after %i iterations with "
+                 "a residual norm of %e", iter, norm);
+      break;
+    }
+
+    /* Update the search direction */
+    beta = (rho_new / rho) * (alpha / omega);
+
+    #pragma omp parallel for
+    for (int i = 0; i < num_rows; i++)
+      p[i] = r[i] + beta * (p[i] - omega * v[i]);
+
+    vCycle(mat, 0, p_hat, p);
+    matMult(mat, p_hat, v);
+
+    alpha = rho_new / vecDot(r_hat, v);
+
+    /* Compute the intermediate residual in r */
+    #pragma omp parallel for
+    for (int i = 0; i < num_rows; i++){
+      r[i] -= alpha * v[i];
+      vec_x[i] += alpha * p_hat[i];
+    }
+
+    iter++;
+
+    if (sqrt(vecDot(r, r)) / norm_b < conv)
+      break;
+
+    /* Stabilize with a minimum residual step */
+    vCycle(mat, 0, s_hat, r);
+    matMult(mat, s_hat, t);
+
+    omega = vecDot(t, r) / vecDot(t, t);
+
+    #pragma omp parallel for
+    for (int i = 0; i < num_rows; i++){
+      vec_x[i] += omega * s_hat[i];
+      r[i] -= omega * t[i];
+    }
+
+    rho = rho_new;
+  }
+
+  return iter;
+}
+
+/**
+ * @brief Create the coarse CMFD levels for multilevel acceleration.
+ * @details Each coarse level aggregates (up to) 2 x 2 Mesh cells of the
+ *          next finer level. The aggregates never straddle the boundaries
+ *          of the Lattice cells on the nested Lattice levels of the
+ *          Geometry above the CMFD Mesh level, so that the coarse levels
+ *          coarsen each pin cell Lattice down to its assembly, and then the
+ *          assembly Lattice down to the core, until a grid of at most 4
+ *          Mesh cells remains. Lattice levels which do not evenly divide
+ *          the next finer Lattice level are skipped. The CMFD groups are
+ *          condensed to (at most) 2 groups on the first coarse level and to
+ *          1 group on the coarser levels.
+ */
+void Cmfd::initializeMultilevel(){
+
+  std::vector<int> lattice_x;
+  std::vector<int> lattice_y;
+  Universe* root = _geometry->getUniverse(0);
+
+  /* Find the number of Lattice cells on the Lattice levels above the
+   * CMFD Mesh level */
+  int num_x = _cx;
+  int num_y = _cy;
+
+  for (int depth = _mesh->getMeshLevel() - 1; depth > 0; depth--){
+
+    int width = 0;
+    int height = 0;
+    _geometry->findMeshWidth(root, &width, depth);
+    _geometry->findMeshHeight(root, &height, depth);
+
+    if (width * height < num_x * num_y && width > 0 && height > 0 &&
+        num_x % width == 0 && num_y % height == 0){
+      lattice_x.push_back(width);
+      lattice_y.push_back(height);
+      num_x = width;
+      num_y = height;
+    }
+  }
+
+  /* The whole core is the coarsest level */
+  lattice_x.push_back(1);
+  lattice_y.push_back(1);
+
+  /* Find the number of Mesh cells on each level and the number of Mesh
+   * cells of the next finer level in each of its Lattice cells */
+  std::vector<int> level_x(1, _cx);
+  std::vector<int> level_y(1, _cy);
+  std::vector<int> block_x(1, 1);
+  std::vector<int> block_y(1, 1);
+  int l = 0;
+
+  while (level_x.back() * level_y.back() > 4){
+
+    int size_x = level_x.back() / lattice_x[l];
+    int size_y = level_y.back() / lattice_y[l];
+
+    /* Move on to the next Lattice level once each Lattice cell has been
+     * aggregated into a single Mesh cell */
+    if (size_x == 1 && size_y == 1){
+      l++;
+      continue;
+    }
+
+    level_x.push_back(lattice_x[l] * ((size_x + 1) / 2));
+    level_y.push_back(lattice_y[l] * ((size_y + 1) / 2));
+    block_x.push_back(size_x);
+    block_y.push_back(size_y);
+  }
+
+  _num_ml_levels = block_x.size();
+
+  log_printf(INFO, "Creating %i CMFD levels", _num_ml_levels);
+
+  try{
+    _ml_cx = new int[_num_ml_levels];
+    _ml_cy = new int[_num_ml_levels];
+    _ml_groups = new int[_num_ml_levels];
+    _ml_rows = new int*[_num_ml_levels];
+    _ml_fine_row_ptr = new int*[_num_ml_levels];
+    _ml_fine_rows = new int*[_num_ml_levels];
+    _ml_A = new sparseMatrix*[_num_ml_levels];
+    _ml_M = new sparseMatrix*[_num_ml_levels];
+    _ml_flux = new double*[_num_ml_levels];
+    _ml_source = new double*[_num_ml_levels];
+    _ml_old_flux = new double*[_num_ml_levels];
+
+    _ml_cx[0] = _cx;
+    _ml_cy[0] = _cy;
+    _ml_groups[0] = _num_cmfd_groups;
+    _ml_rows[0] = NULL;
+    _ml_fine_row_ptr[0] = NULL;
+    _ml_fine_rows[0] = NULL;
+    _ml_A[0] = NULL;
+    _ml_M[0] = NULL;
+    _ml_flux[0] = NULL;
+    _ml_source[0] = NULL;
+    _ml_old_flux[0] = NULL;
+
+    for (int level = 1; level < _num_ml_levels; level++){
+
+      int fine_cx = _ml_cx[level-1];
+      int fine_groups = _ml_groups[level-1];
+      int num_fine_rows = fine_cx * _ml_cy[level-1] * fine_groups;
+
+      _ml_cx[level] = level_x[level];
+      _ml_cy[level] = level_y[level];
+      _ml_groups[level] = (level == 1) ? std::min(_num_cmfd_groups, 2) : 1;
+
+      int num_rows = _ml_cx[level] * _ml_cy[level] * _ml_groups[level];
+
+      /* Find the row containing each row of the next finer level */
+      _ml_rows[level] = new int[num_fine_rows];
+
+      for (int row = 0; row < num_fine_rows; row++){
+
+        int x = (row / fine_groups) % fine_cx;
+        int y = (row / fine_groups) / fine_cx;
+        int g = row % fine_groups;
+
+        /* Aggregate pairs of Mesh cells within each Lattice cell */
+        x = x / block_x[level] * ((block_x[level] + 1) / 2) +
+            x % block_x[level] / 2;
+        y = y / block_y[level] * ((block_y[level] + 1) / 2) +
+            y % block_y[level] / 2;
+
+        _ml_rows[level][row] = (y * _ml_cx[level] + x) * _ml_groups[level]
+                               + g * _ml_groups[level] / fine_groups;
+      }
+
+      /* Sort the rows of the next finer level by the row containing them */
+      _ml_fine_row_ptr[level] = new int[num_rows+1];
+      _ml_fine_rows[level] = new int[num_fine_rows];
+
+      for (int row = 0; row <= num_rows; row++)
+        _ml_fine_row_ptr[level][row] = 0;
+
+      for (int row = 0; row < num_fine_rows; row++)
+        _ml_fine_row_ptr[level][_ml_rows[level][row]+1]++;
+
+      for (int row = 0; row < num_rows; row++)
+        _ml_fine_row_ptr[level][row+1] += _ml_fine_row_ptr[level][row];
+
+      for (int row = 0; row < num_fine_rows; row++){
+        int coarse_row = _ml_rows[level][row];
+        int index = _ml_fine_row_ptr[level][coarse_row]++;
+        _ml_fine_rows[level][index] = row;
+      }
+
+      for (int row = num_rows; row > 0; row--)
+        _ml_fine_row_ptr[level][row] = _ml_fine_row_ptr[level][row-1];
+
+      _ml_fine_row_ptr[level][0] = 0;
+
+      /* The M matrix uses the A matrix structure which includes the
+       * coupling of all groups in each Mesh cell */
+      _ml_A[level] = createMatrix(false, _ml_cx[level], _ml_cy[level],
+                                  _ml_groups[level], false);
+      _ml_M[level] = createMatrix(false, _ml_cx[level], _ml_cy[level],
+                                  _ml_groups[level], false);
+
+      _ml_flux[level] = new double[num_rows];
+      _ml_source[level] = new double[num_rows];
+      _ml_old_flux[level] = new double[num_rows];
+
+      log_printf(INFO, "CMFD level %i: %i x %i Mesh cells, %i groups",
+                 level, _ml_cx[level], _ml_cy[level], _ml_groups[level]);
+    }
+  }
+  catch(std::exception &e){
+    log_printf(ERROR, "Could not allocate memory for the CMFD multilevel "
+               "acceleration. Backtrace:%s", e.what());
+  }
+}
+
+
+/**
+ * @brief Compute the flux-weighted A and M matrices on a coarse CMFD level.
+ * @details Each entry of the next finer level matrices is multiplied by the
+ *          finer level flux in its column and added to the entry coupling
+ *          the coarse Mesh cell groups containing its row and column. The
+ *          coarse level matrices preserve the reaction rates of the finer
+ *          level flux, so that a uniform coarse level flux solves the coarse
+ *          eigenvalue problem once the finer level flux has converged.
+ * @param level the coarse CMFD level (> 0)
+ * @param flux the flux on the next finer level
+ */
+void Cmfd::restrictLevel(int level, double* flux){
+
+  sparseMatrix* fine_A = (level == 1) ? _A : _ml_A[level-1];
+  sparseMatrix* fine_M = (level == 1) ? _M : _ml_M[level-1];
+  int* coarse_rows = _ml_rows[level];
+  int* fine_row_ptr = _ml_fine_row_ptr[level];
+  int* fine_rows = _ml_fine_rows[level];
+
+  matZero(_ml_A[level]);
+  matZero(_ml_M[level]);
+
+  /* Loop over coarse level rows */
+  #pragma omp parallel for
+  for (int row = 0; row < _ml_A[level]->_num_rows; row++){
+
+    int cols_buffer[_num_cmfd_groups+4];
+    double vals_buffer[_num_cmfd_groups+4];
+    int* cols;
+    double* vals;
+
+    for (int m = 0; m < 2; m++){
+
+      sparseMatrix* fine = (m == 0) ? fine_A : fine_M;
+      sparseMatrix* coarse = (m == 0) ? _ml_A[level] : _ml_M[level];
+      int* coarse_cols = &coarse->_cols[coarse->_row_ptr[row]];
+      double* coarse_vals = &coarse->_vals[coarse->_row_ptr[row]];
+      int num_coarse = coarse->_row_ptr[row+1] - coarse->_row_ptr[row];
+
+      /* Loop over the finer level rows in this coarse level row */
+      for (int i = fine_row_ptr[row]; i < fine_row_ptr[row+1]; i++){
+
+        int num_entries = getRow(fine, fine_rows[i], &cols, &vals,
+                                 cols_buffer, vals_buffer);
+
+        for (int k = 0; k < num_entries; k++){
+
+          int col = coarse_rows[cols[k]];
+
+          for (int c = 0; c < num_coarse; c++){
+            if (coarse_cols[c] == col){
+              coarse_vals[c] += vals[k] * flux[cols[k]];
+              break;
+            }
+          }
         }
+      }
+    }
+  }
+}
+
+
+/**
+ * @brief Rebalance the flux on a CMFD level with the eigenvalue problem on
+ *        the next coarser level.
+ * @details The flux-weighted eigenvalue problem on the coarser level is
+ *          solved for a rebalance factor in each coarse Mesh cell group by
+ *          power iterations, each of which applies a few Gauss-Seidel
+ *          sweeps and is itself rebalanced on the next coarser level. The
+ *          flux is then multiplied by the rebalance factors, which removes
+ *          the long-wavelength error modes that converge slowly in the
+ *          power iteration on the finer level. The rebalance factors are
+ *          normalized to conserve the total fission source so that the
+ *          eigenvalue estimate on the finer level is unchanged.
+ * @param level the coarse CMFD level (> 0)
+ * @param flux the flux on the next finer level to rebalance
+ */
+void Cmfd::rebalanceFlux(int level, double* flux){
+
+  restrictLevel(level, flux);
+
+  sparseMatrix* A = _ml_A[level];
+  sparseMatrix* M = _ml_M[level];
+  int num_rows = A->_num_rows;
+  double* factors = _ml_flux[level];
+  double* source = _ml_source[level];
+  double* old_factors = _ml_old_flux[level];
+  double fission, loss, norm, val;
+  double total_fission = 0.0;
+
+  /* The fission source of the finer level flux */
+  for (int i = 0; i < M->_num_nonzeros; i++)
+    total_fission += M->_vals[i];
+
+  for (int row = 0; row < num_rows; row++)
+    factors[row] = 1.0;
+
+  for (int iter = 0; iter < CMFD_MULTILEVEL_ITERATIONS; iter++){
+
+    /* Compute the fission source divided by the eigenvalue estimate */
+    matMult(A, factors, source);
+    loss = 0.0;
+    for (int row = 0; row < num_rows; row++)
+      loss += source[row];
+
+    matMult(M, factors, source);
+    fission = 0.0;
+    for (int row = 0; row < num_rows; row++)
+      fission += source[row];
+
+    for (int row = 0; row < num_rows; row++){
+      source[row] *= loss / fission;
+      old_factors[row] = factors[row];
+    }
+
+    /* Gauss-Seidel sweeps on the coarse level */
+    for (int sweep = 0; sweep < CMFD_MULTILEVEL_SWEEPS; sweep++){
+      for (int row = 0; row < num_rows; row++){
+
+        val = source[row];
+
+        for (int k = A->_row_ptr[row]; k < A->_row_ptr[row+1]; k++){
+          if (k != A->_diag[row])
+            val -= A->_vals[k] * factors[A->_cols[k]];
+        }
+
+        factors[row] = val / A->_vals[A->_diag[row]];
+      }
+    }
+
+    /* Rebalance the factors on the next coarser level */
+    if (level < _num_ml_levels - 1)
+      rebalanceFlux(level + 1, factors);
+
+    /* Compute the RMS relative change in the factors */
+    norm = 0.0;
+    for (int row = 0; row < num_rows; row++)
+      norm += pow((factors[row] - old_factors[row]) / old_factors[row], 2);
+
+    norm = sqrt(norm / num_rows);
+
+    log_printf(DEBUG, "CMFD level %i iter: %i, k_eff: %f, norm: %f",
+               level, iter, fission / loss, norm);
+
+    if (norm < CMFD_MULTILEVEL_CONV)
+      break;
+  }
+
+  /* Normalize the factors to conserve the fission source */
+  matMult(M, factors, source);
+  fission = 0.0;
+  for (int row = 0; row < num_rows; row++)
+    fission += source[row];
+
+  double scale_val = total_fission / fission;
+  int* coarse_rows = _ml_rows[level];
+
+  /* Multiply the finer level flux by the rebalance factors */
+  #pragma omp parallel for
+  for (int row = 0; row < _ml_cx[level-1] * _ml_cy[level-1] *
+         _ml_groups[level-1]; row++)
+    flux[row] *= scale_val * factors[coarse_rows[row]];
+}
+
+
+
+/**
+ * @brief Rescale the initial and converged flux arrays.
+ */
+void Cmfd::rescaleFlux(){
+
+  double sum_new, sum_old, scale_val;
+  double* phi_old = _mesh->getFluxes(PRIMAL);
+  double* phi_new = _mesh->getFluxes(PRIMAL_UPDATE);
+
+  /* Rescale the new and old flux to have an avg source of 1.0 */
+  matMultM(_M, phi_new, _new_source);
+  sum_new = vecSum(_new_source);
+  scale_val = _cx*_cy*_num_cmfd_groups / sum_new;
+  vecScale(phi_new, scale_val);
+  matMultM(_M, phi_old, _old_source);
+  sum_old = vecSum(_old_source);
+  scale_val = _cx*_cy*_num_cmfd_groups / sum_old;
+  vecScale(phi_old, scale_val);
+}
+
+
+/**
+ * @brief Scale vectgor by some scalar value.
+ * @param vec vector to be scaled
+ * @param scale_val value to scale vector
+ */
+void Cmfd::vecScale(double* vec, double scale_val){
+
+  #pragma omp parallel for
+  for (int i = 0; i < _cx*_cy*_num_cmfd_groups; i++)
+    vec[i] *= scale_val;
+}
+
+
+/**
+ * @brief Set every element in vector to some value.
+ * @param vec vector to be set
+ * @param val value to set each element
+ */
+void Cmfd::vecSet(double* vec, double val){
+
+  #pragma omp parallel for
+  for (int i = 0; i < _cx*_cy*_num_cmfd_groups; i++)
+    vec[i] = val;
+}
+
+
+/**
+ * @brief Normalize vector to have avg source of 1.0.
+ * @param mat source matrix
+ * @param vec vector to be normalized
+ */
+void Cmfd::vecNormal(sparseMatrix* mat, double* vec){
+  double source, scale_val;
+  matMultM(mat, vec, _phi_temp);
+  source = vecSum(_phi_temp);
+  scale_val = (_cx*_cy*_num_cmfd_groups) / source;
+  vecScale(vec, scale_val);
+}
+
+
+/**
+ * @brief Multiply matrix by vector (i.e., y = M *x).
+ * @param mat source matrix
+ * @param vec_x x vector
+ * @param vec_y y vector
+ */
+void Cmfd::matMultM(sparseMatrix* mat, double* vec_x, double* vec_y){
+  matMult(mat, vec_x, vec_y);
+}
+
+
+/**
+ * @brief Sum all elements in a vector.
+ * @param vec vector to be summed
+ * @return sum of vector elements
+ */
+double Cmfd::vecSum(double* vec){
+
+  int num_rows = _cx*_cy*_num_cmfd_groups;
+  int num_blocks = (num_rows + CMFD_REDUCTION_BLOCK - 1) /
+                   CMFD_REDUCTION_BLOCK;
+
+  #pragma omp parallel for
+  for (int b = 0; b < num_blocks; b++){
+
+    int end = std::min((b+1)*CMFD_REDUCTION_BLOCK, num_rows);
+    double sum = 0.0;
+
+    for (int i = b*CMFD_REDUCTION_BLOCK; i < end; i++)
+      sum += vec[i];
+
+    _partial_sums[b] = sum;
+  }
+
+  return sumPartials(_partial_sums, num_blocks);
+}
+
+
+/**
+ * @brief Sum the partial sums of the blocks of a parallel reduction.
+ * @details The vector reductions split their vectors into blocks of
+ *          CMFD_REDUCTION_BLOCK elements which are each summed serially by
+ *          one thread. The block sums are then added here in block order,
+ *          so that the result is independent of the number of threads and
+ *          identical from run to run.
+ * @param partial_sums the sum of each block
+ * @param num_blocks the number of blocks
+ * @return the sum of the blocks
+ */
+double Cmfd::sumPartials(double* partial_sums, int num_blocks){
+
+  double sum = 0.0;
+
+  for (int b = 0; b < num_blocks; b++)
+    sum += partial_sums[b];
+
+  return sum;
+}
+
+
+/**
+ * @brief Compute the dot product of two vectors.
+ * @param vec_x the first vector
+ * @param vec_y the second vector
+ * @return the dot product
+ */
+double Cmfd::vecDot(double* vec_x, double* vec_y){
+
+  int num_rows = _cx*_cy*_num_cmfd_groups;
+  int num_blocks = (num_rows + CMFD_REDUCTION_BLOCK - 1) /
+                   CMFD_REDUCTION_BLOCK;
+
+  #pragma omp parallel for
+  for (int b = 0; b < num_blocks; b++){
+
+    int end = std::min((b+1)*CMFD_REDUCTION_BLOCK, num_rows);
+    double sum = 0.0;
+
+    for (int i = b*CMFD_REDUCTION_BLOCK; i < end; i++)
+      sum += vec_x[i] * vec_y[i];
+
+    _partial_sums[b] = sum;
+  }
+
+  return sumPartials(_partial_sums, num_blocks);
+}
+
+
+/**
+ * @brief Compute the sum of the squared relative differences between two
+ *        vectors.
+ * @details The old vector is scaled before the difference is taken and
+ *          elements of the new vector which are zero are skipped.
+ * @param vec_new the new vector
+ * @param vec_old the old vector
+ * @param scale_old the factor to scale the old vector by
+ * @return the sum of the squared relative differences
+ */
+double Cmfd::vecRelativeDiff(double* vec_new, double* vec_old,
+                             double scale_old){
+
+  int num_rows = _cx*_cy*_num_cmfd_groups;
+  int num_blocks = (num_rows + CMFD_REDUCTION_BLOCK - 1) /
+                   CMFD_REDUCTION_BLOCK;
+
+  #pragma omp parallel for
+  for (int b = 0; b < num_blocks; b++){
+
+    int end = std::min((b+1)*CMFD_REDUCTION_BLOCK, num_rows);
+    double sum = 0.0;
+    double diff;
+
+    for (int i = b*CMFD_REDUCTION_BLOCK; i < end; i++){
+      if (vec_new[i] != 0.0){
+        diff = (vec_new[i] - scale_old * vec_old[i]) / vec_new[i];
+        sum += diff * diff;
+      }
+    }
+
+    _partial_sums[b] = sum;
+  }
 
-        /* BOTTOM SURFACE */
+  return sumPartials(_partial_sums, num_blocks);
+}
 
-        /* Set transport term on diagonal */
-        value = (material->getDifHat()[1*_num_cmfd_groups + e]
-                - material->getDifTilde()[1*_num_cmfd_groups + e])
-                * widths[cell % _cx];
 
-        _A[cell][e*(_num_cmfd_groups+4)+e+2] += value;
+/**
+ * @brief Compute the residual r = b - Ax and its squared L2 norm.
+ * @param mat the matrix
+ * @param vec_x the x vector
+ * @param vec_b the b vector
+ * @param vec_r the residual vector to compute
+ * @return the squared L2 norm of the residual
+ */
+double Cmfd::computeResidual(sparseMatrix* mat, double* vec_x, double* vec_b,
+                             double* vec_r){
 
-        /* Set transport term on off diagonal */
-        if (y != _cy - 1){
-          value = - (material->getDifHat()[1*_num_cmfd_groups + e]
-                  + material->getDifTilde()[1*_num_cmfd_groups + e])
-                  * widths[cell % _cx];
+  int num_rows = mat->_num_rows;
+  int num_blocks = (num_rows + CMFD_REDUCTION_BLOCK - 1) /
+                   CMFD_REDUCTION_BLOCK;
 
-          _A[cell][e*(_num_cmfd_groups+4)+1] += value;
-        }
+  #pragma omp parallel for
+  for (int b = 0; b < num_blocks; b++){
 
-        /* TOP SURFACE */
+    /* Buffers for the matrix rows computed in matrix-free mode */
+    int cols_buffer[_num_cmfd_groups+4];
+    double vals_buffer[_num_cmfd_groups+4];
+    int* cols;
+    double* vals;
 
-        /* Set transport term on diagonal */
-        value = (material->getDifHat()[3*_num_cmfd_groups + e]
-                + material->getDifTilde()[3*_num_cmfd_groups + e])
-                * widths[cell % _cx];
+    int end = std::min((b+1)*CMFD_REDUCTION_BLOCK, num_rows);
+    double sum = 0.0;
 
-        _A[cell][e*(_num_cmfd_groups+4)+e+2] += value;
+    for (int row = b*CMFD_REDUCTION_BLOCK; row < end; row++){
 
-        /* Set transport term on off diagonal */
-        if (y != 0){
-          value = - (material->getDifHat()[3*_num_cmfd_groups + e]
-                  - material->getDifTilde()[3*_num_cmfd_groups + e])
-                  * widths[cell % _cx];
+      int num_entries = getRow(mat, row, &cols, &vals, cols_buffer,
+                               vals_buffer);
+      double val = vec_b[row];
 
-          _A[cell][e*(_num_cmfd_groups+4)+_num_cmfd_groups+3] += value;
-        }
+      for (int e = 0; e < num_entries; e++)
+        val -= vals[e] * vec_x[cols[e]];
 
-        /* Source term */
-        for (int g = 0; g < _num_cmfd_groups; g++){
-          value = material->getChi()[e] * material->getNuSigmaF()[g]
-                  * volume;
+      vec_r[row] = val;
+      sum += val * val;
+    }
 
-          if (_flux_type == PRIMAL)
-            _M[cell][e*_num_cmfd_groups+g] += value;
-          else
-            _M[cell][g*_num_cmfd_groups+e] += value;
-        }
+    _partial_sums[b] = sum;
+  }
+
+  return sumPartials(_partial_sums, num_blocks);
+}
+
+
+/**
+ * @brief Copy a vector to another vector.
+ * @param vec_from vector to be copied
+ * @param vec_to vector to receive copied data
+ */
+void Cmfd::vecCopy(double* vec_from, double* vec_to){
+
+  #pragma omp parallel for
+  for (int i = 0; i < _cx*_cy*_num_cmfd_groups; i++)
+    vec_to[i] = vec_from[i];
+}
+
+
+/**
+ * @brief Assign all elements in a matrix to zero.
+ * @param mat matrix to be zeroed
+ */
+void Cmfd::matZero(sparseMatrix* mat){
+
+  if (mat->_vals == NULL)
+    return;
+
+  #pragma omp parallel for
+  for (int i = 0; i < mat->_num_nonzeros; i++)
+    mat->_vals[i] = 0.0;
+}
+
+
+/**
+ * @brief Allocate a sparse matrix with the non-zero structure of the CMFD
+ *        A or M matrix on a grid of Mesh cells.
+ * @details Each row of the A matrix couples a Mesh cell group to all groups
+ *          in the same Mesh cell and to the same group in each of the (up
+ *          to) four neighboring Mesh cells. The M matrix is block diagonal
+ *          with one dense block coupling the groups in each Mesh cell. In
+ *          matrix-free mode no entries are allocated.
+ * @param fission whether to create the M matrix (true) or the A matrix
+ * @param num_x the number of Mesh cells along x
+ * @param num_y the number of Mesh cells along y
+ * @param num_groups the number of energy groups in each Mesh cell, which
+ *        must be the number of CMFD groups for the M matrix
+ * @param matrix_free whether the matrix is applied matrix-free
+ * @return a pointer to the new matrix
+ */
+sparseMatrix* Cmfd::createMatrix(bool fission, int num_x, int num_y,
+                                 int num_groups, bool matrix_free){
+
+  int num_rows = num_x*num_y*num_groups;
+  sparseMatrix* mat = new sparseMatrix;
+
+  mat->_num_rows = num_rows;
+  mat->_num_nonzeros = 0;
+  mat->_row_ptr = NULL;
+  mat->_cols = NULL;
+  mat->_diag = NULL;
+  mat->_vals = NULL;
+  mat->_shift = 0.0;
+
+  if (matrix_free)
+    return mat;
+
+  int cols_buffer[num_groups+4];
+
+  try{
+    mat->_row_ptr = new int[num_rows+1];
+    mat->_diag = new int[num_rows];
+
+    /* Count the non-zero entries in each row */
+    mat->_row_ptr[0] = 0;
+
+    for (int row = 0; row < num_rows; row++){
+
+      int cell = row / num_groups;
+      int e = row % num_groups;
+
+      if (fission)
+        mat->_row_ptr[row+1] = mat->_row_ptr[row] +
+             computeFissionRow(cell, e, cols_buffer, NULL);
+      else
+        mat->_row_ptr[row+1] = mat->_row_ptr[row] +
+             computeLossColumns(cell, e, num_x, num_y, num_groups,
+                                cols_buffer);
+    }
+
+    mat->_num_nonzeros = mat->_row_ptr[num_rows];
+    mat->_cols = new int[mat->_num_nonzeros];
+    mat->_vals = new double[mat->_num_nonzeros];
+  }
+  catch(std::exception &e){
+    log_printf(ERROR, "Could not allocate memory for the CMFD matrix. "
+               "Backtrace:%s", e.what());
+  }
+
+  /* Set the column indices of the entries in each row */
+  #pragma omp parallel for
+  for (int row = 0; row < num_rows; row++){
+
+    int cell = row / num_groups;
+    int e = row % num_groups;
+    int* cols = &mat->_cols[mat->_row_ptr[row]];
+    int num_entries;
+
+    if (fission)
+      num_entries = computeFissionRow(cell, e, cols, NULL);
+    else
+      num_entries = computeLossColumns(cell, e, num_x, num_y, num_groups,
+                                       cols);
+
+    for (int i = 0; i < num_entries; i++){
+      if (cols[i] == row)
+        mat->_diag[row] = mat->_row_ptr[row] + i;
+    }
+  }
+
+  matZero(mat);
+
+  log_printf(INFO, "Created CMFD matrix with %i rows and %i non-zeros",
+             num_rows, mat->_num_nonzeros);
 
-        log_printf(DEBUG, "cel: %i, vol; %f", cell, _mesh->getVolumes()[cell]);
+  return mat;
+}
+
+
+/**
+ * @brief Deallocate a sparse matrix created by Cmfd::createMatrix(...).
+ * @param mat the matrix to delete
+ */
+void Cmfd::deleteMatrix(sparseMatrix* mat){
+
+  if (mat->_row_ptr != NULL)
+    delete [] mat->_row_ptr;
+
+  if (mat->_cols != NULL)
+    delete [] mat->_cols;
+
+  if (mat->_diag != NULL)
+    delete [] mat->_diag;
+
+  if (mat->_vals != NULL)
+    delete [] mat->_vals;
+
+  delete mat;
+}
+
+
+/**
+ * @brief Compute the column indices of a row of the A matrix on a grid of
+ *        Mesh cells.
+ * @details The columns are sorted: the coupling to the top and left
+ *          neighboring Mesh cells, to each group in this Mesh cell, and to
+ *          the right and bottom neighboring Mesh cells. The neighbors on
+ *          the boundary of the grid are omitted.
+ * @param cell the Mesh cell of the row
+ * @param e the CMFD group of the row
+ * @param num_x the number of Mesh cells along x
+ * @param num_y the number of Mesh cells along y
+ * @param num_groups the number of energy groups in each Mesh cell
+ * @param cols an array of at least G+4 column indices to populate
+ * @return the number of non-zero entries in the row
+ */
+int Cmfd::computeLossColumns(int cell, int e, int num_x, int num_y,
+                             int num_groups, int* cols){
+
+  int x = cell % num_x;
+  int y = cell / num_x;
+  int num_entries = 0;
 
-        for (int i = 0; i < _num_cmfd_groups+4; i++)
-          log_printf(DEBUG, "i: %i, A value: %f",
-                     i, _A[cell][e*(_num_cmfd_groups+4)+i]);
+  if (y != 0)
+    cols[num_entries++] = (cell - num_x)*num_groups + e;
 
-        for (int i = 0; i < _num_cmfd_groups; i++)
-          log_printf(DEBUG, "i: %i, M value: %f",
-                     i, _M[cell][e*(_num_cmfd_groups+4)+i]);
+  if (x != 0)
+    cols[num_entries++] = (cell - 1)*num_groups + e;
+
+  for (int g = 0; g < num_groups; g++)
+    cols[num_entries++] = cell*num_groups + g;
+
+  if (x != num_x - 1)
+    cols[num_entries++] = (cell + 1)*num_groups + e;
+
+  if (y != num_y - 1)
+    cols[num_entries++] = (cell + num_x)*num_groups + e;
+
+  return num_entries;
+}
+
+
+/**
+ * @brief Compute the column indices and values of a row of the A matrix
+ *        less a multiple of the M matrix.
+ * @details The entries are sorted by column as described for
+ *          Cmfd::computeLossColumns(...).
+ * @param cell the Mesh cell of the row
+ * @param e the CMFD group of the row
+ * @param shift the multiple of the M matrix to subtract from the A matrix
+ * @param cols an array of at least G+4 column indices to populate
+ * @param vals an array of at least G+4 values to populate
+ * @return the number of non-zero entries in the row
+ */
+int Cmfd::computeLossRow(int cell, int e, double shift, int* cols,
+                         double* vals){
+
+  int x = cell % _cx;
+  int y = cell / _cx;
+  int num_entries = computeLossColumns(cell, e, _cx, _cy, _num_cmfd_groups,
+                                       cols);
+  int block = (y != 0) + (x != 0);
+
+  Material* material = _mesh->getMaterials()[cell];
+  double volume = _mesh->getVolumes()[cell];
+  double height = _mesh->getLengthsY()[y];
+  double width = _mesh->getLengthsX()[x];
+  FP_PRECISION* sigma_s = material->getSigmaS();
+  FP_PRECISION* dif_hat = material->getDifHat();
+  FP_PRECISION* dif_tilde = material->getDifTilde();
+  double* diag = &vals[block + e];
+  int i = 0;
+
+  for (int j = 0; j < num_entries; j++)
+    vals[j] = 0.0;
+
+  /* Absorption term */
+  *diag += material->getSigmaA()[e] * volume;
+
+  /* Out (diagonal) and in (off diagonal) scattering */
+  for (int g = 0; g < _num_cmfd_groups; g++){
+    if (e != g){
+      if (_flux_type == PRIMAL){
+        *diag += sigma_s[g*_num_cmfd_groups + e] * volume;
+        vals[block + g] -= sigma_s[e*_num_cmfd_groups + g] * volume;
+      }
+      else{
+        *diag += sigma_s[e*_num_cmfd_groups + g] * volume;
+        vals[block + g] -= sigma_s[g*_num_cmfd_groups + e] * volume;
       }
     }
   }
 
+  /* Transport terms on the diagonal for the right, left, bottom and top
+   * surfaces */
+  *diag += (dif_hat[2*_num_cmfd_groups + e] -
+            dif_tilde[2*_num_cmfd_groups + e]) * height;
+  *diag += (dif_hat[0*_num_cmfd_groups + e] +
+            dif_tilde[0*_num_cmfd_groups + e]) * height;
+  *diag += (dif_hat[1*_num_cmfd_groups + e] -
+            dif_tilde[1*_num_cmfd_groups + e]) * width;
+  *diag += (dif_hat[3*_num_cmfd_groups + e] +
+            dif_tilde[3*_num_cmfd_groups + e]) * width;
+
+  /* TOP SURFACE transport term on the off diagonal */
+  if (y != 0)
+    vals[i++] = - (dif_hat[3*_num_cmfd_groups + e] -
+                   dif_tilde[3*_num_cmfd_groups + e]) * width;
+
+  /* LEFT SURFACE transport term on the off diagonal */
+  if (x != 0)
+    vals[i++] = - (dif_hat[0*_num_cmfd_groups + e] -
+                   dif_tilde[0*_num_cmfd_groups + e]) * height;
+
+  i += _num_cmfd_groups;
+
+  /* RIGHT SURFACE transport term on the off diagonal */
+  if (x != _cx - 1)
+    vals[i++] = - (dif_hat[2*_num_cmfd_groups + e] +
+                   dif_tilde[2*_num_cmfd_groups + e]) * height;
+
+  /* BOTTOM SURFACE transport term on the off diagonal */
+  if (y != _cy - 1)
+    vals[i++] = - (dif_hat[1*_num_cmfd_groups + e] +
+                   dif_tilde[1*_num_cmfd_groups + e]) * width;
+
+  /* Subtract the shifted fission source */
+  if (shift != 0.0){
+
+    int fission_cols[_num_cmfd_groups];
+    double fission_vals[_num_cmfd_groups];
+    computeFissionRow(cell, e, fission_cols, fission_vals);
+
+    for (int g = 0; g < _num_cmfd_groups; g++)
+      vals[block + g] -= shift * fission_vals[g];
+  }
+
+  return num_entries;
+}
+
+
+/**
+ * @brief Compute the column indices and values of a row of the M matrix.
+ * @param cell the Mesh cell of the row
+ * @param e the CMFD group of the row
+ * @param cols an array of at least G column indices to populate
+ * @param vals an array of at least G values to populate (or NULL to only
+ *        compute the column indices)
+ * @return the number of non-zero entries in the row
+ */
+int Cmfd::computeFissionRow(int cell, int e, int* cols, double* vals){
+
+  for (int g = 0; g < _num_cmfd_groups; g++)
+    cols[g] = cell*_num_cmfd_groups + g;
+
+  if (vals == NULL)
+    return _num_cmfd_groups;
+
+  Material* material = _mesh->getMaterials()[cell];
+  double volume = _mesh->getVolumes()[cell];
+  FP_PRECISION* chi = material->getChi();
+  FP_PRECISION* nu_sigma_f = material->getNuSigmaF();
+
+  for (int g = 0; g < _num_cmfd_groups; g++){
+    if (_flux_type == PRIMAL)
+      vals[g] = chi[e] * nu_sigma_f[g] * volume;
+    else
+      vals[g] = chi[g] * nu_sigma_f[e] * volume;
+  }
+
+  return _num_cmfd_groups;
+}
+
+
+/**
+ * @brief Get the column indices and values of a row of a matrix.
+ * @details If the matrix is stored the column indices and values point
+ *          into the matrix. Otherwise the matrix is applied matrix-free
+ *          and the row is computed into the buffers from the Mesh cell
+ *          Materials.
+ * @param mat the matrix of interest
+ * @param row the row of interest
+ * @param cols a pointer to set to the column indices of the row
+ * @param vals a pointer to set to the values of the row
+ * @param cols_buffer an array of at least G+4 column indices
+ * @param vals_buffer an array of at least G+4 values
+ * @return the number of non-zero entries in the row
+ */
+int Cmfd::getRow(sparseMatrix* mat, int row, int** cols, double** vals,
+                 int* cols_buffer, double* vals_buffer){
+
+  if (mat->_vals != NULL){
+    *cols = &mat->_cols[mat->_row_ptr[row]];
+    *vals = &mat->_vals[mat->_row_ptr[row]];
+    return mat->_row_ptr[row+1] - mat->_row_ptr[row];
+  }
+
+  int cell = row / _num_cmfd_groups;
+  int e = row % _num_cmfd_groups;
+  *cols = cols_buffer;
+  *vals = vals_buffer;
+
+  if (mat == _M)
+    return computeFissionRow(cell, e, cols_buffer, vals_buffer);
+  else
+    return computeLossRow(cell, e, mat->_shift, cols_buffer, vals_buffer);
+}
+
+
+/** @brief Fill in the values in the A matrix, M matrix, and old
+ *        scalar flux vector.
+ * @details The rows of the matrices are independent and are computed in
+ *          parallel. In matrix-free mode the rows are instead computed
+ *          when the matrices are applied.
+ */
+void Cmfd::constructMatrices(){
+
+  log_printf(INFO,"Constructing matrices...");
+
+  if (_matrix_free){
+    log_printf(INFO, "Matrix-free mode: matrix rows computed on the fly");
+    return;
+  }
+
+  /* Loop over rows */
+  #pragma omp parallel for
+  for (int row = 0; row < _cx*_cy*_num_cmfd_groups; row++){
+
+    int cell = row / _num_cmfd_groups;
+    int e = row % _num_cmfd_groups;
+
+    computeLossRow(cell, e, 0.0, &_A->_cols[_A->_row_ptr[row]],
+                   &_A->_vals[_A->_row_ptr[row]]);
+    computeFissionRow(cell, e, &_M->_cols[_M->_row_ptr[row]],
+                      &_M->_vals[_M->_row_ptr[row]]);
+
+    for (int i = _A->_row_ptr[row]; i < _A->_row_ptr[row+1]; i++)
+      log_printf(DEBUG, "row: %i, col: %i, A value: %f",
+                 row, _A->_cols[i], _A->_vals[i]);
+
+    for (int i = _M->_row_ptr[row]; i < _M->_row_ptr[row+1]; i++)
+      log_printf(DEBUG, "row: %i, col: %i, M value: %f",
+                 row, _M->_cols[i], _M->_vals[i]);
+  }
+
   log_printf(INFO, "Done constructing matrices...");
 }
 
@@ -1322,6 +2719,15 @@ Mesh* Cmfd::getMesh(){
 }
 
 
+/**
+ * @brief Get pointer to the Timer object.
+ * @return pointer to the Timer
+ */
+Timer* Cmfd::getTimer(){
+  return _timer;
+}
+
+
 /**
  * @brief Set the flux type (PRIMAL or ADJOINT).
  * @param flux_type char string representing enum for flux type
@@ -1370,6 +2776,153 @@ void Cmfd::dumpVec(double* vec, int length){
 }
 
 
+/**
+ * @brief Set the method used to solve the CMFD linear systems.
+ * @details The options are "SOR" for red-black Gauss-Seidel with
+ *          over-relaxation (the default), "MULTIGRID" for multigrid
+ *          V-cycles, and "BICGSTAB" for BiCGSTAB preconditioned with a
+ *          multigrid V-cycle.
+ * @param linear_method the linear solver method
+ */
+void Cmfd::setLinearMethod(const char* linear_method){
+
+  if (strcmp("SOR", linear_method) == 0)
+    _linear_method = SOR;
+  else if (strcmp("MULTIGRID", linear_method) == 0)
+    _linear_method = MULTIGRID;
+  else if (strcmp("BICGSTAB", linear_method) == 0)
+    _linear_method = BICGSTAB;
+  else
+    log_printf(ERROR, "Could not recognize linear method: "
+               "the options are SOR, MULTIGRID and BICGSTAB");
+}
+
+
+/**
+ * @brief Set whether to apply the CMFD matrices matrix-free.
+ * @details In matrix-free mode the A and M matrices are not stored and
+ *          their rows are computed from the Mesh cell Materials each time
+ *          they are applied. This reduces the memory footprint for large
+ *          Meshes at the cost of recomputing the matrix entries in each
+ *          linear solver iteration.
+ * @param matrix_free whether to use matrix-free mode (true) or not (false)
+ */
+void Cmfd::setMatrixFree(bool matrix_free){
+
+  if (matrix_free == _matrix_free)
+    return;
+
+  _matrix_free = matrix_free;
+
+  /* Recreate any existing matrices with the new storage */
+  if (_A != NULL){
+    deleteMatrix(_A);
+    deleteMatrix(_M);
+    _A = createMatrix(false, _cx, _cy, _num_cmfd_groups,
+                      _matrix_free);
+    _M = createMatrix(true, _cx, _cy, _num_cmfd_groups,
+                      _matrix_free);
+  }
+
+  if (_AM != NULL){
+    deleteMatrix(_AM);
+    _AM = createMatrix(false, _cx, _cy, _num_cmfd_groups,
+                       _matrix_free);
+  }
+}
+
+
+/**
+ * @brief Set whether to adapt the linear solver tolerance to the
+ *        convergence of the CMFD eigenvalue iteration.
+ * @details By default each linear solve in the eigenvalue iteration is
+ *          converged to a fixed tolerance of 1E-8. In adaptive mode the
+ *          tolerance is instead a fraction of the source error of the
+ *          previous eigenvalue iteration, since solving the linear systems
+ *          more accurately than the eigenvector has converged is wasted
+ *          work. The tolerance tightens to 1E-8 as the eigenvalue iteration
+ *          converges, so the converged CMFD solution is unchanged.
+ * @param adaptive whether to use adaptive mode (true) or not (false)
+ */
+void Cmfd::setAdaptive(bool adaptive){
+  _adaptive = adaptive;
+}
+
+
+/**
+ * @brief Return whether the linear solver tolerance is adapted to the
+ *        convergence of the CMFD eigenvalue iteration.
+ * @return whether adaptive mode is in use (true) or not (false)
+ */
+bool Cmfd::getAdaptive(){
+  return _adaptive;
+}
+
+
+/**
+ * @brief Set whether to adapt the Wielandt shift to the convergence rate of
+ *        the CMFD eigenvalue iteration.
+ * @details By default the Wielandt iteration uses a fixed shift of
+ *          CMFD_WIELANDT_SHIFT until the source error is below
+ *          CMFD_WIELANDT_SHIFT_CONV and then a shift of
+ *          CMFD_WIELANDT_MIN_OFFSET above k_eff. The adaptive shift of
+ *          Cmfd::computeShift(...) needs fewer eigenvalue iterations, but
+ *          each linear solve is more expensive for shifts closer to k_eff,
+ *          so whether it is faster depends on the problem and the linear
+ *          solver. It has no effect on the POWER eigenvalue method.
+ * @param adaptive_shift whether to adapt the shift (true) or not (false)
+ */
+void Cmfd::setAdaptiveShift(bool adaptive_shift){
+  _adaptive_shift = adaptive_shift;
+}
+
+
+/**
+ * @brief Return whether the Wielandt shift is adapted to the convergence
+ *        rate of the CMFD eigenvalue iteration.
+ * @return whether the shift is adapted (true) or not (false)
+ */
+bool Cmfd::getAdaptiveShift(){
+  return _adaptive_shift;
+}
+
+
+/**
+ * @brief Set whether to accelerate the CMFD eigenvalue iteration with
+ *        coarser CMFD levels.
+ * @details In multilevel mode the flux of each power or Wielandt
+ *          iteration is rebalanced with the flux-weighted eigenvalue
+ *          problem on a hierarchy of coarser levels built from the nested
+ *          Lattices of the Geometry (e.g. pin cells to assemblies) and from
+ *          condensing the CMFD groups to 2 groups and then 1 group. This
+ *          reduces the number of eigenvalue iterations on the CMFD Mesh for
+ *          large cores.
+ * @param multilevel whether to use multilevel mode (true) or not (false)
+ */
+void Cmfd::setMultilevel(bool multilevel){
+  _multilevel = multilevel;
+}
+
+
+/**
+ * @brief Return whether the CMFD eigenvalue iteration is accelerated with
+ *        coarser CMFD levels.
+ * @return whether multilevel mode is in use (true) or not (false)
+ */
+bool Cmfd::getMultilevel(){
+  return _multilevel;
+}
+
+
+/**
+ * @brief Return whether the CMFD matrices are applied matrix-free.
+ * @return whether matrix-free mode is in use (true) or not (false)
+ */
+bool Cmfd::getMatrixFree(){
+  return _matrix_free;
+}
+
+
 /**
  * @brief Set the SOR factor.
  * @param omega
@@ -1388,90 +2941,205 @@ void Cmfd::setOmega(double omega){
  */
 double Cmfd::rayleighQuotient(double* x, double* snew, double* sold){
 
-  double numer = 0.0;
-  double denom = 0.0;
+  int num_rows = _cx*_cy*_num_cmfd_groups;
+  int num_blocks = (num_rows + CMFD_REDUCTION_BLOCK - 1) /
+                   CMFD_REDUCTION_BLOCK;
+  double* numer = _partial_sums;
+  double* denom = _partial_sums + num_blocks;
 
   matMultA(_A, x, sold);
   matMultM(_M, x, snew);
 
-  for (int i = 0; i < _cx*_cy*_num_cmfd_groups; i++){
-    numer += x[i]*snew[i];
-    denom += x[i]*sold[i];
+  /* Accumulate the numerator and denominator in a single pass */
+  #pragma omp parallel for
+  for (int b = 0; b < num_blocks; b++){
+
+    int end = std::min((b+1)*CMFD_REDUCTION_BLOCK, num_rows);
+    numer[b] = 0.0;
+    denom[b] = 0.0;
+
+    for (int i = b*CMFD_REDUCTION_BLOCK; i < end; i++){
+      numer[b] += x[i]*snew[i];
+      denom[b] += x[i]*sold[i];
+    }
   }
 
-  return numer/denom;
+  return sumPartials(numer, num_blocks) / sumPartials(denom, num_blocks);
 }
 
 
 /**
- * @brief Multiply matrix by vector (i.e., y = M *x).
+ * @brief Multiply matrix by vector (i.e., y = A *x).
  * @param mat source matrix
  * @param vec_x x vector
  * @param vec_y y vector
  */
-void Cmfd::matMultA(double** mat, double* vec_x, double* vec_y){
+void Cmfd::matMultA(sparseMatrix* mat, double* vec_x, double* vec_y){
+  matMult(mat, vec_x, vec_y);
+}
 
-  vecSet(vec_y, 0.0);
-  int row, cell;
 
-  for (int y = 0; y < _cy; y++){
-    for (int x = 0; x < _cx; x++){
+/**
+ * @brief Multiply a sparse matrix by a vector (i.e., y = mat * x).
+ * @param mat the matrix
+ * @param vec_x x vector
+ * @param vec_y y vector
+ */
+void Cmfd::matMult(sparseMatrix* mat, double* vec_x, double* vec_y){
 
-      cell = y*_cx+x;
+  int num_entries;
+  int* cols;
+  double* vals;
 
-      for (int g = 0; g < _num_cmfd_groups; g++){
+  #pragma omp parallel for private(num_entries, cols, vals)
+  for (int row = 0; row < mat->_num_rows; row++){
+
+    /* Buffers for the matrix rows computed in matrix-free mode */
+    int cols_buffer[_num_cmfd_groups+4];
+    double vals_buffer[_num_cmfd_groups+4];
+
+    num_entries = getRow(mat, row, &cols, &vals, cols_buffer, vals_buffer);
+    vec_y[row] = 0.0;
 
-        row = cell*_num_cmfd_groups + g;
+    for (int i = 0; i < num_entries; i++)
+      vec_y[row] += vals[i] * vec_x[cols[i]];
+  }
+}
 
-        if (x != 0)
-          vec_y[row] += mat[cell][g*(_num_cmfd_groups+4)] *
-                        vec_x[(cell-1)*_num_cmfd_groups+g];
 
-        if (y != _cy - 1)
-          vec_y[row] += mat[cell][g*(_num_cmfd_groups+4)+1] *
-                        vec_x[(cell+_cx)*_num_cmfd_groups+g];
+/**
+ * @brief Compute the matrix AM = A - omega * M.
+ * @details The M matrix only couples the groups within each Mesh cell, so
+ *          the AM matrix has the same non-zero structure as the A matrix.
+ *          In matrix-free mode the shift is stored and applied when the
+ *          rows of AM are computed.
+ * @param AM the matrix to compute
+ * @param A the A matrix
+ * @param omega the multiple of the M matrix to subtract
+ * @param M the M matrix
+ */
+void Cmfd::matSubtract(sparseMatrix* AM, sparseMatrix* A, double omega,
+                       sparseMatrix* M){
+
+  AM->_shift = A->_shift + omega;
 
-        if (x != _cx - 1)
-          vec_y[row] += mat[cell][g*(_num_cmfd_groups+4)+_num_cmfd_groups+2] *
-                        vec_x[(cell+1)*_num_cmfd_groups+g];
+  if (_matrix_free)
+    return;
 
-        if (y != 0)
-          vec_y[row] += mat[cell][g*(_num_cmfd_groups+4)+_num_cmfd_groups+3] *
-                        vec_x[(cell-_cx)*_num_cmfd_groups+g];
+  #pragma omp parallel for
+  for (int row = 0; row < AM->_num_rows; row++){
 
-        for (int e = 0; e < _num_cmfd_groups; e++)
-          vec_y[row] += mat[cell][g*(_num_cmfd_groups+4)+2+e] *
-                        vec_x[cell*_num_cmfd_groups+e];
-      }
-    }
+    int e = row % _num_cmfd_groups;
+
+    /* Copy A to AM */
+    for (int i = A->_row_ptr[row]; i < A->_row_ptr[row+1]; i++)
+      AM->_vals[i] = A->_vals[i];
+
+    /* Subtract M from the block coupling the groups in the Mesh cell */
+    int block = AM->_diag[row] - e;
+
+    for (int g = 0; g < _num_cmfd_groups; g++)
+      AM->_vals[block+g] -= omega * M->_vals[M->_row_ptr[row]+g];
   }
 }
 
-
 /**
- * @brief
- * @param AM
- * @param A
- * @param omega
- * @param M
+ * @brief Compute the Wielandt shift for the next eigenvalue iteration.
+ * @details The ratio of successive source errors of the Wielandt iteration
+ *          with shift \f$ k_s \f$ is approximately
+ *          \f$ (1/k_0 - 1/k_s) / (1/k_1 - 1/k_s) \f$, where \f$ k_0 \f$
+ *          is k_eff and \f$ k_1 \f$ is the second eigenvalue. The second
+ *          eigenvalue is estimated from the observed ratio and the shift is
+ *          chosen so that the ratio of the next iteration is
+ *          CMFD_WIELANDT_RATIO. To keep the shifted systems well posed, the
+ *          shift is kept above k_eff by at least CMFD_WIELANDT_MIN_OFFSET
+ *          and by a multiple of the last change in k_eff, its distance to
+ *          k_eff shrinks by at most a factor of CMFD_WIELANDT_MAX_STEP per
+ *          iteration, and it backs off if the shift drops below k_eff. If
+ *          the ratio gives no estimate, the last distance is kept. The
+ *          adaptive shift is only used if Cmfd::setAdaptiveShift(...) is
+ *          set.
+ * @param shift the shift of the last iteration
+ * @param k_old k_eff before the last iteration
+ * @param ratio the ratio of the source errors of the last two iterations
+ * @return the shift for the next iteration
  */
-void Cmfd::matSubtract(double** AM, double** A, double omega, double** M){
+double Cmfd::computeShift(double shift, double k_old, double ratio){
 
-  /* Copy A to AM */
-  for (int i = 0; i < _cx*_cy; i++){
-    for (int g = 0; g < _num_cmfd_groups*(_num_cmfd_groups+4); g++)
-      AM[i][g] = A[i][g];
+  double offset = shift - _k_eff;
+  double max_offset = CMFD_WIELANDT_SHIFT - 1.0;
+  double min_offset = std::max(CMFD_WIELANDT_MIN_OFFSET,
+                               CMFD_WIELANDT_SAFETY * fabs(_k_eff - k_old));
+  double new_offset;
+
+  /* Back off if the shift has crossed k_eff */
+  if (offset <= 0.0)
+    new_offset = 2.0 * min_offset;
+
+  /* Keep the shift if the ratio does not give an estimate, such as after
+   * a change of the shift or once the linear solver tolerance is reached */
+  else if (!(ratio > 0.0 && ratio < 1.0))
+    new_offset = offset;
+
+  else{
+
+    /* Estimate the second eigenvalue from the ratio */
+    double inv_k1 = 1.0/shift + (1.0/_k_eff - 1.0/shift) / ratio;
+
+    /* Find the shift with the target ratio */
+    double inv_shift = (1.0/_k_eff - CMFD_WIELANDT_RATIO * inv_k1) /
+                       (1.0 - CMFD_WIELANDT_RATIO);
+
+    if (inv_shift > 0.0)
+      new_offset = std::max(1.0/inv_shift - _k_eff,
+                            offset / CMFD_WIELANDT_MAX_STEP);
+    else
+      new_offset = max_offset;
   }
 
-  for (int i = 0; i < _cx*_cy; i++){
-    for (int e = 0; e < _num_cmfd_groups; e++){
-      for (int g = 0; g < _num_cmfd_groups; g++)
-        AM[i][g*(_num_cmfd_groups+4)+e+2] -= omega*M[i][g*_num_cmfd_groups+e];
-    }
+  new_offset = std::min(std::max(new_offset, min_offset), max_offset);
+
+  log_printf(DEBUG, "Wielandt ratio: %f, shift: %f", ratio,
+             _k_eff + new_offset);
+
+  return _k_eff + new_offset;
+}
+
+
+/**
+ * @brief Change the multiple of the M matrix subtracted from the AM matrix
+ *        (i.e., AM = A - omega * M).
+ * @details The M matrix only couples the groups within each Mesh cell, so
+ *          only these diagonal blocks of the AM matrix depend on the shift
+ *          and only they are recomputed. The AM matrix must have been
+ *          computed from the same A matrix with Cmfd::matSubtract(...).
+ * @param AM the matrix to update
+ * @param A the A matrix
+ * @param omega the multiple of the M matrix to subtract
+ * @param M the M matrix
+ */
+void Cmfd::shiftMatrix(sparseMatrix* AM, sparseMatrix* A, double omega,
+                       sparseMatrix* M){
+
+  AM->_shift = A->_shift + omega;
+
+  if (_matrix_free)
+    return;
+
+  #pragma omp parallel for
+  for (int row = 0; row < AM->_num_rows; row++){
+
+    int e = row % _num_cmfd_groups;
+    int block = AM->_diag[row] - e;
+
+    for (int g = 0; g < _num_cmfd_groups; g++)
+      AM->_vals[block+g] = A->_vals[block+g] -
+                           omega * M->_vals[M->_row_ptr[row]+g];
   }
 }
 
 
+
 /**
  * @brief Finds and returns the maximum element in a vector.
  * @param vec the vector of interest
@@ -1481,6 +3149,7 @@ double Cmfd::vecMax(double* vec){
 
   double max = vec[0];
 
+  #pragma omp parallel for reduction(max:max)
   for (int i = 0; i < _cx*_cy*_num_cmfd_groups; i++)
     max = std::max(max, vec[i]);
 
@@ -1550,3 +3219,25 @@ void Cmfd::createGroupStructure(int* group_indices, int ncg){
         }
     }
 }
+
+
+/**
+ * @brief Deletes the Timer's timing entries for each phase of the CMFD
+ *        solver.
+ */
+void Cmfd::clearTimerSplits(){
+  if (!_timer_phase.empty())
+    _timer->clearPhase(_timer_phase.c_str());
+}
+
+
+/**
+ * @brief Prints a report of the time spent in each phase of the CMFD
+ *        solver to the console.
+ * @details The phases nested within each phase, such as the linear solves
+ *          within the eigenvalue iterations, are indented below it.
+ */
+void Cmfd::printTimerReport(){
+  if (!_timer_phase.empty())
+    _timer->printPhases(_timer_phase.c_str());
+}
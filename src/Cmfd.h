@@ -27,6 +27,52 @@
 #include "Timer.h"
 #endif
 
+/** The number of vector elements summed serially by each task in the CMFD
+ *  parallel reductions */
+#define CMFD_REDUCTION_BLOCK 512
+
+/** The ratio of the linear solver tolerance to the source error of the
+ *  CMFD eigenvalue iteration in adaptive mode */
+#define CMFD_ADAPTIVE_RATIO 1E-1
+
+/** The maximum number of eigenvalue iterations on each coarse CMFD level
+ *  in multilevel mode */
+#define CMFD_MULTILEVEL_ITERATIONS 3
+
+/** The number of Gauss-Seidel sweeps in each eigenvalue iteration on the
+ *  coarse CMFD levels in multilevel mode */
+#define CMFD_MULTILEVEL_SWEEPS 4
+
+/** The convergence criteria on the flux of the coarse CMFD levels in
+ *  multilevel mode */
+#define CMFD_MULTILEVEL_CONV 1E-4
+
+/** The maximum ratio of successive residual norms of the CMFD multigrid
+ *  iterations above which the linear solve continues with BiCGSTAB */
+#define CMFD_MG_MAX_RATIO 5E-1
+
+/** The initial shift of the CMFD Wielandt eigenvalue iteration */
+#define CMFD_WIELANDT_SHIFT 1.5
+
+/** The source error below which the fixed shift of the CMFD Wielandt
+ *  eigenvalue iteration moves to CMFD_WIELANDT_MIN_OFFSET above keff */
+#define CMFD_WIELANDT_SHIFT_CONV 1E-5
+
+/** The target ratio of successive source errors of the CMFD Wielandt
+ *  eigenvalue iteration */
+#define CMFD_WIELANDT_RATIO 1E-1
+
+/** The minimum distance of the CMFD Wielandt shift above keff */
+#define CMFD_WIELANDT_MIN_OFFSET 5E-2
+
+/** The multiple of the last change in keff by which the CMFD Wielandt
+ *  shift is kept above keff */
+#define CMFD_WIELANDT_SAFETY 1E1
+
+/** The maximum factor by which the distance of the CMFD Wielandt shift
+ *  above keff decreases in each iteration */
+#define CMFD_WIELANDT_MAX_STEP 4.0
+
 
 /**
  * @enum eigenMethod
@@ -42,6 +88,58 @@ enum eigenMethod {
 };
 
 
+/**
+ * @enum linearMethod
+ * @brief Linear system solution methods.
+*/
+enum linearMethod {
+
+  /** Red-black Gauss-Seidel with successive over-relaxation */
+  SOR,
+
+  /** Geometric multigrid V-cycles */
+  MULTIGRID,
+
+  /** BiCGSTAB preconditioned with a multigrid V-cycle */
+  BICGSTAB
+};
+
+
+
+/**
+ * @struct sparseMatrix
+ * @brief A sparse matrix stored in compressed sparse row (CSR) format.
+ * @details The column indices and values of the non-zero entries are
+ *          stored contiguously in row order with the entries in each row
+ *          sorted by column. A matrix applied matrix-free stores no entries
+ *          and its rows are computed on the fly when needed.
+ */
+struct sparseMatrix {
+
+  /** The number of rows in the matrix */
+  int _num_rows;
+
+  /** The number of non-zero entries in the matrix */
+  int _num_nonzeros;
+
+  /** The index of the first entry of each row, with the total number of
+   *  non-zero entries in the last element */
+  int* _row_ptr;
+
+  /** The column index of each non-zero entry */
+  int* _cols;
+
+  /** The index of the diagonal entry of each row */
+  int* _diag;
+
+  /** The value of each non-zero entry */
+  double* _vals;
+
+  /** The multiple of the M matrix subtracted from the A matrix when the
+   *  rows of the matrix are computed on the fly */
+  double _shift;
+};
+
 
 /**
  * @class Cmfd Cmfd.h "src/Cmfd.h"
@@ -64,13 +162,17 @@ private:
   double _k_eff;
 
   /** The A matrix */
-  double** _A;
+  sparseMatrix* _A;
 
   /** The M matrix */
-  double** _M;
+  sparseMatrix* _M;
 
   /** The AM matrix */
-  double** _AM;
+  sparseMatrix* _AM;
+
+  /** Whether to compute the matrix rows on the fly (true) rather than
+   *  storing the matrices (false) */
+  bool _matrix_free;
 
   /** The old source vector */
   double* _old_source;
@@ -99,6 +201,9 @@ private:
   /** Pointer to Timer object */
   Timer* _timer;
 
+  /** The path of the Timer phase for the most recent solve */
+  std::string _timer_phase;
+
   /** Flux type (PRIMAL or ADJOINT) */
   fluxType _flux_type;
 
@@ -132,9 +237,138 @@ private:
   /* Eigenvalue method */
   eigenMethod _eigen_method;
 
+  /** Linear solution method */
+  linearMethod _linear_method;
+
+  /** The number of multigrid levels, including the CMFD Mesh */
+  int _num_mg_levels;
+
+  /** The number of CMFD groups for which the multigrid levels were built */
+  int _mg_num_groups;
+
+  /** The number of Mesh cells in the x direction on each multigrid level */
+  int* _mg_cx;
+
+  /** The number of Mesh cells in the y direction on each multigrid level */
+  int* _mg_cy;
+
+  /** The Galerkin coarse grid matrix on each multigrid level, coupling
+   *  all groups in each coarse Mesh cell and its (up to) eight neighbors
+   *  (NULL on the CMFD Mesh) */
+  sparseMatrix** _mg_matrices;
+
+  /** The solution vector on each multigrid level */
+  double** _mg_x;
+
+  /** The source vector on each multigrid level */
+  double** _mg_b;
+
+  /** The residual vector on each multigrid level */
+  double** _mg_r;
+
+  /** The LU factors of the dense matrix on the coarsest multigrid level */
+  double* _mg_dense;
+
+  /** The row pivots of the LU factors on the coarsest multigrid level */
+  int* _mg_pivots;
+
+  /** The work vectors for the BiCGSTAB solver */
+  double* _krylov;
+
+  /** The partial sums of each block in the parallel reductions */
+  double* _partial_sums;
+
+  /** Whether to adapt the linear solver tolerance to the convergence of
+   *  the eigenvalue iteration */
+  bool _adaptive;
+
+  /** Whether to adapt the Wielandt shift to the convergence rate of the
+   *  eigenvalue iteration */
+  bool _adaptive_shift;
+
+  /** Whether to accelerate the eigenvalue iteration by rebalancing the
+   *  flux on coarser CMFD levels */
+  bool _multilevel;
+
+  /** The number of CMFD levels, including the CMFD Mesh */
+  int _num_ml_levels;
+
+  /** The number of Mesh cells in the x direction on each CMFD level */
+  int* _ml_cx;
+
+  /** The number of Mesh cells in the y direction on each CMFD level */
+  int* _ml_cy;
+
+  /** The number of energy groups on each CMFD level */
+  int* _ml_groups;
+
+  /** The row on each CMFD level containing each row of the next finer
+   *  level (NULL on the CMFD Mesh) */
+  int** _ml_rows;
+
+  /** The index in _ml_fine_rows of the first row of the next finer level
+   *  contained in each row on each CMFD level (NULL on the CMFD Mesh) */
+  int** _ml_fine_row_ptr;
+
+  /** The rows of the next finer level sorted by the row containing them on
+   *  each CMFD level (NULL on the CMFD Mesh) */
+  int** _ml_fine_rows;
+
+  /** The flux-weighted A matrix on each CMFD level (NULL on the CMFD Mesh) */
+  sparseMatrix** _ml_A;
+
+  /** The flux-weighted M matrix on each CMFD level (NULL on the CMFD Mesh) */
+  sparseMatrix** _ml_M;
+
+  /** The rebalance factor vector on each CMFD level */
+  double** _ml_flux;
+
+  /** The source vector on each CMFD level */
+  double** _ml_source;
+
+  /** The previous rebalance factor vector on each CMFD level */
+  double** _ml_old_flux;
+
+  sparseMatrix* createMatrix(bool fission, int num_x, int num_y,
+                             int num_groups, bool matrix_free);
+  void deleteMatrix(sparseMatrix* mat);
+  int computeLossColumns(int cell, int e, int num_x, int num_y,
+                         int num_groups, int* cols);
+  int computeLossRow(int cell, int e, double shift, int* cols, double* vals);
+  int computeFissionRow(int cell, int e, int* cols, double* vals);
+  int getRow(sparseMatrix* mat, int row, int** cols, double** vals,
+             int* cols_buffer, double* vals_buffer);
+  void matMult(sparseMatrix* mat, double* vec_x, double* vec_y);
+  double sumPartials(double* partial_sums, int num_blocks);
+  double vecDot(double* vec_x, double* vec_y);
+  double vecRelativeDiff(double* vec_new, double* vec_old, double scale_old);
+  double computeResidual(sparseMatrix* mat, double* vec_x, double* vec_b,
+                         double* vec_r);
+  void sweepGaussSeidel(sparseMatrix* mat, int num_x, int num_y,
+                        double* vec_x, double* vec_b, double omega,
+                        int num_colors=2);
+  void initializeMultigrid();
+  void clearMultigrid();
+  sparseMatrix* createCoarseMatrix(int num_x, int num_y);
+  void restrictMatrix(sparseMatrix* mat, int level);
+  void factorCoarseMatrix(sparseMatrix* mat);
+  void vCycle(sparseMatrix* mat, int level, double* vec_x, double* vec_b);
+  int solveSOR(sparseMatrix* mat, double* vec_x, double* vec_b,
+               double conv, int max_iter);
+  int solveMultigrid(sparseMatrix* mat, double* vec_x, double* vec_b,
+                     double conv, int max_iter);
+  int solveBiCGSTAB(sparseMatrix* mat, double* vec_x, double* vec_b,
+                    double conv, int max_iter);
+  double computeShift(double shift, double k_old, double ratio);
+  void shiftMatrix(sparseMatrix* AM, sparseMatrix* A, double omega,
+                   sparseMatrix* M);
+  void initializeMultilevel();
+  void restrictLevel(int level, double* flux);
+  void rebalanceFlux(int level, double* flux);
+
 public:
 
-  Cmfd(Geometry* geometry, double criteria=1e-8);
+  Cmfd(Geometry* geometry, double criteria=1e-8, Mesh* mesh=NULL);
   virtual ~Cmfd();
 
   /* Worker functions */
@@ -146,34 +380,47 @@ public:
   double computeKeff();
   void initializeFSRs();
   void rescaleFlux();
-  void linearSolve(double** mat, double* vec_x, double* vec_b,
+  void linearSolve(sparseMatrix* mat, double* vec_x, double* vec_b,
                    double conv, int max_iter=10000);
 
   /* Matrix and Vector functions */
   void dumpVec(double* vec, int length);
-  void matZero(double** mat, int width);
+  void matZero(sparseMatrix* mat);
   void vecCopy(double* vec_from, double* vec_to);
   double vecSum(double* vec);
-  void matMultM(double** mat, double* vec_x, double* vec_y);
-  void matMultA(double** mat, double* vec_x, double* vec_y);
-  void vecNormal(double** mat, double* vec);
+  void matMultM(sparseMatrix* mat, double* vec_x, double* vec_y);
+  void matMultA(sparseMatrix* mat, double* vec_x, double* vec_y);
+  void vecNormal(sparseMatrix* mat, double* vec);
   void vecSet(double* vec, double val);
   void vecScale(double* vec, double scale_val);
-  void matSubtract(double** AM, double** A, double omega, double** M);
+  void matSubtract(sparseMatrix* AM, sparseMatrix* A, double omega,
+                   sparseMatrix* M);
   double vecMax(double* vec);
   double rayleighQuotient(double* x, double* snew, double* sold);
   void createGroupStructure(int* group_indices, int ncg);
+  void clearTimerSplits();
+  void printTimerReport();
   
   /* Get parameters */
   Mesh* getMesh();
+  Timer* getTimer();
   double getKeff();
   int getNumCmfdGroups();
   int getCmfdGroup(int group);
+  bool getMatrixFree();
+  bool getAdaptive();
+  bool getAdaptiveShift();
+  bool getMultilevel();
 
   /* Set parameters */
   void setOmega(double omega);
   void setFluxType(const char* flux_type);
   void setEigenMethod(const char* eigen_method);
+  void setLinearMethod(const char* linear_method);
+  void setMatrixFree(bool matrix_free);
+  void setAdaptive(bool adaptive);
+  void setAdaptiveShift(bool adaptive_shift);
+  void setMultilevel(bool multilevel);
 
   /* Set FSR parameters */
   void setFSRMaterials(Material** FSR_materials);
@@ -0,0 +1,448 @@
+#include "DiffusionSolver.h"
+
+
+/**
+ * @brief Constructor creates the Cmfd solver for the Geometry's Mesh.
+ * @details The Geometry must have a DIFFUSION Mesh and its flat source
+ *          regions must have been initialized. The solver uses one OpenMP
+ *          thread by default.
+ * @param geometry pointer to the Geometry
+ * @param criteria convergence criteria on keff
+ */
+DiffusionSolver::DiffusionSolver(Geometry* geometry, double criteria) {
+
+  if (geometry->getMesh()->getSolveType() != DIFFUSION)
+    log_printf(ERROR, "Unable to create a DiffusionSolver for a Geometry "
+               "whose Mesh solve type is not DIFFUSION");
+
+  _geometry = geometry;
+  _conv_criteria = criteria;
+  _num_threads = 1;
+
+  /* The fastest Cmfd options for coarse mesh diffusion problems */
+  _eigen_method = "POWER";
+  _linear_method = "BICGSTAB";
+  _multilevel = true;
+  _adaptive = false;
+  _adaptive_shift = false;
+  _omega = 1.5;
+
+  _cmfd = new Cmfd(_geometry, _conv_criteria);
+  configureCmfd(_cmfd);
+}
+
+
+/**
+ * @brief Destructor deletes the Cmfd solvers and the Meshes of the cases.
+ */
+DiffusionSolver::~DiffusionSolver() {
+
+  clearCases();
+
+  std::map<int, Material*>::iterator iter;
+  for (iter = _updates.begin(); iter != _updates.end(); ++iter)
+    delete iter->second;
+
+  delete _cmfd;
+}
+
+
+/**
+ * @brief Returns the Cmfd solver for the Geometry's Mesh.
+ * @return a pointer to the Cmfd solver
+ */
+Cmfd* DiffusionSolver::getCmfd() {
+  return _cmfd;
+}
+
+
+/**
+ * @brief Returns the Geometry's Mesh.
+ * @return a pointer to the Mesh
+ */
+Mesh* DiffusionSolver::getMesh() {
+  return _cmfd->getMesh();
+}
+
+
+/**
+ * @brief Returns keff from the last solve of the Geometry's Mesh.
+ * @return keff
+ */
+double DiffusionSolver::getKeff() {
+  return _cmfd->getKeff();
+}
+
+
+/**
+ * @brief Returns the number of OpenMP threads used for the cases.
+ * @return the number of threads
+ */
+int DiffusionSolver::getNumThreads() {
+  return _num_threads;
+}
+
+
+/**
+ * @brief Returns the number of cases.
+ * @return the number of cases
+ */
+int DiffusionSolver::getNumCases() {
+  return _case_meshes.size();
+}
+
+
+/**
+ * @brief Returns the Mesh of a case.
+ * @details The Mesh holds the Mesh cell fluxes and Materials of the case.
+ * @param case_id the case ID returned by DiffusionSolver::addCase()
+ * @return a pointer to the Mesh of the case
+ */
+Mesh* DiffusionSolver::getCaseMesh(int case_id) {
+
+  if (case_id < 0 || case_id >= getNumCases())
+    log_printf(ERROR, "Unable to get the Mesh of case %d since there are "
+               "%d cases", case_id, getNumCases());
+
+  return _case_meshes.at(case_id);
+}
+
+
+/**
+ * @brief Returns keff from the last solve of a case.
+ * @param case_id the case ID returned by DiffusionSolver::addCase()
+ * @return keff of the case
+ */
+double DiffusionSolver::getCaseKeff(int case_id) {
+
+  if (case_id < 0 || case_id >= getNumCases())
+    log_printf(ERROR, "Unable to get keff of case %d since there are "
+               "%d cases", case_id, getNumCases());
+
+  return _case_keffs.at(case_id);
+}
+
+
+/**
+ * @brief Sets the number of OpenMP threads used for the cases (>0).
+ * @details Each thread solves one case at a time, so the cases are solved
+ *          concurrently while the solve of the Geometry's Mesh uses all of
+ *          the threads within each Cmfd operation.
+ * @param num_threads the number of threads
+ */
+void DiffusionSolver::setNumThreads(int num_threads) {
+
+  if (num_threads <= 0)
+    log_printf(ERROR, "Unable to set the number of threads for the "
+               "DiffusionSolver to %d since it is less than or equal to 0",
+               num_threads);
+
+  _num_threads = num_threads;
+
+  /* Set the number of threads for OpenMP */
+  omp_set_num_threads(_num_threads);
+}
+
+
+/**
+ * @brief Sets the Cmfd eigenvalue method (POWER or WIELANDT).
+ * @param eigen_method char string representing the eigenvalue method
+ */
+void DiffusionSolver::setEigenMethod(const char* eigen_method) {
+  _cmfd->setEigenMethod(eigen_method);
+  _eigen_method = eigen_method;
+
+  for (int i = 0; i < getNumCases(); i++)
+    configureCmfd(_case_cmfds.at(i));
+}
+
+
+/**
+ * @brief Sets the Cmfd linear solution method (SOR, MULTIGRID or BICGSTAB).
+ * @param linear_method char string representing the linear method
+ */
+void DiffusionSolver::setLinearMethod(const char* linear_method) {
+  _cmfd->setLinearMethod(linear_method);
+  _linear_method = linear_method;
+
+  for (int i = 0; i < getNumCases(); i++)
+    configureCmfd(_case_cmfds.at(i));
+}
+
+
+/**
+ * @brief Sets whether to use multilevel Cmfd acceleration.
+ * @param multilevel use multilevel acceleration (true) or not (false)
+ */
+void DiffusionSolver::setMultilevel(bool multilevel) {
+  _multilevel = multilevel;
+  configureCmfd(_cmfd);
+
+  for (int i = 0; i < getNumCases(); i++)
+    configureCmfd(_case_cmfds.at(i));
+}
+
+
+/**
+ * @brief Sets whether to adapt the Cmfd linear solver tolerance.
+ * @param adaptive use adaptive tolerances (true) or not (false)
+ */
+void DiffusionSolver::setAdaptive(bool adaptive) {
+  _adaptive = adaptive;
+  configureCmfd(_cmfd);
+
+  for (int i = 0; i < getNumCases(); i++)
+    configureCmfd(_case_cmfds.at(i));
+}
+
+
+/**
+ * @brief Sets whether to adapt the Cmfd Wielandt shift.
+ * @param adaptive_shift use an adaptive shift (true) or not (false)
+ */
+void DiffusionSolver::setAdaptiveShift(bool adaptive_shift) {
+  _adaptive_shift = adaptive_shift;
+  configureCmfd(_cmfd);
+
+  for (int i = 0; i < getNumCases(); i++)
+    configureCmfd(_case_cmfds.at(i));
+}
+
+
+/**
+ * @brief Sets the Cmfd Gauss-Seidel SOR factor.
+ * @param omega the SOR factor
+ */
+void DiffusionSolver::setOmega(double omega) {
+  _omega = omega;
+  configureCmfd(_cmfd);
+
+  for (int i = 0; i < getNumCases(); i++)
+    configureCmfd(_case_cmfds.at(i));
+}
+
+
+/**
+ * @brief Applies the solver options to a Cmfd solver.
+ * @param cmfd pointer to the Cmfd solver
+ */
+void DiffusionSolver::configureCmfd(Cmfd* cmfd) {
+  cmfd->setEigenMethod(_eigen_method.c_str());
+  cmfd->setLinearMethod(_linear_method.c_str());
+  cmfd->setMultilevel(_multilevel);
+  cmfd->setAdaptive(_adaptive);
+  cmfd->setAdaptiveShift(_adaptive_shift);
+  cmfd->setOmega(_omega);
+}
+
+
+/**
+ * @brief Stages a copy of a Material to replace the cross-sections of the
+ *        Mesh cells with the same Material ID before the next solve.
+ * @details A Material staged again for the same ID replaces the earlier
+ *          copy, so only the last update of each Material is applied.
+ * @param updates pointer to the map of staged Materials
+ * @param mesh pointer to the Mesh the Material will be applied to
+ * @param material pointer to the Material
+ */
+void DiffusionSolver::stageMaterial(std::map<int, Material*>* updates,
+                                    Mesh* mesh, Material* material) {
+
+  int id = material->getId();
+  Material** materials = mesh->getMaterials();
+  int num_cells = mesh->getCellsX() * mesh->getCellsY();
+  int cell = 0;
+
+  /* Find a Mesh cell filled by the Material */
+  while (cell < num_cells && materials[cell]->getId() != id)
+    cell++;
+
+  if (cell == num_cells)
+    log_printf(ERROR, "Unable to update Material %d since it does not fill "
+               "any Mesh cell", id);
+
+  if (material->getNumEnergyGroups() !=
+      materials[cell]->getNumEnergyGroups())
+    log_printf(ERROR, "Unable to update Material %d with %d energy groups "
+               "since the Mesh cells have %d energy groups", id,
+               material->getNumEnergyGroups(),
+               materials[cell]->getNumEnergyGroups());
+
+  if (updates->find(id) != updates->end())
+    delete updates->at(id);
+
+  (*updates)[id] = material->clone();
+}
+
+
+/**
+ * @brief Copies the cross-sections of the staged Materials to the Mesh
+ *        cells in a single pass and clears the staged Materials.
+ * @details If a staged Material does not have diffusion coefficients, they
+ *          are estimated with \f$ \frac{1}{3\Sigma_t} \f$.
+ * @param updates pointer to the map of staged Materials
+ * @param mesh pointer to the Mesh
+ */
+void DiffusionSolver::applyMaterials(std::map<int, Material*>* updates,
+                                     Mesh* mesh) {
+
+  if (updates->empty())
+    return;
+
+  Material** materials = mesh->getMaterials();
+  int num_cells = mesh->getCellsX() * mesh->getCellsY();
+
+  #pragma omp parallel for
+  for (int i = 0; i < num_cells; i++){
+
+    std::map<int, Material*>::iterator iter =
+         updates->find(materials[i]->getId());
+
+    if (iter == updates->end())
+      continue;
+
+    Material* from = iter->second;
+    Material* to = materials[i];
+    int num_groups = from->getNumEnergyGroups();
+
+    for (int e = 0; e < num_groups; e++){
+      to->setSigmaTByGroup(from->getSigmaT()[e], e);
+      to->setSigmaAByGroup(from->getSigmaA()[e], e);
+      to->setSigmaFByGroup(from->getSigmaF()[e], e);
+      to->setNuSigmaFByGroup(from->getNuSigmaF()[e], e);
+      to->setChiByGroup(from->getChi()[e], e);
+
+      for (int g = 0; g < num_groups; g++)
+        to->setSigmaSByGroup(from->getSigmaS()[e*num_groups+g], e, g);
+
+      if (from->getDifCoef() != NULL)
+        to->setDifCoefByGroup(from->getDifCoef()[e], e);
+      else
+        to->setDifCoefByGroup(1.0 / (3.0 * from->getSigmaT()[e]), e);
+    }
+  }
+
+  std::map<int, Material*>::iterator iter;
+  for (iter = updates->begin(); iter != updates->end(); ++iter)
+    delete iter->second;
+
+  updates->clear();
+}
+
+
+/**
+ * @brief Stages a Material to replace the cross-sections of the Mesh cells
+ *        of the Geometry's Mesh with the same Material ID.
+ * @details A copy of the Material is made, so the Material may be modified
+ *          or reused after this call. All staged Materials are applied in
+ *          a single pass before the next DiffusionSolver::computeKeff().
+ * @param material pointer to the Material
+ */
+void DiffusionSolver::updateMaterial(Material* material) {
+  stageMaterial(&_updates, _cmfd->getMesh(), material);
+}
+
+
+/**
+ * @brief Solves the diffusion eigenvalue problem on the Geometry's Mesh.
+ * @details The staged Materials are applied before the solve. Each solve
+ *          starts from the flux of the previous solve.
+ * @return keff
+ */
+double DiffusionSolver::computeKeff() {
+  applyMaterials(&_updates, _cmfd->getMesh());
+  return _cmfd->computeKeff();
+}
+
+
+/**
+ * @brief Adds a case with a copy of the Geometry's Mesh.
+ * @details The case starts with the Materials of the Geometry's Mesh,
+ *          including any staged Materials, and is modified with
+ *          DiffusionSolver::updateCaseMaterial(...).
+ * @return the case ID
+ */
+int DiffusionSolver::addCase() {
+
+  applyMaterials(&_updates, _cmfd->getMesh());
+
+  Mesh* mesh = _cmfd->getMesh()->clone();
+  Cmfd* cmfd = new Cmfd(_geometry, _conv_criteria, mesh);
+  configureCmfd(cmfd);
+
+  _case_meshes.push_back(mesh);
+  _case_cmfds.push_back(cmfd);
+  _case_updates.push_back(std::map<int, Material*>());
+  _case_keffs.push_back(0.0);
+
+  return getNumCases() - 1;
+}
+
+
+/**
+ * @brief Stages a Material to replace the cross-sections of the Mesh cells
+ *        of a case with the same Material ID.
+ * @param case_id the case ID returned by DiffusionSolver::addCase()
+ * @param material pointer to the Material
+ */
+void DiffusionSolver::updateCaseMaterial(int case_id, Material* material) {
+
+  if (case_id < 0 || case_id >= getNumCases())
+    log_printf(ERROR, "Unable to update a Material of case %d since there "
+               "are %d cases", case_id, getNumCases());
+
+  stageMaterial(&_case_updates.at(case_id), _case_meshes.at(case_id),
+                material);
+}
+
+
+/**
+ * @brief Solves the diffusion eigenvalue problems of all cases.
+ * @details The cases are distributed dynamically over the OpenMP threads
+ *          and each case is solved by a single thread. Each solve starts
+ *          from the flux of the previous solve of the case.
+ */
+void DiffusionSolver::computeCases() {
+
+  int num_cases = getNumCases();
+
+  log_printf(NORMAL, "Solving %d diffusion cases on %d threads...",
+             num_cases, _num_threads);
+
+  #pragma omp parallel for schedule(dynamic) num_threads(_num_threads)
+  for (int i = 0; i < num_cases; i++){
+    applyMaterials(&_case_updates.at(i), _case_meshes.at(i));
+    _case_keffs.at(i) = _case_cmfds.at(i)->computeKeff();
+  }
+}
+
+
+/**
+ * @brief Deletes all cases.
+ */
+void DiffusionSolver::clearCases() {
+
+  std::map<int, Material*>::iterator iter;
+
+  for (int i = 0; i < getNumCases(); i++){
+
+    for (iter = _case_updates.at(i).begin();
+         iter != _case_updates.at(i).end(); ++iter)
+      delete iter->second;
+
+    Mesh* mesh = _case_meshes.at(i);
+    Material** materials = mesh->getMaterials();
+
+    for (int j = 0; j < mesh->getCellsX() * mesh->getCellsY(); j++)
+      delete materials[j];
+
+    delete [] materials;
+    delete _case_cmfds.at(i);
+    delete mesh;
+  }
+
+  _case_meshes.clear();
+  _case_cmfds.clear();
+  _case_updates.clear();
+  _case_keffs.clear();
+}
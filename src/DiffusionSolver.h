@@ -0,0 +1,118 @@
+/**
+ * @file DiffusionSolver.h
+ * @brief The DiffusionSolver class.
+ * @date October 19, 2026
+ */
+
+#ifndef DIFFUSIONSOLVER_H_
+#define DIFFUSIONSOLVER_H_
+
+#ifdef __cplusplus
+#include <omp.h>
+#include <map>
+#include <vector>
+#include <string>
+#include "Cmfd.h"
+#endif
+
+
+/**
+ * @class DiffusionSolver DiffusionSolver.h "src/DiffusionSolver.h"
+ * @brief A standalone solver for coarse mesh diffusion eigenvalue problems.
+ * @details The DiffusionSolver solves the diffusion eigenvalue problem on
+ *          the DIFFUSION Mesh of a Geometry with the Cmfd solver, using the
+ *          fastest Cmfd options by default: the power iteration with
+ *          multilevel acceleration and BiCGSTAB linear solves preconditioned
+ *          with multigrid. For parameter studies, Material updates are
+ *          staged and applied to all Mesh cells in a single pass before the
+ *          next solve, and any number of perturbed cases may be added, each
+ *          with its own copy of the Mesh, and solved concurrently on a pool
+ *          of OpenMP threads.
+ */
+class DiffusionSolver {
+
+private:
+
+  /** Pointer to the Geometry */
+  Geometry* _geometry;
+
+  /** The convergence criteria on keff */
+  double _conv_criteria;
+
+  /** The number of OpenMP threads used for the cases */
+  int _num_threads;
+
+  /** The Cmfd eigenvalue method */
+  std::string _eigen_method;
+
+  /** The Cmfd linear solution method */
+  std::string _linear_method;
+
+  /** Whether to use multilevel Cmfd acceleration */
+  bool _multilevel;
+
+  /** Whether to adapt the Cmfd linear solver tolerance */
+  bool _adaptive;
+
+  /** Whether to adapt the Cmfd Wielandt shift */
+  bool _adaptive_shift;
+
+  /** The Cmfd Gauss-Seidel SOR factor */
+  double _omega;
+
+  /** The Cmfd solver for the Geometry's Mesh */
+  Cmfd* _cmfd;
+
+  /** The Materials staged for the Geometry's Mesh, keyed by Material ID */
+  std::map<int, Material*> _updates;
+
+  /** The Mesh of each case */
+  std::vector<Mesh*> _case_meshes;
+
+  /** The Cmfd solver of each case */
+  std::vector<Cmfd*> _case_cmfds;
+
+  /** The Materials staged for each case, keyed by Material ID */
+  std::vector< std::map<int, Material*> > _case_updates;
+
+  /** The keff of each case */
+  std::vector<double> _case_keffs;
+
+  void configureCmfd(Cmfd* cmfd);
+  void stageMaterial(std::map<int, Material*>* updates, Mesh* mesh,
+                     Material* material);
+  void applyMaterials(std::map<int, Material*>* updates, Mesh* mesh);
+
+public:
+
+  DiffusionSolver(Geometry* geometry, double criteria=1e-8);
+  virtual ~DiffusionSolver();
+
+  /* Get parameters */
+  Cmfd* getCmfd();
+  Mesh* getMesh();
+  double getKeff();
+  int getNumThreads();
+  int getNumCases();
+  Mesh* getCaseMesh(int case_id);
+  double getCaseKeff(int case_id);
+
+  /* Set parameters */
+  void setNumThreads(int num_threads);
+  void setEigenMethod(const char* eigen_method);
+  void setLinearMethod(const char* linear_method);
+  void setMultilevel(bool multilevel);
+  void setAdaptive(bool adaptive);
+  void setAdaptiveShift(bool adaptive_shift);
+  void setOmega(double omega);
+
+  /* Worker functions */
+  void updateMaterial(Material* material);
+  double computeKeff();
+  int addCase();
+  void updateCaseMaterial(int case_id, Material* material);
+  void computeCases();
+  void clearCases();
+};
+
+#endif /* DIFFUSIONSOLVER_H_ */
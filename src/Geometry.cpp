@@ -1,6 +1,164 @@
 #include "Geometry.h"
 
 
+/**
+ * @brief Update a 64-bit FNV-1a hash with an array of bytes.
+ * @param data a pointer to the array of bytes
+ * @param size the number of bytes
+ * @param hash the hash to update
+ * @return the updated 64-bit hash
+ */
+static uint64_t fnv1a_hash(const char* data, size_t size,
+                           uint64_t hash=FNV_OFFSET_BASIS) {
+
+  for (size_t i=0; i < size; i++) {
+    hash ^= (unsigned char)data[i];
+    hash *= FNV_PRIME;
+  }
+
+  return hash;
+}
+
+
+/**
+ * @brief Update a 64-bit FNV-1a hash with an array of values.
+ * @param hash the hash to update
+ * @param values a pointer to the array of values
+ * @param num_values the number of values
+ */
+template <typename T>
+static void hash_values(uint64_t& hash, const T* values, int num_values) {
+  hash = fnv1a_hash(reinterpret_cast<const char*>(values),
+                    sizeof(T)*num_values, hash);
+}
+
+
+/**
+ * @brief Returns the ID of a Surface or Cell if it was defined by the user.
+ * @details Automatic IDs start at 10000 and depend on the order in which
+ *          Surfaces and Cells were created in a run.
+ * @param id the ID of the Surface or Cell
+ * @return the ID if it was defined by the user or 0 if it is automatic
+ */
+static int user_id(int id) {
+  return (id < 10000) ? id : 0;
+}
+
+
+/**
+ * @brief Computes the coefficients which define a Surface.
+ * @param surface a pointer to the Surface
+ * @param coeffs an array of 3 coefficients to populate
+ */
+static void surface_coefficients(Surface* surface, double* coeffs) {
+
+  coeffs[0] = 0.;
+  coeffs[1] = 0.;
+  coeffs[2] = 0.;
+
+  switch (surface->getSurfaceType()) {
+  case XPLANE:
+    coeffs[0] = static_cast<XPlane*>(surface)->getX();
+    break;
+  case YPLANE:
+    coeffs[0] = static_cast<YPlane*>(surface)->getY();
+    break;
+  case PLANE:
+    coeffs[0] = static_cast<Plane*>(surface)->getA();
+    coeffs[1] = static_cast<Plane*>(surface)->getB();
+    coeffs[2] = static_cast<Plane*>(surface)->getC();
+    break;
+  case CIRCLE:
+    coeffs[0] = static_cast<Circle*>(surface)->getX0();
+    coeffs[1] = static_cast<Circle*>(surface)->getY0();
+    coeffs[2] = static_cast<Circle*>(surface)->getRadius();
+    break;
+  default:
+    break;
+  }
+}
+
+
+/**
+ * @brief Write an array of values to a binary stream.
+ * @param out the binary stream
+ * @param values a pointer to the array of values
+ * @param num_values the number of values to write
+ */
+template <typename T>
+static void write_values(std::stringstream& out, const T* values,
+                         int num_values) {
+  out.write(reinterpret_cast<const char*>(values), sizeof(T)*num_values);
+}
+
+
+/**
+ * @brief Read an array of values from a binary stream.
+ * @param in the binary stream
+ * @param values a pointer to the array to store the values
+ * @param num_values the number of values to read
+ */
+template <typename T>
+static void read_values(std::stringstream& in, T* values, int num_values) {
+
+  in.read(reinterpret_cast<char*>(values), sizeof(T)*num_values);
+
+  if (in.fail())
+    log_printf(ERROR, "Unable to read the Geometry snapshot since it is "
+               "truncated");
+}
+
+
+/**
+ * @brief Returns a key which is the same for Surfaces with the same
+ *        coefficients.
+ * @details Plane coefficients are normalized and their sign is chosen so
+ *          that a Plane and its opposite have the same key. The coefficients
+ *          are rounded to ON_SURFACE_THRESH. Other Surfaces only have the
+ *          same key as themselves.
+ * @param surface a pointer to the Surface
+ * @return a vector of the Surface type and its rounded coefficients
+ */
+static std::vector<double> surface_key(Surface* surface) {
+
+  std::vector<double> key;
+  surfaceType type = surface->getSurfaceType();
+
+  if (type == CIRCLE) {
+    Circle* circle = static_cast<Circle*>(surface);
+    key.push_back(CIRCLE);
+    key.push_back(circle->getX0());
+    key.push_back(circle->getY0());
+    key.push_back(circle->getRadius());
+  }
+  else if (type != QUADRATIC &&
+           (static_cast<Plane*>(surface)->getA() != 0. ||
+            static_cast<Plane*>(surface)->getB() != 0.)) {
+    Plane* plane = static_cast<Plane*>(surface);
+    double norm = sqrt(plane->getA() * plane->getA() +
+                       plane->getB() * plane->getB());
+
+    if (plane->getA() < -ON_SURFACE_THRESH ||
+        (plane->getA() < ON_SURFACE_THRESH && plane->getB() < 0.))
+      norm = -norm;
+
+    key.push_back(PLANE);
+    key.push_back(plane->getA() / norm);
+    key.push_back(plane->getB() / norm);
+    key.push_back(plane->getC() / norm);
+  }
+  else {
+    key.push_back(QUADRATIC);
+    key.push_back(surface->getUid());
+  }
+
+  for (size_t i=1; i < key.size(); i++)
+    key[i] = floor(key[i] / ON_SURFACE_THRESH + 0.5);
+
+  return key;
+}
+
+
 /**
  * @brief Constructor initializes an empty Geometry.
  */
@@ -24,11 +182,18 @@ Geometry::Geometry(Mesh* mesh) {
 
   _num_FSRs = 0;
   _num_groups = 0;
+  _lattice_depth = 0;
+  _num_material_changes = -1;
 
   if (mesh == NULL)
     _mesh = new Mesh();
   else
     _mesh = mesh;
+
+  _cell_FSR_offsets = NULL;
+  _lattice_FSR_offsets = NULL;
+  _lattice_offset_indices = NULL;
+  _lattice_num_x = NULL;
 }
 
 
@@ -49,6 +214,16 @@ Geometry::~Geometry() {
     delete [] _FSRs_to_cells;
     delete [] _FSRs_to_material_UIDs;
     delete [] _FSRs_to_material_IDs;
+    delete [] _FSRs_to_origins;
+    delete [] _FSRs_to_lattice_paths;
+  }
+
+  /* Free the FSR offset tables if they were initialized */
+  if (_cell_FSR_offsets != NULL) {
+    delete [] _cell_FSR_offsets;
+    delete [] _lattice_FSR_offsets;
+    delete [] _lattice_offset_indices;
+    delete [] _lattice_num_x;
   }
 }
 
@@ -172,6 +347,40 @@ boundaryType Geometry::getBCRight() {
 }
 
 
+/**
+ * @brief Returns whether the Geometry's bounding box and boundary conditions
+ *        are symmetric under a reflection about the y-axis (x -> -x).
+ * @details This only checks the bounding box and the left and right boundary
+ *          conditions. It is used by the TrackGenerator to detect mirror
+ *          planes for symmetry-aware Track generation.
+ * @return true if the Geometry may be mirrored about the y-axis
+ */
+bool Geometry::isSymmetricX() {
+
+  if (fabs(_x_min + _x_max) > ON_SURFACE_THRESH * getWidth())
+    return false;
+
+  return (_left_bc == _right_bc);
+}
+
+
+/**
+ * @brief Returns whether the Geometry's bounding box and boundary conditions
+ *        are symmetric under a reflection about the x-axis (y -> -y).
+ * @details This only checks the bounding box and the top and bottom boundary
+ *          conditions. It is used by the TrackGenerator to detect mirror
+ *          planes for symmetry-aware Track generation.
+ * @return true if the Geometry may be mirrored about the x-axis
+ */
+bool Geometry::isSymmetricY() {
+
+  if (fabs(_y_min + _y_max) > ON_SURFACE_THRESH * getHeight())
+    return false;
+
+  return (_top_bc == _bottom_bc);
+}
+
+
 /**
  * @brief Returns the number of flat source regions (FSRs) in the Geometry.
  * @return number of FSRs
@@ -231,6 +440,51 @@ int* Geometry::getFSRtoMaterialMap() {
 }
 
 
+/**
+ * @brief Return an array indexed by flat source region IDs which contain
+ *        the coordinates of the origin of the Universe containing each FSR.
+ * @details The x and y coordinates of the origin for the FSR with ID r are
+ *          stored at indices 2*r and 2*r+1 in the array.
+ * @return a double array of FSR-to-Universe origin coordinates
+ */
+double* Geometry::getFSRtoOriginMap() {
+  if (_num_FSRs == 0)
+    log_printf(ERROR, "Unable to return the FSR-to-origin map array since "
+               "the Geometry has not initialized FSRs.");
+
+  return _FSRs_to_origins;
+}
+
+
+/**
+ * @brief Return an array indexed by flat source region IDs which contain
+ *        the Lattice cell indices at each nested Lattice level.
+ * @details The Lattice cell x and y indices of the FSR with ID r at nested
+ *          Lattice level l are stored at indices 2*(r*depth+l) and
+ *          2*(r*depth+l)+1 in the array, where depth is the Lattice depth
+ *          returned by Geometry::getLatticeDepth(). Levels below the
+ *          innermost Lattice containing the FSR are padded with -1.
+ * @return an integer array of FSR-to-Lattice cell indices
+ */
+int* Geometry::getFSRtoLatticePathMap() {
+  if (_num_FSRs == 0)
+    log_printf(ERROR, "Unable to return the FSR-to-Lattice path map array "
+               "since the Geometry has not initialized FSRs.");
+
+  return _FSRs_to_lattice_paths;
+}
+
+
+/**
+ * @brief Return the maximum number of nested Lattices along any path
+ *        through the nested Universe hierarchy.
+ * @return the nested Lattice depth
+ */
+int Geometry::getLatticeDepth() {
+  return _lattice_depth;
+}
+
+
 /**
  * @brief Return the max Track segment length computed during segmentation (cm)
  * @return max Track segment length (cm)
@@ -429,6 +683,9 @@ Mesh* Geometry::getMesh(){
  */
 void Geometry::addMaterial(Material* material) {
 
+  /* The FSR Material maps must be checked for this change */
+  _num_material_changes = -1;
+
   /* Checks the number of energy groups */
   if (material->getNumEnergyGroups() == 0)
     log_printf(ERROR, "Unable to add Material %d since it does not "
@@ -571,6 +828,9 @@ void Geometry::addSurface(Surface* surface) {
  */
 void Geometry::addCell(Cell* cell) {
 
+  /* The FSR Material maps must be checked for this change */
+  _num_material_changes = -1;
+
   /* Prints error msg if the Cell is filled with a non-existent Material */
   if (cell->getType() == MATERIAL &&
            _materials.find(static_cast<CellBasic*>(cell)->getMaterial()) ==
@@ -699,6 +959,326 @@ void Geometry::addLattice(Lattice* lattice) {
 }
 
 
+/**
+ * @brief Creates XPlanes from an array of x-coordinates and adds them to
+ *        the Geometry.
+ * @details This method is a bulk alternative to creating each XPlane and
+ *          adding it to the Geometry from Python. The boundary condition for
+ *          each XPlane is given as a boundaryType. The IDs of the new
+ *          XPlanes are returned, as follows from Python:
+ *
+ * @code
+ *          x = numpy.array([-2., 2.])
+ *          bcs = numpy.array([REFLECTIVE, REFLECTIVE], dtype=numpy.int32)
+ *          surface_ids = geometry.createXPlanes(x, bcs, len(x))
+ * @endcode
+ *
+ * @param x an array of the XPlanes' x-coordinates
+ * @param num_x the number of x-coordinates
+ * @param boundaries an array of the XPlanes' boundary conditions
+ * @param num_boundaries the number of boundary conditions
+ * @param surface_ids an array to store the new XPlanes' IDs
+ * @param num_surfaces the number of XPlanes
+ */
+void Geometry::createXPlanes(double* x, int num_x, int* boundaries,
+                             int num_boundaries, int* surface_ids,
+                             int num_surfaces) {
+
+  if (num_x != num_surfaces || num_boundaries != num_surfaces)
+    log_printf(ERROR, "Unable to create %d XPlanes from %d x-coordinates and "
+               "%d boundary conditions", num_surfaces, num_x, num_boundaries);
+
+  for (int i=0; i < num_surfaces; i++) {
+    Surface* surface = new XPlane(x[i]);
+    surface->setBoundaryType(boundaryType(boundaries[i]));
+    addSurface(surface);
+    surface_ids[i] = surface->getId();
+  }
+}
+
+
+/**
+ * @brief Creates YPlanes from an array of y-coordinates and adds them to
+ *        the Geometry.
+ * @details This method is a bulk alternative to creating each YPlane and
+ *          adding it to the Geometry from Python. The boundary condition for
+ *          each YPlane is given as a boundaryType.
+ * @param y an array of the YPlanes' y-coordinates
+ * @param num_y the number of y-coordinates
+ * @param boundaries an array of the YPlanes' boundary conditions
+ * @param num_boundaries the number of boundary conditions
+ * @param surface_ids an array to store the new YPlanes' IDs
+ * @param num_surfaces the number of YPlanes
+ */
+void Geometry::createYPlanes(double* y, int num_y, int* boundaries,
+                             int num_boundaries, int* surface_ids,
+                             int num_surfaces) {
+
+  if (num_y != num_surfaces || num_boundaries != num_surfaces)
+    log_printf(ERROR, "Unable to create %d YPlanes from %d y-coordinates and "
+               "%d boundary conditions", num_surfaces, num_y, num_boundaries);
+
+  for (int i=0; i < num_surfaces; i++) {
+    Surface* surface = new YPlane(y[i]);
+    surface->setBoundaryType(boundaryType(boundaries[i]));
+    addSurface(surface);
+    surface_ids[i] = surface->getId();
+  }
+}
+
+
+/**
+ * @brief Creates Planes from arrays of coefficients and adds them to the
+ *        Geometry.
+ * @details This method is a bulk alternative to creating each Plane and
+ *          adding it to the Geometry from Python. Each Plane is defined by
+ *          the coefficients of \f$ Ax + By + C = 0 \f$ and its boundary
+ *          condition is given as a boundaryType.
+ * @param A an array of the Planes' coefficients for the linear term in x
+ * @param num_A the number of coefficients for the linear term in x
+ * @param B an array of the Planes' coefficients for the linear term in y
+ * @param num_B the number of coefficients for the linear term in y
+ * @param C an array of the Planes' constant offsets
+ * @param num_C the number of constant offsets
+ * @param boundaries an array of the Planes' boundary conditions
+ * @param num_boundaries the number of boundary conditions
+ * @param surface_ids an array to store the new Planes' IDs
+ * @param num_surfaces the number of Planes
+ */
+void Geometry::createPlanes(double* A, int num_A, double* B, int num_B,
+                            double* C, int num_C, int* boundaries,
+                            int num_boundaries, int* surface_ids,
+                            int num_surfaces) {
+
+  if (num_A != num_surfaces || num_B != num_surfaces ||
+      num_C != num_surfaces || num_boundaries != num_surfaces)
+    log_printf(ERROR, "Unable to create %d Planes from %d, %d and %d "
+               "coefficients and %d boundary conditions", num_surfaces,
+               num_A, num_B, num_C, num_boundaries);
+
+  for (int i=0; i < num_surfaces; i++) {
+    Surface* surface = new Plane(A[i], B[i], C[i]);
+    surface->setBoundaryType(boundaryType(boundaries[i]));
+    addSurface(surface);
+    surface_ids[i] = surface->getId();
+  }
+}
+
+
+/**
+ * @brief Creates Circles from arrays of centers and radii and adds them to
+ *        the Geometry.
+ * @details This method is a bulk alternative to creating each Circle and
+ *          adding it to the Geometry from Python, as follows:
+ *
+ * @code
+ *          radii = numpy.array([0.54, 0.58, 0.62])
+ *          x = numpy.zeros(len(radii))
+ *          y = numpy.zeros(len(radii))
+ *          surface_ids = geometry.createCircles(x, y, radii, len(radii))
+ * @endcode
+ *
+ * @param x an array of the x-coordinates of the Circles' centers
+ * @param num_x the number of x-coordinates
+ * @param y an array of the y-coordinates of the Circles' centers
+ * @param num_y the number of y-coordinates
+ * @param radii an array of the Circles' radii
+ * @param num_radii the number of radii
+ * @param surface_ids an array to store the new Circles' IDs
+ * @param num_surfaces the number of Circles
+ */
+void Geometry::createCircles(double* x, int num_x, double* y, int num_y,
+                             double* radii, int num_radii, int* surface_ids,
+                             int num_surfaces) {
+
+  if (num_x != num_surfaces || num_y != num_surfaces ||
+      num_radii != num_surfaces)
+    log_printf(ERROR, "Unable to create %d Circles from %d x-coordinates, "
+               "%d y-coordinates and %d radii", num_surfaces, num_x, num_y,
+               num_radii);
+
+  for (int i=0; i < num_surfaces; i++) {
+    Surface* surface = new Circle(x[i], y[i], radii[i]);
+    addSurface(surface);
+    surface_ids[i] = surface->getId();
+  }
+}
+
+
+/**
+ * @brief Creates CellBasics from arrays of their attributes and adds them to
+ *        the Geometry.
+ * @details This method is a bulk alternative to creating each CellBasic,
+ *          adding its Surfaces and adding it to the Geometry from Python.
+ *          The Surfaces bounding each Cell are given in compressed form:
+ *          the Surfaces of the Cell with index i are the entries from
+ *          surface_offsets[i] to surface_offsets[i+1] in the cell_surfaces
+ *          array. Each entry is a Surface ID multiplied by the halfspace of
+ *          the Cell with respect to the Surface. The Surfaces must have been
+ *          added to the Geometry. The IDs of the new Cells are returned, as
+ *          follows from Python:
+ *
+ * @code
+ *          universes = numpy.array([1, 1], dtype=numpy.int32)
+ *          materials = numpy.array([uo2_id, water_id], dtype=numpy.int32)
+ *          rings = numpy.array([3, 0], dtype=numpy.int32)
+ *          sectors = numpy.array([8, 8], dtype=numpy.int32)
+ *          offsets = numpy.array([0, 1, 2], dtype=numpy.int32)
+ *          surfaces = numpy.array([-circle_id, circle_id], dtype=numpy.int32)
+ *          cell_ids = geometry.createCellBasics(universes, materials, rings,
+ *                                               sectors, offsets, surfaces,
+ *                                               len(universes))
+ * @endcode
+ *
+ * @param universes an array of the IDs of the Universes containing the Cells
+ * @param num_universes the number of Universe IDs
+ * @param materials an array of the IDs of the Materials filling the Cells
+ * @param num_materials the number of Material IDs
+ * @param rings an array of the number of rings subdividing each Cell
+ * @param num_rings the number of ring counts
+ * @param sectors an array of the number of sectors subdividing each Cell
+ * @param num_sectors the number of sector counts
+ * @param surface_offsets an array of the offsets of each Cell's Surfaces
+ * @param num_offsets the number of offsets (the number of Cells plus one)
+ * @param cell_surfaces an array of the signed IDs of each Cell's Surfaces
+ * @param num_cell_surfaces the number of signed Surface IDs
+ * @param cell_ids an array to store the new Cells' IDs
+ * @param num_cells the number of Cells
+ */
+void Geometry::createCellBasics(int* universes, int num_universes,
+                                int* materials, int num_materials,
+                                int* rings, int num_rings, int* sectors,
+                                int num_sectors, int* surface_offsets,
+                                int num_offsets, int* cell_surfaces,
+                                int num_cell_surfaces, int* cell_ids,
+                                int num_cells) {
+
+  if (num_universes != num_cells || num_materials != num_cells ||
+      num_rings != num_cells || num_sectors != num_cells)
+    log_printf(ERROR, "Unable to create %d CellBasics from %d Universe IDs, "
+               "%d Material IDs, %d ring counts and %d sector counts",
+               num_cells, num_universes, num_materials, num_rings,
+               num_sectors);
+
+  if (num_offsets != num_cells + 1)
+    log_printf(ERROR, "Unable to create %d CellBasics from %d Surface "
+               "offsets", num_cells, num_offsets);
+
+  for (int i=0; i < num_cells; i++) {
+    Cell* cell = new CellBasic(universes[i], materials[i], rings[i],
+                               sectors[i]);
+    addCellSurfaces(cell, surface_offsets, cell_surfaces, num_cell_surfaces,
+                    i);
+    addCell(cell);
+    cell_ids[i] = cell->getId();
+  }
+}
+
+
+/**
+ * @brief Creates CellFills from arrays of their attributes and adds them to
+ *        the Geometry.
+ * @details This method is a bulk alternative to creating each CellFill,
+ *          adding its Surfaces and adding it to the Geometry from Python.
+ *          The Surfaces bounding each Cell are given in the same compressed
+ *          form as for Geometry::createCellBasics(...).
+ * @param universes an array of the IDs of the Universes containing the Cells
+ * @param num_universes the number of Universe IDs
+ * @param universe_fills an array of the IDs of the Universes filling the
+ *        Cells
+ * @param num_fills the number of filling Universe IDs
+ * @param surface_offsets an array of the offsets of each Cell's Surfaces
+ * @param num_offsets the number of offsets (the number of Cells plus one)
+ * @param cell_surfaces an array of the signed IDs of each Cell's Surfaces
+ * @param num_cell_surfaces the number of signed Surface IDs
+ * @param cell_ids an array to store the new Cells' IDs
+ * @param num_cells the number of Cells
+ */
+void Geometry::createCellFills(int* universes, int num_universes,
+                               int* universe_fills, int num_fills,
+                               int* surface_offsets, int num_offsets,
+                               int* cell_surfaces, int num_cell_surfaces,
+                               int* cell_ids, int num_cells) {
+
+  if (num_universes != num_cells || num_fills != num_cells)
+    log_printf(ERROR, "Unable to create %d CellFills from %d Universe IDs "
+               "and %d filling Universe IDs", num_cells, num_universes,
+               num_fills);
+
+  if (num_offsets != num_cells + 1)
+    log_printf(ERROR, "Unable to create %d CellFills from %d Surface "
+               "offsets", num_cells, num_offsets);
+
+  for (int i=0; i < num_cells; i++) {
+    Cell* cell = new CellFill(universes[i], universe_fills[i]);
+    addCellSurfaces(cell, surface_offsets, cell_surfaces, num_cell_surfaces,
+                    i);
+    addCell(cell);
+    cell_ids[i] = cell->getId();
+  }
+}
+
+
+/**
+ * @brief Adds the Surfaces bounding a Cell from the compressed arrays of
+ *        Surfaces passed to Geometry::createCellBasics(...) or
+ *        Geometry::createCellFills(...).
+ * @param cell a pointer to the Cell
+ * @param surface_offsets an array of the offsets of each Cell's Surfaces
+ * @param cell_surfaces an array of the signed IDs of each Cell's Surfaces
+ * @param num_cell_surfaces the number of signed Surface IDs
+ * @param index the index of the Cell in the arrays
+ */
+void Geometry::addCellSurfaces(Cell* cell, int* surface_offsets,
+                               int* cell_surfaces, int num_cell_surfaces,
+                               int index) {
+
+  int start = surface_offsets[index];
+  int end = surface_offsets[index+1];
+
+  if (start < 0 || end < start || end > num_cell_surfaces)
+    log_printf(ERROR, "Unable to add Surfaces %d to %d to the Cell with "
+               "index %d since there are %d Surfaces", start, end, index,
+               num_cell_surfaces);
+
+  for (int s=start; s < end; s++) {
+    int halfspace = (cell_surfaces[s] < 0) ? -1 : 1;
+    cell->addSurface(halfspace, getSurface(halfspace * cell_surfaces[s]));
+  }
+}
+
+
+/**
+ * @brief Creates a Lattice from an array of Universe IDs and adds it to the
+ *        Geometry.
+ * @details This method is a bulk alternative to creating a Lattice, setting
+ *          its Lattice cells and adding it to the Geometry from Python. The
+ *          Universe IDs are given in row major order starting from the upper
+ *          left corner as for Lattice::setLatticeCells(...), such as with a
+ *          2D NumPy array:
+ *
+ * @code
+ *          universes = numpy.ones((17, 17), dtype=numpy.int32)
+ *          geometry.createLattice(2, 1.26, 1.26, universes)
+ * @endcode
+ *
+ * @param id the user-specified Lattice (Universe) ID
+ * @param width_x the width of the Lattice cells along x
+ * @param width_y the width of the Lattice cells along y
+ * @param num_x the number of Lattice cells along x
+ * @param num_y the number of Lattice cells along y
+ * @param universes an array of the IDs of the Universes filling each
+ *        Lattice cell
+ */
+void Geometry::createLattice(int id, double width_x, double width_y,
+                             int num_x, int num_y, int* universes) {
+
+  Lattice* lattice = new Lattice(id, width_x, width_y);
+  lattice->setLatticeCells(num_x, num_y, universes);
+  addLattice(lattice);
+}
+
+
 /**
  * @brief Removes a Material from the Geometry.
  * @details Note: this method does not remove the Cells filled by this Material
@@ -707,6 +1287,9 @@ void Geometry::addLattice(Lattice* lattice) {
  */
 void Geometry::removeMaterial(int id) {
 
+  /* The FSR Material maps must be checked for this change */
+  _num_material_changes = -1;
+
   /* Checks if the Geometry contains this Material */
   if (_materials.find(id) == _materials.end())
     log_printf(WARNING, "Cannot remove a Material with ID = %d from the "
@@ -733,6 +1316,9 @@ void Geometry::removeMaterial(int id) {
  */
 void Geometry::removeCell(int id) {
 
+  /* The FSR Material maps must be checked for this change */
+  _num_material_changes = -1;
+
   /* Checks if the Geometry contains this Cell */
   if (_cells.find(id) == _cells.end())
     log_printf(WARNING, "Cannot remove a Cell with ID = %d from the "
@@ -1007,9 +1593,12 @@ Cell* Geometry::findCell(Universe* univ, int fsr_id) {
  *          that the LocalCoords will reach next along its trajectory.
  * @param coords pointer to a LocalCoords object
  * @param angle the angle of the trajectory
+ * @param test a LocalCoords used to store a copy of the coords while
+ *        testing the next Cell
  * @return a pointer to a Cell if found, NULL if no Cell found
  */
-Cell* Geometry::findNextCell(LocalCoords* coords, double angle) {
+Cell* Geometry::findNextCell(LocalCoords* coords, double angle,
+                             LocalCoords* test) {
 
   Cell* cell = NULL;
   double dist;
@@ -1026,15 +1615,14 @@ Cell* Geometry::findNextCell(LocalCoords* coords, double angle) {
 
     /* Check the min distance to the next Surface in the current Cell */
     Point surf_intersection;
+    Surface* surface = NULL;
     LocalCoords* lowest_level = coords->getLowestLevel();
     dist = cell->minSurfaceDist(lowest_level->getPoint(), angle,
-                                &surf_intersection);
+                                &surf_intersection, &surface);
 
     /* If the distance returned is not INFINITY, the trajectory will
      * intersect a Surface in the Cell */
     if (dist != std::numeric_limits<double>::infinity()) {
-      LocalCoords test(0,0);
-
       /* Move LocalCoords just to the next Surface in the Cell plus an
        * additional small bit into the next Cell */
       double delta_x = cos(angle) * TINY_MOVE;
@@ -1043,17 +1631,35 @@ Cell* Geometry::findNextCell(LocalCoords* coords, double angle) {
       /* Copy coords to the test coords before moving it by delta and
        * finding the new Cell it is in - do this for testing purposes
        * in case the new Cell found is NULL or is in a new Lattice cell*/
-      coords->copyCoords(&test);
+      coords->copyCoords(test);
       coords->updateMostLocal(&surf_intersection);
       coords->adjustCoords(delta_x, delta_y);
 
+      /* If the perturbed coords remain in the same Cells at all higher
+       * levels, look up the new Cell across the Surface that was crossed.
+       * Grazing crossings which leave the perturbed coords within
+       * ON_SURFACE_THRESH of the current Cell use the search from the root
+       * Universe, which may return the current Cell again */
+      if (surface != NULL && withinParentCells(lowest_level) &&
+          !cell->cellContainsCoords(lowest_level)) {
+
+        Cell* next_cell = cell->findNeighborCell(surface, lowest_level);
+
+        if (next_cell != NULL && next_cell->getType() == MATERIAL) {
+          lowest_level->setCell(next_cell->getId());
+          lowest_level->setCellUid(next_cell->getUid());
+          test->prune();
+          return next_cell;
+        }
+      }
+
       /* Find new Cell for the perturbed coords */
       cell = findCellContainingCoords(coords);
 
 
      /* Check if the next Cell found is in the same lattice cell
       * as the previous cell */
-      LocalCoords* test_curr = test.getLowestLevel();
+      LocalCoords* test_curr = test->getLowestLevel();
       LocalCoords* coords_curr = coords->getLowestLevel();
 
       while (test_curr != NULL && test_curr->getUniverse() != 0 &&
@@ -1083,16 +1689,16 @@ Cell* Geometry::findNextCell(LocalCoords* coords, double angle) {
       /* If the distance is not INFINITY then the new Cell found is the
        * one to return */
       if (dist != std::numeric_limits<double>::infinity()) {
-        test.prune();
+        test->prune();
         return cell;
       }
 
       /* If the distance is INFINITY then the new Cell found is not
        * the one to return and we should move to a new Lattice cell */
       else
-        test.copyCoords(coords);
+        test->copyCoords(coords);
 
-      test.prune();
+      test->prune();
     }
 
     /* If the distance returned is INFINITY, the trajectory will not
@@ -1175,139 +1781,1396 @@ Cell* Geometry::findNextCell(LocalCoords* coords, double angle) {
 
 
 /**
- * @brief Find and return the ID of the flat source region that a given
- *        LocalCoords object resides within.
- * @param coords a LocalCoords object pointer
- * @return the FSR ID for a given LocalCoords object
+ * @brief Checks whether a LocalCoords remains inside the same Cells and
+ *        Lattice cells at all levels above the lowest level in the nested
+ *        Universe hierarchy.
+ * @details This method is used by Geometry::findNextCell(...) to determine
+ *          whether the Cell across a Surface can be found from the lists of
+ *          neighboring Cells rather than a search from the root Universe.
+ * @param coords a pointer to the lowest level LocalCoords
+ * @return true if the LocalCoords is inside the same parent Cells
  */
-int Geometry::findFSRId(LocalCoords* coords) {
+bool Geometry::withinParentCells(LocalCoords* coords) {
 
-  int fsr_id = 0;
-  LocalCoords* curr = coords;
+  LocalCoords* curr = coords->getPrev();
 
-  /* Traverse linked list defined by the LocalCoords object and compute the FSR
-   * ID using the offset maps at each level of the nested Universe hierarchy */
+  /* Traverse the linked list up to the root Universe */
   while (curr != NULL) {
 
-    /* If the current level is a Lattice, add an offset from the Lattice map
-     * to the FSR ID */
+    /* Check that the next level is still inside the same Lattice cell */
     if (curr->getType() == LAT) {
       Lattice* lattice = _lattices.at(curr->getLattice());
-      fsr_id += lattice->getFSR(curr->getLatticeX(), curr->getLatticeY());
+      LocalCoords* next = curr->getNext();
+
+      if (fabs(next->getX()) >= lattice->getWidthX() / 2. ||
+          fabs(next->getY()) >= lattice->getWidthY() / 2.)
+        return false;
     }
 
-    /* If the current level is a Lattice, add an offset from the Lattice map
-     * to the FSR ID*/
-    else if (curr->getType() == UNIV) {
+    /* Check that this level is still inside the same Cell */
+    else {
       Universe* universe = _universes.at(curr->getUniverse());
-      fsr_id += universe->getFSR(curr->getCell());
+
+      if (!universe->getCell(curr->getCell())->cellContainsCoords(curr))
+        return false;
     }
 
-    /* Get next LocalCoords node in the linked list */
-    curr = curr->getNext();
+    curr = curr->getPrev();
   }
 
-  return fsr_id;
+  return true;
 }
 
 
 /**
- * @brief Subidivides all Cells in the Geometry into rings and angular sectors.
- * @details This method is called by the Geometry::initializeFlatSourceRegions()
- *          method but may also be called by the user in Python if needed:
- *
- * @code
- *          geometry.subdivideCells()
- * @endcode
+ * @brief Checks whether two Surface halfspaces are on opposite sides of the
+ *        same Surface.
+ * @details The Surfaces may be distinct objects with the same coefficients,
+ *          such as the outermost Circle created when subdividing a Cell into
+ *          rings and the Circle bounding the original Cell.
+ * @param surface1 a pointer to the first Surface
+ * @param halfspace1 the halfspace (+/-1) of the first Surface
+ * @param surface2 a pointer to the second Surface
+ * @param halfspace2 the halfspace (+/-1) of the second Surface
+ * @return true if the halfspaces are on opposite sides of the Surface
  */
-void Geometry::subdivideCells() {
-
-  std::map<int, Universe*>::iterator iter;
-  Universe* curr;
+bool Geometry::isOppositeHalfspace(Surface* surface1, int halfspace1,
+                                   Surface* surface2, int halfspace2) {
 
-  /* Loop over all Universe in the Geometry and instruct each to inform
-   * their Cells to subdivide into rings and sectors as specified by
-   * the user during Cell instantiation */
-  for (iter = _universes.begin(); iter != _universes.end(); ++iter) {
-    curr = (*iter).second;
-    curr->subdivideCells();
-  }
-}
+  if (surface1 == surface2)
+    return (halfspace1 == -halfspace2);
 
+  surfaceType type1 = surface1->getSurfaceType();
+  surfaceType type2 = surface2->getSurfaceType();
 
-/**
- * @brief Compute the number of flat source regions in the Geometry and
- *        initialize arrays for FSR IDs and maps.
- * @details This method is intended to be called by the user before initiating
- *          source iteration. This method first subdivides all Cells by calling
- *          the Geometry::subdivideCells() method. Then it computes the total
- *          number of FSRs in the Geometry and initializes integer arrays of
- *          maps to Cells and Materials UIDs/IDs indexed by FSR IDs.
- */
-void Geometry::initializeFlatSourceRegions() {
+  /* Two Circles must have the same center and radius */
+  if (type1 == CIRCLE && type2 == CIRCLE) {
+    Circle* circle1 = static_cast<Circle*>(surface1);
+    Circle* circle2 = static_cast<Circle*>(surface2);
 
-  /* Initialize pointers from CellFills to Universes */
-  initializeCellFillPointers();
+    return (halfspace1 == -halfspace2 &&
+            fabs(circle1->getX0() - circle2->getX0()) < ON_SURFACE_THRESH &&
+            fabs(circle1->getY0() - circle2->getY0()) < ON_SURFACE_THRESH &&
+            fabs(circle1->getRadius() - circle2->getRadius()) <
+            ON_SURFACE_THRESH);
+  }
 
-  /* Subdivide Cells into sectors and rings */
-  subdivideCells();
+  /* Two Planes must have opposite normalized coefficients */
+  else if (type1 != CIRCLE && type1 != QUADRATIC &&
+           type2 != CIRCLE && type2 != QUADRATIC) {
+    Plane* plane1 = static_cast<Plane*>(surface1);
+    Plane* plane2 = static_cast<Plane*>(surface2);
 
-  /* Generate flat source regions offset maps for each Universe and Lattice */
-  Universe *univ = _universes.at(0);
-  _num_FSRs = univ->computeFSRMaps();
+    double norm1 = sqrt(plane1->getA() * plane1->getA() +
+                        plane1->getB() * plane1->getB());
+    double norm2 = sqrt(plane2->getA() * plane2->getA() +
+                        plane2->getB() * plane2->getB());
 
-  log_printf(NORMAL, "Number of flat source regions: %d", _num_FSRs);
+    if (norm1 == 0. || norm2 == 0.)
+      return false;
 
-  /* Allocate memory for maps between FSR IDs and Cell or Material IDs/UIDs */
-  _FSRs_to_cells = new int[_num_FSRs];
-  _FSRs_to_material_UIDs = new int[_num_FSRs];
-  _FSRs_to_material_IDs = new int[_num_FSRs];
+    norm1 *= halfspace1;
+    norm2 *= halfspace2;
 
-  /* Load maps with Cell and Material IDs/UIDs */
-  for (int r=0; r < _num_FSRs; r++) {
-    CellBasic* curr=static_cast<CellBasic*>(findCell(_universes.at(0), r));
-    _FSRs_to_cells[r] = curr->getId();
-    _FSRs_to_material_UIDs[r] = getMaterial(curr->getMaterial())->getUid();
-    _FSRs_to_material_IDs[r] = getMaterial(curr->getMaterial())->getId();
+    return (fabs(plane1->getA() / norm1 + plane2->getA() / norm2) <
+            ON_SURFACE_THRESH &&
+            fabs(plane1->getB() / norm1 + plane2->getB() / norm2) <
+            ON_SURFACE_THRESH &&
+            fabs(plane1->getC() / norm1 + plane2->getC() / norm2) <
+            ON_SURFACE_THRESH);
   }
 
-  if (_mesh->getCmfdOn())
-    initializeMesh();
+  return false;
 }
 
 
 /**
- * @brief This method performs ray tracing to create Track segments within each
- *        flat source region in the Geometry.
- * @details This method starts at the beginning of a Track and finds successive
- *          intersection points with FSRs as the Track crosses through the
- *          Geometry and creates segment structs and adds them to the Track.
- * @param track a pointer to a track to segmentize
+ * @brief Builds the lists of neighboring Cells across each Surface of each
+ *        Cell in the Geometry.
+ * @details Each Surface is given the lists of Cells bounded by each of its
+ *          halfspaces. For each (Cell, Surface) pair, the neighboring Cells
+ *          are then those in the same Universe on the opposite halfspace of
+ *          the Surface, or of another Surface with the same coefficients
+ *          such as the outermost Circle created when subdividing a Cell into
+ *          rings. These lists are used by Geometry::findNextCell(...) to
+ *          find the Cell across a Surface without searching the nested
+ *          Universe hierarchy from the root Universe, which is retained as
+ *          a fallback. This method is called by
+ *          Geometry::initializeFlatSourceRegions().
  */
-void Geometry::segmentize(Track* track) {
+void Geometry::initializeCellNeighbors() {
 
-  /* Track starting Point coordinates and azimuthal angle */
-  double x0 = track->getStart()->getX();
-  double y0 = track->getStart()->getY();
-  double phi = track->getPhi();
+  std::map<int, Universe*>::iterator iter;
+  std::map<int, Cell*>::iterator iter1;
+  std::map<Surface*, int>::iterator iter2;
+  std::vector<Surface*>::iterator iter3;
+  std::vector<Cell*>::iterator iter4;
+  std::map<std::vector<double>, std::vector<Surface*> > equivalent;
+  std::map<Surface*, std::vector<Surface*>* > surface_equivalent;
+  int num_neighbors = 0;
+
+  /* Add each Cell to the lists of the Surfaces bounding it */
+  for (iter = _universes.begin(); iter != _universes.end(); ++iter) {
 
-  /* Length of each segment */
-  FP_PRECISION segment_length;
-  Material* segment_material;
-  int fsr_id;
-  FP_PRECISION* sigma_t;
-  int min_num_segments;
-  int num_segments;
+    if (iter->second->getType() == LATTICE)
+      continue;
 
-  /* Use a LocalCoords for the start and end of each segment */
-  LocalCoords segment_start(x0, y0);
-  LocalCoords segment_end(x0, y0);
-  segment_start.setUniverse(0);
-  segment_end.setUniverse(0);
+    std::map<int, Cell*> cells = iter->second->getCells();
 
-  /* Find the Cell containing the Track starting Point */
-  Cell* curr = findFirstCell(&segment_end, phi);
-  Cell* prev;
+    for (iter1 = cells.begin(); iter1 != cells.end(); ++iter1) {
+
+      Cell* cell = iter1->second;
+      std::map<Surface*, int> surfaces = cell->getSurfaces();
+
+      cell->clearNeighborCells();
+
+      for (iter2 = surfaces.begin(); iter2 != surfaces.end(); ++iter2) {
+
+        Surface* surface = iter2->first;
+
+        /* Group the Surfaces with the same coefficients */
+        if (surface_equivalent.find(surface) == surface_equivalent.end()) {
+          surface->clearNeighborCells();
+          std::vector<Surface*>& group = equivalent[surface_key(surface)];
+          group.push_back(surface);
+          surface_equivalent[surface] = &group;
+        }
+
+        surface->addNeighborCell(iter2->second, cell);
+      }
+    }
+  }
+
+  /* Add the Cells in the same Universe on the opposite halfspace of each
+   * Surface to the neighbors of each Cell bounded by it */
+  for (iter = _universes.begin(); iter != _universes.end(); ++iter) {
+
+    if (iter->second->getType() == LATTICE)
+      continue;
+
+    std::map<int, Cell*> cells = iter->second->getCells();
+
+    for (iter1 = cells.begin(); iter1 != cells.end(); ++iter1) {
+
+      Cell* cell = iter1->second;
+      std::map<Surface*, int> surfaces = cell->getSurfaces();
+
+      for (iter2 = surfaces.begin(); iter2 != surfaces.end(); ++iter2) {
+
+        std::vector<Surface*>* group = surface_equivalent[iter2->first];
+
+        for (iter3 = group->begin(); iter3 != group->end(); ++iter3) {
+          for (int halfspace=-1; halfspace <= 1; halfspace += 2) {
+
+            if (!isOppositeHalfspace(iter2->first, iter2->second,
+                                     *iter3, halfspace))
+              continue;
+
+            std::vector<Cell*>& neighbors =
+                (*iter3)->getNeighborCells(halfspace);
+
+            for (iter4 = neighbors.begin(); iter4 != neighbors.end();
+                 ++iter4) {
+              if (*iter4 != cell &&
+                  (*iter4)->getUniverseId() == cell->getUniverseId()) {
+                cell->addNeighborCell(iter2->first, *iter4);
+                num_neighbors++;
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+
+  log_printf(DEBUG, "Initialized %d neighboring Cell pairs across Surfaces",
+             num_neighbors);
+}
+
+
+/**
+ * @brief Find and return the ID of the flat source region that a given
+ *        LocalCoords object resides within.
+ * @details The FSR ID is the sum of the FSR offsets of the Cell or Lattice
+ *          cell at each level of the nested Universe hierarchy, which are
+ *          looked up from the tables built by
+ *          Geometry::initializeFSROffsetTables() by Cell and Lattice UID.
+ *          Levels of LocalCoords without a Cell or Lattice UID fall back
+ *          to the FSR maps of the Universes and Lattices keyed by ID.
+ * @param coords a LocalCoords object pointer
+ * @return the FSR ID for a given LocalCoords object
+ */
+int Geometry::findFSRId(LocalCoords* coords) {
+
+  int fsr_id = 0;
+  int lattice_uid;
+  LocalCoords* curr = coords;
+
+  /* Traverse linked list defined by the LocalCoords object and compute the FSR
+   * ID using the offset tables at each level of the nested Universe
+   * hierarchy */
+  while (curr != NULL) {
+
+    /* If the current level is a Lattice, add an offset from the Lattice
+     * cell table to the FSR ID */
+    if (curr->getType() == LAT) {
+      lattice_uid = curr->getLatticeUid();
+
+      /* Use the Lattice's map if the LocalCoords were not filled with a
+       * Lattice UID, such as by the user in Python */
+      if (lattice_uid < 0) {
+        Lattice* lattice = _lattices.at(curr->getLattice());
+        fsr_id += lattice->getFSR(curr->getLatticeX(), curr->getLatticeY());
+      }
+      else
+        fsr_id += _lattice_FSR_offsets[_lattice_offset_indices[lattice_uid] +
+                  curr->getLatticeY() * _lattice_num_x[lattice_uid] +
+                  curr->getLatticeX()];
+    }
+
+    /* If the current level is a Universe, add an offset from the Cell
+     * table to the FSR ID */
+    else if (curr->getType() == UNIV) {
+
+      /* Use the Universe's map if the LocalCoords were not filled with a
+       * Cell UID */
+      if (curr->getCellUid() < 0) {
+        Universe* universe = _universes.at(curr->getUniverse());
+        fsr_id += universe->getFSR(curr->getCell());
+      }
+      else
+        fsr_id += _cell_FSR_offsets[curr->getCellUid()];
+    }
+
+    /* Get next LocalCoords node in the linked list */
+    curr = curr->getNext();
+  }
+
+  return fsr_id;
+}
+
+
+/**
+ * @brief Compiles the FSR offset maps of the Universes and Lattices into flat
+ *        tables indexed by Cell and Lattice UID.
+ * @details This method is called by Geometry::initializeFlatSourceRegions()
+ *          after the FSR offset maps have been computed. The tables allow
+ *          Geometry::findFSRId(...) to compute an FSR ID with a few array
+ *          lookups rather than std::map lookups at each nested level.
+ */
+void Geometry::initializeFSROffsetTables() {
+
+  std::map<int, Universe*>::iterator iter1;
+  std::map<int, Lattice*>::iterator iter2;
+  std::map<int, Cell*>::iterator iter3;
+  int max_cell_uid = -1;
+  int max_lattice_uid = -1;
+  int num_lattice_cells = 0;
+
+  /* Free any FSR offset tables from a previous initialization */
+  if (_cell_FSR_offsets != NULL) {
+    delete [] _cell_FSR_offsets;
+    delete [] _lattice_FSR_offsets;
+    delete [] _lattice_offset_indices;
+    delete [] _lattice_num_x;
+  }
+
+  /* Find the maximum Cell and Lattice UIDs */
+  for (iter1 = _universes.begin(); iter1 != _universes.end(); ++iter1) {
+    std::map<int, Cell*> cells = iter1->second->getCells();
+    for (iter3 = cells.begin(); iter3 != cells.end(); ++iter3)
+      max_cell_uid = std::max(max_cell_uid, iter3->second->getUid());
+  }
+
+  for (iter2 = _lattices.begin(); iter2 != _lattices.end(); ++iter2) {
+    max_lattice_uid = std::max(max_lattice_uid, iter2->second->getUid());
+    num_lattice_cells += iter2->second->getNumX() * iter2->second->getNumY();
+  }
+
+  /* Allocate the FSR offset tables */
+  try {
+    _cell_FSR_offsets = new int[max_cell_uid+1];
+    _lattice_FSR_offsets = new int[num_lattice_cells];
+    _lattice_offset_indices = new int[max_lattice_uid+1];
+    _lattice_num_x = new int[max_lattice_uid+1];
+  }
+  catch (std::exception &e) {
+    log_printf(ERROR, "Could not allocate memory for the FSR offset tables. "
+               "Backtrace:\n%s", e.what());
+  }
+
+  for (int i=0; i <= max_cell_uid; i++)
+    _cell_FSR_offsets[i] = -1;
+
+  /* Load the FSR offsets for each Lattice cell */
+  int index = 0;
+
+  for (iter2 = _lattices.begin(); iter2 != _lattices.end(); ++iter2) {
+    Lattice* lattice = iter2->second;
+    _lattice_offset_indices[lattice->getUid()] = index;
+    _lattice_num_x[lattice->getUid()] = lattice->getNumX();
+
+    for (int i=0; i < lattice->getNumY(); i++) {
+      for (int j=0; j < lattice->getNumX(); j++) {
+        _lattice_FSR_offsets[index] = lattice->getFSR(j, i);
+        index++;
+      }
+    }
+  }
+
+  /* Load the FSR offsets for each Cell reached from the root Universe */
+  initializeCellFSROffsets(_universes.at(0));
+}
+
+
+/**
+ * @brief Recursively loads the FSR offsets for each Cell in a Universe and
+ *        in the Universes nested within it into the Cell offset table.
+ * @param univ a pointer to the Universe of interest
+ */
+void Geometry::initializeCellFSROffsets(Universe* univ) {
+
+  /* Recurse into the Universe in each Lattice cell */
+  if (univ->getType() == LATTICE) {
+    Lattice* lattice = static_cast<Lattice*>(univ);
+
+    for (int i=0; i < lattice->getNumY(); i++) {
+      for (int j=0; j < lattice->getNumX(); j++)
+        initializeCellFSROffsets(lattice->getUniverse(j, i));
+    }
+
+    return;
+  }
+
+  std::map<int, Cell*> cells = univ->getCells();
+  std::map<int, Cell*>::iterator iter;
+
+  for (iter = cells.begin(); iter != cells.end(); ++iter) {
+    Cell* cell = iter->second;
+
+    /* Return if the Universe has already been visited */
+    if (_cell_FSR_offsets[cell->getUid()] != -1)
+      return;
+
+    _cell_FSR_offsets[cell->getUid()] = univ->getFSR(cell->getId());
+
+    /* Recurse into the Universe filling this Cell */
+    if (cell->getType() == FILL)
+      initializeCellFSROffsets(static_cast<CellFill*>(cell)->getUniverseFill());
+  }
+}
+
+
+/**
+ * @brief Finds the FSR IDs for arrays of x and y coordinates.
+ * @details This method is intended to be called from Python with NumPy
+ *          arrays of the coordinates of each point, such as the points of a
+ *          grid used by the routines in openmoc.plotter:
+ *
+ * @code
+ *          fsr_ids = geometry.findFSRIds(x, y, x.size)
+ * @endcode
+ *
+ *          The FSR ID is -1 for points outside of the Geometry.
+ * @param x_coords an array of the x-coordinates of each point
+ * @param num_x the number of x-coordinates
+ * @param y_coords an array of the y-coordinates of each point
+ * @param num_y the number of y-coordinates
+ * @param fsr_ids an array to store the FSR ID of each point
+ * @param num_points the number of points
+ */
+void Geometry::findFSRIds(double* x_coords, int num_x, double* y_coords,
+                          int num_y, int* fsr_ids, int num_points) {
+  findPointIds(x_coords, num_x, y_coords, num_y, fsr_ids, NULL, NULL,
+               num_points);
+}
+
+
+/**
+ * @brief Finds the IDs of the Cells at the lowest level of the nested Universe
+ *        hierarchy for arrays of x and y coordinates.
+ * @details This method is intended to be called from Python with NumPy
+ *          arrays of the coordinates of each point:
+ *
+ * @code
+ *          cell_ids = geometry.findCellIds(x, y, x.size)
+ * @endcode
+ *
+ *          The Cell ID is -1 for points outside of the Geometry.
+ * @param x_coords an array of the x-coordinates of each point
+ * @param num_x the number of x-coordinates
+ * @param y_coords an array of the y-coordinates of each point
+ * @param num_y the number of y-coordinates
+ * @param cell_ids an array to store the Cell ID of each point
+ * @param num_points the number of points
+ */
+void Geometry::findCellIds(double* x_coords, int num_x, double* y_coords,
+                           int num_y, int* cell_ids, int num_points) {
+  findPointIds(x_coords, num_x, y_coords, num_y, NULL, cell_ids, NULL,
+               num_points);
+}
+
+
+/**
+ * @brief Finds the Material IDs for arrays of x and y coordinates.
+ * @details This method is intended to be called from Python with NumPy
+ *          arrays of the coordinates of each point:
+ *
+ * @code
+ *          material_ids = geometry.findMaterialIds(x, y, x.size)
+ * @endcode
+ *
+ *          The Material ID is -1 for points outside of the Geometry.
+ * @param x_coords an array of the x-coordinates of each point
+ * @param num_x the number of x-coordinates
+ * @param y_coords an array of the y-coordinates of each point
+ * @param num_y the number of y-coordinates
+ * @param material_ids an array to store the Material ID of each point
+ * @param num_points the number of points
+ */
+void Geometry::findMaterialIds(double* x_coords, int num_x, double* y_coords,
+                               int num_y, int* material_ids, int num_points) {
+  findPointIds(x_coords, num_x, y_coords, num_y, NULL, NULL, material_ids,
+               num_points);
+}
+
+
+/**
+ * @brief Finds the FSR, Cell and/or Material IDs for arrays of x and y
+ *        coordinates in parallel.
+ * @details Each thread reuses a single array-backed LocalCoords for all of
+ *          its points. Any of the output arrays may be NULL if those IDs are
+ *          not needed. The IDs are -1 for points outside of the Geometry.
+ * @param x_coords an array of the x-coordinates of each point
+ * @param num_x the number of x-coordinates
+ * @param y_coords an array of the y-coordinates of each point
+ * @param num_y the number of y-coordinates
+ * @param fsr_ids an array to store the FSR ID of each point (or NULL)
+ * @param cell_ids an array to store the Cell ID of each point (or NULL)
+ * @param material_ids an array to store the Material ID of each point
+ *        (or NULL)
+ * @param num_points the number of points
+ */
+void Geometry::findPointIds(double* x_coords, int num_x, double* y_coords,
+                            int num_y, int* fsr_ids, int* cell_ids,
+                            int* material_ids, int num_points) {
+
+  if (num_x != num_points || num_y != num_points)
+    log_printf(ERROR, "Unable to find the IDs for %d points with %d "
+               "x-coordinates and %d y-coordinates", num_points, num_x, num_y);
+
+  if (_num_FSRs == 0)
+    log_printf(ERROR, "Unable to find the IDs for %d points since the flat "
+               "source regions have not been initialized", num_points);
+
+  #pragma omp parallel
+  {
+    LocalCoords coords(0., 0., true);
+    Cell* cell;
+
+    #pragma omp for
+    for (int i=0; i < num_points; i++) {
+
+      coords.prune();
+      coords.setX(x_coords[i]);
+      coords.setY(y_coords[i]);
+      coords.setUniverse(0);
+      cell = findCellContainingCoords(&coords);
+
+      /* The point is outside of the Geometry */
+      if (cell == NULL) {
+        if (fsr_ids != NULL)
+          fsr_ids[i] = -1;
+        if (cell_ids != NULL)
+          cell_ids[i] = -1;
+        if (material_ids != NULL)
+          material_ids[i] = -1;
+        continue;
+      }
+
+      if (fsr_ids != NULL)
+        fsr_ids[i] = findFSRId(&coords);
+      if (cell_ids != NULL)
+        cell_ids[i] = cell->getId();
+      if (material_ids != NULL)
+        material_ids[i] = static_cast<CellBasic*>(cell)->getMaterial();
+    }
+  }
+}
+
+
+/**
+ * @brief Subidivides all Cells in the Geometry into rings and angular sectors.
+ * @details This method is called by the Geometry::initializeFlatSourceRegions()
+ *          method but may also be called by the user in Python if needed:
+ *
+ * @code
+ *          geometry.subdivideCells()
+ * @endcode
+ */
+void Geometry::subdivideCells() {
+
+  std::map<int, Universe*>::iterator iter;
+  Universe* curr;
+
+  /* Loop over all Universe in the Geometry and instruct each to inform
+   * their Cells to subdivide into rings and sectors as specified by
+   * the user during Cell instantiation */
+  for (iter = _universes.begin(); iter != _universes.end(); ++iter) {
+    curr = (*iter).second;
+    curr->subdivideCells();
+  }
+}
+
+
+/**
+ * @brief Compute the maximum number of nested Lattices along any path
+ *        through the nested Universe hierarchy below a Universe.
+ * @param univ a pointer to the Universe at the top of the hierarchy
+ * @return the nested Lattice depth
+ */
+int Geometry::computeLatticeDepth(Universe* univ) {
+
+  int depth = 0;
+
+  /* If the Universe is a Lattice, find the depth of each unique Universe
+   * filling its Lattice cells */
+  if (univ->getType() == LATTICE) {
+    Lattice* lattice = static_cast<Lattice*>(univ);
+    std::map<int, int> depths;
+
+    for (int i=0; i < lattice->getNumY(); i++) {
+      for (int j=0; j < lattice->getNumX(); j++) {
+        Universe* next_univ = lattice->getUniverse(j, i);
+
+        if (depths.find(next_univ->getId()) == depths.end())
+          depths[next_univ->getId()] = computeLatticeDepth(next_univ);
+
+        depth = std::max(depth, depths[next_univ->getId()]);
+      }
+    }
+
+    return depth + 1;
+  }
+
+  /* If the Universe is SIMPLE, find the depth of each Universe filling its
+   * CellFills */
+  else {
+    std::map<int, Cell*>::iterator iter;
+    std::map<int, Cell*> cells = univ->getCells();
+
+    for (iter = cells.begin(); iter != cells.end(); ++iter) {
+      if (iter->second->getType() == FILL) {
+        CellFill* cell = static_cast<CellFill*>(iter->second);
+        depth = std::max(depth, computeLatticeDepth(cell->getUniverseFill()));
+      }
+    }
+
+    return depth;
+  }
+}
+
+
+/**
+ * @brief Recursively load the maps from FSR IDs to Cell and Material
+ *        IDs/UIDs, Universe origins and Lattice paths for all FSRs within
+ *        a Universe.
+ * @details This method traverses the nested Universe hierarchy once using
+ *          the FSR offset maps computed by each Universe and Lattice, such
+ *          that each FSR is visited exactly once. The FSRs in each Lattice
+ *          cell form a contiguous range of FSR IDs, so the Lattice cells of
+ *          the outermost Lattice are loaded in parallel.
+ * @param univ a pointer to the Universe to traverse
+ * @param fsr_id the ID of the first FSR within the Universe
+ * @param x the x-coordinate of the origin of the Universe
+ * @param y the y-coordinate of the origin of the Universe
+ * @param lattice_path an array of the Lattice cell indices above the Universe
+ * @param level the number of nested Lattices above the Universe
+ * @param parallel whether to load Lattice cells in parallel (true) or not
+ */
+void Geometry::initializeFSRMaps(Universe* univ, int fsr_id, double x,
+                                 double y, int* lattice_path, int level,
+                                 bool parallel) {
+
+  /* If the Universe is SIMPLE, load the FSR maps for each of its Cells */
+  if (univ->getType() == SIMPLE) {
+    std::map<int, Cell*>::iterator iter;
+    std::map<int, Cell*> cells = univ->getCells();
+
+    for (iter = cells.begin(); iter != cells.end(); ++iter) {
+      int cell_fsr_id = fsr_id + univ->getFSR(iter->first);
+
+      /* Load the maps for the single FSR in a MATERIAL type Cell */
+      if (iter->second->getType() == MATERIAL) {
+        CellBasic* cell = static_cast<CellBasic*>(iter->second);
+        Material* material = getMaterial(cell->getMaterial());
+
+        _FSRs_to_cells[cell_fsr_id] = cell->getId();
+        _FSRs_to_material_UIDs[cell_fsr_id] = material->getUid();
+        _FSRs_to_material_IDs[cell_fsr_id] = material->getId();
+        _FSRs_to_origins[2*cell_fsr_id] = x;
+        _FSRs_to_origins[2*cell_fsr_id+1] = y;
+
+        int* path = &_FSRs_to_lattice_paths[2*cell_fsr_id*_lattice_depth];
+        for (int i=0; i < 2*_lattice_depth; i++) {
+          if (i < 2*level)
+            path[i] = lattice_path[i];
+          else
+            path[i] = -1;
+        }
+      }
+
+      /* Descend into the Universe filling a FILL type Cell */
+      else {
+        CellFill* cell = static_cast<CellFill*>(iter->second);
+        initializeFSRMaps(cell->getUniverseFill(), cell_fsr_id, x, y,
+                          lattice_path, level, parallel);
+      }
+    }
+  }
+
+  /* If the Universe is a Lattice, descend into each of its Lattice cells */
+  else {
+    Lattice* lattice = static_cast<Lattice*>(univ);
+    int num_x = lattice->getNumX();
+    int num_y = lattice->getNumY();
+    double min_x = x + lattice->getOrigin()->getX();
+    double min_y = y + lattice->getOrigin()->getY();
+
+    #pragma omp parallel if (parallel)
+    {
+      /* Each thread appends its Lattice cell indices to its own copy
+       * of the Lattice path */
+      int* path = new int[2*_lattice_depth];
+      for (int i=0; i < 2*level; i++)
+        path[i] = lattice_path[i];
+
+      #pragma omp for schedule(dynamic)
+      for (int n=0; n < num_x*num_y; n++) {
+        int i = n / num_x;
+        int j = n % num_x;
+
+        path[2*level] = j;
+        path[2*level+1] = i;
+
+        initializeFSRMaps(lattice->getUniverse(j, i),
+                          fsr_id + lattice->getFSR(j, i),
+                          min_x + (j + 0.5) * lattice->getWidthX(),
+                          min_y + (i + 0.5) * lattice->getWidthY(),
+                          path, level+1, false);
+      }
+
+      delete [] path;
+    }
+  }
+}
+
+
+/**
+ * @brief Compute the number of flat source regions in the Geometry and
+ *        initialize arrays for FSR IDs and maps.
+ * @details This method is intended to be called by the user before initiating
+ *          source iteration. This method first subdivides all Cells by calling
+ *          the Geometry::subdivideCells() method. Then it computes the total
+ *          number of FSRs in the Geometry and initializes integer arrays of
+ *          maps to Cells and Materials UIDs/IDs indexed by FSR IDs, along
+ *          with the Universe origin and Lattice path of each FSR, in a single
+ *          traversal of the nested Universe hierarchy.
+ */
+void Geometry::initializeFlatSourceRegions() {
+
+  /* Initialize pointers from CellFills to Universes */
+  initializeCellFillPointers();
+
+  /* Subdivide Cells into sectors and rings */
+  subdivideCells();
+
+  /* Bin the Cells in each Universe into search grids for fast Cell lookup */
+  std::map<int, Universe*>::iterator iter;
+  for (iter = _universes.begin(); iter != _universes.end(); ++iter)
+    iter->second->initializeCellGrid();
+
+  /* Build the lists of neighboring Cells across each Cell's Surfaces */
+  initializeCellNeighbors();
+
+  /* Generate flat source regions offset maps for each Universe and Lattice */
+  Universe *univ = _universes.at(0);
+  _num_FSRs = univ->computeFSRMaps();
+
+  log_printf(NORMAL, "Number of flat source regions: %d", _num_FSRs);
+
+  /* Compile the FSR offset maps into flat tables for Geometry::findFSRId */
+  initializeFSROffsetTables();
+
+  /* Allocate memory for maps between FSR IDs and Cell or Material IDs/UIDs */
+  _lattice_depth = computeLatticeDepth(univ);
+
+  try {
+    _FSRs_to_cells = new int[_num_FSRs];
+    _FSRs_to_material_UIDs = new int[_num_FSRs];
+    _FSRs_to_material_IDs = new int[_num_FSRs];
+    _FSRs_to_origins = new double[2*_num_FSRs];
+    _FSRs_to_lattice_paths = new int[2*_num_FSRs*_lattice_depth];
+  }
+  catch (std::exception &e) {
+    log_printf(ERROR, "Could not allocate memory for the FSR maps. "
+               "Backtrace:\n%s", e.what());
+  }
+
+  /* Load maps with Cell and Material IDs/UIDs in a single traversal of the
+   * nested Universe hierarchy */
+  int* lattice_path = new int[2*_lattice_depth];
+  initializeFSRMaps(univ, 0, 0., 0., lattice_path, 0, true);
+  delete [] lattice_path;
+  _num_material_changes = CellBasic::getNumMaterialChanges();
+
+  if (_mesh->getCmfdOn())
+    initializeMesh();
+}
+
+
+/**
+ * @brief Update the maps between FSR IDs and Material IDs/UIDs with the
+ *        Materials currently filling each Cell.
+ * @details This method is intended to be called after the Material filling
+ *          one or more Cells has been changed once the FSRs have been
+ *          initialized. The TrackGenerator uses the FSRs returned by this
+ *          method to rebind the Materials for the affected Track segments
+ *          without ray tracing. The FSRs are only searched if a Cell's
+ *          Material has been changed with CellBasic::setMaterial(...), or
+ *          Materials or Cells have been added to or removed from the
+ *          Geometry, since the last update.
+ * @return a std::vector of the IDs of the FSRs whose Material changed
+ */
+std::vector<int> Geometry::updateFSRMaterials() {
+
+  if (_num_FSRs == 0)
+    log_printf(ERROR, "Unable to update the FSR Materials since the Geometry "
+               "has not initialized FSRs.");
+
+  std::vector<int> changed_FSRs;
+  CellBasic* cell;
+  Material* material;
+
+  /* Skip the search if no Materials have changed since the last update */
+  if (_num_material_changes == CellBasic::getNumMaterialChanges())
+    return changed_FSRs;
+
+  /* Check each FSR's Material against the FSR-to-Material map */
+  for (int r=0; r < _num_FSRs; r++) {
+    cell = static_cast<CellBasic*>(findCell(_universes.at(0), r));
+    material = getMaterial(cell->getMaterial());
+
+    if (material->getUid() != _FSRs_to_material_UIDs[r]) {
+      _FSRs_to_material_UIDs[r] = material->getUid();
+      _FSRs_to_material_IDs[r] = material->getId();
+      changed_FSRs.push_back(r);
+    }
+  }
+
+  _num_material_changes = CellBasic::getNumMaterialChanges();
+
+  log_printf(INFO, "Updated the Material in %d FSRs", (int)changed_FSRs.size());
+
+  return changed_FSRs;
+}
+
+
+/**
+ * @brief Writes a binary snapshot of the Geometry to a file.
+ * @details The snapshot contains the Surfaces, the subdivided Cells and the
+ *          Lattices in the Geometry along with the FSR maps. A Geometry
+ *          snapshot may be read with Geometry::readFromFile(...) to skip
+ *          the computation of the FSR maps, as follows from Python:
+ *
+ * @code
+ *          geometry.initializeFlatSourceRegions()
+ *          geometry.dumpToFile('core.geometry')
+ * @endcode
+ *
+ *          The snapshot is stored with a 64-bit FNV-1a hash of its contents
+ *          which is used to validate it when it is read.
+ * @param filename the name of the snapshot file
+ */
+void Geometry::dumpToFile(const char* filename) {
+
+  if (_num_FSRs == 0)
+    log_printf(ERROR, "Unable to dump the Geometry to a file since the "
+               "Geometry has not initialized FSRs.");
+
+  /* Serialize the Geometry and hash the snapshot */
+  std::stringstream payload;
+  dumpSnapshot(payload);
+
+  std::string data = payload.str();
+  uint64_t size = data.size();
+  uint64_t hash = fnv1a_hash(data.c_str(), data.size());
+  int version = GEOMETRY_SNAPSHOT_VERSION;
+
+  FILE* out;
+  out = fopen(filename, "wb");
+
+  if (out == NULL)
+    log_printf(ERROR, "Unable to open file %s to dump the Geometry",
+               filename);
+
+  /* Write the snapshot header and contents to the file */
+  fwrite(GEOMETRY_SNAPSHOT_MAGIC, sizeof(char),
+         strlen(GEOMETRY_SNAPSHOT_MAGIC), out);
+  fwrite(&version, sizeof(int), 1, out);
+  fwrite(&hash, sizeof(uint64_t), 1, out);
+  fwrite(&size, sizeof(uint64_t), 1, out);
+  fwrite(data.c_str(), sizeof(char), size, out);
+
+  fclose(out);
+
+  log_printf(NORMAL, "Dumped the Geometry to file %s", filename);
+}
+
+
+/**
+ * @brief Reads a binary snapshot of the Geometry from a file.
+ * @details The snapshot must have been written by Geometry::dumpToFile(...).
+ *          The Materials filling the Cells must be added to the Geometry
+ *          before the snapshot is read, as follows from Python:
+ *
+ * @code
+ *          geometry = Geometry()
+ *          for material in materials.values(): geometry.addMaterial(material)
+ *          geometry.readFromFile('core.geometry')
+ * @endcode
+ *
+ *          This method creates the Surfaces, Cells and Lattices in the
+ *          snapshot and loads the FSR maps, such that the Geometry is ready
+ *          for Track generation without calling
+ *          Geometry::initializeFlatSourceRegions().
+ * @param filename the name of the snapshot file
+ */
+void Geometry::readFromFile(const char* filename) {
+
+  if (_cells.size() != 0)
+    log_printf(ERROR, "Unable to read the Geometry from file %s since the "
+               "Geometry already contains Cells", filename);
+
+  FILE* in;
+  in = fopen(filename, "rb");
+
+  if (in == NULL)
+    log_printf(ERROR, "Unable to open Geometry file %s", filename);
+
+  int magic_length = strlen(GEOMETRY_SNAPSHOT_MAGIC);
+  std::vector<char> magic(magic_length);
+  int version;
+  uint64_t hash;
+  uint64_t size;
+  size_t ret;
+
+  /* Read the snapshot header */
+  ret = fread(&magic[0], sizeof(char), magic_length, in);
+
+  if (ret != (size_t)magic_length ||
+      strncmp(&magic[0], GEOMETRY_SNAPSHOT_MAGIC, magic_length) != 0) {
+    fclose(in);
+    log_printf(ERROR, "Unable to read the Geometry from file %s since it "
+               "is not a Geometry snapshot", filename);
+  }
+
+  ret = fread(&version, sizeof(int), 1, in);
+
+  if (ret != 1 || version != GEOMETRY_SNAPSHOT_VERSION) {
+    fclose(in);
+    log_printf(ERROR, "Unable to read the Geometry from file %s since it "
+               "has an unsupported snapshot version", filename);
+  }
+
+  ret = fread(&hash, sizeof(uint64_t), 1, in);
+  ret += fread(&size, sizeof(uint64_t), 1, in);
+
+  if (ret != 2) {
+    fclose(in);
+    log_printf(ERROR, "Unable to read the Geometry from file %s since the "
+               "snapshot is truncated", filename);
+  }
+
+  /* Read the snapshot contents and validate them against the hash */
+  std::string data(size, '\0');
+
+  if (size > 0)
+    ret = fread(&data[0], sizeof(char), size, in);
+  else
+    ret = 0;
+
+  fclose(in);
+
+  if (ret != size || fnv1a_hash(data.c_str(), data.size()) != hash)
+    log_printf(ERROR, "Unable to read the Geometry from file %s since the "
+               "snapshot is corrupt", filename);
+
+  std::stringstream payload(data);
+  readSnapshot(payload);
+
+  log_printf(NORMAL, "Read the Geometry from file %s", filename);
+}
+
+
+/**
+ * @brief Serializes the Surfaces, Cells, Lattices and FSR maps of the
+ *        Geometry to a binary stream.
+ * @details The Cells are written as they were added to the Geometry, with
+ *          the number of rings and sectors to subdivide them into, followed
+ *          by the IDs of the Cells in each Universe after subdivision. The
+ *          Lattices are written such that each Lattice follows the Lattices
+ *          nested within it.
+ * @param out the binary stream
+ */
+void Geometry::dumpSnapshot(std::stringstream& out) {
+
+  std::map<int, Surface*>::iterator iter1;
+  std::map<int, Lattice*>::iterator iter2;
+  std::map<int, Cell*>::iterator iter3;
+  std::map<Surface*, int>::iterator iter4;
+  std::map<int, Universe*>::iterator iter5;
+  std::map<Surface*, int> surface_indices;
+  std::vector<Surface*> surfaces;
+
+  /* Collect the Surfaces in the Geometry and any Surfaces which were added
+   * to a Cell after the Cell was added to the Geometry */
+  for (iter1 = _surfaces.begin(); iter1 != _surfaces.end(); ++iter1) {
+    surface_indices[iter1->second] = surfaces.size();
+    surfaces.push_back(iter1->second);
+  }
+
+  for (iter3 = _cells.begin(); iter3 != _cells.end(); ++iter3) {
+    std::map<Surface*, int> cell_surfaces = iter3->second->getSurfaces();
+
+    for (iter4 = cell_surfaces.begin(); iter4 != cell_surfaces.end();
+         ++iter4) {
+      if (surface_indices.find(iter4->first) == surface_indices.end()) {
+        surface_indices[iter4->first] = surfaces.size();
+        surfaces.push_back(iter4->first);
+      }
+    }
+  }
+
+  /* Write the Surfaces */
+  int num_surfaces = surfaces.size();
+  write_values(out, &num_surfaces, 1);
+
+  for (int i=0; i < num_surfaces; i++) {
+    Surface* surface = surfaces[i];
+    int header[3] = {surface->getId(), surface->getSurfaceType(),
+                     surface->getBoundaryType()};
+    double coeffs[3];
+
+    switch (surface->getSurfaceType()) {
+    case XPLANE:
+      coeffs[0] = static_cast<XPlane*>(surface)->getX();
+      break;
+    case YPLANE:
+      coeffs[0] = static_cast<YPlane*>(surface)->getY();
+      break;
+    case PLANE:
+      coeffs[0] = static_cast<Plane*>(surface)->getA();
+      coeffs[1] = static_cast<Plane*>(surface)->getB();
+      coeffs[2] = static_cast<Plane*>(surface)->getC();
+      break;
+    case CIRCLE:
+      coeffs[0] = static_cast<Circle*>(surface)->getX0();
+      coeffs[1] = static_cast<Circle*>(surface)->getY0();
+      coeffs[2] = static_cast<Circle*>(surface)->getRadius();
+      break;
+    default:
+      log_printf(ERROR, "Unable to dump Surface with ID = %d to the Geometry "
+                 "snapshot since its Surface type is not supported",
+                 surface->getId());
+    }
+
+    write_values(out, header, 3);
+    write_values(out, coeffs, 3);
+  }
+
+  /* Write the Cells, their rings and sectors and the indices of the
+   * Surfaces bounding them */
+  int num_cells = _cells.size();
+  write_values(out, &num_cells, 1);
+
+  for (iter3 = _cells.begin(); iter3 != _cells.end(); ++iter3) {
+    Cell* cell = iter3->second;
+    int header[7] = {cell->getId(), cell->getUniverseId(), cell->getType(),
+                     0, 0, 0, cell->getNumSurfaces()};
+
+    if (cell->getType() == MATERIAL) {
+      CellBasic* cell_basic = static_cast<CellBasic*>(cell);
+      header[3] = cell_basic->getMaterial();
+      header[4] = cell_basic->getNumRings();
+      header[5] = cell_basic->getNumSectors();
+    }
+    else
+      header[3] = static_cast<CellFill*>(cell)->getUniverseFillId();
+
+    write_values(out, header, 7);
+
+    std::map<Surface*, int> cell_surfaces = cell->getSurfaces();
+
+    for (iter4 = cell_surfaces.begin(); iter4 != cell_surfaces.end();
+         ++iter4) {
+      int surface[2] = {surface_indices[iter4->first], iter4->second};
+      write_values(out, surface, 2);
+    }
+  }
+
+  /* Write the ID and fill of the Cells in each SIMPLE Universe after the
+   * Cells were subdivided, which map the Cell IDs in the FSR maps to the
+   * Cells created when the snapshot is read */
+  int num_universes = 0;
+  for (iter5 = _universes.begin(); iter5 != _universes.end(); ++iter5) {
+    if (iter5->second->getType() == SIMPLE)
+      num_universes++;
+  }
+
+  write_values(out, &num_universes, 1);
+
+  for (iter5 = _universes.begin(); iter5 != _universes.end(); ++iter5) {
+
+    if (iter5->second->getType() != SIMPLE)
+      continue;
+
+    std::map<int, Cell*> univ_cells = iter5->second->getCells();
+    int header[2] = {iter5->first, (int)univ_cells.size()};
+    write_values(out, header, 2);
+
+    for (iter3 = univ_cells.begin(); iter3 != univ_cells.end(); ++iter3) {
+      int cell[2] = {iter3->first, 0};
+
+      if (iter3->second->getType() == MATERIAL)
+        cell[1] = static_cast<CellBasic*>(iter3->second)->getMaterial();
+      else
+        cell[1] = static_cast<CellFill*>(iter3->second)->getUniverseFillId();
+
+      write_values(out, cell, 2);
+    }
+  }
+
+  /* Order the Lattices such that nested Lattices are written first */
+  std::vector<Lattice*> lattices;
+  std::map<int, bool> written;
+
+  while (lattices.size() < _lattices.size()) {
+    int num_written = lattices.size();
+
+    for (iter2 = _lattices.begin(); iter2 != _lattices.end(); ++iter2) {
+      Lattice* lattice = iter2->second;
+      bool ready = !written[lattice->getId()];
+
+      for (int i=0; i < lattice->getNumY() && ready; i++) {
+        for (int j=0; j < lattice->getNumX() && ready; j++) {
+          Universe* univ = lattice->getUniverse(j, i);
+          if (univ->getType() == LATTICE && !written[univ->getId()])
+            ready = false;
+        }
+      }
+
+      if (ready) {
+        lattices.push_back(lattice);
+        written[lattice->getId()] = true;
+      }
+    }
+
+    if ((int)lattices.size() == num_written)
+      log_printf(ERROR, "Unable to dump the Lattices to the Geometry "
+                 "snapshot since they are not nested in a hierarchy");
+  }
+
+  /* Write the Lattices with Universe IDs starting from the upper left */
+  int num_lattices = lattices.size();
+  write_values(out, &num_lattices, 1);
+
+  for (int n=0; n < num_lattices; n++) {
+    Lattice* lattice = lattices[n];
+    int num_x = lattice->getNumX();
+    int num_y = lattice->getNumY();
+    int header[3] = {lattice->getId(), num_x, num_y};
+    double widths[2] = {lattice->getWidthX(), lattice->getWidthY()};
+    int* universe_ids = new int[num_x*num_y];
+
+    for (int i=0; i < num_y; i++) {
+      for (int j=0; j < num_x; j++)
+        universe_ids[(num_y-1-i)*num_x + j] =
+          lattice->getUniverse(j, i)->getId();
+    }
+
+    write_values(out, header, 3);
+    write_values(out, widths, 2);
+    write_values(out, universe_ids, num_x*num_y);
+
+    delete [] universe_ids;
+  }
+
+  /* Write the FSR maps */
+  write_values(out, &_num_FSRs, 1);
+  write_values(out, &_lattice_depth, 1);
+  write_values(out, _FSRs_to_cells, _num_FSRs);
+  write_values(out, _FSRs_to_material_IDs, _num_FSRs);
+  write_values(out, _FSRs_to_origins, 2*_num_FSRs);
+  write_values(out, _FSRs_to_lattice_paths, 2*_num_FSRs*_lattice_depth);
+}
+
+
+/**
+ * @brief Creates the Surfaces, Cells and Lattices and loads the FSR maps
+ *        from a binary stream written by Geometry::dumpSnapshot(...).
+ * @details The Cells are subdivided into rings and sectors as they were
+ *          when the snapshot was written. Surfaces and Cells which were
+ *          assigned an automatic ID when they were created are assigned a
+ *          new automatic ID, and the Cell IDs in the FSR maps are mapped to
+ *          the new IDs.
+ * @param in the binary stream
+ */
+void Geometry::readSnapshot(std::stringstream& in) {
+
+  /* Create the Surfaces */
+  int num_surfaces;
+  read_values(in, &num_surfaces, 1);
+
+  std::vector<Surface*> surfaces(num_surfaces);
+
+  for (int i=0; i < num_surfaces; i++) {
+    int header[3];
+    double coeffs[3];
+    read_values(in, header, 3);
+    read_values(in, coeffs, 3);
+
+    int id = user_id(header[0]);
+
+    switch (header[1]) {
+    case XPLANE:
+      surfaces[i] = new XPlane(coeffs[0], id);
+      break;
+    case YPLANE:
+      surfaces[i] = new YPlane(coeffs[0], id);
+      break;
+    case PLANE:
+      surfaces[i] = new Plane(coeffs[0], coeffs[1], coeffs[2], id);
+      break;
+    case CIRCLE:
+      surfaces[i] = new Circle(coeffs[0], coeffs[1], coeffs[2], id);
+      break;
+    default:
+      log_printf(ERROR, "Unable to read Surface with ID = %d from the "
+                 "Geometry snapshot since its Surface type is not supported",
+                 header[0]);
+    }
+
+    surfaces[i]->setBoundaryType(boundaryType(header[2]));
+    addSurface(surfaces[i]);
+  }
+
+  /* Create the Cells, which creates the SIMPLE Universes containing them */
+  int num_cells;
+  read_values(in, &num_cells, 1);
+
+  for (int i=0; i < num_cells; i++) {
+    int header[7];
+    read_values(in, header, 7);
+
+    int id = user_id(header[0]);
+    Cell* cell;
+
+    if (header[2] == MATERIAL)
+      cell = new CellBasic(header[1], header[3], header[4], header[5], id);
+    else
+      cell = new CellFill(header[1], header[3], id);
+
+    for (int s=0; s < header[6]; s++) {
+      int surface[2];
+      read_values(in, surface, 2);
+      cell->addSurface(surface[1], surfaces.at(surface[0]));
+    }
+
+    addCell(cell);
+  }
+
+  /* Read the ID and fill of the Cells in each Universe after subdivision */
+  int num_universes;
+  read_values(in, &num_universes, 1);
+
+  std::map<int, std::vector<int> > univ_cells;
+
+  for (int n=0; n < num_universes; n++) {
+    int header[2];
+    read_values(in, header, 2);
+
+    std::vector<int>& cells = univ_cells[header[0]];
+    cells.resize(2*header[1]);
+
+    if (header[1] > 0)
+      read_values(in, &cells[0], 2*header[1]);
+  }
+
+  /* Create the Lattices */
+  int num_lattices;
+  read_values(in, &num_lattices, 1);
+
+  for (int n=0; n < num_lattices; n++) {
+    int header[3];
+    double widths[2];
+    read_values(in, header, 3);
+    read_values(in, widths, 2);
+
+    int* universe_ids = new int[header[1]*header[2]];
+    read_values(in, universe_ids, header[1]*header[2]);
+
+    Lattice* lattice = new Lattice(header[0], widths[0], widths[1]);
+    lattice->setLatticeCells(header[1], header[2], universe_ids);
+    addLattice(lattice);
+
+    delete [] universe_ids;
+  }
+
+  /* Initialize pointers from CellFills to Universes */
+  initializeCellFillPointers();
+
+  /* Subdivide Cells into sectors and rings */
+  subdivideCells();
+
+  /* Map the ID of each Cell in the snapshot to the ID of the Cell created in
+   * its place. Automatic IDs increase in the order the Cells are created, so
+   * the Cells in each Universe are in the same order as in the snapshot */
+  std::map<int, int> cell_ids;
+  std::map<int, std::vector<int> >::iterator iter1;
+  std::map<int, Cell*>::iterator iter2;
+
+  for (iter1 = univ_cells.begin(); iter1 != univ_cells.end(); ++iter1) {
+
+    std::vector<int>& snapshot_cells = iter1->second;
+    std::map<int, Cell*> cells;
+
+    if (_universes.find(iter1->first) != _universes.end())
+      cells = _universes.at(iter1->first)->getCells();
+
+    if (2*cells.size() != snapshot_cells.size())
+      log_printf(ERROR, "Unable to read the Geometry snapshot since Universe "
+                 "%d contains %d Cells but the snapshot contains %d Cells",
+                 iter1->first, (int)cells.size(),
+                 (int)snapshot_cells.size() / 2);
+
+    int c = 0;
+
+    for (iter2 = cells.begin(); iter2 != cells.end(); ++iter2, c += 2) {
+      Cell* cell = iter2->second;
+      int fill;
+
+      if (cell->getType() == MATERIAL)
+        fill = static_cast<CellBasic*>(cell)->getMaterial();
+      else
+        fill = static_cast<CellFill*>(cell)->getUniverseFillId();
+
+      if (user_id(cell->getId()) != user_id(snapshot_cells[c]) ||
+          fill != snapshot_cells[c+1])
+        log_printf(ERROR, "Unable to read the Geometry snapshot since Cell "
+                   "%d in Universe %d does not match Cell %d in the "
+                   "snapshot", cell->getId(), iter1->first,
+                   snapshot_cells[c]);
+
+      cell_ids[snapshot_cells[c]] = cell->getId();
+    }
+  }
+
+  /* Bin the Cells in each Universe into search grids for fast Cell lookup */
+  std::map<int, Universe*>::iterator iter;
+  for (iter = _universes.begin(); iter != _universes.end(); ++iter)
+    iter->second->initializeCellGrid();
+
+  /* Build the lists of neighboring Cells across each Cell's Surfaces */
+  initializeCellNeighbors();
+
+  /* Generate flat source regions offset maps for each Universe and Lattice */
+  int num_FSRs;
+  read_values(in, &num_FSRs, 1);
+  read_values(in, &_lattice_depth, 1);
+
+  _num_FSRs = _universes.at(0)->computeFSRMaps();
+
+  if (_num_FSRs != num_FSRs)
+    log_printf(ERROR, "Unable to read the Geometry snapshot since it contains "
+               "%d FSRs but the Geometry contains %d FSRs",
+               num_FSRs, _num_FSRs);
+
+  log_printf(NORMAL, "Number of flat source regions: %d", _num_FSRs);
+
+  /* Compile the FSR offset maps into flat tables for Geometry::findFSRId */
+  initializeFSROffsetTables();
+
+  /* Load the maps between FSR IDs and Cell or Material IDs/UIDs */
+  try {
+    _FSRs_to_cells = new int[_num_FSRs];
+    _FSRs_to_material_UIDs = new int[_num_FSRs];
+    _FSRs_to_material_IDs = new int[_num_FSRs];
+    _FSRs_to_origins = new double[2*_num_FSRs];
+    _FSRs_to_lattice_paths = new int[2*_num_FSRs*_lattice_depth];
+  }
+  catch (std::exception &e) {
+    log_printf(ERROR, "Could not allocate memory for the FSR maps. "
+               "Backtrace:\n%s", e.what());
+  }
+
+  read_values(in, _FSRs_to_cells, _num_FSRs);
+  read_values(in, _FSRs_to_material_IDs, _num_FSRs);
+  read_values(in, _FSRs_to_origins, 2*_num_FSRs);
+  read_values(in, _FSRs_to_lattice_paths, 2*_num_FSRs*_lattice_depth);
+
+  for (int r=0; r < _num_FSRs; r++) {
+
+    if (cell_ids.find(_FSRs_to_cells[r]) == cell_ids.end())
+      log_printf(ERROR, "Unable to read the Geometry snapshot since FSR %d "
+                 "is in Cell %d which is not in the snapshot",
+                 r, _FSRs_to_cells[r]);
+
+    _FSRs_to_cells[r] = cell_ids[_FSRs_to_cells[r]];
+    _FSRs_to_material_UIDs[r] = getMaterial(_FSRs_to_material_IDs[r])->getUid();
+  }
+
+  _num_material_changes = CellBasic::getNumMaterialChanges();
+
+  if (_mesh->getCmfdOn())
+    initializeMesh();
+}
+
+
+/**
+ * @brief This method performs ray tracing to create Track segments within each
+ *        flat source region in the Geometry.
+ * @details This method starts at the beginning of a Track and finds successive
+ *          intersection points with FSRs as the Track crosses through the
+ *          Geometry and creates segment structs and adds them to the Track.
+ * @param track a pointer to a track to segmentize
+ */
+void Geometry::segmentize(Track* track) {
+
+  /* Track starting Point coordinates and azimuthal angle */
+  double x0 = track->getStart()->getX();
+  double y0 = track->getStart()->getY();
+  double phi = track->getPhi();
+
+  /* Length of each segment */
+  FP_PRECISION segment_length;
+  Material* segment_material;
+  int fsr_id;
+  FP_PRECISION* sigma_t;
+  int min_num_segments;
+  int num_segments;
+
+  /* Use a LocalCoords for the start and end of each segment, and one to
+   * test the next Cell, each with an array for the nested Universe levels */
+  LocalCoords segment_start(x0, y0, true);
+  LocalCoords segment_end(x0, y0, true);
+  LocalCoords test(0., 0., true);
+  segment_start.setUniverse(0);
+  segment_end.setUniverse(0);
+
+  /* Find the Cell containing the Track starting Point */
+  Cell* curr = findFirstCell(&segment_end, phi);
+  Cell* prev;
 
   /* If starting Point was outside the bounds of the Geometry */
   if (curr == NULL)
@@ -1323,7 +3186,7 @@ void Geometry::segmentize(Track* track) {
 
     /* Find the next Cell along the Track's trajectory */
     prev = curr;
-    curr = findNextCell(&segment_end, phi);
+    curr = findNextCell(&segment_end, phi, &test);
 
     /* Checks to make sure that new Segment does not have the same start
      * and end Points */
@@ -1473,9 +3336,16 @@ void Geometry::computeFissionability(Universe* univ) {
  * @brief Converts this Geometry's attributes to a character array.
  * @details This method calls the toString() method for all Materials,
  *          Surfaces, Cell, Universes and Lattices contained by the Geometry.
+ *          If the Materials are omitted, the character array describes only
+ *          the layout of the Geometry. The TrackGenerator compares the
+ *          layout before and after changes to the Geometry to detect changes
+ *          which only affect the Materials, and which therefore do not
+ *          require ray tracing.
+ * @param materials whether to include the Materials and the Material filling
+ *        each Cell (true by default)
  * @return a character array of this Geometry's class attributes
  */
-std::string Geometry::toString() {
+std::string Geometry::toString(bool materials) {
 
   std::stringstream string;
   std::map<int, Material*>::iterator iter1;
@@ -1483,22 +3353,46 @@ std::string Geometry::toString() {
   std::map<int, Cell*>::iterator iter3;
   std::map<int, Universe*>::iterator iter4;
   std::map<int, Lattice*>::iterator iter5;
+  std::map<Surface*, int>::iterator iter6;
+  std::map<Surface*, int> surfaces;
+  CellBasic* cell;
 
   string << "Geometry: width = " << getWidth() << ", height = "
          << getHeight() << ", Bounding Box: ((" << _x_min << ", "
          << _y_min << "), (" << _x_max << ", " << _y_max << ")";
 
-  string << "\n\tMaterials:\n\t\t";
-  for (iter1 = _materials.begin(); iter1 != _materials.end(); ++iter1)
-    string << iter1->second->toString() << "\n\n\t\t";
+  if (materials) {
+    string << "\n\tMaterials:\n\t\t";
+    for (iter1 = _materials.begin(); iter1 != _materials.end(); ++iter1)
+      string << iter1->second->toString() << "\n\n\t\t";
+  }
 
   string << "\n\tSurfaces:\n\t\t";
   for (iter2 = _surfaces.begin(); iter2 != _surfaces.end(); ++iter2)
     string << iter2->second->toString() << "\n\t\t";
 
   string << "\n\tCells:\n\t\t";
-  for (iter3 = _cells.begin(); iter3 != _cells.end(); ++iter3)
-    string << iter3->second->toString() << "\n\t\t";
+  for (iter3 = _cells.begin(); iter3 != _cells.end(); ++iter3) {
+
+    /* Omit the Material ID for CellBasics in the layout */
+    if (!materials && iter3->second->getType() == MATERIAL) {
+      cell = static_cast<CellBasic*>(iter3->second);
+      surfaces = cell->getSurfaces();
+
+      string << "Cell id = " << cell->getId() << ", type = MATERIAL"
+             << ", universe = " << cell->getUniverseId()
+             << ", num of rings = " << cell->getNumRings()
+             << ", num of sectors = " << cell->getNumSectors()
+             << ", surface ids = ";
+
+      for (iter6 = surfaces.begin(); iter6 != surfaces.end(); ++iter6)
+        string << iter6->first->getId() * iter6->second << ", ";
+    }
+    else
+      string << iter3->second->toString();
+
+    string << "\n\t\t";
+  }
 
   string << "\n\tUniverses:\n\t\t";
   for (iter4 = _universes.begin(); iter4 != _universes.end(); ++iter4)
@@ -1515,6 +3409,128 @@ std::string Geometry::toString() {
 }
 
 
+/**
+ * @brief Computes a 64-bit hash of this Geometry's Materials, Surfaces,
+ *        Cells and Lattices.
+ * @details The 64-bit FNV-1a hash is computed directly over the bounding
+ *          box, the Surface coefficients, the Cells' Surfaces, fills and
+ *          subdivision parameters and the Lattices' layouts, such that two
+ *          Geometries with the same description have the same hash in
+ *          different runs. Automatic Surface and Cell IDs depend on the
+ *          order of creation, so they are hashed as 0, and the Surfaces
+ *          bounding each Cell are hashed by their halfspace, type and
+ *          coefficients rather than their IDs. The Materials' cross
+ *          sections are hashed from their arrays at full precision. The hash
+ *          is recomputed on each call since the Materials, Surfaces and
+ *          Cells may be changed through their own setters without the
+ *          Geometry's knowledge. The TrackGenerator uses the hash to
+ *          identify the Geometry for which Tracks were stored in a Track
+ *          file.
+ * @return the 64-bit hash of the Geometry
+ */
+unsigned long long Geometry::hash() {
+
+  std::map<int, Material*>::iterator iter1;
+  std::map<int, Surface*>::iterator iter2;
+  std::map<int, Cell*>::iterator iter3;
+  std::map<int, Lattice*>::iterator iter4;
+  std::map<Surface*, int>::iterator iter5;
+  uint64_t hash = FNV_OFFSET_BASIS;
+
+  /* Hash the bounding box and boundary conditions */
+  double bounds[4] = {_x_min, _x_max, _y_min, _y_max};
+  int bcs[4] = {_left_bc, _right_bc, _bottom_bc, _top_bc};
+  hash_values(hash, bounds, 4);
+  hash_values(hash, bcs, 4);
+
+  /* Hash the Materials' nuclear data */
+  for (iter1 = _materials.begin(); iter1 != _materials.end(); ++iter1) {
+    Material* material = iter1->second;
+    int num_groups = material->getNumEnergyGroups();
+    int header[2] = {material->getId(), num_groups};
+
+    hash_values(hash, header, 2);
+    hash_values(hash, material->getSigmaT(), num_groups);
+    hash_values(hash, material->getSigmaA(), num_groups);
+    hash_values(hash, material->getSigmaF(), num_groups);
+    hash_values(hash, material->getNuSigmaF(), num_groups);
+    hash_values(hash, material->getChi(), num_groups);
+    hash_values(hash, material->getSigmaS(), num_groups*num_groups);
+  }
+
+  /* Hash the Surfaces' types, boundary conditions and coefficients */
+  for (iter2 = _surfaces.begin(); iter2 != _surfaces.end(); ++iter2) {
+    Surface* surface = iter2->second;
+    int header[3] = {user_id(surface->getId()), surface->getSurfaceType(),
+                     surface->getBoundaryType()};
+    double coeffs[3];
+
+    surface_coefficients(surface, coeffs);
+    hash_values(hash, header, 3);
+    hash_values(hash, coeffs, 3);
+  }
+
+  /* Hash the Cells' fills, subdivision parameters and Surfaces */
+  for (iter3 = _cells.begin(); iter3 != _cells.end(); ++iter3) {
+    Cell* cell = iter3->second;
+    int header[6] = {user_id(cell->getId()), cell->getUniverseId(),
+                     cell->getType(), 0, 0, 0};
+
+    if (cell->getType() == MATERIAL) {
+      CellBasic* cell_basic = static_cast<CellBasic*>(cell);
+      header[3] = cell_basic->getMaterial();
+      header[4] = cell_basic->getNumRings();
+      header[5] = cell_basic->getNumSectors();
+    }
+    else
+      header[3] = static_cast<CellFill*>(cell)->getUniverseFillId();
+
+    hash_values(hash, header, 6);
+
+    /* Describe each Surface by its halfspace, type and coefficients rather
+     * than its ID, which may be automatic, and sort the Surfaces since they
+     * are stored by pointer */
+    std::map<Surface*, int> cell_surfaces = cell->getSurfaces();
+    std::vector< std::vector<double> > surfaces;
+
+    for (iter5 = cell_surfaces.begin(); iter5 != cell_surfaces.end();
+         ++iter5) {
+      std::vector<double> surface(5);
+      surface[0] = iter5->second;
+      surface[1] = iter5->first->getSurfaceType();
+      surface_coefficients(iter5->first, &surface[2]);
+      surfaces.push_back(surface);
+    }
+
+    std::sort(surfaces.begin(), surfaces.end());
+
+    for (int i=0; i < (int)surfaces.size(); i++)
+      hash_values(hash, &surfaces[i][0], 5);
+  }
+
+  /* Hash the Lattices' dimensions and the Universes filling them */
+  for (iter4 = _lattices.begin(); iter4 != _lattices.end(); ++iter4) {
+    Lattice* lattice = iter4->second;
+    int header[3] = {lattice->getId(), lattice->getNumX(),
+                     lattice->getNumY()};
+    double widths[2] = {lattice->getWidthX(), lattice->getWidthY()};
+
+    std::vector< std::vector< std::pair<int, Universe*> > > universes =
+      lattice->getUniverses();
+
+    hash_values(hash, header, 3);
+    hash_values(hash, widths, 2);
+
+    for (int i=0; i < lattice->getNumY(); i++) {
+      for (int j=0; j < lattice->getNumX(); j++)
+        hash_values(hash, &universes.at(i).at(j).first, 1);
+    }
+  }
+
+  return hash;
+}
+
+
 /**
  * @brief Prints a string representation of all of the Geometry's attributes to
  *        the console.
@@ -11,8 +11,11 @@
 #ifdef __cplusplus
 #include <limits.h>
 #include <limits>
+#include <sstream>
+#include <stdint.h>
 #include <sys/types.h>
 #include <sys/stat.h>
+#include <omp.h>
 #include "LocalCoords.h"
 #include "Track.h"
 #include "Mesh.h"
@@ -20,6 +23,19 @@
 #endif
 
 
+/** The magic string identifying a binary Geometry snapshot file */
+#define GEOMETRY_SNAPSHOT_MAGIC "OPENMOC_GEOMETRY"
+
+/** The version of the binary Geometry snapshot file format */
+#define GEOMETRY_SNAPSHOT_VERSION 2
+
+/** The offset basis for the 64-bit FNV-1a hash */
+#define FNV_OFFSET_BASIS 14695981039346656037ULL
+
+/** The prime multiplier for the 64-bit FNV-1a hash */
+#define FNV_PRIME 1099511628211ULL
+
+
 /**
  * @class Geometry Geometry.h "src/Geometry.h"
  * @brief The master class containing references to all geometry-related
@@ -76,6 +92,23 @@ private:
   /** An array of Material UIDs indexed by FSR IDs */
   int* _FSRs_to_material_IDs;
 
+  /** An array of the x and y coordinates of the origin of the Universe
+   *  containing each FSR, indexed by FSR ID */
+  double* _FSRs_to_origins;
+
+  /** The maximum number of nested Lattices along any path through the
+   *  nested Universe hierarchy */
+  int _lattice_depth;
+
+  /** The value of CellBasic::getNumMaterialChanges() when the FSR Material
+   *  maps were last updated, or -1 if Materials or Cells have since been
+   *  added to or removed from the Geometry */
+  int _num_material_changes;
+
+  /** An array of the Lattice cell x and y indices at each nested Lattice
+   *  level for each FSR, indexed by FSR ID */
+  int* _FSRs_to_lattice_paths;
+
   /** The maximum Track segment length in the Geometry */
   double _max_seg_length;
 
@@ -100,11 +133,42 @@ private:
   /** A CMFD Mesh object pointer */
   Mesh* _mesh;
 
+  /** An array of the FSR offset of each Cell within its Universe, indexed
+   *  by Cell UID */
+  int* _cell_FSR_offsets;
+
+  /** An array of the FSR offsets of each Lattice cell for all Lattices */
+  int* _lattice_FSR_offsets;
+
+  /** An array of the index of the first Lattice cell of each Lattice in the
+   *  Lattice cell FSR offsets array, indexed by Lattice UID */
+  int* _lattice_offset_indices;
+
+  /** An array of the number of Lattice cells along the x-axis for each
+   *  Lattice, indexed by Lattice UID */
+  int* _lattice_num_x;
+
   void initializeCellFillPointers();
 
   Cell* findFirstCell(LocalCoords* coords, double angle);
-  Cell* findNextCell(LocalCoords* coords, double angle);
+  Cell* findNextCell(LocalCoords* coords, double angle, LocalCoords* test);
   Cell* findCell(Universe* univ, int fsr_id);
+  bool withinParentCells(LocalCoords* coords);
+  bool isOppositeHalfspace(Surface* surface1, int halfspace1,
+                           Surface* surface2, int halfspace2);
+  void initializeCellNeighbors();
+  int computeLatticeDepth(Universe* univ);
+  void initializeFSRMaps(Universe* univ, int fsr_id, double x, double y,
+                         int* lattice_path, int level, bool parallel);
+  void initializeFSROffsetTables();
+  void initializeCellFSROffsets(Universe* univ);
+  void addCellSurfaces(Cell* cell, int* surface_offsets, int* cell_surfaces,
+                       int num_cell_surfaces, int index);
+  void dumpSnapshot(std::stringstream& out);
+  void readSnapshot(std::stringstream& in);
+  void findPointIds(double* x_coords, int num_x, double* y_coords, int num_y,
+                    int* fsr_ids, int* cell_ids, int* material_ids,
+                    int num_points);
 
 public:
 
@@ -121,11 +185,16 @@ public:
   boundaryType getBCBottom();
   boundaryType getBCLeft();
   boundaryType getBCRight();
+  bool isSymmetricX();
+  bool isSymmetricY();
   int getNumFSRs();
   int getNumEnergyGroups();
   int getNumMaterials();
   int* getFSRtoCellMap();
   int* getFSRtoMaterialMap();
+  double* getFSRtoOriginMap();
+  int* getFSRtoLatticePathMap();
+  int getLatticeDepth();
   double getMaxSegmentLength();
   double getMinSegmentLength();
   std::map<int, Material*> getMaterials();
@@ -144,6 +213,28 @@ public:
   void addUniverse(Universe* universe);
   void addLattice(Lattice* lattice);
 
+  void createXPlanes(double* x, int num_x, int* boundaries,
+                     int num_boundaries, int* surface_ids, int num_surfaces);
+  void createYPlanes(double* y, int num_y, int* boundaries,
+                     int num_boundaries, int* surface_ids, int num_surfaces);
+  void createPlanes(double* A, int num_A, double* B, int num_B,
+                    double* C, int num_C, int* boundaries,
+                    int num_boundaries, int* surface_ids, int num_surfaces);
+  void createCircles(double* x, int num_x, double* y, int num_y,
+                     double* radii, int num_radii, int* surface_ids,
+                     int num_surfaces);
+  void createCellBasics(int* universes, int num_universes, int* materials,
+                        int num_materials, int* rings, int num_rings,
+                        int* sectors, int num_sectors, int* surface_offsets,
+                        int num_offsets, int* cell_surfaces,
+                        int num_cell_surfaces, int* cell_ids, int num_cells);
+  void createCellFills(int* universes, int num_universes, int* universe_fills,
+                       int num_fills, int* surface_offsets, int num_offsets,
+                       int* cell_surfaces, int num_cell_surfaces,
+                       int* cell_ids, int num_cells);
+  void createLattice(int id, double width_x, double width_y,
+                     int num_x, int num_y, int* universes);
+
   void removeMaterial(int id);
   void removeCell(int id);
   void removeUniverse(int id);
@@ -152,12 +243,22 @@ public:
   Cell* findCellContainingCoords(LocalCoords* coords);
   CellBasic* findCellContainingFSR(int fsr_id);
   int findFSRId(LocalCoords* coords);
+  void findFSRIds(double* x_coords, int num_x, double* y_coords, int num_y,
+                  int* fsr_ids, int num_points);
+  void findCellIds(double* x_coords, int num_x, double* y_coords, int num_y,
+                   int* cell_ids, int num_points);
+  void findMaterialIds(double* x_coords, int num_x, double* y_coords,
+                       int num_y, int* material_ids, int num_points);
   void subdivideCells();
   void initializeFlatSourceRegions();
+  std::vector<int> updateFSRMaterials();
+  void dumpToFile(const char* filename);
+  void readFromFile(const char* filename);
   void segmentize(Track* track);
   void computeFissionability(Universe* univ=NULL);
 
-  std::string toString();
+  std::string toString(bool materials=true);
+  unsigned long long hash();
   void printString();
 
   void initializeMesh();
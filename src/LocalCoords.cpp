@@ -2,20 +2,49 @@
 
 /**
  * @brief Constructor sets the x and y coordinates.
+ * @details If the LocalCoords is the first in a linked list, it allocates a
+ *          fixed-depth array of LocalCoords which is used by
+ *          LocalCoords::getNextCreate(...) to build the linked list for the
+ *          lower nested Universe levels without further allocations.
  * @param x the x-coordinate
  * @param y the y-coordinate
+ * @param first whether this is the first LocalCoords in a linked list
  */
-LocalCoords::LocalCoords(double x, double y) {
+LocalCoords::LocalCoords(double x, double y, bool first) {
   _coords.setCoords(x, y);
+  _cell_uid = -1;
+  _lattice_uid = -1;
   _next = NULL;
   _prev = NULL;
+  _next_array = NULL;
+  _array_size = 0;
+  _position = -1;
+
+  if (first) {
+    _array_size = LOCAL_COORDS_DEPTH;
+    _next_array = new LocalCoords[_array_size];
+
+    for (int i=0; i < _array_size; i++)
+      _next_array[i].setArrayPosition(_next_array, i, _array_size);
+  }
 }
 
 
 /**
- * @brief Destructor.
+ * @brief Destructor deletes the LocalCoords beneath this one in the linked
+ *        list along with the array of LocalCoords for the lower levels.
  */
-LocalCoords::~LocalCoords() { }
+LocalCoords::~LocalCoords() {
+
+  /* LocalCoords stored in an array are deleted along with the array */
+  if (_position != -1)
+    return;
+
+  prune();
+
+  if (_next_array != NULL)
+    delete [] _next_array;
+}
 
 
 /**
@@ -45,6 +74,15 @@ int LocalCoords::getCell() const {
 }
 
 
+/**
+ * @brief Return the UID of the Cell within which this LocalCoords resides.
+ * @return the Cell UID
+ */
+int LocalCoords::getCellUid() const {
+  return _cell_uid;
+}
+
+
 /**
  * @brief Return the ID of the Lattice within which this LocalCoords resides.
  * @return the Lattice ID
@@ -53,6 +91,15 @@ int LocalCoords::getLattice() const {
   return _lattice;
 }
 
+
+/**
+ * @brief Return the UID of the Lattice within which this LocalCoords resides.
+ * @return the Lattice UID
+ */
+int LocalCoords::getLatticeUid() const {
+  return _lattice_uid;
+}
+
 /**
  * @brief Return the first index of the Lattice cell within which this
  *        LocalCoords resides.
@@ -148,6 +195,15 @@ void LocalCoords::setCell(int cell) {
 }
 
 
+/**
+ * @brief Set the UID of the Cell within which this LocalCoords resides.
+ * @param cell_uid the Cell UID
+ */
+void LocalCoords::setCellUid(int cell_uid) {
+  _cell_uid = cell_uid;
+}
+
+
 /**
  * @brief Sets the ID of the Lattice within which this LocalCoords resides.
  * @param lattice the Lattice ID
@@ -157,6 +213,15 @@ void LocalCoords::setLattice(int lattice) {
 }
 
 
+/**
+ * @brief Sets the UID of the Lattice within which this LocalCoords resides.
+ * @param lattice_uid the Lattice UID
+ */
+void LocalCoords::setLatticeUid(int lattice_uid) {
+  _lattice_uid = lattice_uid;
+}
+
+
 /**
  * @brief Sets the row index for the Lattice cell within which this
  *        LocalCoords resides.
@@ -205,6 +270,59 @@ void LocalCoords::setNext(LocalCoords* next) {
 }
 
 
+/**
+ * @brief Sets the array of LocalCoords within which this LocalCoords is
+ *        stored and its position in the array.
+ * @param array the array of LocalCoords for the lower levels
+ * @param position the position of this LocalCoords in the array
+ * @param array_size the number of LocalCoords in the array
+ */
+void LocalCoords::setArrayPosition(LocalCoords* array, int position,
+                                   int array_size) {
+  _next_array = array;
+  _position = position;
+  _array_size = array_size;
+}
+
+
+/**
+ * @brief Returns the LocalCoords at the next lower nested Universe level,
+ *        creating it if it does not exist.
+ * @details A new LocalCoords is taken from the array of LocalCoords for the
+ *          lower levels if this LocalCoords belongs to one. A new array is
+ *          only allocated if the array is exhausted, or a single LocalCoords
+ *          if this LocalCoords does not belong to an array.
+ * @param x the x-coordinate of a new LocalCoords
+ * @param y the y-coordinate of a new LocalCoords
+ * @return a pointer to the LocalCoords at the next lower level
+ */
+LocalCoords* LocalCoords::getNextCreate(double x, double y) {
+
+  if (_next != NULL)
+    return _next;
+
+  /* Take the next LocalCoords in the array */
+  if (_next_array != NULL && _position + 1 < _array_size) {
+    _next = &_next_array[_position + 1];
+    _next->setNext(NULL);
+    _next->setX(x);
+    _next->setY(y);
+  }
+
+  /* Allocate a new array if this array is exhausted */
+  else if (_next_array != NULL)
+    _next = new LocalCoords(x, y, true);
+
+  /* Allocate a single LocalCoords outside of an array */
+  else
+    _next = new LocalCoords(x, y);
+
+  _next->setPrev(this);
+
+  return _next;
+}
+
+
 /**
  * @brief Sets the pointer to the LocalCoords on the next higher nested
  *        Universe level.
@@ -294,10 +412,15 @@ void LocalCoords::prune() {
   LocalCoords* curr = getLowestLevel();
   LocalCoords* next = curr->getPrev();
 
-  /* Iterate over LocalCoords beneath this one in the linked list */
+  /* Iterate over LocalCoords beneath this one in the linked list - those
+   * stored in an array are only unlinked since the array is reused */
   while (curr != this) {
     next = curr->getPrev();
-    delete curr;
+    curr->setNext(NULL);
+
+    if (curr->_position == -1)
+      delete curr;
+
     curr = next;
   }
 
@@ -331,9 +454,11 @@ void LocalCoords::copyCoords(LocalCoords* coords) {
     if (curr1->getType() == UNIV) {
       curr2->setType(UNIV);
       curr2->setCell(curr1->getCell());
+      curr2->setCellUid(curr1->getCellUid());
     }
     else {
       curr2->setLattice(curr1->getLattice());
+      curr2->setLatticeUid(curr1->getLatticeUid());
       curr2->setLatticeX(curr1->getLatticeX());
       curr2->setLatticeY(curr1->getLatticeY());
       curr2->setType(LAT);
@@ -341,12 +466,8 @@ void LocalCoords::copyCoords(LocalCoords* coords) {
 
     curr1 = curr1->getNext();
 
-    if (curr1 != NULL && curr2->getNext() == NULL) {
-      LocalCoords* new_coords = new LocalCoords(0.0, 0.0);
-      curr2->setNext(new_coords);
-      new_coords->setPrev(curr2);
-      curr2 = new_coords;
-    }
+    if (curr1 != NULL && curr2->getNext() == NULL)
+      curr2 = curr2->getNextCreate(0.0, 0.0);
     else if (curr1 != NULL)
       curr2 = curr2->getNext();
   }
@@ -13,6 +13,12 @@
 #include "Universe.h"
 #endif
 
+
+/** The number of nested Universe levels stored in the array of LocalCoords
+ *  owned by the first LocalCoords in a linked list. Deeper levels are stored
+ *  in an additional array allocated on demand. */
+#define LOCAL_COORDS_DEPTH 8
+
 /**
  * @enum coordType
  * @brief The type of Universe level on which the LocalCoords reside
@@ -30,6 +36,10 @@ enum coordType {
  * @class LocalCoords LocalCoords.h "openmoc/src/host/LocalCoords.h"
  * @brief The LocalCoords represents a set of local coordinates on some
  *        level of nested Universes making up the geometry.
+ * @details A LocalCoords created as the first in a linked list may own a
+ *          fixed-depth array of LocalCoords for the lower levels. The linked
+ *          list is then built from and pruned back into this array without
+ *          any allocations, which is used during ray tracing.
  */
 class LocalCoords {
 
@@ -43,9 +53,15 @@ private:
   /** The ID of the Cell within which this LocalCoords resides */
   int _cell;
 
+  /** The UID of the Cell within which this LocalCoords resides */
+  int _cell_uid;
+
   /** The ID of the Lattice within which this LocalCoords resides */
   int _lattice;
 
+  /** The UID of the Lattice within which this LocalCoords resides */
+  int _lattice_uid;
+
   /** The first index of the Lattice cell within which this LocalCoords
    *  resides */
   int _lattice_x;
@@ -63,13 +79,27 @@ private:
   /** A pointer to the LocalCoords at the next higher nested Universe level */
   LocalCoords* _prev;
 
+  /** An array of LocalCoords for the lower nested Universe levels */
+  LocalCoords* _next_array;
+
+  /** The number of LocalCoords in the array of lower levels */
+  int _array_size;
+
+  /** The position of this LocalCoords in the array of lower levels, or -1
+   *  if it was not stored in an array */
+  int _position;
+
+  void setArrayPosition(LocalCoords* array, int position, int array_size);
+
 public:
-  LocalCoords(double x, double y);
+  LocalCoords(double x=0., double y=0., bool first=false);
   virtual ~LocalCoords();
   coordType getType();
   int getUniverse() const;
   int getCell() const;
+  int getCellUid() const;
   int getLattice() const;
+  int getLatticeUid() const;
   int getLatticeX() const;
   int getLatticeY() const;
   double getX() const;
@@ -81,7 +111,9 @@ public:
   void setType(coordType type);
   void setUniverse(int universe);
   void setCell(int cell);
+  void setCellUid(int cell_uid);
   void setLattice(int lattice);
+  void setLatticeUid(int lattice_uid);
   void setLatticeX(int lattice_x);
   void setLatticeY(int lattice_y);
   void setX(double x);
@@ -89,6 +121,7 @@ public:
   void setNext(LocalCoords *next);
   void setPrev(LocalCoords* coords);
 
+  LocalCoords* getNextCreate(double x, double y);
   LocalCoords* getLowestLevel();
   void adjustCoords(double delta_x, double delta_y);
   void updateMostLocal(Point* point);
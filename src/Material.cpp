@@ -179,6 +179,27 @@ FP_PRECISION* Material::getSigmaA() {
 }
 
 
+/**
+ * @brief Return the Material's absorption cross-section for some energy
+ *        group.
+ * @details The cross-section includes the buckling term \f$ DB^2 \f$
+ *          added by Material::setSigmaA(...).
+ * @param group the energy group
+ * @return the absorption cross-section of the energy group
+ */
+FP_PRECISION Material::getSigmaAByGroup(int group) {
+  if (_sigma_a == NULL)
+      log_printf(ERROR, "Unable to return Material %d's absorption "
+                 "cross-section since it has not yet been set", _id);
+
+  if (group < 0 || group >= _num_groups)
+    log_printf(ERROR, "Unable to get sigma_a for group %d for material "
+               "%d which contains %d energy groups", group, _id, _num_groups);
+
+  return _sigma_a[group];
+}
+
+
 /**
  * @brief Return the array of the Material's scattering cross-section matrix.
  * @return the pointer to the Material's array of scattering cross-sections
@@ -109,6 +109,7 @@ public:
   int getNumEnergyGroups() const;
   FP_PRECISION* getSigmaT();
   FP_PRECISION* getSigmaA();
+  FP_PRECISION getSigmaAByGroup(int group);
   FP_PRECISION* getSigmaS();
   FP_PRECISION* getSigmaF();
   FP_PRECISION* getNuSigmaF();
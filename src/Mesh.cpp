@@ -40,6 +40,8 @@ Mesh::Mesh(solveType solve_type, bool cmfd_on,
   _boundaries[3] = REFLECTIVE;
 
   _volumes = NULL;
+  _fsr_indices = NULL;
+  _fsrs_to_mesh_cells = NULL;
   _bounds_x = NULL;
   _bounds_y = NULL;
   _lengths_x = NULL;
@@ -49,9 +51,10 @@ Mesh::Mesh(solveType solve_type, bool cmfd_on,
 
 
 /**
- * @brief Destructor deletes arrays of boundaries, volumes, lengths, and bounds.
+ * @brief Destructor deletes arrays of boundaries, volumes, lengths, bounds
+ *        and fluxes.
  * @details Deallocates memory for all arrays allocated by the CMFD class
- *          including boundaries, volumes, lengths, and bounds.
+ *          including boundaries, volumes, lengths, bounds and fluxes.
  */
 Mesh::~Mesh(){
 
@@ -61,6 +64,12 @@ Mesh::~Mesh(){
   if (_volumes != NULL)
     delete [] _volumes;
 
+  if (_fsr_indices != NULL)
+    delete [] _fsr_indices;
+
+  if (_fsrs_to_mesh_cells != NULL)
+    delete [] _fsrs_to_mesh_cells;
+
   if (_bounds_x != NULL)
     delete [] _bounds_x;
 
@@ -73,6 +82,9 @@ Mesh::~Mesh(){
   if (_lengths_y != NULL)
     delete [] _lengths_y;
 
+  std::map<fluxType, double*>::iterator iter;
+  for (iter = _fluxes.begin(); iter != _fluxes.end(); ++iter)
+    delete [] iter->second;
 }
 
 
@@ -173,27 +185,32 @@ void Mesh::setCellsY(int cells_y){
 
 /**
  * @brief given an x,y coordinate, find what Mesh cell the point is in.
+ * @details The Mesh cell bounds are sorted in increasing x and decreasing
+ *          y, so the row and column of the Mesh cell are found with a
+ *          binary search over the bounds rather than a linear scan. Points
+ *          within 1E-8 cm of a bound are assigned to the first (leftmost
+ *          or topmost) Mesh cell sharing it.
  * @param x_coord coordinate
  * @param y_coord coordinate
  * @return the Mesh cell id
  */
 int Mesh::findMeshCell(double x_coord, double y_coord){
 
-  int x = 0, y = 0;
+  /* Find the first row whose bottom bound is below the point */
+  int y = std::lower_bound(_bounds_y+1, _bounds_y+_num_y+1, y_coord + 1.e-8,
+                           std::greater<double>()) - (_bounds_y+1);
 
-  /* Loop over cells in y direction */
-  for (y = 0; y < _num_y; y++){
-    if (y_coord - _bounds_y[y+1] >= -1.e-8 && y_coord - _bounds_y[y] <= 1.e-8){
-      break;
-    }
-  }
+  /* The point is above the top bound of the row */
+  if (y < _num_y && y_coord - _bounds_y[y] > 1.e-8)
+    y = _num_y;
 
-  /* Loop over cells in y direction */
-  for (x = 0; x < _num_x; x++){
-    if (x_coord - _bounds_x[x] >= -1.e-8 && x_coord - _bounds_x[x+1] <= 1.e-8){
-      break;
-    }
-  }
+  /* Find the first column whose right bound is to the right of the point */
+  int x = std::lower_bound(_bounds_x+1, _bounds_x+_num_x+1, x_coord - 1.e-8)
+          - (_bounds_x+1);
+
+  /* The point is to the left of the left bound of the column */
+  if (x < _num_x && x_coord - _bounds_x[x] < -1.e-8)
+    x = _num_x;
 
   int cell = (y*_num_x + x);
   return cell;
@@ -238,6 +255,9 @@ double Mesh::getLengthY(){
 
 /**
  * @brief Set the FSR bounds for each Mesh cell.
+ * @details This method also builds the array of the Mesh cell containing
+ *          each FSR used by Mesh::findMeshSurface(...). FSRs which are not
+ *          in any Mesh cell are mapped to -1.
  */
 void Mesh::setFSRBounds(){
 
@@ -245,15 +265,25 @@ void Mesh::setFSRBounds(){
   int max;
   std::vector<int>::iterator iter;
 
+  if (_fsr_indices != NULL)
+    delete [] _fsr_indices;
+
+  if (_fsrs_to_mesh_cells != NULL)
+    delete [] _fsrs_to_mesh_cells;
+
   /* Create arrays of FSR indices, cell bounds, and surfaces */
   try{
     _fsr_indices = new int[2 * _num_x * _num_y];
+    _fsrs_to_mesh_cells = new int[_num_fsrs];
   }
   catch(std::exception &e){
     log_printf(ERROR, "Could not allocate memory for the Mesh fsr bounds. "
                "Backtrace:%s", e.what());
   }
 
+  for (int r = 0; r < _num_fsrs; r++)
+    _fsrs_to_mesh_cells[r] = -1;
+
   /* Loop over Mesh cells */
   for (int i = 0; i < _num_y * _num_x; i++){
 
@@ -267,6 +297,10 @@ void Mesh::setFSRBounds(){
 
       min = std::min(*iter, min);
       max = std::max(*iter, max);
+
+      /* Map the FSR to the first Mesh cell containing it */
+      if (*iter >= 0 && *iter < _num_fsrs && _fsrs_to_mesh_cells[*iter] == -1)
+        _fsrs_to_mesh_cells[*iter] = i;
     }
 
     /* Set FSR bounds */
@@ -278,113 +312,67 @@ void Mesh::setFSRBounds(){
 
 /**
  * @brief Using an FSR ID and coordinate, find which surface a coordinate is on.
+ * @details The Mesh cell containing the FSR is looked up in the array built
+ *          by Mesh::setFSRBounds() and the coordinate is classified against
+ *          the bounds of that Mesh cell. Surfaces 0 - 3 are the left,
+ *          bottom, right and top sides of the Mesh cell and surfaces
+ *          4 - 7 are the bottom left, bottom right, top right and top left
+ *          corners.
  * @param fsr_id the ID of the FSR of interest
  * @param coord coordinate of segment on Mesh surface
  * @return surface UID representing surface
  */
 int Mesh::findMeshSurface(int fsr_id, LocalCoords* coord){
 
-  int surface = -1;
+  if (fsr_id < 0 || fsr_id >= _num_fsrs)
+    return -1;
+
+  int i = _fsrs_to_mesh_cells[fsr_id];
+
+  if (i == -1)
+    return -1;
+
   double x = coord->getX();
   double y = coord->getY();
-  int i;
-  bool break_cells = false;
+  double left = _bounds_x[i % _num_x];
+  double right = _bounds_x[i % _num_x + 1];
+  double top = _bounds_y[i / _num_x];
+  double bottom = _bounds_y[i / _num_x + 1];
+
+  bool on_top = fabs(y - top) < 1e-6;
+  bool between = (y - bottom) > 1e-6 && (y - top) < -1e-6;
+
+  /* Check if coordinate is on left surface, left top, or
+   * left bottom corner */
+  if (fabs(x - left) < 1e-6){
+    if (between)
+      return i*8+0;
+    else if (on_top)
+      return i*8+7;
+    else
+      return i*8+4;
+  }
 
-  std::vector<int>::iterator iter;
+  /* Check if coordinate is on right surface, right top
+   * corner, or right bottom corner */
+  else if (fabs(x - right) < 1e-6){
+    if (between)
+      return i*8+2;
+    else if (on_top)
+      return i*8+6;
+    else
+      return i*8+5;
+  }
 
-  /* Loop over mesh cells */
-  for (i = 0; i < _num_x * _num_y; i++){
-
-    break_cells = false;
-
-    /* Find if FSR is within bounds of cell */
-    if (fsr_id >= _fsr_indices[2*i] && fsr_id <= _fsr_indices[2*i+1]){
-
-      /* Loop over FSRs in cell to see if FSR is actually in the cell
-       * since the FSR bounds can overlap */
-      for (iter = _cell_fsrs.at(i).begin();
-           iter < _cell_fsrs.at(i).end(); iter++){
-
-        if (fsr_id == *iter){
-
-          /* Check if coordinate is on left surface, left top, or
-           * left bottom corner */
-          if (fabs(x -  _bounds_x[i % _num_x]) < 1e-6){
-
-            /* Check if coordinate is on left surface */
-            if ((y - _bounds_y[i / _num_x+1]) > 1e-6 &&
-                (y - _bounds_y[i/_num_x]) < -1e-6){
-
-              surface = i*8+0;
-              break_cells = true;
-              break;
-            }
-
-            /* Check if coordinate is on left top corner */
-            else if (fabs(y - _bounds_y[i/_num_x]) < 1e-6){
-              surface = i*8+7;
-              break_cells = true;
-              break;
-            }
-
-            /* Check if coordinate is on left bottom corner */
-            else{
-              surface = i*8+4;
-              break_cells = true;
-              break;
-            }
-          }
-
-          /* Check if coordinate is on right surface, right top
-           * corner, or right bottom corner */
-          else if (fabs(x - _bounds_x[i%_num_x + 1]) < 1e-6){
-
-            /* Check if coordinate is on right surface */
-            if ((y - _bounds_y[i/_num_x+1]) > 1e-6 &&
-                (y - _bounds_y[i/_num_x]) < -1e-6){
-
-              surface = i*8+2;
-              break_cells = true;
-              break;
-            }
-
-            /* Check if coordinate is on right top surface */
-            else if (fabs(y - _bounds_y[i/_num_x]) < 1e-6){
-              surface = i*8+6;
-              break_cells = true;
-              break;
-            }
-
-            /* Coordinate is on right bottom surface */
-            else{
-              surface = i*8+5;
-              break_cells = true;
-              break;
-            }
-          }
-
-          /* Check if coordinate is on top surface */
-          else if (fabs(y - _bounds_y[i/_num_x]) < 1e-6){
-            surface = i*8+3;
-            break_cells = true;
-            break;
-          }
-
-          /* Coordinate is on bottom surface */
-          else if (fabs(y - _bounds_y[i/_num_x+1]) < 1e-6){
-            surface = i*8+1;
-            break_cells = true;
-            break;
-          }
-        }
-      }
-    }
+  /* Check if coordinate is on top surface */
+  else if (on_top)
+    return i*8+3;
 
-    if (break_cells)
-      break;
-  }
+  /* Check if coordinate is on bottom surface */
+  else if (fabs(y - bottom) < 1e-6)
+    return i*8+1;
 
-  return surface;
+  return -1;
 }
 
 
@@ -660,26 +648,7 @@ double Mesh::getFlux(int cell_id, int group, fluxType flux_type){
  * @return the number of Mesh cells
  */
 int Mesh::findCellId(LocalCoords* coord){
-
-  double x_coord = coord->getX();
-  double y_coord = coord->getY();
-  int x,y;
-
-  /* Loop over cells in y direction */
-  for (y = 0; y < _num_y; y++){
-    if (y_coord - _bounds_y[y+1] >= -1.e-8 && y_coord - _bounds_y[y] <= 1.e-8){
-      break;
-    }
-  }
-
-  /* Loop over cells in y direction */
-  for (x = 0; x < _num_x; x++){
-    if (x_coord - _bounds_x[x] >= -1.e-8 && x_coord - _bounds_x[x+1] <= 1.e-8){
-      break;
-    }
-  }
-
-  return (y*_num_x + x);
+  return findMeshCell(coord->getX(), coord->getY());
 }
 
 
@@ -1039,3 +1008,63 @@ void Mesh::initializeFlux(){
     }
   }
 }
+
+
+/**
+ * @brief Create a duplicate of the Mesh.
+ * @details The duplicate has the same Mesh cells, FSRs and boundary
+ *          conditions as this Mesh. For a DIFFUSION Mesh, each Mesh cell
+ *          Material is cloned so that the duplicate can be solved
+ *          independently of this Mesh. The Mesh cell fluxes are not
+ *          copied and are initialized by the Cmfd solver.
+ * @return a pointer to the clone
+ */
+Mesh* Mesh::clone(){
+
+  Mesh* clone = new Mesh(_solve_method, _cmfd_on, _relax_factor,
+                         _mesh_level);
+
+  clone->setNumGroups(_num_groups);
+  clone->setNumFSRs(_num_fsrs);
+  clone->setCellsX(_num_x);
+  clone->setCellsY(_num_y);
+  clone->setLengthX(_length_x);
+  clone->setLengthY(_length_y);
+  clone->setAcceleration(_acceleration);
+  clone->setOpticallyThick(_optically_thick);
+
+  for (int side = 0; side < 4; side++)
+    clone->setBoundary(side, _boundaries[side]);
+
+  clone->initialize();
+
+  for (int x = 0; x < _num_x; x++)
+    clone->_lengths_x[x] = _lengths_x[x];
+
+  for (int y = 0; y < _num_y; y++)
+    clone->_lengths_y[y] = _lengths_y[y];
+
+  for (int i = 0; i < _num_x*_num_y; i++)
+    clone->_cell_fsrs.at(i) = _cell_fsrs.at(i);
+
+  clone->setFSRBounds();
+  clone->setCellBounds();
+
+  for (int i = 0; i < _num_x*_num_y; i++)
+    clone->_volumes[i] = _volumes[i];
+
+  if (_solve_method == DIFFUSION){
+    try{
+      clone->_materials = new Material*[_num_x*_num_y];
+
+      for (int i = 0; i < _num_x*_num_y; i++)
+        clone->_materials[i] = _materials[i]->clone();
+    }
+    catch(std::exception &e){
+      log_printf(ERROR, "Could not allocate memory for the Mesh cell "
+                 "materials. Backtrace:%s", e.what());
+    }
+  }
+
+  return clone;
+}
@@ -15,6 +15,8 @@
 #include <map>
 #include <utility>
 #include <sstream>
+#include <algorithm>
+#include <functional>
 #include "log.h"
 #include "LocalCoords.h"
 #include "Surface.h"
@@ -116,6 +118,9 @@ private:
   /** An array of FSR bounds */
   int* _fsr_indices;
 
+  /** An array of the Mesh cell containing each FSR, indexed by FSR ID */
+  int* _fsrs_to_mesh_cells;
+
   /** An array of lengths of each Mesh cell in x direction */
   double* _lengths_x;
 
@@ -203,6 +208,7 @@ public:
                                     int* fsrs_to_mats);
   void initializeSurfaceCurrents();
   void initializeFlux();
+  Mesh* clone();
 };
 
 #endif /* MESH_H_ */
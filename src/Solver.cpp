@@ -433,6 +433,9 @@ void Solver::initializeCmfd(){
   _cmfd->setFSRVolumes(_FSR_volumes);
   _cmfd->setFSRMaterials(_FSR_materials);
   _cmfd->setFSRFluxes(_scalar_flux);
+
+  /* Time the phases of the CMFD solver within the source iterations */
+  _cmfd->getTimer()->setParent(_timer);
 }
 
 
@@ -522,6 +525,7 @@ FP_PRECISION Solver::convergeSource(int max_iterations) {
 
   /* Start the timer to record the total time to converge the source */
   _timer->startTimer();
+  _timer->startPhase("Source convergence");
 
   /* Counter for the number of iterations to converge the source */
   _num_iterations = 0;
@@ -537,6 +541,7 @@ FP_PRECISION Solver::convergeSource(int max_iterations) {
   FP_PRECISION keff_old = 1.0;
 
   /* Initialize data structures */
+  _timer->startPhase("Initialization");
   initializePolarQuadrature();
   initializeFluxArrays();
   initializeSourceArrays();
@@ -554,6 +559,7 @@ FP_PRECISION Solver::convergeSource(int max_iterations) {
   flattenFSRFluxes(1.0);
   flattenFSRSources(1.0);
   zeroTrackFluxes();
+  _timer->stopPhase();
 
   /* Source iteration loop */
   for (int i=0; i < max_iterations; i++) {
@@ -561,18 +567,30 @@ FP_PRECISION Solver::convergeSource(int max_iterations) {
     log_printf(NORMAL, "Iteration %d: \tk_eff = %1.6f"
                "\tres = %1.3E", i, _k_eff, residual);
 
+    _timer->startPhase("Flux normalization");
     normalizeFluxes();
+    _timer->stopPhase();
 
+    _timer->startPhase("FSR sources");
     residual = computeFSRSources();
+    _timer->stopPhase();
+
+    _timer->startPhase("Transport sweep");
     transportSweep();
+    _timer->stopPhase();
+
+    _timer->startPhase("Scalar flux update");
     addSourceToScalarFlux();
+    _timer->stopPhase();
 
     /* Update the flux with cmfd */
     if (_cmfd->getMesh()->getAcceleration()){
       _k_eff = _cmfd->computeKeff();
     }
 
+    _timer->startPhase("Keff");
     computeKeff();
+    _timer->stopPhase();
 
     _num_iterations++;
 
@@ -580,12 +598,14 @@ FP_PRECISION Solver::convergeSource(int max_iterations) {
     if (i > 1 && residual < _source_convergence_thresh) {
       _timer->stopTimer();
       _timer->recordSplit("Total time to converge the source");
+      _timer->stopPhase();
       return _k_eff;
     }
   }
 
   _timer->stopTimer();
   _timer->recordSplit("Total time to converge the source");
+  _timer->stopPhase();
 
   log_printf(WARNING, "Unable to converge the source after %d iterations",
              max_iterations);
@@ -596,10 +616,11 @@ FP_PRECISION Solver::convergeSource(int max_iterations) {
 
 /**
  * @brief Deletes the Timer's timing entries for each timed code section
- *        code in the source convergence loop.
+ *        code in the source convergence loop, including the CMFD solver.
  */
 void Solver::clearTimerSplits() {
   _timer->clearSplit("Total time to converge the source");
+  _timer->clearPhase("Source convergence");
 }
 
 
@@ -638,6 +659,9 @@ void Solver::printTimerReport() {
   msg_string.resize(53, '.');
   log_printf(RESULT, "%s%1.4E sec", msg_string.c_str(), time_per_integration);
 
+  /* Time in each phase of the source iterations, including CMFD */
+  _timer->printPhases("Source convergence");
+
   set_separator_character('-');
   log_printf(SEPARATOR, "-");
 
@@ -97,6 +97,36 @@ void Surface::setBoundaryType(boundaryType boundary_type) {
 }
 
 
+/**
+ * @brief Adds a Cell bounded by one of the halfspaces of this Surface.
+ * @details This method is called by Geometry::initializeCellNeighbors() to
+ *          find the Cells on either side of each Surface.
+ * @param halfspace the halfspace (+/-1) of this Surface bounding the Cell
+ * @param cell a pointer to the Cell
+ */
+void Surface::addNeighborCell(int halfspace, Cell* cell) {
+  _neighbors[halfspace].push_back(cell);
+}
+
+
+/**
+ * @brief Removes all Cells bounded by this Surface.
+ */
+void Surface::clearNeighborCells() {
+  _neighbors.clear();
+}
+
+
+/**
+ * @brief Returns the Cells bounded by one of the halfspaces of this Surface.
+ * @param halfspace the halfspace (+/-1) of this Surface
+ * @return a reference to the vector of Cells bounded by the halfspace
+ */
+std::vector<Cell*>& Surface::getNeighborCells(int halfspace) {
+  return _neighbors[halfspace];
+}
+
+
 /**
  * @brief Return true or false if a Point is on or off of a Surface.
  * @param point pointer to the Point of interest
@@ -140,6 +170,33 @@ Plane::Plane(const double A, const double B,
 }
 
 
+/**
+ * @brief Returns the coefficient for the linear term in x.
+ * @return the coefficient A in \f$ A * x + B * y + C = 0 \f$
+ */
+double Plane::getA() {
+  return _A;
+}
+
+
+/**
+ * @brief Returns the coefficient for the linear term in y.
+ * @return the coefficient B in \f$ A * x + B * y + C = 0 \f$
+ */
+double Plane::getB() {
+  return _B;
+}
+
+
+/**
+ * @brief Returns the constant offset.
+ * @return the coefficient C in \f$ A * x + B * y + C = 0 \f$
+ */
+double Plane::getC() {
+  return _C;
+}
+
+
 /**
  * @brief Returns the minimum x value of -INFINITY on this Surface.
  * @return the minimum x value of -INFINITY
@@ -11,6 +11,8 @@
 
 #ifdef __cplusplus
 #include <limits>
+#include <map>
+#include <vector>
 #include "Cell.h"
 #include "LocalCoords.h"
 #endif
@@ -101,6 +103,9 @@ protected:
    *  (ie, VACUUM or REFLECTIVE) */
   boundaryType _boundary_type;
 
+  /** The Cells bounded by each halfspace (+/-1) of this Surface */
+  std::map<int, std::vector<Cell*> > _neighbors;
+
 public:
   Surface(const int id=0);
   virtual ~Surface();
@@ -135,6 +140,9 @@ public:
   virtual double getYMax() =0;
 
   void setBoundaryType(const boundaryType boundary_type);
+  void addNeighborCell(int halfspace, Cell* cell);
+  void clearNeighborCells();
+  std::vector<Cell*>& getNeighborCells(int halfspace);
 
   /**
    * @brief Evaluate a Point using the Surface's potential equation.
@@ -202,6 +210,9 @@ public:
 
   Plane(const double A, const double B, const double C, const int id=0);
 
+  double getA();
+  double getB();
+  double getC();
   double getXMin();
   double getXMax();
   double getYMin();
@@ -17,6 +17,10 @@ ThreadPrivateSolver::ThreadPrivateSolver(Geometry* geometry,
   CPUSolver(geometry, track_generator, cmfd) {
 
   _thread_flux = NULL;
+  _thread_tiles = NULL;
+  _thread_num_tiles = NULL;
+  _thread_tracks = NULL;
+  _num_tiles = 0;
   _thread_currents = NULL;
 }
 
@@ -36,6 +40,25 @@ ThreadPrivateSolver::~ThreadPrivateSolver() {
     _thread_flux = NULL;
   }
 
+  if (_thread_tiles != NULL) {
+
+    for (int t=0; t < _num_threads; t++)
+      delete [] _thread_tiles[t];
+
+    delete [] _thread_tiles;
+    _thread_tiles = NULL;
+  }
+
+  if (_thread_num_tiles != NULL) {
+    delete [] _thread_num_tiles;
+    _thread_num_tiles = NULL;
+  }
+
+  if (_thread_tracks != NULL) {
+    delete [] _thread_tracks;
+    _thread_tracks = NULL;
+  }
+
   if (_thread_currents != NULL) {
     delete [] _thread_currents;
     _thread_currents = NULL;
@@ -48,7 +71,10 @@ ThreadPrivateSolver::~ThreadPrivateSolver() {
  * @brief Allocates memory for Track boundary angular flux and leakage and
  *        FSR scalar flux arrays.
  * @details Deletes memory for old flux arrays if they were allocated for a
- *          previous simulation.
+ *          previous simulation. The thread private FSR scalar flux array of
+ *          each thread only holds the tiles of FSRs visited by the Tracks
+ *          the thread sweeps, which are found by
+ *          ThreadPrivateSolver::partitionTracks().
  */
 void ThreadPrivateSolver::initializeFluxArrays() {
 
@@ -62,20 +88,132 @@ void ThreadPrivateSolver::initializeFluxArrays() {
     delete [] _thread_flux;
   }
 
+  partitionTracks();
+
   int size;
+  long num_tiles = 0;
 
   /* Allocate memory for the flux and leakage arrays */
   try{
 
     /* Allocate a thread local array of FSR scalar fluxes */
     _thread_flux = new FP_PRECISION*[_num_threads];
-    for (int t=0; t < _num_threads; t++)
-      _thread_flux[t] = new FP_PRECISION[_num_FSRs * _num_groups];
+    for (int t=0; t < _num_threads; t++) {
+      size = _thread_num_tiles[t] * THREAD_FLUX_TILE_SIZE * _num_groups;
+      _thread_flux[t] = new FP_PRECISION[size];
+      num_tiles += _thread_num_tiles[t];
+    }
   }
   catch(std::exception &e) {
     log_printf(ERROR, "Could not allocate memory for the Solver's fluxes. "
                "Backtrace:%s", e.what());
   }
+
+  log_printf(INFO, "Thread private FSR fluxes use %ld of %ld FSR tiles "
+             "(%.1f MB)", num_tiles, long(_num_tiles) * _num_threads,
+             double(num_tiles) * THREAD_FLUX_TILE_SIZE * _num_groups *
+             sizeof(FP_PRECISION) / 1.E6);
+}
+
+
+/**
+ * @brief Assigns a contiguous range of Tracks in each azimuthal angle
+ *        halfspace to each thread and finds the tiles of FSRs they visit.
+ * @details The Tracks in each halfspace are split so that each thread
+ *          sweeps about the same number of segments. Since neighboring
+ *          Tracks are stored next to each other, each thread sweeps a band
+ *          of the Geometry when there are more threads than azimuthal
+ *          angles. The FSRs are grouped into tiles of THREAD_FLUX_TILE_SIZE
+ *          FSRs and each thread stores the offset of each tile it visits in
+ *          its thread private FSR scalar flux array.
+ */
+void ThreadPrivateSolver::partitionTracks() {
+
+  /* Delete the old partition if it exists */
+  if (_thread_tiles != NULL) {
+    for (int t=0; t < _num_threads; t++)
+      delete [] _thread_tiles[t];
+
+    delete [] _thread_tiles;
+  }
+
+  if (_thread_num_tiles != NULL)
+    delete [] _thread_num_tiles;
+
+  if (_thread_tracks != NULL)
+    delete [] _thread_tracks;
+
+  _num_tiles = (_num_FSRs + THREAD_FLUX_TILE_SIZE - 1) /
+               THREAD_FLUX_TILE_SIZE;
+
+  try{
+    _thread_tracks = new int[2 * (_num_threads + 1)];
+    _thread_num_tiles = new int[_num_threads];
+    _thread_tiles = new int*[_num_threads];
+
+    for (int t=0; t < _num_threads; t++)
+      _thread_tiles[t] = new int[_num_tiles];
+  }
+  catch(std::exception &e) {
+    log_printf(ERROR, "Could not allocate memory for the Solver's thread "
+               "private FSR tiles. Backtrace:%s", e.what());
+  }
+
+  /* Split the Tracks in each halfspace by the number of segments */
+  for (int i=0; i < 2; i++) {
+
+    int min = i * (_tot_num_tracks / 2);
+    int max = (i + 1) * (_tot_num_tracks / 2);
+    int* bounds = &_thread_tracks[i * (_num_threads + 1)];
+    long num_segments = 0;
+    long sum = 0;
+    int t = 0;
+
+    for (int track_id=min; track_id < max; track_id++)
+      num_segments += _tracks[track_id]->getNumSegments();
+
+    /* Each thread starts at the first Track after the segments of the
+     * previous threads */
+    for (int track_id=min; track_id < max; track_id++) {
+      while (t < _num_threads && sum * _num_threads >= t * num_segments)
+        bounds[t++] = track_id;
+
+      sum += _tracks[track_id]->getNumSegments();
+    }
+
+    while (t <= _num_threads)
+      bounds[t++] = max;
+  }
+
+  /* Find the tiles of FSRs visited by the Tracks of each thread */
+  #pragma omp parallel for schedule(static, 1)
+  for (int t=0; t < _num_threads; t++) {
+
+    int* tiles = _thread_tiles[t];
+    int num_tiles = 0;
+
+    for (int tile=0; tile < _num_tiles; tile++)
+      tiles[tile] = -1;
+
+    for (int i=0; i < 2; i++) {
+
+      int* bounds = &_thread_tracks[i * (_num_threads + 1)];
+
+      for (int track_id=bounds[t]; track_id < bounds[t+1]; track_id++) {
+
+        segment* segments = _tracks[track_id]->getSegments();
+
+        for (int s=0; s < _tracks[track_id]->getNumSegments(); s++) {
+          int tile = segments[s]._region_id / THREAD_FLUX_TILE_SIZE;
+
+          if (tiles[tile] == -1)
+            tiles[tile] = THREAD_FLUX_TILE_SIZE * num_tiles++;
+        }
+      }
+    }
+
+    _thread_num_tiles[t] = num_tiles;
+  }
 }
 
 
@@ -127,10 +265,10 @@ void ThreadPrivateSolver::flattenFSRFluxes(FP_PRECISION value) {
   /* Flatten the thread private FSR scalar flux array */
   #pragma omp parallel for schedule(guided)
   for (int tid=0; tid < _num_threads; tid++) {
-    for (int r=0; r < _num_FSRs; r++) {
-      for (int e=0; e < _num_groups; e++)
-        _thread_flux(tid,r,e) = 0.0;
-    }
+    int size = _thread_num_tiles[tid] * THREAD_FLUX_TILE_SIZE * _num_groups;
+
+    for (int i=0; i < size; i++)
+      _thread_flux[tid][i] = 0.0;
   }
 
   return;
@@ -164,11 +302,12 @@ void ThreadPrivateSolver::zeroSurfaceCurrents() {
  *        Tracks, Track segments, polar angles and energy groups.
  * @details The method integrates the flux along each track and updates the
  *          boundary fluxes for the corresponding output Track, while updating
- *          the scalar flux in each flat source region.
+ *          the scalar flux in each flat source region. Each thread sweeps
+ *          the range of Tracks assigned to it by
+ *          ThreadPrivateSolver::partitionTracks().
  */
 void ThreadPrivateSolver::transportSweep() {
 
-  int tid;
   int fsr_id;
   Track* curr_track;
   int azim_index;
@@ -188,48 +327,46 @@ void ThreadPrivateSolver::transportSweep() {
   /* Loop over azimuthal angle halfspaces */
   for (int i=0; i < 2; i++) {
 
-    /* Compute the minimum and maximum Track IDs corresponding to this
-     * this azimuthal angular halfspace */
-    int min = i * (_tot_num_tracks / 2);
-    int max = (i + 1) * (_tot_num_tracks / 2);
+    /* The first Track of each thread in this azimuthal angle halfspace */
+    int* bounds = &_thread_tracks[i * (_num_threads + 1)];
 
     /* Loop over each thread within this azimuthal angle halfspace */
-    #pragma omp parallel for private(tid, fsr_id, curr_track, azim_index, \
-      num_segments, segments, curr_segment,  track_flux) schedule(guided)
-    for (int track_id=min; track_id < max; track_id++) {
+    #pragma omp parallel for private(fsr_id, curr_track, azim_index, \
+      num_segments, segments, curr_segment,  track_flux) schedule(static, 1)
+    for (int tid=0; tid < _num_threads; tid++) {
+      for (int track_id=bounds[tid]; track_id < bounds[tid+1]; track_id++) {
+
+        /* Initialize local pointers to important data structures */
+        curr_track = _tracks[track_id];
+        azim_index = curr_track->getAzimAngleIndex();
+        num_segments = curr_track->getNumSegments();
+        segments = curr_track->getSegments();
+        track_flux = &_boundary_flux(track_id,0,0,0);
+
+        /* Loop over each Track segment in forward direction */
+        for (int s=0; s < num_segments; s++) {
+          curr_segment = &segments[s];
+          fsr_id = curr_segment->_region_id;
+          scalarFluxTally(curr_segment, azim_index, track_flux,
+                          &_thread_flux(tid,fsr_id,0),true);
+        }
 
-      tid = omp_get_thread_num();
-
-      /* Initialize local pointers to important data structures */
-      curr_track = _tracks[track_id];
-      azim_index = curr_track->getAzimAngleIndex();
-      num_segments = curr_track->getNumSegments();
-      segments = curr_track->getSegments();
-      track_flux = &_boundary_flux(track_id,0,0,0);
-
-      /* Loop over each Track segment in forward direction */
-      for (int s=0; s < num_segments; s++) {
-        curr_segment = &segments[s];
-        fsr_id = curr_segment->_region_id;
-        scalarFluxTally(curr_segment, azim_index, track_flux,
-                        &_thread_flux(tid,fsr_id,0),true);
-      }
+        /* Transfer boundary angular flux to outgoing track */
+        transferBoundaryFlux(track_id, azim_index, true, track_flux);
 
-      /* Transfer boundary angular flux to outgoing track */
-      transferBoundaryFlux(track_id, azim_index, true, track_flux);
+       /* Loop over each Track segment in reverse direction */
+        track_flux += _polar_times_groups;
 
-     /* Loop over each Track segment in reverse direction */
-      track_flux += _polar_times_groups;
+        for (int s=num_segments-1; s > -1; s--) {
+          curr_segment = &segments[s];
+          fsr_id = curr_segment->_region_id;
+          scalarFluxTally(curr_segment, azim_index, track_flux,
+                          &_thread_flux(tid,fsr_id,0),false);
+        }
 
-      for (int s=num_segments-1; s > -1; s--) {
-        curr_segment = &segments[s];
-        fsr_id = curr_segment->_region_id;
-        scalarFluxTally(curr_segment, azim_index, track_flux,
-                        &_thread_flux(tid,fsr_id,0),false);
+        /* Transfer boundary angular flux to outgoing Track */
+        transferBoundaryFlux(track_id, azim_index, false, track_flux);
       }
-
-      /* Transfer boundary angular flux to outgoing Track */
-      transferBoundaryFlux(track_id, azim_index, false, track_flux);
     }
   }
 
@@ -326,13 +463,26 @@ void ThreadPrivateSolver::scalarFluxTally(segment* curr_segment,
 /**
  * @brief Reduces the FSR scalar fluxes from private thread private arrays to a
  *        global array FSR scalar flux array.
+ * @details The tiles of FSRs are reduced in parallel, adding the fluxes of
+ *          the threads which visit each tile in the order of the threads.
  */
 void ThreadPrivateSolver::reduceThreadScalarFluxes() {
 
-  for (int tid=0; tid < _num_threads; tid++) {
-    for (int r=0; r < _num_FSRs; r++) {
-      for (int e=0; e < _num_groups; e++)
-        _scalar_flux(r,e) += _thread_flux(tid,r,e);
+  #pragma omp parallel for schedule(guided)
+  for (int tile=0; tile < _num_tiles; tile++) {
+
+    int min = tile * THREAD_FLUX_TILE_SIZE;
+    int max = std::min(min + THREAD_FLUX_TILE_SIZE, _num_FSRs);
+
+    for (int tid=0; tid < _num_threads; tid++) {
+
+      if (_thread_tiles[tid][tile] == -1)
+        continue;
+
+      for (int r=min; r < max; r++) {
+        for (int e=0; e < _num_groups; e++)
+          _scalar_flux(r,e) += _thread_flux(tid,r,e);
+      }
     }
   }
 
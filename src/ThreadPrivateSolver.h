@@ -17,8 +17,14 @@
 #include "CPUSolver.h"
 #endif
 
-/** Indexing scheme for the thread private FSR scalar flux for each thread */
-#define _thread_flux(tid,r,e) (_thread_flux[(tid)][(r)*_num_groups+(e)])
+/** The number of FSRs in each tile of the thread private FSR scalar fluxes */
+#define THREAD_FLUX_TILE_SIZE 64
+
+/** Indexing scheme for the thread private FSR scalar flux for each thread.
+ *  The FSR must be in a tile visited by the thread's Tracks */
+#define _thread_flux(tid,r,e) (_thread_flux[(tid)] \
+        [(_thread_tiles[(tid)][(r)/THREAD_FLUX_TILE_SIZE] + \
+          (r)%THREAD_FLUX_TILE_SIZE)*_num_groups+(e)])
 
 /** Indexing scheme for the thread private Cmfd Mesh surface currents for each 
  * thread in each FSR and energy group */
@@ -31,20 +37,39 @@
  * @details Since this class stores a separate copy of the FSR scalar
  *          fluxes for each OMP thread, the memory requirements are greater
  *          than for the CPUSolver, but the parallel performance and scaling
- *          are much better.
+ *          are much better. Each thread sweeps a fixed, contiguous range of
+ *          Tracks and only stores the fluxes for the tiles of FSRs crossed
+ *          by its Tracks, so the memory grows with the number of FSRs each
+ *          thread visits rather than with the total number of FSRs.
  */
 class ThreadPrivateSolver : public CPUSolver {
 
 protected:
 
-  /** An array for the FSR scalar fluxes for each thread */
+  /** An array for the FSR scalar fluxes in the tiles visited by each
+   *  thread */
   FP_PRECISION** _thread_flux;
 
+  /** The number of tiles of FSRs */
+  int _num_tiles;
+
+  /** The offset of each tile of FSRs in the FSR scalar fluxes of each
+   *  thread, in units of FSRs, or -1 if the thread does not visit it */
+  int** _thread_tiles;
+
+  /** The number of tiles of FSRs visited by each thread */
+  int* _thread_num_tiles;
+
+  /** The first Track swept by each thread in each azimuthal angle
+   *  halfspace, with the end of the halfspace after the last thread */
+  int* _thread_tracks;
+
   /** An array for the CMFD Mesh surface currents for each thread */
   FP_PRECISION* _thread_currents;
 
   void initializeFluxArrays();
   void initializeCmfd();
+  void partitionTracks();
 
   void flattenFSRFluxes(FP_PRECISION value);
   void zeroSurfaceCurrents();
@@ -2,7 +2,7 @@
 
 
 std::map<std::string, double> Timer::_timer_splits;
-std::vector<double> Timer::_start_times;
+std::map<std::string, timerPhase> Timer::_timer_phases;
 
 
 /**
@@ -46,7 +46,9 @@ void Timer::stopTimer() {
  * @brief Records a message corresponding to a time for the current split.
  * @details When this method is called it assumes that the Timer has been
  *          stopped and has the current time for the process corresponding
- *          to the message.
+ *          to the message. Each Timer keeps its own start times, so Timers
+ *          used by different threads may record splits concurrently and
+ *          the times for the same message are summed.
  * @param msg a msg corresponding to this time split
  */
 void Timer::recordSplit(const char* msg) {
@@ -54,10 +56,13 @@ void Timer::recordSplit(const char* msg) {
   double time = getTime();
   std::string msg_string = std::string(msg);
 
-  if (_timer_splits.find(msg_string) != _timer_splits.end())
-    _timer_splits[msg_string] += time;
-  else
-    _timer_splits.insert(std::pair<std::string, double>(msg_string, time));
+  #pragma omp critical (timer_splits)
+  {
+    if (_timer_splits.find(msg_string) != _timer_splits.end())
+      _timer_splits[msg_string] += time;
+    else
+      _timer_splits.insert(std::pair<std::string, double>(msg_string, time));
+  }
 }
 
 
@@ -79,11 +84,15 @@ double Timer::getTime() {
 double Timer::getSplit(const char* msg) {
 
   std::string msg_string = std::string(msg);
+  double split = 0.0;
 
-  if (_timer_splits.find(msg_string) == _timer_splits.end())
-    return 0.0;
-  else
-    return _timer_splits[msg_string];
+  #pragma omp critical (timer_splits)
+  {
+    if (_timer_splits.find(msg_string) != _timer_splits.end())
+      split = _timer_splits[msg_string];
+  }
+
+  return split;
 }
 
 
@@ -123,10 +132,8 @@ void Timer::clearSplit(const char* msg) {
 
   std::string msg_string = std::string(msg);
 
-  if (_timer_splits.find(msg_string) == _timer_splits.end())
-    return;
-  else
-    _timer_splits.erase(msg_string);
+  #pragma omp critical (timer_splits)
+  _timer_splits.erase(msg_string);
 }
 
 
@@ -134,5 +141,287 @@ void Timer::clearSplit(const char* msg) {
  * @brief Clears all times split messages from the Timer.
  */
 void Timer::clearSplits() {
+
+  #pragma omp critical (timer_splits)
   _timer_splits.clear();
 }
+
+
+/**
+ * @brief Nests this Timer's phases within the current phase of a parent
+ *        Timer.
+ * @details This is used to time the phases of the Cmfd solver within the
+ *          phases of the Solver's source iterations.
+ * @param parent a pointer to the parent Timer
+ */
+void Timer::setParent(Timer* parent) {
+  _parent = parent;
+}
+
+
+/**
+ * @brief Starts timing a phase nested within the current phase.
+ * @details Phases are stopped in the reverse order in which they were
+ *          started with Timer::stopPhase(), as follows:
+ *
+ * @code
+ *          timer->startPhase("Source convergence");
+ *          timer->startPhase("Transport sweep");
+ *          transportSweep();
+ *          timer->stopPhase();
+ *          timer->stopPhase();
+ * @endcode
+ *
+ * @param name the name of the phase
+ */
+void Timer::startPhase(const char* name) {
+
+  std::string path = std::string(getCurrentPhase());
+
+  if (!path.empty())
+    path += TIMER_PHASE_SEPARATOR;
+
+  path += name;
+
+  _phase_stack.push_back(std::pair<std::string, double>(path,
+                                                        omp_get_wtime()));
+}
+
+
+/**
+ * @brief Stops timing the current phase and adds the elapsed time to it.
+ * @details When the outermost phase of this Timer stops, the phases
+ *          accumulated by this Timer are added to the phases shared by
+ *          all Timers.
+ */
+void Timer::stopPhase() {
+
+  if (_phase_stack.empty())
+    log_printf(ERROR, "Unable to stop a Timer phase since no phase "
+               "has been started");
+
+  double time = omp_get_wtime() - _phase_stack.back().second;
+
+  timerPhase& phase = _phases[_phase_stack.back().first];
+  phase._time += time;
+  phase._count++;
+
+  _phase_stack.pop_back();
+
+  if (_phase_stack.empty())
+    flushPhases();
+}
+
+
+/**
+ * @brief Adds the phases accumulated by this Timer to the phases shared
+ *        by all Timers.
+ */
+void Timer::flushPhases() {
+
+  std::map<std::string, timerPhase>::iterator iter;
+
+  #pragma omp critical (timer_phases)
+  {
+    for (iter = _phases.begin(); iter != _phases.end(); ++iter) {
+      timerPhase& phase = _timer_phases[iter->first];
+      phase._time += iter->second._time;
+      phase._count += iter->second._count;
+    }
+  }
+
+  _phases.clear();
+}
+
+
+/**
+ * @brief Returns the path of the current phase of this Timer, or of its
+ *        parent Timer if this Timer is not timing a phase.
+ * @return the path of the current phase, or an empty string if none
+ */
+const char* Timer::getCurrentPhase() {
+
+  if (!_phase_stack.empty())
+    return _phase_stack.back().first.c_str();
+  else if (_parent != NULL)
+    return _parent->getCurrentPhase();
+  else
+    return "";
+}
+
+
+/**
+ * @brief Returns the number of phases timed by all Timers.
+ * @return the number of phases
+ */
+int Timer::getNumPhases() {
+
+  int num_phases;
+
+  #pragma omp critical (timer_phases)
+  num_phases = _timer_phases.size();
+
+  return num_phases;
+}
+
+
+/**
+ * @brief Returns the path of a phase timed by any Timer.
+ * @details The phases are sorted by path, so that each phase is followed
+ *          by the phases nested within it.
+ * @param index the index of the phase
+ * @return the path of the phase
+ */
+std::string Timer::getPhaseName(int index) {
+
+  std::string name;
+  bool found = false;
+  std::map<std::string, timerPhase>::iterator iter;
+
+  /* The name is copied inside the critical section since the phases may be
+   * modified by other Timers once it is left */
+  #pragma omp critical (timer_phases)
+  {
+    if (index >= 0 && index < (int)_timer_phases.size()) {
+      iter = _timer_phases.begin();
+      std::advance(iter, index);
+      name = iter->first;
+      found = true;
+    }
+  }
+
+  if (!found)
+    log_printf(ERROR, "Unable to get the name of Timer phase %d since "
+               "there are only %d phases", index, getNumPhases());
+
+  return name;
+}
+
+
+/**
+ * @brief Returns the total time spent in a phase by all Timers.
+ * @details If the phase does not exist, returns 0.
+ * @param phase the path of the phase
+ * @return the time spent in the phase (seconds)
+ */
+double Timer::getPhaseTime(const char* phase) {
+
+  double time = 0.0;
+  std::map<std::string, timerPhase>::iterator iter;
+
+  #pragma omp critical (timer_phases)
+  {
+    iter = _timer_phases.find(std::string(phase));
+    if (iter != _timer_phases.end())
+      time = iter->second._time;
+  }
+
+  return time;
+}
+
+
+/**
+ * @brief Returns the number of times a phase was timed by all Timers.
+ * @details If the phase does not exist, returns 0.
+ * @param phase the path of the phase
+ * @return the number of times the phase was timed
+ */
+int Timer::getPhaseCount(const char* phase) {
+
+  int count = 0;
+  std::map<std::string, timerPhase>::iterator iter;
+
+  #pragma omp critical (timer_phases)
+  {
+    iter = _timer_phases.find(std::string(phase));
+    if (iter != _timer_phases.end())
+      count = iter->second._count;
+  }
+
+  return count;
+}
+
+
+/**
+ * @brief Prints the time spent in a phase and each phase nested within it
+ *        to the console.
+ * @details Each nested phase is indented by two spaces for each level of
+ *          nesting below the phase.
+ * @param phase the path of the phase, or an empty string for all phases
+ */
+void Timer::printPhases(const char* phase) {
+
+  std::string root = std::string(phase);
+  std::string prefix = root + TIMER_PHASE_SEPARATOR;
+  std::map<std::string, timerPhase>::iterator iter;
+
+  #pragma omp critical (timer_phases)
+  {
+    for (iter = _timer_phases.lower_bound(root); iter != _timer_phases.end()
+           && iter->first.compare(0, root.size(), root) == 0; ++iter) {
+
+      const std::string& path = iter->first;
+
+      if (!root.empty() && path != root &&
+          path.compare(0, prefix.size(), prefix) != 0)
+        continue;
+
+      /* Indent the name of the phase by its depth below the root */
+      int depth = 0;
+
+      for (size_t i = root.size(); i < path.size(); i++) {
+        if (path.compare(i, 1, TIMER_PHASE_SEPARATOR) == 0)
+          depth++;
+      }
+
+      size_t last = path.rfind(TIMER_PHASE_SEPARATOR);
+      std::string msg_string = std::string(2 * depth, ' ');
+
+      if (last == std::string::npos)
+        msg_string += path;
+      else
+        msg_string += path.substr(last + 1);
+
+      msg_string.resize(53, '.');
+      log_printf(RESULT, "%s%1.4E sec", msg_string.c_str(),
+                 iter->second._time);
+    }
+  }
+}
+
+
+/**
+ * @brief Clears the time for a phase and each phase nested within it.
+ * @param phase the path of the phase
+ */
+void Timer::clearPhase(const char* phase) {
+
+  std::string root = std::string(phase);
+  std::string prefix = root + TIMER_PHASE_SEPARATOR;
+  std::map<std::string, timerPhase>::iterator iter;
+
+  #pragma omp critical (timer_phases)
+  {
+    iter = _timer_phases.lower_bound(root);
+
+    while (iter != _timer_phases.end() &&
+           iter->first.compare(0, root.size(), root) == 0) {
+
+      if (iter->first == root ||
+          iter->first.compare(0, prefix.size(), prefix) == 0)
+        _timer_phases.erase(iter++);
+      else
+        ++iter;
+    }
+  }
+}
+
+
+/**
+ * @brief Clears the times for all phases timed by all Timers.
+ */
+void Timer::clearPhases() {
+
+  #pragma omp critical (timer_phases)
+  _timer_phases.clear();
+}
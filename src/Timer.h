@@ -22,9 +22,41 @@
 #endif
 
 
+/** The separator between the names of nested phases */
+#define TIMER_PHASE_SEPARATOR "/"
+
+
+/**
+ * @struct timerPhase
+ * @brief The time and number of calls accumulated for a phase of the code.
+ */
+struct timerPhase {
+
+  /** The total time (seconds) spent in the phase */
+  double _time;
+
+  /** The number of times the phase was timed */
+  int _count;
+};
+
+
 /**
  * @class Timer Timer.h "src/Timer.cpp"
  * @brief The Timer class is for timing and profiling regions of code.
+ * @details In addition to the named splits, the Timer times nested phases
+ *          of the code. Each phase is identified by its path, the names of
+ *          the enclosing phases and its own name joined by "/", such as
+ *          "Source convergence/CMFD/Linear solves". A Timer may be nested
+ *          within the current phase of a parent Timer. Each Timer
+ *          accumulates its phases locally and adds them to the phases
+ *          shared by all Timers when its outermost phase stops, so Timers
+ *          used by different threads only synchronize once per outermost
+ *          phase. The phases are accumulated per Timer and not per thread:
+ *          a phase such as the transport sweep, which is timed by one
+ *          thread around an OpenMP parallel region, reports the wall time
+ *          of the region and not the time spent by each thread, so load
+ *          imbalance between threads is not measured. Each thread must use
+ *          its own Timer, since a Timer is not thread safe.
  */
 class Timer {
 
@@ -32,7 +64,7 @@ private:
 
   /** A vector of floating point start times at each inclusive level
    *  at which we are timing */
-  static std::vector<double> _start_times;
+  std::vector<double> _start_times;
 
   /** The time elapsed (seconds) for the current split */
   float _elapsed_time;
@@ -40,9 +72,25 @@ private:
   /** Whether or not the Timer is running for the current split */
   bool _running;
 
-  /** A vector of the times and messages for each split */
+  /** A vector of the times and messages for each split, shared by all
+   *  Timers */
   static std::map<std::string, double> _timer_splits;
 
+  /** The Timer whose current phase encloses this Timer's phases */
+  Timer* _parent;
+
+  /** The path and start time of each phase currently being timed */
+  std::vector< std::pair<std::string, double> > _phase_stack;
+
+  /** The phases accumulated by this Timer since its outermost phase
+   *  started, keyed by path */
+  std::map<std::string, timerPhase> _phases;
+
+  /** The accumulated phases of all Timers, keyed by path */
+  static std::map<std::string, timerPhase> _timer_phases;
+
+  void flushPhases();
+
   /**
    * @brief Assignment operator for static referencing of the Timer.
    * @param & the Timer static class object
@@ -63,6 +111,7 @@ public:
   Timer() {
     _running = false;
     _elapsed_time = 0;
+    _parent = NULL;
   }
 
   /**
@@ -87,6 +136,18 @@ public:
   void printSplits();
   void clearSplit(const char* msg);
   void clearSplits();
+
+  void setParent(Timer* parent);
+  void startPhase(const char* name);
+  void stopPhase();
+  const char* getCurrentPhase();
+  int getNumPhases();
+  std::string getPhaseName(int index);
+  double getPhaseTime(const char* phase);
+  int getPhaseCount(const char* phase);
+  void printPhases(const char* phase);
+  void clearPhase(const char* phase);
+  void clearPhases();
 };
 
 #endif /* TIMER_H_ */
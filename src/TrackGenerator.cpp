@@ -16,9 +16,12 @@ TrackGenerator::TrackGenerator(Geometry* geometry, const int num_azim,
   _tot_num_tracks = 0;
   _tot_num_segments = 0;
   _num_segments = NULL;
+  _segment_offsets = NULL;
   _contains_tracks = false;
   _use_input_file = false;
   _tracks_filename = "";
+  _mirror_x = false;
+  _mirror_y = false;
 }
 
 
@@ -40,6 +43,9 @@ TrackGenerator::~TrackGenerator() {
 
     delete [] _tracks;
   }
+
+  if (_segment_offsets != NULL)
+    delete [] _segment_offsets;
 }
 
 
@@ -158,6 +164,26 @@ FP_PRECISION* TrackGenerator::getAzimWeights() {
 }
 
 
+/**
+ * @brief Returns whether mirror symmetry about the y-axis (x -> -x) is
+ *        exploited during ray tracing.
+ * @return true if Tracks are mirrored about the y-axis; false otherwise
+ */
+bool TrackGenerator::getMirrorX() {
+  return _mirror_x;
+}
+
+
+/**
+ * @brief Returns whether mirror symmetry about the x-axis (y -> -y) is
+ *        exploited during ray tracing.
+ * @return true if Tracks are mirrored about the x-axis; false otherwise
+ */
+bool TrackGenerator::getMirrorY() {
+  return _mirror_y;
+}
+
+
 /**
  * @brief Returns whether or not the TrackGenerator contains Track that are
  *        for its current number of azimuthal angles, track spacing and
@@ -277,6 +303,238 @@ void TrackGenerator::retrieveSegmentCoords(double* coords, int num_segments) {
 }
 
 
+/**
+ * @brief Returns a new array of the start and end Point coordinates
+ *        (x0, y0, x1, y1) for each Track, indexed by Track UID.
+ * @details This class method is intended to be called by the OpenMOC
+ *          Python "plotter" module. The segments of each Track are stored
+ *          separately, so the Track and segment methods fill a new array
+ *          from the Tracks for each call rather than keeping flattened
+ *          copies of the Tracks in memory. SWIG hands the array to NumPy,
+ *          which deletes it when the NumPy array is garbage collected, so
+ *          the array stays valid after the Tracks are regenerated or the
+ *          TrackGenerator is deleted. This method would be called from
+ *          within Python as follows:
+ *
+ * @code
+ *          points = track_generator.getTrackPoints()
+ * @endcode
+ *
+ * @param track_points a pointer to the new array of Track coordinates
+ * @param num_tracks the total number of Tracks
+ * @param num_coords the number of coordinates per Track (4)
+ */
+void TrackGenerator::getTrackPoints(double** track_points, int* num_tracks,
+                                    int* num_coords) {
+
+  double* points = new double[4*_tot_num_tracks];
+  Track* track;
+  int uid;
+
+  #pragma omp parallel for private(track, uid)
+  for (int i=0; i < _num_azim; i++) {
+    for (int j=0; j < _num_tracks[i]; j++) {
+      track = &_tracks[i][j];
+      uid = track->getUid();
+      points[4*uid] = track->getStart()->getX();
+      points[4*uid+1] = track->getStart()->getY();
+      points[4*uid+2] = track->getEnd()->getX();
+      points[4*uid+3] = track->getEnd()->getY();
+    }
+  }
+
+  *track_points = points;
+  *num_tracks = _tot_num_tracks;
+  *num_coords = 4;
+}
+
+
+/**
+ * @brief Returns a new array of the azimuthal angle index for each Track,
+ *        indexed by Track UID.
+ * @param azim_indices a pointer to the new array of azimuthal angle indices
+ * @param num_tracks the total number of Tracks
+ */
+void TrackGenerator::getTrackAzimIndices(int** azim_indices,
+                                         int* num_tracks) {
+
+  int* indices = new int[_tot_num_tracks];
+
+  #pragma omp parallel for
+  for (int i=0; i < _num_azim; i++) {
+    for (int j=0; j < _num_tracks[i]; j++)
+      indices[_tracks[i][j].getUid()] = i;
+  }
+
+  *azim_indices = indices;
+  *num_tracks = _tot_num_tracks;
+}
+
+
+/**
+ * @brief Returns an array of the offset of each Track's segments into the
+ *        segment arrays, indexed by Track UID.
+ * @details The segments for the Track with UID i are found at indices
+ *          offsets[i] up to (but not including) offsets[i+1], so the array
+ *          has one more entry than the number of Tracks. The offsets are
+ *          computed once when the Tracks are segmentized, read from file
+ *          or have their segment Materials updated, and the array is owned
+ *          by the TrackGenerator.
+ * @return array with the segment offsets of each Track
+ */
+int* TrackGenerator::getSegmentOffsets() {
+  if (!_contains_tracks)
+    log_printf(ERROR, "Unable to return the array of the segment offsets "
+               "per Track since Tracks have not yet been generated.");
+
+  return _segment_offsets;
+}
+
+
+/**
+ * @brief Returns a new array of the length of each segment.
+ * @param segment_lengths a pointer to the new array of segment lengths
+ * @param num_segments the total number of segments
+ */
+void TrackGenerator::getSegmentLengths(double** segment_lengths,
+                                       int* num_segments) {
+
+  double* lengths = new double[_tot_num_segments];
+  int* offsets = getSegmentOffsets();
+
+  Track* track;
+  segment* segments;
+  int offset;
+
+  #pragma omp parallel for private(track, segments, offset)
+  for (int i=0; i < _num_azim; i++) {
+    for (int j=0; j < _num_tracks[i]; j++) {
+      track = &_tracks[i][j];
+      segments = track->getSegments();
+      offset = offsets[track->getUid()];
+
+      for (int s=0; s < track->getNumSegments(); s++)
+        lengths[offset+s] = segments[s]._length;
+    }
+  }
+
+  *segment_lengths = lengths;
+  *num_segments = _tot_num_segments;
+}
+
+
+/**
+ * @brief Returns a new array of the FSR ID for each segment.
+ * @param segment_FSR_ids a pointer to the new array of segment FSR IDs
+ * @param num_segments the total number of segments
+ */
+void TrackGenerator::getSegmentFSRIds(int** segment_FSR_ids,
+                                      int* num_segments) {
+
+  int* FSR_ids = new int[_tot_num_segments];
+  int* offsets = getSegmentOffsets();
+
+  Track* track;
+  segment* segments;
+  int offset;
+
+  #pragma omp parallel for private(track, segments, offset)
+  for (int i=0; i < _num_azim; i++) {
+    for (int j=0; j < _num_tracks[i]; j++) {
+      track = &_tracks[i][j];
+      segments = track->getSegments();
+      offset = offsets[track->getUid()];
+
+      for (int s=0; s < track->getNumSegments(); s++)
+        FSR_ids[offset+s] = segments[s]._region_id;
+    }
+  }
+
+  *segment_FSR_ids = FSR_ids;
+  *num_segments = _tot_num_segments;
+}
+
+
+/**
+ * @brief Returns a new array of the Material ID for each segment.
+ * @param segment_material_ids a pointer to the new array of segment
+ *        Material IDs
+ * @param num_segments the total number of segments
+ */
+void TrackGenerator::getSegmentMaterialIds(int** segment_material_ids,
+                                           int* num_segments) {
+
+  int* material_ids = new int[_tot_num_segments];
+  int* offsets = getSegmentOffsets();
+
+  Track* track;
+  segment* segments;
+  int offset;
+
+  #pragma omp parallel for private(track, segments, offset)
+  for (int i=0; i < _num_azim; i++) {
+    for (int j=0; j < _num_tracks[i]; j++) {
+      track = &_tracks[i][j];
+      segments = track->getSegments();
+      offset = offsets[track->getUid()];
+
+      for (int s=0; s < track->getNumSegments(); s++)
+        material_ids[offset+s] = segments[s]._material->getId();
+    }
+  }
+
+  *segment_material_ids = material_ids;
+  *num_segments = _tot_num_segments;
+}
+
+
+/**
+ * @brief Returns a new array of the start and end Point coordinates
+ *        (x0, y0, x1, y1) for each segment.
+ * @param segment_points a pointer to the new array of segment coordinates
+ * @param num_segments the total number of segments
+ * @param num_coords the number of coordinates per segment (4)
+ */
+void TrackGenerator::getSegmentPoints(double** segment_points,
+                                      int* num_segments, int* num_coords) {
+
+  double* points = new double[4*_tot_num_segments];
+  int* offsets = getSegmentOffsets();
+
+  Track* track;
+  segment* segments;
+  double x0, y0, phi;
+  int offset;
+
+  #pragma omp parallel for private(track, segments, x0, y0, phi, offset)
+  for (int i=0; i < _num_azim; i++) {
+    for (int j=0; j < _num_tracks[i]; j++) {
+      track = &_tracks[i][j];
+      segments = track->getSegments();
+      offset = offsets[track->getUid()];
+      x0 = track->getStart()->getX();
+      y0 = track->getStart()->getY();
+      phi = track->getPhi();
+
+      for (int s=0; s < track->getNumSegments(); s++) {
+        points[4*(offset+s)] = x0;
+        points[4*(offset+s)+1] = y0;
+
+        x0 += cos(phi) * segments[s]._length;
+        y0 += sin(phi) * segments[s]._length;
+
+        points[4*(offset+s)+2] = x0;
+        points[4*(offset+s)+3] = y0;
+      }
+    }
+  }
+
+  *segment_points = points;
+  *num_segments = _tot_num_segments;
+  *num_coords = 4;
+}
+
+
 /**
  * @brief Set the number of azimuthal angles in \f$ [0, 2\pi] \f$.
  * @param num_azim the number of azimuthal angles in \f$ 2\pi \f$
@@ -331,6 +589,52 @@ void TrackGenerator::setGeometry(Geometry* geometry) {
   _tracks_filename = "";
 }
 
+
+/**
+ * @brief Declare the mirror planes of the Geometry to exploit during
+ *        ray tracing.
+ * @details If a mirror plane is declared, only the unique Tracks are
+ *          ray traced and the segments for their mirror images are built
+ *          by remapping FSR IDs. The remapped segments are validated by
+ *          ray tracing a sample of the mirrored Tracks, and every Track is
+ *          ray traced if they do not match. Mirror planes may be declared
+ *          as in the following from Python:
+ *
+ * @code
+ *          track_generator.setMirrorPlanes(True, True)
+ * @endcode
+ *
+ * @param mirror_x whether the Geometry is symmetric about the y-axis
+ * @param mirror_y whether the Geometry is symmetric about the x-axis
+ */
+void TrackGenerator::setMirrorPlanes(bool mirror_x, bool mirror_y) {
+  _mirror_x = mirror_x;
+  _mirror_y = mirror_y;
+}
+
+
+/**
+ * @brief Detect the mirror planes to exploit during ray tracing from the
+ *        Geometry's bounding box and boundary conditions.
+ * @details This method only inspects the bounding box and the boundary
+ *          conditions. The contents of the Geometry are checked when the
+ *          Tracks are segmented, and the TrackGenerator falls back to ray
+ *          tracing every Track if the mirrored FSRs or the segments of the
+ *          sampled mirrored Tracks do not match.
+ */
+void TrackGenerator::detectMirrorPlanes() {
+
+  if (_geometry == NULL)
+    log_printf(ERROR, "Unable to detect mirror planes since no Geometry "
+               "has been set for the TrackGenerator");
+
+  setMirrorPlanes(_geometry->isSymmetricX(), _geometry->isSymmetricY());
+
+  log_printf(INFO, "Detected mirror planes: x = %d, y = %d",
+             _mirror_x, _mirror_y);
+}
+
+
 /**
  * @brief Generates tracks for some number of azimuthal angles and track spacing
  * @details Computes the effective angles and track spacing. Computes the
@@ -344,6 +648,14 @@ void TrackGenerator::generateTracks() {
     log_printf(ERROR, "Unable to generate Tracks since no Geometry "
                "has been set for the TrackGenerator");
 
+  /* If only the Materials have changed since the Tracks were generated,
+   * rebind the segment Materials rather than ray tracing again */
+  if (_contains_tracks &&
+      _layout_string.compare(_geometry->toString(false)) == 0) {
+    updateMaterials();
+    return;
+  }
+
   /* Deletes Tracks arrays if Tracks have been generated */
   if (_contains_tracks) {
     delete [] _num_tracks;
@@ -399,10 +711,187 @@ void TrackGenerator::generateTracks() {
   }
 
   initializeBoundaryConditions();
+  _layout_string = _geometry->toString(false);
+  _FSR_tracks.clear();
   return;
 }
 
 
+/**
+ * @brief Rebind the Materials for the Track segments to the Materials which
+ *        currently fill each FSR without ray tracing.
+ * @details This method is intended to be called after changing the Material
+ *          filling one or more Cells once Tracks have been generated, as
+ *          follows from Python:
+ *
+ * @code
+ *          cell.setMaterial(2)
+ *          track_generator.updateMaterials()
+ * @endcode
+ *
+ *          Only the Tracks crossing the FSRs whose Material changed are
+ *          updated, which are found from an index of the Tracks crossing
+ *          each FSR. The segments along these Tracks are recut to ensure
+ *          that they are short enough for the exponential table. This method
+ *          is called by TrackGenerator::generateTracks() if it detects that
+ *          only the Materials have changed since the Tracks were generated.
+ */
+void TrackGenerator::updateMaterials() {
+
+  if (!_contains_tracks)
+    log_printf(ERROR, "Unable to update the Track segment Materials since "
+               "Tracks have not yet been generated.");
+
+  /* Find the FSRs whose Material has changed */
+  std::vector<int> changed_FSRs = _geometry->updateFSRMaterials();
+
+  if (changed_FSRs.size() == 0)
+    return;
+
+  if (_FSR_tracks.size() == 0)
+    initializeFSRTrackIndex();
+
+  /* Find the new Material for each changed FSR */
+  std::map<int, Material*> FSR_materials;
+  CellBasic* cell;
+
+  for (int i=0; i < (int)changed_FSRs.size(); i++) {
+    cell = _geometry->findCellContainingFSR(changed_FSRs[i]);
+    FSR_materials[changed_FSRs[i]] =
+      _geometry->getMaterial(cell->getMaterial());
+  }
+
+  /* Find the Tracks crossing the changed FSRs */
+  std::vector<Track*> tracks;
+  std::vector<bool> flagged(_tot_num_tracks, false);
+  std::vector<Track*>::iterator iter;
+
+  for (int i=0; i < (int)changed_FSRs.size(); i++) {
+    std::vector<Track*>& FSR_tracks = _FSR_tracks.at(changed_FSRs[i]);
+
+    for (iter = FSR_tracks.begin(); iter != FSR_tracks.end(); ++iter) {
+      if (!flagged[(*iter)->getUid()]) {
+        flagged[(*iter)->getUid()] = true;
+        tracks.push_back(*iter);
+      }
+    }
+  }
+
+  log_printf(NORMAL, "Updating segment Materials for %d of %d Tracks...",
+             (int)tracks.size(), _tot_num_tracks);
+
+  /* Rebind the segment Materials for each affected Track */
+  #pragma omp parallel for
+  for (int i=0; i < (int)tracks.size(); i++)
+    rebindSegments(tracks[i], FSR_materials);
+
+  /* Update the number of segments for each affected Track */
+  for (int i=0; i < (int)tracks.size(); i++) {
+    _tot_num_segments -= _num_segments[tracks[i]->getUid()];
+    _num_segments[tracks[i]->getUid()] = tracks[i]->getNumSegments();
+    _tot_num_segments += _num_segments[tracks[i]->getUid()];
+  }
+
+  computeSegmentOffsets();
+
+  /* Update the Track file for the new Materials */
+  dumpTracksToFile();
+  _layout_string = _geometry->toString(false);
+}
+
+
+/**
+ * @brief Builds an index of the Tracks which cross each FSR.
+ */
+void TrackGenerator::initializeFSRTrackIndex() {
+
+  Track* track;
+  segment* segments;
+  int fsr_id;
+
+  _FSR_tracks.clear();
+  _FSR_tracks.resize(_geometry->getNumFSRs());
+
+  for (int i=0; i < _num_azim; i++) {
+    for (int j=0; j < _num_tracks[i]; j++) {
+
+      track = &_tracks[i][j];
+      segments = track->getSegments();
+
+      for (int s=0; s < track->getNumSegments(); s++) {
+        fsr_id = segments[s]._region_id;
+
+        /* Only add each Track once for each FSR */
+        if (_FSR_tracks[fsr_id].size() == 0 ||
+            _FSR_tracks[fsr_id].back() != track)
+          _FSR_tracks[fsr_id].push_back(track);
+      }
+    }
+  }
+}
+
+
+/**
+ * @brief Rebinds the Materials for a Track's segments and recuts them to
+ *        the new Materials' total cross-sections.
+ * @details Consecutive segments within the same FSR are merged and then cut
+ *          up into sub-segments such that the length of each does not exceed
+ *          the size of the exponential table in the Solver, as in
+ *          Geometry::segmentize(...).
+ * @param track a pointer to the Track of interest
+ * @param FSR_materials a std::map of the new Materials for changed FSRs
+ */
+void TrackGenerator::rebindSegments(Track* track,
+                                    std::map<int, Material*>& FSR_materials) {
+
+  int num_groups = _geometry->getNumEnergyGroups();
+  std::vector<segment> old_segments(track->getSegments(),
+                                    track->getSegments() +
+                                    track->getNumSegments());
+  std::map<int, Material*>::iterator iter;
+  segment new_segment;
+  FP_PRECISION length;
+  FP_PRECISION* sigma_t;
+  int min_num_segments;
+  int num_segments;
+  int s = 0;
+
+  track->clearSegments();
+
+  while (s < (int)old_segments.size()) {
+
+    /* Merge the consecutive segments within this FSR */
+    new_segment = old_segments[s];
+    length = 0.;
+
+    while (s < (int)old_segments.size() &&
+           old_segments[s]._region_id == new_segment._region_id) {
+      length += old_segments[s]._length;
+      s++;
+    }
+
+    /* Find the Material for this FSR */
+    iter = FSR_materials.find(new_segment._region_id);
+    if (iter != FSR_materials.end())
+      new_segment._material = iter->second;
+
+    /* Compute the number of segments to cut this segment into */
+    sigma_t = new_segment._material->getSigmaT();
+    min_num_segments = 1;
+    for (int e=0; e < num_groups; e++) {
+      num_segments = ceil(length * sigma_t[e] / 10.0);
+      if (num_segments > min_num_segments)
+        min_num_segments = num_segments;
+    }
+
+    new_segment._length = length / FP_PRECISION(min_num_segments);
+
+    for (int i=0; i < min_num_segments; i++)
+      track->addSegment(&new_segment);
+  }
+}
+
+
 /**
  * @brief This method creates a directory to store Track files, and reads
  *        in ray tracing data for Tracks and segments from a Track file
@@ -967,14 +1456,23 @@ void TrackGenerator::segmentize() {
    * Tracks were not read in from an input file */
   if (!_use_input_file) {
 
-    /* Loop over all Tracks */
-    #pragma omp parallel for private(track)
-    for (int i=0; i < _num_azim; i++) {
-      for (int j=0; j < _num_tracks[i]; j++){
-        track = &_tracks[i][j];
-        log_printf(DEBUG, "Segmenting Track %d/%d with i = %d, j = %d",
-        track->getUid(), _tot_num_tracks, i, j);
-        _geometry->segmentize(track);
+    /* Only ray trace the unique Tracks if mirror planes were declared */
+    if ((_mirror_x || _mirror_y) && _geometry->getMesh()->getCmfdOn())
+      log_printf(WARNING, "Unable to exploit mirror symmetry for ray tracing "
+                 "with CMFD so all Tracks will be ray traced");
+
+    if ((_mirror_x || _mirror_y) && !_geometry->getMesh()->getCmfdOn())
+      segmentizeSymmetric();
+
+    else {
+      #pragma omp parallel for private(track)
+      for (int i=0; i < _num_azim; i++) {
+        for (int j=0; j < _num_tracks[i]; j++){
+          track = &_tracks[i][j];
+          log_printf(DEBUG, "Segmenting Track %d/%d with i = %d, j = %d",
+          track->getUid(), _tot_num_tracks, i, j);
+          _geometry->segmentize(track);
+        }
       }
     }
 
@@ -989,6 +1487,8 @@ void TrackGenerator::segmentize() {
         _tot_num_segments += _num_segments[track->getUid()];
       }
     }
+
+    computeSegmentOffsets();
   }
 
     _contains_tracks = true;
@@ -997,6 +1497,377 @@ void TrackGenerator::segmentize() {
 }
 
 
+/**
+ * @brief Compute the offset of each Track's segments into the segment
+ *        arrays from the number of segments per Track.
+ * @details This method is called whenever the number of segments per Track
+ *          changes so that TrackGenerator::getSegmentOffsets() and the
+ *          segment array methods need not recompute the offsets.
+ */
+void TrackGenerator::computeSegmentOffsets() {
+
+  if (_segment_offsets != NULL)
+    delete [] _segment_offsets;
+
+  _segment_offsets = new int[_tot_num_tracks+1];
+
+  _segment_offsets[0] = 0;
+  for (int uid=0; uid < _tot_num_tracks; uid++)
+    _segment_offsets[uid+1] = _segment_offsets[uid] + _num_segments[uid];
+}
+
+
+/**
+ * @brief Generate segments for each Track by only ray tracing the Tracks
+ *        which are unique under the declared mirror planes.
+ * @details Each Track is grouped with its mirror images about the y-axis,
+ *          the x-axis and the origin. The Track with the smallest UID in
+ *          each group is ray traced and its segments are copied to the
+ *          other Tracks in the group with FSR IDs remapped to the mirrored
+ *          FSRs. Mirror images about the x-axis run in the opposite
+ *          direction, so their segments are copied in reverse order.
+ *
+ *          The FSR mirror maps are found from a single point in each FSR, so
+ *          they are validated before they are used. Each mirrored FSR must
+ *          be filled by the same Material and map back to the original FSR,
+ *          and one in every MIRROR_VALIDATION_STRIDE mirrored Tracks is ray
+ *          traced and compared with the segments copied to it. If any of
+ *          these checks fail the remaining Tracks are ray traced instead.
+ */
+void TrackGenerator::segmentizeSymmetric() {
+
+  int num_FSRs = _geometry->getNumFSRs();
+  int* FSRs_to_materials = _geometry->getFSRtoMaterialMap();
+
+  /* The source Track and mirror transformation for each Track UID. The
+   * transformations are indexed by 1 (x -> -x), 2 (y -> -y) and 3 (both) */
+  Track** sources = new Track*[_tot_num_tracks];
+  int* transforms = new int[_tot_num_tracks];
+  std::vector<Track*> unique_tracks;
+  std::vector<Track*> mirror_tracks;
+
+  Track* track;
+  Track* image;
+
+  /* Find the Track with the smallest UID among each Track's mirror images */
+  for (int i=0; i < _num_azim; i++) {
+    for (int j=0; j < _num_tracks[i]; j++) {
+
+      track = &_tracks[i][j];
+      sources[track->getUid()] = track;
+      transforms[track->getUid()] = 0;
+
+      for (int t=1; t < 4; t++) {
+
+        /* Skip transformations which were not declared */
+        if (((t & 1) && !_mirror_x) || ((t & 2) && !_mirror_y))
+          continue;
+
+        image = findMirrorTrack(track, t & 1, t & 2);
+
+        if (image == NULL)
+          log_printf(ERROR, "Unable to find the mirror image of Track %d "
+                     "for mirror transformation %d", track->getUid(), t);
+
+        if (image->getUid() < sources[track->getUid()]->getUid()) {
+          sources[track->getUid()] = image;
+          transforms[track->getUid()] = t;
+        }
+      }
+
+      if (transforms[track->getUid()] == 0)
+        unique_tracks.push_back(track);
+      else
+        mirror_tracks.push_back(track);
+    }
+  }
+
+  log_printf(NORMAL, "Ray tracing %d of %d Tracks using mirror symmetry...",
+             (int)unique_tracks.size(), _tot_num_tracks);
+
+  /* Ray trace the unique Tracks */
+  #pragma omp parallel for
+  for (int i=0; i < (int)unique_tracks.size(); i++)
+    _geometry->segmentize(unique_tracks[i]);
+
+  /* Find the longest segment within each FSR along the unique Tracks. The
+   * midpoint of this segment is used to locate the mirrored FSR */
+  double* sample_x = new double[num_FSRs];
+  double* sample_y = new double[num_FSRs];
+  double* sample_length = new double[num_FSRs];
+  double x0, y0, phi;
+  segment* segments;
+
+  for (int r=0; r < num_FSRs; r++)
+    sample_length[r] = 0.;
+
+  for (int i=0; i < (int)unique_tracks.size(); i++) {
+
+    track = unique_tracks[i];
+    x0 = track->getStart()->getX();
+    y0 = track->getStart()->getY();
+    phi = track->getPhi();
+    segments = track->getSegments();
+
+    for (int s=0; s < track->getNumSegments(); s++) {
+
+      int fsr_id = segments[s]._region_id;
+
+      if (segments[s]._length > sample_length[fsr_id]) {
+        sample_length[fsr_id] = segments[s]._length;
+        sample_x[fsr_id] = x0 + cos(phi) * segments[s]._length / 2.;
+        sample_y[fsr_id] = y0 + sin(phi) * segments[s]._length / 2.;
+      }
+
+      x0 += cos(phi) * segments[s]._length;
+      y0 += sin(phi) * segments[s]._length;
+    }
+  }
+
+  /* Compute the FSR mirror maps for each transformation */
+  int* mirror_maps = new int[4*num_FSRs];
+  bool valid = true;
+
+  for (int t=1; t < 4; t++) {
+
+    if (((t & 1) && !_mirror_x) || ((t & 2) && !_mirror_y))
+      continue;
+
+    for (int r=0; r < num_FSRs; r++) {
+
+      mirror_maps[t*num_FSRs+r] = -1;
+
+      if (sample_length[r] == 0.)
+        continue;
+
+      int mirror_id = findMirrorFSR(sample_x[r], sample_y[r], t & 1, t & 2);
+
+      /* Check that the mirrored FSR is filled by the same Material */
+      if (mirror_id == -1 ||
+          FSRs_to_materials[mirror_id] != FSRs_to_materials[r]) {
+        log_printf(WARNING, "Unable to find a mirror image with the same "
+                   "Material for FSR %d with mirror transformation %d so "
+                   "all Tracks will be ray traced", r, t);
+        valid = false;
+        break;
+      }
+
+      mirror_maps[t*num_FSRs+r] = mirror_id;
+    }
+
+    if (!valid)
+      break;
+
+    /* Check that each mirrored FSR maps back to the original FSR */
+    for (int r=0; r < num_FSRs; r++) {
+
+      int mirror_id = mirror_maps[t*num_FSRs+r];
+
+      if (mirror_id == -1 || sample_length[mirror_id] == 0.)
+        continue;
+
+      if (mirror_maps[t*num_FSRs+mirror_id] != r) {
+        log_printf(WARNING, "The mirror image of FSR %d with mirror "
+                   "transformation %d does not map back to it so all "
+                   "Tracks will be ray traced", r, t);
+        valid = false;
+        break;
+      }
+    }
+
+    if (!valid)
+      break;
+  }
+
+  /* Copy the segments from each source Track with remapped FSR IDs */
+  if (valid) {
+    #pragma omp parallel for private(track, image, segments)
+    for (int i=0; i < (int)mirror_tracks.size(); i++) {
+
+      track = mirror_tracks[i];
+      image = sources[track->getUid()];
+      int t = transforms[track->getUid()];
+      int num_segments = image->getNumSegments();
+      segments = image->getSegments();
+      segment new_segment;
+
+      for (int s=0; s < num_segments; s++) {
+
+        /* Mirror images about the x-axis run in the opposite direction */
+        if (t & 2)
+          new_segment = segments[num_segments-s-1];
+        else
+          new_segment = segments[s];
+
+        new_segment._region_id =
+             mirror_maps[t*num_FSRs+new_segment._region_id];
+        track->addSegment(&new_segment);
+      }
+    }
+
+    /* Ray trace a sample of the mirrored Tracks to validate their segments */
+    int num_invalid = 0;
+
+    int num_validated = (int)mirror_tracks.size() / MIRROR_VALIDATION_STRIDE;
+
+    #pragma omp parallel for reduction(+:num_invalid)
+    for (int i=0; i <= num_validated; i++) {
+      int index = std::min(i * MIRROR_VALIDATION_STRIDE,
+                           (int)mirror_tracks.size() - 1);
+      if (!validateMirrorSegments(mirror_tracks[index]))
+        num_invalid++;
+    }
+
+    if (num_invalid > 0) {
+      log_printf(WARNING, "The segments of %d mirrored Tracks do not match "
+                 "those found by ray tracing so all Tracks will be ray "
+                 "traced", num_invalid);
+      valid = false;
+    }
+  }
+
+  /* Ray trace the mirrored Tracks if the Geometry is not symmetric */
+  if (!valid) {
+    #pragma omp parallel for
+    for (int i=0; i < (int)mirror_tracks.size(); i++) {
+      mirror_tracks[i]->clearSegments();
+      _geometry->segmentize(mirror_tracks[i]);
+    }
+  }
+
+  delete [] sources;
+  delete [] transforms;
+  delete [] sample_x;
+  delete [] sample_y;
+  delete [] sample_length;
+  delete [] mirror_maps;
+}
+
+
+/**
+ * @brief Find the Track which is the mirror image of a Track about the
+ *        y-axis and/or the x-axis.
+ * @details Mirror images about the x-axis run in the opposite direction, so
+ *          the start Point of the image Track is the mirror image of the
+ *          Track's end Point.
+ * @param track a pointer to the Track of interest
+ * @param mirror_x whether to mirror the Track about the y-axis (x -> -x)
+ * @param mirror_y whether to mirror the Track about the x-axis (y -> -y)
+ * @return a pointer to the mirror image Track or NULL if none was found
+ */
+Track* TrackGenerator::findMirrorTrack(Track* track, bool mirror_x,
+                                       bool mirror_y) {
+
+  double width = _geometry->getWidth();
+  double height = _geometry->getHeight();
+  double sign_x = mirror_x ? -1. : 1.;
+  double sign_y = mirror_y ? -1. : 1.;
+  int i = track->getAzimAngleIndex();
+  int azim_index, j;
+
+  /* Mirror images about only one axis have the complementary angle */
+  if (mirror_x != mirror_y)
+    azim_index = _num_azim - i - 1;
+  else
+    azim_index = i;
+
+  /* Compute the start and end Points of the mirror image */
+  Point* start = mirror_y ? track->getEnd() : track->getStart();
+  Point* end = mirror_y ? track->getStart() : track->getEnd();
+  double x0 = sign_x * start->getX();
+  double y0 = sign_y * start->getY();
+  double x1 = sign_x * end->getX();
+  double y1 = sign_y * end->getY();
+
+  /* Compute the index of the Track with this start Point with respect to
+   * the bottom left corner of the Geometry */
+  double dx = width / _num_x[azim_index];
+  double dy = height / _num_y[azim_index];
+
+  if (fabs(y0 + height / 2.) < MIRROR_TRACK_THRESH)
+    j = round((x0 + width / 2.) / dx - 0.5);
+  else
+    j = _num_x[azim_index] + round((y0 + height / 2.) / dy - 0.5);
+
+  if (j < 0 || j >= _num_tracks[azim_index])
+    return NULL;
+
+  /* Check that the Track found has the expected start and end Points */
+  Track* image = &_tracks[azim_index][j];
+
+  if (fabs(image->getStart()->getX() - x0) > MIRROR_TRACK_THRESH ||
+      fabs(image->getStart()->getY() - y0) > MIRROR_TRACK_THRESH ||
+      fabs(image->getEnd()->getX() - x1) > MIRROR_TRACK_THRESH ||
+      fabs(image->getEnd()->getY() - y1) > MIRROR_TRACK_THRESH)
+    return NULL;
+
+  return image;
+}
+
+
+/**
+ * @brief Find the ID of the FSR containing the mirror image of a Point
+ *        about the y-axis and/or the x-axis.
+ * @param x the x-coordinate of the Point
+ * @param y the y-coordinate of the Point
+ * @param mirror_x whether to mirror the Point about the y-axis (x -> -x)
+ * @param mirror_y whether to mirror the Point about the x-axis (y -> -y)
+ * @return the ID of the mirrored FSR or -1 if no Cell was found
+ */
+int TrackGenerator::findMirrorFSR(double x, double y, bool mirror_x,
+                                  bool mirror_y) {
+
+  int fsr_id = -1;
+
+  if (mirror_x)
+    x = -x;
+  if (mirror_y)
+    y = -y;
+
+  LocalCoords coords(x, y);
+  coords.setUniverse(0);
+
+  if (_geometry->findCellContainingCoords(&coords) != NULL)
+    fsr_id = _geometry->findFSRId(&coords);
+
+  coords.prune();
+
+  return fsr_id;
+}
+
+
+/**
+ * @brief Ray traces a mirrored Track and compares the segments found with
+ *        the segments copied from its mirror image.
+ * @details The segments found by ray tracing replace the copied segments.
+ * @param track a pointer to the mirrored Track
+ * @return true if the segments match and false otherwise
+ */
+bool TrackGenerator::validateMirrorSegments(Track* track) {
+
+  std::vector<segment> copied;
+
+  for (int s=0; s < track->getNumSegments(); s++)
+    copied.push_back(*track->getSegment(s));
+
+  track->clearSegments();
+  _geometry->segmentize(track);
+
+  if (track->getNumSegments() != (int)copied.size())
+    return false;
+
+  segment* segments = track->getSegments();
+
+  for (int s=0; s < track->getNumSegments(); s++) {
+    if (segments[s]._region_id != copied[s]._region_id ||
+        fabs(segments[s]._length - copied[s]._length) > MIRROR_SEGMENT_THRESH)
+      return false;
+  }
+
+  return true;
+}
+
+
 /**
  * @brief Writes all Track and segment data to a "*.tracks" binary file.
  * @details Storing Tracks in a binary file saves time by eliminating ray
@@ -1012,14 +1883,12 @@ void TrackGenerator::dumpTracksToFile() {
   FILE* out;
   out = fopen(_tracks_filename.c_str(), "w");
 
-  /* Get a string representation of the Geometry's attributes. This is used to
-   * check whether or not ray tracing has been performed for this Geometry */
-  std::string geometry_to_string = _geometry->toString();
-  int string_length = geometry_to_string.length();
+  /* Get a hash of the Geometry's attributes. This is used to check whether
+   * or not ray tracing has been performed for this Geometry */
+  unsigned long long geometry_hash = _geometry->hash();
 
   /* Write geometry metadata to the Track file */
-  fwrite(&string_length, sizeof(int), 1, out);
-  fwrite(geometry_to_string.c_str(), sizeof(char)*string_length, 1, out);
+  fwrite(&geometry_hash, sizeof(unsigned long long), 1, out);
 
   /* Write ray tracing metadata to the Track file */
   fwrite(&_num_azim, sizeof(int), 1, out);
@@ -1135,19 +2004,17 @@ bool TrackGenerator::readTracksFromFile() {
   FILE* in;
   in = fopen(_tracks_filename.c_str(), "r");
 
-  int string_length;
+  unsigned long long geometry_hash;
 
   /* Import Geometry metadata from the Track file */
-  ret = fread(&string_length, sizeof(int), 1, in);
-  char* geometry_to_string = new char[string_length];
-  ret = fread(geometry_to_string, sizeof(char)*string_length, 1, in);
+  ret = fread(&geometry_hash, sizeof(unsigned long long), 1, in);
 
   /* Check if our Geometry is exactly the same as the Geometry in the
    * Track file for this number of azimuthal angles and track spacing */
-  if (_geometry->toString().compare(geometry_to_string) != 0)
+  if (ret != 1 || _geometry->hash() != geometry_hash) {
+    fclose(in);
     return false;
-
-  delete [] geometry_to_string;
+  }
 
   log_printf(NORMAL, "Importing ray tracing data from file...");
 
@@ -1214,7 +2081,7 @@ bool TrackGenerator::readTracksFromFile() {
       ret = fread(&num_segments, sizeof(int), 1, in);
 
       _tot_num_segments += num_segments;
-      _num_segments[uid] += num_segments;
+      _num_segments[uid] = num_segments;
 
       /* Initialize a Track with this data */
       curr_track = &_tracks[i][j];
@@ -1252,6 +2119,8 @@ bool TrackGenerator::readTracksFromFile() {
     }
   }
 
+  computeSegmentOffsets();
+
   /* Inform the rest of the class methods that Tracks have been initialized */
   if (ret)
     _contains_tracks = true;
@@ -21,6 +21,19 @@
 #endif
 
 
+/** Error threshold (cm) for matching the end Points of a Track with those
+ *  of the mirror image of another Track */
+#define MIRROR_TRACK_THRESH 1E-8
+
+/** Error threshold (cm) for matching the lengths of the segments copied to
+ *  a mirrored Track with those found by ray tracing it */
+#define MIRROR_SEGMENT_THRESH 1E-6
+
+/** One in this many mirrored Tracks is ray traced to validate the segments
+ *  copied from its mirror image */
+#define MIRROR_VALIDATION_STRIDE 8
+
+
 /**
  * @class TrackGenerator TrackGenerator.h "src/TrackGenerator.h"
  * @brief The TrackGenerator is dedicated to generating and storing Tracks
@@ -50,6 +63,10 @@ private:
   /** The total number of segments for all Tracks */
   int _tot_num_segments;
 
+  /** An integer array of the offset of each Track's segments into the
+   *  segment arrays, indexed by Track UID */
+  int* _segment_offsets;
+
   /** An integer array of the number of Tracks starting on the x-axis for each
    *  azimuthal angle */
   int* _num_x;
@@ -76,6 +93,21 @@ private:
   /** Boolean whether the Tracks have been generated (true) or not (false) */
   bool _contains_tracks;
 
+  /** The layout of the Geometry (without Materials) when the Tracks were
+   *  generated, used to detect Material-only changes to the Geometry */
+  std::string _layout_string;
+
+  /** A std::vector of the Tracks crossing each FSR */
+  std::vector< std::vector<Track*> > _FSR_tracks;
+
+  /** Boolean for whether to exploit mirror symmetry about the y-axis
+   *  (x -> -x) during ray tracing */
+  bool _mirror_x;
+
+  /** Boolean for whether to exploit mirror symmetry about the x-axis
+   *  (y -> -y) during ray tracing */
+  bool _mirror_y;
+
   void computeEndPoint(Point* start, Point* end,  const double phi,
                        const double width, const double height);
 
@@ -84,6 +116,13 @@ private:
   void recalibrateTracksToOrigin();
   void initializeBoundaryConditions();
   void segmentize();
+  void segmentizeSymmetric();
+  void computeSegmentOffsets();
+  Track* findMirrorTrack(Track* track, bool mirror_x, bool mirror_y);
+  int findMirrorFSR(double x, double y, bool mirror_x, bool mirror_y);
+  bool validateMirrorSegments(Track* track);
+  void initializeFSRTrackIndex();
+  void rebindSegments(Track* track, std::map<int, Material*>& FSR_materials);
   void dumpTracksToFile();
   bool readTracksFromFile();
 
@@ -100,16 +139,30 @@ public:
   int* getNumSegmentsArray();
   Track** getTracks();
   FP_PRECISION* getAzimWeights();
+  bool getMirrorX();
+  bool getMirrorY();
 
   void setNumAzim(int num_azim);
   void setTrackSpacing(double spacing);
   void setGeometry(Geometry* geometry);
+  void setMirrorPlanes(bool mirror_x, bool mirror_y);
+  void detectMirrorPlanes();
 
   bool containsTracks();
   void retrieveTrackCoords(double* coords, int num_tracks);
   void retrieveSegmentCoords(double* coords, int num_segments);
+  void getTrackPoints(double** track_points, int* num_tracks,
+                      int* num_coords);
+  void getTrackAzimIndices(int** azim_indices, int* num_tracks);
+  int* getSegmentOffsets();
+  void getSegmentLengths(double** segment_lengths, int* num_segments);
+  void getSegmentFSRIds(int** segment_FSR_ids, int* num_segments);
+  void getSegmentMaterialIds(int** segment_material_ids, int* num_segments);
+  void getSegmentPoints(double** segment_points, int* num_segments,
+                        int* num_coords);
 
   void generateTracks();
+  void updateMaterials();
 };
 
 #endif /* TRACKGENERATOR_H_ */
@@ -34,6 +34,10 @@ Universe::Universe(const int id) {
 
   /* By default, the Universe's fissionability is unknown */
   _fissionable = false;
+
+  /* The search grid is built by Universe::initializeCellGrid() */
+  _grid_num_x = 0;
+  _grid_num_y = 0;
 }
 
 
@@ -233,6 +237,9 @@ void Universe::addCell(Cell* cell) {
     _cells.insert(std::pair<int, Cell*>(cell->getId(), cell));
     log_printf(INFO, "Added Cell with ID = %d to Universe with ID = %d",
                cell->getId(), _id);
+
+    /* Invalidate the search grid since it no longer spans all Cells */
+    _cell_grid.clear();
   }
   catch (std::exception &e) {
     log_printf(ERROR, "Unable to add Cell with ID = %d to Universe with"
@@ -332,65 +339,175 @@ void Universe::setFissionability(bool fissionable) {
 /**
  * @brief Finds the Cell for which a LocalCoords object resides.
  * @details Finds the Cell that a LocalCoords object is located inside by
- *          checking each of this Universe's Cells. Returns NULL if the
- *          LocalCoords is not in any of the Cells.
+ *          checking the candidate Cells in the search grid bin containing
+ *          the LocalCoords, or each of this Universe's Cells if the search
+ *          grid has not been initialized or does not contain the LocalCoords.
+ *          Returns NULL if the LocalCoords is not in any of the Cells.
  * @param coords a pointer to the LocalCoords of interest
  * @param universes a container of all of the Universes passed in by Geometry
  * @return a pointer the Cell where the LocalCoords is located
  */
 Cell* Universe::findCell(LocalCoords* coords,
-                         std::map<int, Universe*> universes) {
+                         std::map<int, Universe*>& universes) {
 
-  Cell* return_cell = NULL;
-  std::map<int, Cell*>::iterator iter;
+  Cell* cell = NULL;
 
   /* Sets the LocalCoord type to UNIV at this level */
   coords->setType(UNIV);
 
+  /* Search the candidate Cells in the search grid bin for the coords */
+  if (!_cell_grid.empty()) {
+
+    int grid_x = (int)floor((coords->getX() - _grid_min_x) / _grid_width_x);
+    int grid_y = (int)floor((coords->getY() - _grid_min_y) / _grid_width_y);
+
+    if (grid_x >= 0 && grid_x < _grid_num_x &&
+        grid_y >= 0 && grid_y < _grid_num_y) {
+
+      std::vector<Cell*>& candidates = _cell_grid[grid_y*_grid_num_x + grid_x];
+      std::vector<Cell*>::iterator iter;
+
+      for (iter = candidates.begin(); iter != candidates.end(); ++iter) {
+        if ((*iter)->cellContainsCoords(coords)) {
+          cell = *iter;
+          break;
+        }
+      }
+    }
+  }
+
   /* Loop over all Cells in this Universe */
-  for (iter = _cells.begin(); iter != _cells.end(); ++iter) {
-    Cell* cell = iter->second;
+  if (cell == NULL) {
+
+    std::map<int, Cell*>::iterator iter;
+
+    for (iter = _cells.begin(); iter != _cells.end(); ++iter) {
+      if (iter->second->cellContainsCoords(coords)) {
+        cell = iter->second;
+        break;
+      }
+    }
+  }
+
+  if (cell == NULL)
+    return NULL;
+
+  /* Set the Cell on this level */
+  coords->setCell(cell->getId());
+  coords->setCellUid(cell->getUid());
+
+  /* MATERIAL type Cell - lowest level, terminate search for Cell */
+  if (cell->getType() == MATERIAL)
+    return cell;
+
+  /* FILL type Cell - Cell contains a Universe at a lower level
+   * Update coords to next level and continue search */
+  LocalCoords* next_coords = coords->getNextCreate(coords->getX(),
+                                                   coords->getY());
 
-    if (cell->cellContainsCoords(coords)) {
+  CellFill* cell_fill = static_cast<CellFill*>(cell);
+  int universe_id = cell_fill->getUniverseFillId();
+  next_coords->setUniverse(universe_id);
+  Universe* univ = universes.at(universe_id);
+
+  coords->setNext(next_coords);
+  next_coords->setPrev(coords);
+  if (univ->getType() == SIMPLE)
+    return univ->findCell(next_coords, universes);
+  else
+    return static_cast<Lattice*>(univ)->findCell(next_coords, universes);
+}
 
-      /* Set the Cell on this level */
-      coords->setCell(cell->getId());
 
-      /* MATERIAL type Cell - lowest level, terminate search for Cell */
-      if (cell->getType() == MATERIAL) {
-        coords->setCell(cell->getId());
-        return_cell = cell;
-        return return_cell;
+/**
+ * @brief Bins the Cells in this Universe into a uniform search grid.
+ * @details The search grid spans the finite extents of the bounding boxes
+ *          of the Cells in the Universe. Each bin stores the Cells whose
+ *          bounding box overlaps it, so that Universe::findCell(...) only
+ *          needs to test a few candidate Cells rather than all of them.
+ *          No grid is built for Lattices, for Universes with a single Cell,
+ *          or if the Cells do not bound the Universe along both axes. This
+ *          method is called by Geometry::initializeFlatSourceRegions().
+ */
+void Universe::initializeCellGrid() {
+
+  _cell_grid.clear();
+  _grid_num_x = 0;
+  _grid_num_y = 0;
+
+  if (_type == LATTICE || _cells.size() < 2)
+    return;
+
+  std::map<int, Cell*>::iterator iter;
+  double min_x = std::numeric_limits<double>::infinity();
+  double max_x = -std::numeric_limits<double>::infinity();
+  double min_y = std::numeric_limits<double>::infinity();
+  double max_y = -std::numeric_limits<double>::infinity();
+  double bounds[2];
+
+  /* Compute the extents of the finite bounding box coordinates */
+  for (iter = _cells.begin(); iter != _cells.end(); ++iter) {
+
+    bounds[0] = iter->second->getMinX();
+    bounds[1] = iter->second->getMaxX();
+    for (int i=0; i < 2; i++) {
+      if (fabs(bounds[i]) != std::numeric_limits<double>::infinity()) {
+        min_x = std::min(min_x, bounds[i]);
+        max_x = std::max(max_x, bounds[i]);
       }
+    }
 
-      /* FILL type Cell - Cell contains a Universe at a lower level
-       * Update coords to next level and continue search */
-      else if (cell->getType() == FILL) {
-
-        LocalCoords* next_coords;
-
-        if (coords->getNext() == NULL)
-          next_coords = new LocalCoords(coords->getX(), coords->getY());
-        else
-          next_coords = coords->getNext();
-
-        CellFill* cell_fill = static_cast<CellFill*>(cell);
-        int universe_id = cell_fill->getUniverseFillId();
-        next_coords->setUniverse(universe_id);
-        Universe* univ = universes.at(universe_id);
-        coords->setCell(cell->getId());
-
-        coords->setNext(next_coords);
-        next_coords->setPrev(coords);
-        if (univ->getType() == SIMPLE)
-          return univ->findCell(next_coords, universes);
-        else
-          return static_cast<Lattice*>(univ)->findCell(next_coords, universes);
+    bounds[0] = iter->second->getMinY();
+    bounds[1] = iter->second->getMaxY();
+    for (int i=0; i < 2; i++) {
+      if (fabs(bounds[i]) != std::numeric_limits<double>::infinity()) {
+        min_y = std::min(min_y, bounds[i]);
+        max_y = std::max(max_y, bounds[i]);
       }
     }
   }
 
-  return return_cell;
+  /* Return if the Cells do not bound a finite region along both axes */
+  if (!(max_x > min_x) || !(max_y > min_y))
+    return;
+
+  /* Use roughly one bin per Cell */
+  int num_bins = (int)ceil(sqrt(double(_cells.size())));
+  _grid_num_x = num_bins;
+  _grid_num_y = num_bins;
+  _grid_min_x = min_x;
+  _grid_min_y = min_y;
+  _grid_width_x = (max_x - min_x) / _grid_num_x;
+  _grid_width_y = (max_y - min_y) / _grid_num_y;
+  _cell_grid.resize(_grid_num_x * _grid_num_y);
+
+  /* Append each Cell to the bins overlapped by its padded bounding box */
+  for (iter = _cells.begin(); iter != _cells.end(); ++iter) {
+
+    Cell* cell = iter->second;
+    double x0 = std::max(cell->getMinX() - CELL_GRID_PADDING, min_x);
+    double x1 = std::min(cell->getMaxX() + CELL_GRID_PADDING, max_x);
+    double y0 = std::max(cell->getMinY() - CELL_GRID_PADDING, min_y);
+    double y1 = std::min(cell->getMaxY() + CELL_GRID_PADDING, max_y);
+
+    if (x0 > x1 || y0 > y1)
+      continue;
+
+    int start_x = std::max(0, (int)floor((x0 - min_x) / _grid_width_x));
+    int end_x = std::min(_grid_num_x-1, (int)floor((x1 - min_x) /
+                                                   _grid_width_x));
+    int start_y = std::max(0, (int)floor((y0 - min_y) / _grid_width_y));
+    int end_y = std::min(_grid_num_y-1, (int)floor((y1 - min_y) /
+                                                   _grid_width_y));
+
+    for (int j=start_y; j <= end_y; j++) {
+      for (int i=start_x; i <= end_x; i++)
+        _cell_grid[j*_grid_num_x + i].push_back(cell);
+    }
+  }
+
+  log_printf(DEBUG, "Initialized a %d x %d Cell search grid for Universe %d",
+             _grid_num_x, _grid_num_y, _id);
 }
 
 
@@ -809,7 +926,7 @@ bool Lattice::withinBounds(Point* point) {
  * @return a pointer to the Cell this LocalCoord is in or NULL
  */
 Cell* Lattice::findCell(LocalCoords* coords,
-                        std::map<int, Universe*> universes) {
+                        std::map<int, Universe*>& universes) {
 
   /* Set the LocalCoord to be a LAT type at this level */
   coords->setType(LAT);
@@ -847,12 +964,7 @@ Cell* Lattice::findCell(LocalCoords* coords,
   double nextY = coords->getY() - (_origin.getY() + (lat_y + 0.5) * _width_y);
 
   /* Create a new LocalCoords object for the next level Universe */
-  LocalCoords* next_coords;
-
-  if (coords->getNext() == NULL)
-    next_coords = new LocalCoords(nextX, nextY);
-  else
-    next_coords = coords->getNext();
+  LocalCoords* next_coords = coords->getNextCreate(nextX, nextY);
 
   int universe_id = getUniverse(lat_x, lat_y)->getId();
   Universe* univ = universes.at(universe_id);
@@ -860,6 +972,7 @@ Cell* Lattice::findCell(LocalCoords* coords,
 
   /* Set Lattice indices */
   coords->setLattice(_id);
+  coords->setLatticeUid(_uid);
   coords->setLatticeX(lat_x);
   coords->setLatticeY(lat_y);
 
@@ -890,7 +1003,7 @@ Cell* Lattice::findCell(LocalCoords* coords,
  * @return a pointer to a Cell if found, NULL if no cell found
  */
 Cell* Lattice::findNextLatticeCell(LocalCoords* coords, double angle,
-                                   std::map<int, Universe*> universes) {
+                                   std::map<int, Universe*>& universes) {
 
   /* Tests the upper, lower, left and right Lattice Cells adjacent to
    * the LocalCoord and uses the one with the shortest distance from
@@ -1067,9 +1180,7 @@ Cell* Lattice::findNextLatticeCell(LocalCoords* coords, double angle,
                      + (new_lattice_y + 0.5) * _width_y);
 
       /* Set the coordinates at the next level LocalCoord */
-      next_coords = new LocalCoords(nextX, nextY);
-      next_coords->setPrev(coords);
-      coords->setNext(next_coords);
+      next_coords = coords->getNextCreate(nextX, nextY);
 
       next_coords->setUniverse(univ->getId());
 
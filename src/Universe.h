@@ -26,6 +26,11 @@
 #define TINY_MOVE 1E-10
 
 
+/** Padding (cm) applied to the bounding box of each Cell when binning it
+ *  into the search grid of its Universe */
+#define CELL_GRID_PADDING 1E-8
+
+
 class LocalCoords;
 class Cell;
 class CellFill;
@@ -88,6 +93,28 @@ protected:
    *  with a non-zero fission cross-section and is fissionable */
   bool _fissionable;
 
+  /** The number of search grid bins along the x-axis */
+  int _grid_num_x;
+
+  /** The number of search grid bins along the y-axis */
+  int _grid_num_y;
+
+  /** The minimum x-coordinate of the search grid */
+  double _grid_min_x;
+
+  /** The minimum y-coordinate of the search grid */
+  double _grid_min_y;
+
+  /** The width of each search grid bin along the x-axis */
+  double _grid_width_x;
+
+  /** The width of each search grid bin along the y-axis */
+  double _grid_width_y;
+
+  /** A std::vector of the candidate Cells overlapping each search grid bin,
+   *  in the same order as the Cells are stored in the _cells std::map */
+  std::vector< std::vector<Cell*> > _cell_grid;
+
 public:
 
   Universe(const int id);
@@ -114,9 +141,10 @@ public:
   void setOrigin(Point* origin);
   void setFissionability(bool fissionable);
 
-  Cell* findCell(LocalCoords* coords, std::map<int, Universe*> universes);
+  Cell* findCell(LocalCoords* coords, std::map<int, Universe*>& universes);
   int computeFSRMaps();
   void subdivideCells();
+  void initializeCellGrid();
   std::string toString();
   void printString();
 
@@ -170,9 +198,9 @@ public:
   void setUniversePointer(Universe* universe);
 
   bool withinBounds(Point* point);
-  Cell* findCell(LocalCoords* coords, std::map<int, Universe*> universes);
+  Cell* findCell(LocalCoords* coords, std::map<int, Universe*>& universes);
   Cell* findNextLatticeCell(LocalCoords* coords, double angle,
-                            std::map<int, Universe*> universes);
+                            std::map<int, Universe*>& universes);
   int computeFSRMaps();
 
   std::string toString();
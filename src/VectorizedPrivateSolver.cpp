@@ -173,6 +173,9 @@ void VectorizedPrivateSolver::transportSweep() {
   /* Initialize flux in each FSR to zero */
   flattenFSRFluxes(0.0);
 
+  /* Set the OpenMP schedule for the loop over Tracks */
+  omp_set_schedule(_schedule, 0);
+
   /* Loop over azimuthal angle halfspaces */
   for (int i=0; i < 2; i++) {
 
@@ -183,7 +186,7 @@ void VectorizedPrivateSolver::transportSweep() {
 
     /* Loop over each thread within this azimuthal angle halfspace */
     #pragma omp parallel for private(tid, fsr_id, curr_track, azim_index, \
-      num_segments, segments, curr_segment, track_flux) schedule(guided)
+      num_segments, segments, curr_segment, track_flux) schedule(runtime)
     for (int track_id=min; track_id < max; track_id++) {
 
       tid = omp_get_thread_num();